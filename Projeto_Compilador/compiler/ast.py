@@ -2,21 +2,28 @@ from __future__ import annotations
 from functools import reduce
 from enum import Enum, auto
 from typing import Union
+from contextvars import ContextVar
+import functools
 import json
 from .lexer import TokenPos
 
 class NodePos:
     """
-    Represents the location of this node on the source text.
+    Represents the location of a node on the source text. All nodes derive from this class, so that the position is
+    stored on the node itself instead of on a separate object (see Node.pos).
+
+    The start and end of the node are kept as references to the (immutable) positions of the tokens that delimit it,
+    so rows and columns are only resolved when they are first read (see lexer.TokenPos).
     """
-    def __init__(self, startPos, endPos, _rawStartPos = 0, _rawEndPos = 0):
-        self._startPos = _rawStartPos
-        self.startRow = startPos[0]
-        self.startCol = startPos[1]
+    __slots__ = ("_start", "_end")
+
+    _startPos = property(lambda self: self._start._startPos)
+    startRow = property(lambda self: self._start.startRow)
+    startCol = property(lambda self: self._start.startCol)
 
-        self._endPos = _rawEndPos
-        self.endRow = endPos[0]
-        self.endCol = endPos[1]
+    _endPos = property(lambda self: self._end._endPos)
+    endRow = property(lambda self: self._end.endRow)
+    endCol = property(lambda self: self._end.endCol)
 
     def getStart(self):
         return (self._startPos, self.startRow, self.startCol)
@@ -24,48 +31,42 @@ class NodePos:
     def getEnd(self):
         return (self._endPos, self.endRow, self.endCol)
 
-    def toJSON(self):
+    def posToJSON(self):
         return {
             "start": [self._startPos, self.startRow, self.startCol],
             "end": [self._endPos, self.endRow, self.endCol]
         }
 
     def setMonoPos(self, pos: (int, int, int)):
-        self._startPos = pos[0]
-        self.startRow = pos[1]
-        self.startCol = pos[2]
+        self._start = TokenPos.resolved(pos, pos)
 
         return self
 
     def setFullPos(self, start: (int, int, int), end: (int, int, int)):
-        self._startPos = start[0]
-        self.startRow = start[1]
-        self.startCol = start[2]
-
-        self._endPos = end[0]
-        self.endRow = end[1]
-        self.endCol = end[2]
+        self._start = TokenPos.resolved(start, end)
+        self._end = self._start
 
         return self
     
-    def setTokenPos(self, pos: TokenPos):
-        self._startPos = pos._startPos
-        self.startRow = pos.startRow
-        self.startCol = pos.startCol
-
-        self._endPos = pos._endPos
-        self.endRow = pos.endRow
-        self.endCol = pos.endCol
+    # The setters below accept either a TokenPos or the NodePos of another node. In the latter case, the token positions
+    #   referenced by that node are copied, so that later changes to it are not reflected on this node.
+    def setTokenPos(self, pos: TokenPos | NodePos):
+        if (isinstance(pos, NodePos)):
+            self._start = pos._start
+            self._end = pos._end
+        else:
+            self._start = pos
+            self._end = pos
+
+        return self
     
-    def setStartTokenPos(self, pos: TokenPos):
-        self._startPos = pos._startPos
-        self.startRow = pos.startRow
-        self.startCol = pos.startCol
+    def setStartTokenPos(self, pos: TokenPos | NodePos):
+        self._start = pos._start if isinstance(pos, NodePos) else pos
+
+        return self
     
-    def setEndTokenPos(self, pos: TokenPos):
-        self._endPos = pos._endPos
-        self.endRow = pos.endRow
-        self.endCol = pos.endCol
+    def setEndTokenPos(self, pos: TokenPos | NodePos):
+        self._end = pos._end if isinstance(pos, NodePos) else pos
 
         return self
     
@@ -81,7 +82,36 @@ class NodePos:
         return f"{self.startRow}:{self.startCol} - {self.endRow}:{self.endCol}"
     fullString = property(_fullString)
 
-class Node:
+# The position of nodes that are not positioned by the parser. Token positions are never changed once resolved (the
+#   setters above replace them), so it is shared by all of those nodes.
+_NO_POS = TokenPos.resolved((0, (0, 0), (0, 0)), (0, (0, 0), (0, 0)))
+
+#region ------- Shallow JSON -------
+# The node whose JSON is being built shallowly (see Node.toShallowJSON), if any.
+_SHALLOW_JSON: ContextVar["Node"] = ContextVar("shallowJSON", default = None)
+
+class DeferredJSON:
+    """
+    Stands for the JSON of a child node on the output of Node.toShallowJSON.
+    """
+    __slots__ = ("node",)
+
+    def __init__(self, node: "Node"):
+        self.node = node
+
+def _deferrableJSON(toJSON):
+    # Wraps a toJSON method, so that it yields a DeferredJSON instead when called on a child of a node whose JSON is
+    #   being built shallowly. Calls on the node itself (e.g. super().toJSON()) are run as usual.
+    @functools.wraps(toJSON)
+    def wrapper(self):
+        shallow = _SHALLOW_JSON.get()
+        if (shallow is not None and shallow is not self): return DeferredJSON(self)
+        return toJSON(self)
+
+    return wrapper
+#endregion ------- Shallow JSON -------
+
+class Node(NodePos):
     """
     Represents an abstract Node in an Abstract Syntax Tree. All nodes must derive from this base class.
     In order to assert for a specific node type in an AST-based rule, use Node#ist.
@@ -89,11 +119,24 @@ class Node:
     By default, printing the value of a node will not reveal it's position nor the names of the parameters. 
     To show those properties, set the static attribute Node.verbose to True.
     """
+    # Nodes declare the attributes they set on __slots__, as the AST is the largest structure built by the compiler.
+    __slots__ = ("value", "symbol")
     verbose = True
 
-    def __init__(self, value = None, pos = ((0, 0), (0, 0))):
+    def __init__(self, value = None, pos: TokenPos = _NO_POS):
         self.value = value
-        self.pos = NodePos(pos, pos)
+        # The symbol this node refers to, bound by the semantic analyser on it's first resolution (see
+        #   SymbolTable.resolveBinding). Only set on nodes that name a symbol (identifiers, variables and activations).
+        self.symbol = None
+        self._start = pos
+        self._end = pos
+
+    # The position is folded into the node (see NodePos).
+    pos = property(lambda self: self)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if ("toJSON" in cls.__dict__): cls.toJSON = _deferrableJSON(cls.__dict__["toJSON"])
 
     def _formatPos(self):
         if (self.verbose): return f"start={self.pos.startString}, end={self.pos.endString}"
@@ -105,16 +148,28 @@ class Node:
         else: 
             return f"{type(self).__name__}({self.value})"
 
+    @_deferrableJSON
     def toJSON(self):
         return {
             "type": type(self).__name__,
             "value": self.value, # Here I assume that nodes with non-overriden JSON parsers 
                                  #   will only use primitives as the value.
-            "pos": self.pos.toJSON()
+            "pos": self.posToJSON()
         }
     
     def toJSONString(self):
         return json.dumps(self.toJSON(), ensure_ascii=False)
+
+    def toShallowJSON(self):
+        """
+        Builds the JSON of this node as Node#toJSON does, but with the JSON of each child node replaced by a DeferredJSON,
+        so that a tree can be serialized one node at a time (see astdump.py).
+        """
+        token = _SHALLOW_JSON.set(self)
+        try:
+            return self.toJSON()
+        finally:
+            _SHALLOW_JSON.reset(token)
     
     def ist(self, kind: "Node") -> bool:
         """
@@ -122,31 +177,13 @@ class Node:
         """
         return isinstance(self, kind)
 
-    def setMonoPos(self, pos: (int, int, int)):
-        self.pos.setMonoPos(pos)
-        return self
-
-    def setFullPos(self, start: (int, int, int), end: (int, int, int)):
-        self.pos.setFullPos(start, end)
-        return self
-
-    def setTokenPos(self, tokenPos):
-        self.pos.setTokenPos(tokenPos)
-        return self
-
-    def setStartTokenPos(self, tokenPos):
-        self.pos.setStartTokenPos(tokenPos)
-        return self
-
-    def setEndTokenPos(self, tokenPos):
-        self.pos.setEndTokenPos(tokenPos)
-        return self
-
 #region ============== Compound Primitives =============
 class SpecialSymbolKind(Enum):
     SS_NIL = auto()
 
 class SpecialSymbolNode(Node):
+    __slots__ = ()
+
     def __init__(self, value: SpecialSymbolKind):
         super().__init__(value)
 
@@ -181,6 +218,8 @@ class SpecialSymbolNode(Node):
         }
 
 class StringNode(Node):
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__(None)
         self.value = value
@@ -192,6 +231,8 @@ class StringNode(Node):
         return hash(self.value)
 
 class IdentifierNode(Node):
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__(None)
         self.value = value
@@ -209,6 +250,8 @@ class NumberKind(Enum):
     SIGNED_INTEGER = auto()
 
 class NumberNode(Node):
+    __slots__ = ("kind",)
+
     def __init__(self, value: str, kind: NumberKind):
         super().__init__(None)
         self.kind = kind
@@ -256,6 +299,8 @@ class NumberNode(Node):
         else: return -1
 
 class UnsignedConstantNode(Node):
+    __slots__ = ()
+
     def __init__(self, value: NumberNode | StringNode | IdentifierNode | SpecialSymbolNode):
         super().__init__(value)
         self.setTokenPos(value.pos)
@@ -303,6 +348,8 @@ class UnsignedConstantNode(Node):
         else: return -1
 
 class DirectiveNode(Node):
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__(None)
         self.value = value
@@ -312,6 +359,8 @@ ConstantNode = NumberNode | IdentifierNode | StringNode
 
 # Section 3.A
 class ProgramHeadingNode(Node):
+    __slots__ = ("name", "externals")
+
     def __init__(self, name, externals):
         super().__init__(None)
         self.name = name
@@ -342,6 +391,8 @@ class ProgramHeadingNode(Node):
 
 # Section 3.B
 class LabelDeclarationNode(Node):
+    __slots__ = ()
+
     def __init__(self, labels):
         super().__init__(None)
         self.value = labels
@@ -355,6 +406,8 @@ class LabelDeclarationNode(Node):
 
 #region ============== Section 3.C ==============
 class ConstantDefinitionNode(Node):
+    __slots__ = ("key",)
+
     def __init__(self, key, value):
         super().__init__(None)
         self.key = key
@@ -384,6 +437,8 @@ class ConstantDefinitionNode(Node):
         }
 
 class ConstantDefinitionPartNode(Node):
+    __slots__ = ()
+
     def __init__(self, constants: list[ConstantDefinitionNode]):
         super().__init__(None)
         self.value = constants
@@ -428,6 +483,8 @@ class TypeKind(Enum):
     TYPE_IDENTIFIER = auto()
 
 class TypeNode(Node):
+    __slots__ = ("kind",)
+
     def __init__(self):
         super().__init__()
         self.kind = TypeKind.TYPE_UNKNOWN
@@ -440,6 +497,8 @@ class TypeNode(Node):
         }
 
 class TypeIdentifierNode(TypeNode):
+    __slots__ = ()
+
     def __init__(self, value: IdentifierNode):
         super().__init__()
         self.kind = TypeKind.TYPE_IDENTIFIER
@@ -456,6 +515,8 @@ class TypeIdentifierNode(TypeNode):
 
 #region -------------- Simple Types --------------
 class SimpleTypeNode(TypeNode):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.kind = TypeKind.TYPE_SIMPLE
@@ -465,10 +526,14 @@ class OrdinalTypeNode(SimpleTypeNode):
     Used exclusively for categorization purposes. Doesn't do jack shit on it's own and doesn't even have concrete
     representation on the AST.
     """
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
 class EnumeratedTypeNode(OrdinalTypeNode):
+    __slots__ = ()
+
     def __init__(self, types: list[IdentifierNode]):
         super().__init__()
         self.value = types
@@ -505,6 +570,8 @@ class EnumeratedTypeNode(OrdinalTypeNode):
         # return base
 
 class SubrangeTypeNode(OrdinalTypeNode):
+    __slots__ = ("start", "end")
+
     def __init__(self, start: Node, end: Node):
         super().__init__()
         self.start = start
@@ -539,6 +606,8 @@ class SubrangeTypeNode(OrdinalTypeNode):
 
 #region -------------- Structured Types --------------
 class StructuredTypeNode(TypeNode):
+    __slots__ = ("packed",)
+
     def __init__(self, packed: bool = False):
         super().__init__()
         self.kind = TypeKind.TYPE_STRUCTURED
@@ -552,6 +621,8 @@ class StructuredTypeNode(TypeNode):
         }
 
 class ArrayTypeNode(StructuredTypeNode):
+    __slots__ = ("basetype",)
+
     def __init__(self, values: list[SimpleTypeNode], basetype: SimpleTypeNode):
         super().__init__()
         self.value = values
@@ -590,6 +661,8 @@ class ArrayTypeNode(StructuredTypeNode):
         }
 
 class RecordSectionNode(Node):
+    __slots__ = ("identifiers", "basetype")
+
     def __init__(self, identifiers: list[IdentifierNode], basetype: TypeNode):
         super().__init__()
         self.identifiers = identifiers
@@ -628,6 +701,8 @@ class RecordSectionNode(Node):
         }
 
 class RecordVariantCaseNode(Node):
+    __slots__ = ("consts", "fixedPart", "variantPart")
+
     def __init__(self, consts: list[Node], fixedPart: list[RecordSectionNode] = None, variantPart = None):
         super().__init__()
         self.consts = consts
@@ -686,6 +761,8 @@ class RecordVariantCaseNode(Node):
         }
 
 class RecordVariantNode(Node):
+    __slots__ = ("identifier", "basetype", "cases")
+
     def __init__(self, identifier: str | None, basetype: TypeNode, cases: list[RecordVariantCaseNode]):
         super().__init__()
         self.identifier = identifier
@@ -733,6 +810,8 @@ class RecordVariantNode(Node):
         }
 
 class RecordTypeNode(StructuredTypeNode):
+    __slots__ = ("fixedPart", "variantPart")
+
     def __init__(self, fixedPart: list[RecordSectionNode] = None, variantPart = None):
         super().__init__()
         self.fixedPart = fixedPart
@@ -782,6 +861,8 @@ class RecordTypeNode(StructuredTypeNode):
         }
 
 class SetTypeNode(StructuredTypeNode):
+    __slots__ = ("basetype",)
+
     def __init__(self, basetype: OrdinalTypeNode):
         super().__init__()
         self.basetype = basetype
@@ -811,6 +892,8 @@ class SetTypeNode(StructuredTypeNode):
         }
 
 class FileTypeNode(StructuredTypeNode):
+    __slots__ = ("basetype",)
+
     def __init__(self, basetype: TypeNode):
         super().__init__()
         self.basetype = basetype
@@ -842,6 +925,8 @@ class FileTypeNode(StructuredTypeNode):
 
 #region -------------- Pointer Types --------------
 class PointerTypeNode(TypeNode):
+    __slots__ = ("basetype",)
+
     def __init__(self, basetype: TypeNode):
         super().__init__()
         self.kind = TypeKind.TYPE_POINTER
@@ -873,6 +958,8 @@ class PointerTypeNode(TypeNode):
 #endregion -------------- Pointer Types --------------
 
 class TypeDefinitionNode(Node):
+    __slots__ = ("key",)
+
     def __init__(self, key, value):
         super().__init__(None)
         self.key = key
@@ -912,6 +999,8 @@ class TypeDefinitionNode(Node):
         }
 
 class TypeDefinitionPartNode(Node):
+    __slots__ = ()
+
     def __init__(self, types: list[TypeDefinitionNode]):
         super().__init__(None)
         self.value = types
@@ -950,6 +1039,8 @@ class TypeDefinitionPartNode(Node):
 #region ============== Section 3.E ==============
 
 class VariableDeclarationNode(Node):
+    __slots__ = ("keys",)
+
     def __init__(self, keys: list[IdentifierNode], value: TypeNode):
         super().__init__(None)
         self.keys = keys
@@ -992,6 +1083,8 @@ class VariableDeclarationNode(Node):
         }
 
 class VariableDeclarationPartNode(Node):
+    __slots__ = ()
+
     def __init__(self, variables: list[VariableDeclarationNode]):
         super().__init__(None)
         self.value = variables
@@ -1031,6 +1124,8 @@ class VariableDeclarationPartNode(Node):
 #region ============== Section 11 ==============
 #region -------------- Parameter Lists --------------
 class IndexTypeSpecificationNode(Node):
+    __slots__ = ("lb", "hb", "name")
+
     def __init__(self, lb, hb, name):
         super().__init__(None)
         self.lb = lb
@@ -1064,6 +1159,8 @@ class IndexTypeSpecificationNode(Node):
         }
 
 class PackedConformantArraySchemaNode(Node):
+    __slots__ = ("specification", "name")
+
     def __init__(self, specification: IndexTypeSpecificationNode, name: TypeIdentifierNode):
         super().__init__(None)
         self.specification = specification
@@ -1098,6 +1195,8 @@ class PackedConformantArraySchemaNode(Node):
         }
 
 class UnpackedConformantArraySchemaNode(Node):
+    __slots__ = ("specifications", "name")
+
     def __init__(self, specifications: list[IndexTypeSpecificationNode], name: TypeIdentifierNode):
         super().__init__(None)
         self.specifications = specifications
@@ -1139,6 +1238,8 @@ class UnpackedConformantArraySchemaNode(Node):
         }
 
 class ParameterSpecificationNode(Node):
+    __slots__ = ("identifiers", "basetype", "variable")
+
     def __init__(
         self, 
         identifiers: list[IdentifierNode], 
@@ -1191,6 +1292,8 @@ class ParameterSpecificationNode(Node):
         }
 
 class ActualParameterListNode(Node):
+    __slots__ = ()
+
     def __init__(self, params: list["ExpressionLikeNode"]):
         super().__init__(params)
 
@@ -1228,6 +1331,8 @@ class ActualParameterListNode(Node):
 
 #region -------------- Procedure --------------
 class ProcedureHeadingNode(Node):
+    __slots__ = ("name", "params")
+
     def __init__(self, name, params: list[ParameterSpecificationNode]):
         super().__init__(None)
         self.name = name
@@ -1272,6 +1377,8 @@ class ProcedureHeadingNode(Node):
         }
 
 class ProcedureDeclarationNode(Node):
+    __slots__ = ("heading", "body")
+
     def __init__(self, heading: ProcedureHeadingNode, body: "BlockNode" | DirectiveNode):
         super().__init__(None)
         self.heading = heading
@@ -1303,6 +1410,8 @@ class ProcedureDeclarationNode(Node):
 
 #region -------------- Function --------------
 class FunctionHeadingNode(Node):
+    __slots__ = ("name", "params", "rettype")
+
     def __init__(self, name, params: list[ParameterSpecificationNode], rettype: TypeIdentifierNode):
         super().__init__(None)
         self.name = name
@@ -1350,6 +1459,8 @@ class FunctionHeadingNode(Node):
         }
 
 class FunctionDeclarationNode(Node):
+    __slots__ = ("heading", "body")
+
     def __init__(self, heading: FunctionHeadingNode, body: "BlockNode" | DirectiveNode):
         super().__init__(None)
         self.heading = heading
@@ -1380,6 +1491,8 @@ class FunctionDeclarationNode(Node):
 #endregion -------------- Function --------------
 
 class ProcedureAndFunctionDeclarationPartNode(Node):
+    __slots__ = ()
+
     def __init__(self, value: list[ProcedureDeclarationNode]):
         super().__init__(None)
         self.value = value
@@ -1431,6 +1544,8 @@ class VariableStaticType(Enum):
     VARIABLE_ST_POINTER = auto()
 
 class VariableNode(Node):
+    __slots__ = ("kind", "staticType")
+
     def __init__(self):
         super().__init__()
         self.kind = VariableKind.VARIABLE_UNKNOWN
@@ -1453,6 +1568,8 @@ class VariableNode(Node):
         }
 
 class EntireVariableNode(VariableNode):
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__()
         self.kind = VariableKind.VARIABLE_ENTIRE
@@ -1487,6 +1604,8 @@ class EntireVariableNode(VariableNode):
         }
 
 class IndexedVariableNode(VariableNode):
+    __slots__ = ("lbindex", "hbindex")
+
     def __init__(self, value: VariableNode, lbindex: "ExpressionNode", hbindex: "ExpressionNode" | None):
         super().__init__()
         self.kind = VariableKind.VARIABLE_COMPONENT
@@ -1534,6 +1653,8 @@ class IndexedVariableNode(VariableNode):
         }
 
 class FieldDesignatorNode(VariableNode):
+    __slots__ = ("key",)
+
     def __init__(self, key: VariableNode | IdentifierNode, value: IdentifierNode):
         super().__init__()
         self.kind = VariableKind.VARIABLE_COMPONENT
@@ -1580,6 +1701,8 @@ class FieldDesignatorNode(VariableNode):
         }
 
 class IdentifiedVariableNode(VariableNode):
+    __slots__ = ()
+
     def __init__(self, value: VariableNode):
         super().__init__()
         self.kind = VariableKind.VARIABLE_IDENTIFIED
@@ -1639,6 +1762,8 @@ class OpKind(Enum):
     OP_IN = auto()
 
 class OpNode(Node):
+    __slots__ = ()
+
     def __init__(self, op: OpKind):
         super().__init__(op)
 
@@ -1676,6 +1801,8 @@ class ExpressionStaticType(Enum):
     EXP_INTEGER = auto()
 
 class ExpressionLikeNode(Node):
+    __slots__ = ("kind", "staticType")
+
     def __init__(self, value: UnsignedConstantNode | VariableNode | IdentifierNode = None):
         super().__init__(value)
         self.kind = ExpressionKind.EXP_UNARY
@@ -1726,6 +1853,8 @@ class ExpressionLikeNode(Node):
         }
 
 class ExpressionNode(ExpressionLikeNode):
+    __slots__ = ("lhs", "op", "rhs")
+
     def __init__(self, lhs: ExpressionLikeNode, op: OpNode, rhs: ExpressionLikeNode):
         super().__init__()
         self.kind = ExpressionKind.EXP_BINARY
@@ -1779,6 +1908,8 @@ class ExpressionNode(ExpressionLikeNode):
         }
 
 class ElementDescriptionNode(Node):
+    __slots__ = ("start", "end")
+
     def __init__(self, start: ExpressionLikeNode, end: ExpressionLikeNode | None):
         super().__init__()
         self.start = start
@@ -1817,6 +1948,8 @@ class ElementDescriptionNode(Node):
         return base
 
 class SetConstructorNode(Node):
+    __slots__ = ()
+
     def __init__(self, value: list[ElementDescriptionNode]):
         super().__init__(None)
         self.value = value
@@ -1852,6 +1985,8 @@ class SetConstructorNode(Node):
         }
 
 class FunctionDesignatorNode(ExpressionLikeNode):
+    __slots__ = ("key", "params")
+
     def __init__(self, key: IdentifierNode, params: ActualParameterListNode | None):
         super().__init__()
         self.key = key
@@ -1892,6 +2027,8 @@ class FunctionDesignatorNode(ExpressionLikeNode):
 
 #region ============== Section R9 ==============
 class StatementNode(Node):
+    __slots__ = ("_label",)
+
     def __init__(self, value = None):
         super().__init__(value)
         self._label = None
@@ -1927,6 +2064,8 @@ class StatementNode(Node):
 #   - The type of the key and the resulting type of the expression value are compatible string types, that is, they both
 # are character arrays with equal length.
 class AssignmentStatementNode(StatementNode):
+    __slots__ = ("key",)
+
     def __init__(self, key: IdentifierNode | VariableNode, value: ExpressionNode):
         super().__init__(None)
         self.key = key
@@ -1963,6 +2102,8 @@ class AssignmentStatementNode(StatementNode):
 
 # Essentially, this is a function call.
 class ProcedureStatementNode(StatementNode):
+    __slots__ = ("key", "params")
+
     def __init__(self, key: IdentifierNode, params: ActualParameterListNode | None):
         super().__init__(None)
         self.key = key
@@ -2003,6 +2144,8 @@ class ProcedureStatementNode(StatementNode):
 #   - The statement must not attempt to jump to a label that does not exist in the current scope or attempt to jump to 
 # a label that was not declared on the current block (see Section 10.1).
 class GotoStatementNode(StatementNode):
+    __slots__ = ()
+
     def __init__(self, label: NumberNode):
         super().__init__(label)
 
@@ -2031,6 +2174,8 @@ class GotoStatementNode(StatementNode):
         }
 
 class CompoundStatementNode(StatementNode):
+    __slots__ = ()
+
     def __init__(self, statements: list[StatementNode]):
         super().__init__(None)
         self.value = statements
@@ -2071,6 +2216,8 @@ class CompoundStatementNode(StatementNode):
         }
 
 class ConditionalStatementNode(StatementNode):
+    __slots__ = ("cond", "ifStmt", "elseStmt")
+
     def __init__(self, cond: ExpressionNode, ifStmt: StatementNode, elseStmt: StatementNode | None):
         super().__init__(None)
         self.cond = cond
@@ -2121,6 +2268,8 @@ class ConditionalStatementNode(StatementNode):
         }
 
 class CaseStatementNode(StatementNode):
+    __slots__ = ("index", "cases")
+
     def __init__(self, index: ExpressionNode, cases: list[StatementNode]):
         super().__init__(None)
         self.index = index
@@ -2168,6 +2317,8 @@ class CaseStatementNode(StatementNode):
         }
 
 class CaseNode(Node):
+    __slots__ = ("heading", "body")
+
     def __init__(self, heading: list[Node], body: StatementNode):
         super().__init__(None)
         self.heading = heading
@@ -2211,6 +2362,8 @@ class CaseNode(Node):
         }
 
 class WhileStatementNode(StatementNode):
+    __slots__ = ("cond", "body")
+
     def __init__(self, cond: ExpressionNode, body: StatementNode):
         super().__init__(None)
         self.cond = cond
@@ -2249,6 +2402,8 @@ class WhileStatementNode(StatementNode):
         }
 
 class RepeatStatementNode(StatementNode):
+    __slots__ = ("cond", "body")
+
     def __init__(self, cond: ExpressionNode, body: list[StatementNode]):
         super().__init__(None)
         self.cond = cond
@@ -2320,6 +2475,8 @@ class ForTraversalMode(Enum):
 #
 # NOTE: Refer to section R9.2.3.3 for statement-equivalence examples for For Statements.
 class ForStatementNode(StatementNode):
+    __slots__ = ("controlVar", "initial", "traversalMode", "final", "body")
+
     def __init__(
         self, 
         controlVar: VariableNode, initial: ExpressionNode, 
@@ -2374,6 +2531,8 @@ class ForStatementNode(StatementNode):
         }
 
 class WithStatementNode(StatementNode):
+    __slots__ = ("recVars", "body")
+
     def __init__(self, recVars: list[VariableNode], body: StatementNode):
         super().__init__(None)
         self.recVars = recVars
@@ -2423,6 +2582,8 @@ class WithStatementNode(StatementNode):
 
 # Section 3
 class BlockNode(Node):
+    __slots__ = ("labels", "consts", "types", "variables", "subfuncs", "stmt")
+
     def __init__(
         self, 
         labels: LabelDeclarationNode, 
@@ -2481,6 +2642,8 @@ class BlockNode(Node):
         return obj
 
 class ProgramNode(Node):
+    __slots__ = ("heading", "body")
+
     def __init__(self, heading: ProgramHeadingNode, body: BlockNode):
         super().__init__(None)
         self.heading = heading
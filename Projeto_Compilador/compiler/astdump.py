@@ -0,0 +1,327 @@
+import io
+import json
+import struct
+import compiler.ast as ast
+
+#
+# AST Dumps
+#
+#   This module writes the dumps of an AST (see ast.Node#toJSON) read by the AST viewer (see web/astviewer.html), either
+# as JSON (see writeJSON) or on a compact binary encoding (see writeAST).
+#   Both writers build the JSON of a single node at a time (see ast.Node#toShallowJSON), from an explicit stack, so the
+# dict tree of the whole AST is never held in memory, and trees deeper than the recursion limit can be dumped.
+#
+#   The binary dumps are read by web/js/astBinary.js, and can be loaded back with loadAST. A dump starts with the
+# FORMAT_MAGIC bytes and the FORMAT_VERSION byte, followed by a single value, encoded as a tag byte and it's payload:
+#
+#   - TAG_NULL, TAG_FALSE, TAG_TRUE:    No payload.
+#   - TAG_INT:                          A zigzag-encoded varint.
+#   - TAG_FLOAT:                        A little-endian IEEE 754 double.
+#   - TAG_STRING:                       A varint byte length and the UTF-8 bytes of a string, which is assigned the next
+#                                       string id.
+#   - TAG_STRING_REF:                   A varint string id, standing for a string already written.
+#   - TAG_ARRAY:                        A varint item count, followed by the items.
+#   - TAG_OBJECT:                       A varint entry count, followed by each key (as a string value) and value.
+#
+#   Strings, including object keys, are interned as they are written, so the node types and field names are only
+# written once.
+#
+
+FORMAT_MAGIC = b"PASB"
+FORMAT_VERSION = 1
+
+TAG_NULL       = 0
+TAG_FALSE      = 1
+TAG_TRUE       = 2
+TAG_INT        = 3
+TAG_FLOAT      = 4
+TAG_STRING     = 5
+TAG_STRING_REF = 6
+TAG_ARRAY      = 7
+TAG_OBJECT     = 8
+
+_FLOAT = struct.Struct("<d")
+_FLUSH_SIZE = 1 << 16
+_FLUSH_CHUNKS = 1 << 13
+
+#region ------- JSON Writer -------
+_encodeString = json.encoder.encode_basestring
+
+def _encodeFloat(v: float) -> str:
+    # As the json module does.
+    if (v != v): return "NaN"
+    elif (v == float("inf")): return "Infinity"
+    elif (v == float("-inf")): return "-Infinity"
+    return float.__repr__(v)
+
+class JSONWriter:
+    """
+    Writes JSON AST dumps to a text stream, in chunks. The output is identical to the one of Node#toJSONString.
+    """
+    def __init__(self, stream):
+        self.stream = stream
+        self._chunks = []
+
+    def write(self, root):
+        """
+            Writes a dump of a given node, or JSON value.
+        """
+        chunks = self._chunks
+
+        # Containers are written depth-first from an explicit stack of iterators over their items (see ASTWriter).
+        stack = []
+        it = iter((root,))
+        isDict = False
+        first = True
+        while True:
+            for v in it:
+                if (not first): chunks.append(", ")
+                first = False
+                if (isDict):
+                    (k, v) = v
+                    chunks.append(_encodeString(k))
+                    chunks.append(": ")
+
+                t = type(v)
+                if (t is ast.DeferredJSON):
+                    v = v.node.toShallowJSON()
+                    t = type(v)
+                elif (isinstance(v, ast.Node)):
+                    v = v.toShallowJSON()
+                    t = type(v)
+
+                if (t is str): chunks.append(_encodeString(v))
+                elif (t is int): chunks.append(int.__repr__(v))
+                elif (v is None): chunks.append("null")
+                elif (t is bool): chunks.append("true" if v else "false")
+                elif (t is float): chunks.append(_encodeFloat(v))
+                elif (t is dict or t is list or t is tuple):
+                    if (len(v) == 0):
+                        chunks.append("{}" if (t is dict) else "[]")
+                        continue
+
+                    chunks.append("{" if (t is dict) else "[")
+                    stack.append((it, isDict))
+                    isDict = t is dict
+                    it = iter(v.items()) if isDict else iter(v)
+                    first = True
+                    break
+                else:
+                    raise TypeError(f"Cannot dump a value of type '{t.__name__}'.")
+            else:
+                # The container was exhausted.
+                if (len(stack) == 0): break
+                chunks.append("}" if isDict else "]")
+                (it, isDict) = stack.pop()
+
+            if (len(chunks) >= _FLUSH_CHUNKS): self.flush()
+
+        self.flush()
+
+    def flush(self):
+        self.stream.write("".join(self._chunks))
+        self._chunks.clear()
+
+def writeJSON(root: ast.Node, stream):
+    """
+        Writes a JSON dump of the AST rooted at a given node to a text stream.
+    """
+    JSONWriter(stream).write(root)
+#endregion ------- JSON Writer -------
+
+#region ------- Binary Writer -------
+class ASTWriter:
+    """
+    Writes binary AST dumps to a binary stream, in chunks.
+    """
+    def __init__(self, stream):
+        self.stream = stream
+        self._buf = bytearray()
+        self._strings = {}
+
+    def _varint(self, v: int):
+        buf = self._buf
+        while (v >= 0x80):
+            buf.append((v & 0x7F) | 0x80)
+            v >>= 7
+        buf.append(v)
+
+    def _string(self, v: str):
+        sid = self._strings.get(v)
+        if (sid != None):
+            self._buf.append(TAG_STRING_REF)
+            self._varint(sid)
+        else:
+            self._strings[v] = len(self._strings)
+            data = v.encode("utf-8")
+            self._buf.append(TAG_STRING)
+            self._varint(len(data))
+            self._buf += data
+
+    def write(self, root):
+        """
+            Writes a dump of a given node, or JSON value, preceded by the format header.
+        """
+        buf = self._buf
+        strings = self._strings
+        varint = self._varint
+        string = self._string
+        buf += FORMAT_MAGIC
+        buf.append(FORMAT_VERSION)
+
+        # Containers are written depth-first from an explicit stack of iterators over their items, as trees may be
+        #   deeper than the recursion limit. The common cases (small varints, interned strings) are written inline.
+        stack = []
+        it = iter((root,))
+        isDict = False
+        while True:
+            for v in it:
+                if (isDict):
+                    (k, v) = v
+                    sid = strings.get(k)
+                    if (sid != None and sid < 0x80): buf += bytes((TAG_STRING_REF, sid))
+                    else: string(k)
+
+                t = type(v)
+                if (t is ast.DeferredJSON):
+                    v = v.node.toShallowJSON()
+                    t = type(v)
+                elif (isinstance(v, ast.Node)):
+                    v = v.toShallowJSON()
+                    t = type(v)
+
+                if (t is str):
+                    sid = strings.get(v)
+                    if (sid != None and sid < 0x80): buf += bytes((TAG_STRING_REF, sid))
+                    else: string(v)
+                elif (t is int):
+                    z = (v << 1) if (v >= 0) else ((-v << 1) - 1)
+                    if (z < 0x80): buf += bytes((TAG_INT, z))
+                    else:
+                        buf.append(TAG_INT)
+                        varint(z)
+                elif (v is None): buf.append(TAG_NULL)
+                elif (t is bool): buf.append(TAG_TRUE if v else TAG_FALSE)
+                elif (t is float):
+                    buf.append(TAG_FLOAT)
+                    buf += _FLOAT.pack(v)
+                elif (t is dict or t is list or t is tuple):
+                    if (len(v) == 0):
+                        buf += bytes((TAG_OBJECT if (t is dict) else TAG_ARRAY, 0))
+                        continue
+
+                    buf.append(TAG_OBJECT if (t is dict) else TAG_ARRAY)
+                    varint(len(v))
+                    stack.append((it, isDict))
+                    isDict = t is dict
+                    it = iter(v.items()) if isDict else iter(v)
+                    break
+                else:
+                    raise TypeError(f"Cannot dump a value of type '{t.__name__}'.")
+            else:
+                # The container was exhausted.
+                if (len(stack) == 0): break
+                (it, isDict) = stack.pop()
+
+            if (len(buf) >= _FLUSH_SIZE): self.flush()
+
+        self.flush()
+
+    def flush(self):
+        self.stream.write(self._buf)
+        self._buf.clear()
+
+def writeAST(root: ast.Node, stream):
+    """
+        Writes a binary dump of the AST rooted at a given node to a binary stream.
+    """
+    ASTWriter(stream).write(root)
+
+def dumpAST(root: ast.Node) -> bytes:
+    """
+        Returns a binary dump of the AST rooted at a given node.
+    """
+    out = io.BytesIO()
+    writeAST(root, out)
+    return out.getvalue()
+#endregion ------- Binary Writer -------
+
+#region ------- Loader -------
+def loadAST(data: bytes):
+    """
+        Loads a binary AST dump, returning the same JSON value as the Node#toJSON of the dumped tree.
+        Raises a ValueError if the dump is malformed.
+    """
+    if (data[:len(FORMAT_MAGIC)] != FORMAT_MAGIC): raise ValueError("Not a binary AST dump.")
+    if (data[len(FORMAT_MAGIC)] != FORMAT_VERSION): raise ValueError(f"Unsupported AST dump version {data[4]}.")
+
+    pos = len(FORMAT_MAGIC) + 1
+    strings = []
+
+    def varint() -> int:
+        nonlocal pos
+        (v, shift) = (0, 0)
+        while True:
+            b = data[pos]
+            pos += 1
+            v |= (b & 0x7F) << shift
+            if (b < 0x80): return v
+            shift += 7
+
+    # The container being filled, along with the number of values left to read on it. The entries of an object are read
+    #   as a key and a value, so it's keys are read when an even number of values is left. The root value is read into
+    #   a single item list.
+    stack = []
+    root = []
+    (cur, left, isDict, key) = (root, 1, False, None)
+    try:
+        while True:
+            while (left > 0):
+                tag = data[pos]
+                pos += 1
+
+                if (tag == TAG_STRING_REF):
+                    sid = data[pos]
+                    if (sid < 0x80):
+                        pos += 1
+                        v = strings[sid]
+                    else: v = strings[varint()]
+                elif (tag == TAG_STRING):
+                    length = varint()
+                    v = data[pos:pos + length].decode("utf-8")
+                    pos += length
+                    strings.append(v)
+                elif (tag == TAG_INT):
+                    z = varint()
+                    v = (z >> 1) if (z & 1 == 0) else -((z + 1) >> 1)
+                elif (tag == TAG_NULL): v = None
+                elif (tag == TAG_FALSE): v = False
+                elif (tag == TAG_TRUE): v = True
+                elif (tag == TAG_FLOAT):
+                    (v,) = _FLOAT.unpack_from(data, pos)
+                    pos += _FLOAT.size
+                elif (tag == TAG_ARRAY or tag == TAG_OBJECT):
+                    v = [] if (tag == TAG_ARRAY) else {}
+                    count = varint()
+                    if (isDict): cur[key] = v
+                    else: cur.append(v)
+                    left -= 1
+
+                    if (count > 0):
+                        stack.append((cur, left, isDict, key))
+                        (cur, isDict) = (v, tag == TAG_OBJECT)
+                        left = (count * 2) if isDict else count
+                    continue
+                else:
+                    raise ValueError(f"Unknown tag {tag} at offset {pos - 1}.")
+
+                if (not isDict): cur.append(v)
+                elif (left & 1 == 0): key = v
+                else: cur[key] = v
+                left -= 1
+
+            if (len(stack) == 0): return root[0]
+            (cur, left, isDict, key) = stack.pop()
+    except IndexError:
+        raise ValueError("Truncated AST dump.")
+#endregion ------- Loader -------
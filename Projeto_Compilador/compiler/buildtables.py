@@ -0,0 +1,61 @@
+import os
+import sys
+from ply import yacc
+import compiler.synanaler as synanaler
+
+#
+# Parsing Tables Builder
+#
+#   This module generates the LALR tables of the syntatic analyser (see synanaler.py) and writes them to lrtables.py,
+# which is shipped with the package and loaded on import instead of generating the tables again. It should be run
+# whenever the grammar changes:
+#
+#     python3 -m compiler.buildtables [output path]
+#
+#   The tables are written as nested tuples, which are stored as constants on the compiled module, and keyed by the
+# signature of the grammar (see synanaler.grammarSignature), in order for outdated tables to be detected on import.
+#
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "lrtables.py")
+
+def generateTables() -> yacc.LRTable:
+    """
+        Generates the LALR tables of the syntatic analyser grammar, in memory.
+    """
+    lr = yacc.yacc(module=synanaler, debug=False, write_tables=False)
+    return lr
+
+def writeTables(path: str = DEFAULT_PATH):
+    """
+        Generates the LALR tables of the syntatic analyser grammar and writes them to a module at the given path.
+    """
+    parser = generateTables()
+
+    def writeRows(f, name, table):
+        f.write(f"{name} = (\n")
+        for state in sorted(table):
+            row = tuple(sorted(table[state].items()))
+            f.write(f"    ({state!r}, {row!r}),\n")
+        f.write(")\n\n")
+
+    with open(path, "w") as f:
+        f.write("# This file is automatically generated by compiler/buildtables.py. Do not edit.\n")
+        f.write("# fmt: off\n\n")
+        f.write(f"TABLES_VERSION = {synanaler.TABLES_VERSION!r}\n")
+        f.write(f"GRAMMAR_HASH = {synanaler.grammarSignature()!r}\n")
+        f.write(f"METHOD = 'LALR'\n\n")
+
+        writeRows(f, "ACTION", parser.action)
+        writeRows(f, "GOTO", parser.goto)
+
+        f.write("PRODUCTIONS = (\n")
+        for p in parser.productions:
+            # Only the file name is kept, in order for the tables not to depend on where the package is installed.
+            file = os.path.basename(p.file) if p.file else p.file
+            f.write(f"    ({str(p)!r}, {p.name!r}, {p.len!r}, {p.func!r}, {file!r}, {p.line!r}),\n")
+        f.write(")\n")
+
+    print(f"Wrote {len(parser.action)} states and {len(parser.productions)} productions to '{path}'.")
+
+if __name__ == "__main__":
+    writeTables(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH)
@@ -0,0 +1,314 @@
+import os
+import json
+import struct
+import hashlib
+import tempfile
+import functools
+from compiler.diag import Diagnostic, DiagnosticSource, DiagnosticType, DiagnosticKind
+
+#
+# Compilation Cache
+#
+#   This module defines an on-disk cache of compilation results, in order for unchanged sources not to be compiled
+# again. Results are cached per stage, each keyed by a hash over the source text and the version of the compiler modules
+# the stage depends on:
+#
+#   - STAGE_SYNTAX:   The outcome of the lexical and syntatic analysis: their diagnostics and the AST, encoded as a flat
+#                     AST (see flatast.py). Depends on the lexer, parser and AST modules.
+#   - STAGE_CODE:     The outcome of the semantic analysis and code generation: the semantic and code generator
+#                     diagnostics and the generated code. Depends on every compiler module.
+#
+#   The version of the compiler is a hash over the sources of the modules (see moduleVersion), so any change to the
+# compiler invalidates the stages that depend on the changed modules, e.g. a change to the code generator still reuses
+# the cached AST, skipping the lexical and syntatic analysis.
+#   The token stream is not cached, as nothing past the parser reads it: the AST stands for it.
+#
+#   Each stage result is stored on it's own file, written atomically, so the cache may be shared by concurrent
+# compilations (see tests/test.py batch). The cache is bounded in size, and the least recently used files are evicted
+# once it grows past that size.
+#
+
+STAGE_SYNTAX = "syn"
+STAGE_CODE = "gen"
+
+DEFAULT_ROOT = ".pascache"
+DEFAULT_MAX_BYTES = 64 << 20
+
+FORMAT_MAGIC = b"PCACHE"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<HI")
+_SUFFIX = ".pcc"
+
+_COMPILER_ROOT = os.path.dirname(os.path.realpath(__file__))
+_SYNTAX_MODULES = ("lexer.py", "synanaler.py", "lrtables.py", "ast.py", "diag.py", "flatast.py", "cache.py")
+
+#region ------- Versions -------
+@functools.cache
+def moduleVersion(names: tuple[str] = None) -> str:
+    """
+        Computes the version of the given compiler modules (paths relative to the compiler package), as a hash over
+        their sources. If no modules are given, every module of the compiler package is hashed.
+    """
+    if (names == None):
+        names = sorted(
+            os.path.relpath(os.path.join(d, f), _COMPILER_ROOT)
+            for (d, _, files) in os.walk(_COMPILER_ROOT) for f in files if f.endswith((".py", ".pas"))
+        )
+
+    h = hashlib.sha256(f"{FORMAT_VERSION}:".encode())
+    for name in names:
+        h.update(name.encode() + b"\0")
+        with open(os.path.join(_COMPILER_ROOT, name), "rb") as f: h.update(f.read())
+        h.update(b"\0")
+
+    return h.hexdigest()
+
+def stageVersion(stage: str) -> str:
+    """
+        Gets the version of the compiler modules a given stage depends on.
+    """
+    return moduleVersion(_SYNTAX_MODULES) if (stage == STAGE_SYNTAX) else moduleVersion()
+#endregion ------- Versions -------
+
+#region ------- Diagnostics -------
+def encodeDiagnostic(d: Diagnostic) -> list:
+    # The arguments are only used to format the message, so those which are not JSON values are stored as their text.
+    args = { k: v if (v == None or isinstance(v, (str, int, float))) else str(v) for (k, v) in d.args.items() }
+    return [d.source.name, d.type.name, d.kind.name, list(d.startPos), list(d.endPos), args]
+
+def decodeDiagnostic(v: list) -> Diagnostic:
+    (source, dtype, kind, start, end, args) = v
+    return Diagnostic(
+        DiagnosticSource[source], DiagnosticType[dtype], DiagnosticKind[kind], tuple(start), tuple(end), args
+    )
+#endregion ------- Diagnostics -------
+
+class CacheEntry:
+    """
+    Represents the cached result of a stage: a status, the diagnostics of each phase of the stage, and a binary payload
+    (the flat AST or the generated code).
+    """
+    def __init__(self, status: str, diagnostics: dict[str, list[Diagnostic]] = None, payload: bytes = b"", **extra):
+        self.status = status
+        self.diagnostics = diagnostics or {}
+        self.payload = payload
+        self.extra = extra
+
+    def toBytes(self) -> bytes:
+        meta = json.dumps({
+            "status": self.status,
+            "diagnostics": {
+                phase: [encodeDiagnostic(d) for d in diags] for (phase, diags) in self.diagnostics.items()
+            },
+            "extra": self.extra
+        }, ensure_ascii=False).encode("utf-8")
+
+        return b"".join((FORMAT_MAGIC, _HEADER.pack(FORMAT_VERSION, len(meta)), meta, self.payload))
+
+    @classmethod
+    def fromBytes(cls, data: bytes) -> "CacheEntry":
+        """
+            Deserializes a cache entry written by CacheEntry#toBytes.
+            Raises a ValueError if the entry is malformed.
+        """
+        if (data[:len(FORMAT_MAGIC)] != FORMAT_MAGIC): raise ValueError("Not a cache entry.")
+        offset = len(FORMAT_MAGIC)
+        (version, metaLen) = _HEADER.unpack_from(data, offset)
+        if (version != FORMAT_VERSION): raise ValueError(f"Unsupported cache entry version {version}.")
+
+        offset += _HEADER.size
+        try:
+            meta = json.loads(data[offset:offset + metaLen].decode("utf-8"))
+            diagnostics = {
+                phase: [decodeDiagnostic(d) for d in diags] for (phase, diags) in meta["diagnostics"].items()
+            }
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Malformed cache entry: {e!r}")
+
+        return cls(meta["status"], diagnostics, data[offset + metaLen:], **meta["extra"])
+
+class CompilationCache:
+    """
+    Represents an on-disk cache of compilation results, on a given directory (see the module description).
+    """
+    def __init__(self, root: str = DEFAULT_ROOT, maxBytes: int = DEFAULT_MAX_BYTES):
+        self.root = root
+        self.maxBytes = maxBytes
+
+        self.hits = 0
+        self.misses = 0
+        self._size = None # The size of the cache, as of the last scan plus the entries written since.
+
+    def key(self, stage: str, source: str) -> str:
+        """
+            Computes the key of the result of a given stage for a given source text.
+        """
+        h = hashlib.sha256(f"{stage}:{stageVersion(stage)}:".encode())
+        h.update(source.encode("utf-8", "surrogatepass"))
+        return h.hexdigest()
+
+    def _path(self, stage: str, source: str) -> str:
+        return os.path.join(self.root, f"{stage}-{self.key(stage, source)}{_SUFFIX}")
+
+    def get(self, stage: str, source: str) -> CacheEntry:
+        """
+            Gets the cached result of a given stage for a given source text, or None if there is none.
+        """
+        path = self._path(stage, source)
+        try:
+            with open(path, "rb") as f: entry = CacheEntry.fromBytes(f.read())
+            # The modification time tracks the last use of an entry, for eviction.
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry
+
+    def put(self, stage: str, source: str, entry: CacheEntry):
+        """
+            Caches the result of a given stage for a given source text, evicting the least recently used results if the
+            cache grows past it's maximum size.
+        """
+        os.makedirs(self.root, exist_ok = True)
+
+        # Written to a temporary file first, in order for concurrent readers to never see a partial entry.
+        data = entry.toBytes()
+        (fd, tmp) = tempfile.mkstemp(dir = self.root, suffix = ".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f: f.write(data)
+            os.replace(tmp, self._path(stage, source))
+        except BaseException:
+            if (os.path.exists(tmp)): os.remove(tmp)
+            raise
+
+        # The cache is only scanned once it may have grown past it's maximum size, not on every write. Entries written
+        #   by concurrent compilations are only accounted for on the next scan.
+        if (self._size != None): self._size += len(data)
+        if (self._size == None or self._size > self.maxBytes): self.evict()
+
+    def evict(self):
+        """
+            Removes the least recently used entries until the cache fits it's maximum size.
+        """
+        files = []
+        size = 0
+        with os.scandir(self.root) as it:
+            for e in it:
+                if (not e.name.endswith(_SUFFIX)): continue
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue
+                files.append((st.st_mtime_ns, st.st_size, e.path))
+                size += st.st_size
+
+        files.sort()
+        for (_, fsize, path) in files:
+            if (size <= self.maxBytes): break
+            try:
+                os.remove(path)
+            except OSError:
+                pass # Already evicted by a concurrent compilation.
+            size -= fsize
+
+        self._size = size
+
+    def clear(self):
+        """
+            Removes every entry of the cache.
+        """
+        if (not os.path.isdir(self.root)): return
+        for name in os.listdir(self.root):
+            if (name.endswith(_SUFFIX)): os.remove(os.path.join(self.root, name))
+        self._size = 0
+
+#region ------- Compilation -------
+class CachedResult:
+    """
+    Represents the outcome of a compilation run through the cache (see compileCached).
+    The status is the phase that errored out ("SYNTAX", "SEMANTIC" or "CODEGEN"), or "OK" if the code was generated.
+    As the parser recovers from lexical errors, those do not stop the compilation, and should be checked for by the
+    caller.
+    """
+    def __init__(self):
+        self.status = "OK"
+        self.lexerDiagnostics = []
+        self.parserDiagnostics = []
+        self.semanticDiagnostics = []
+        self.codegenDiagnostics = []
+        self.semVerdict = True
+        self.code = None
+        self.cached = [] # The stages read from the cache.
+
+        self._ast = None
+        self._flatAST = None
+
+    def getAST(self):
+        """
+            Gets the AST of the compiled source, decoding it from the cache if the parser was skipped, or None if the
+            syntatic analysis errored out with a critical error.
+        """
+        if (self._ast == None and self._flatAST != None):
+            from compiler.flatast import FlatAST
+            self._ast = FlatAST.fromBytes(self._flatAST).node()
+
+        return self._ast
+
+def compileCached(source: str, cache: CompilationCache, debug = False) -> CachedResult:
+    """
+        Compiles a source text on it's own compilation (see compilation.py), skipping every stage whose result is
+        already cached for the source text, and caching the result of every stage that was run.
+    """
+    from compiler.compilation import Compilation
+    from compiler.flatast import FlatAST
+    res = CachedResult()
+    comp = Compilation(debug)
+
+    # Lexical and Syntatic Analysis
+    entry = cache.get(STAGE_SYNTAX, source)
+    if (entry != None):
+        res.cached.append(STAGE_SYNTAX)
+        res._flatAST = entry.payload or None
+    else:
+        pout = comp.parse(source)
+        res._ast = pout
+        payload = FlatAST.fromNode(pout).toBytes() if (pout != None) else b""
+        entry = CacheEntry(
+            "SYNTAX" if (pout == None or len(comp.getParserDiagnostics()) != 0) else "OK",
+            { "lexer": comp.getLexerDiagnostics(), "parser": comp.getParserDiagnostics() },
+            payload
+        )
+        cache.put(STAGE_SYNTAX, source, entry)
+
+    res.status = entry.status
+    res.lexerDiagnostics = entry.diagnostics["lexer"]
+    res.parserDiagnostics = entry.diagnostics["parser"]
+    if (res.status != "OK"): return res
+
+    # Semantic Analysis and Code Generation
+    entry = cache.get(STAGE_CODE, source)
+    if (entry != None): res.cached.append(STAGE_CODE)
+    else:
+        pout = res.getAST()
+        semVerdict = comp.analyze(pout)
+        semDiags = comp.getSemanticDiagnostics()
+        if (len(semDiags) != 0): entry = CacheEntry("SEMANTIC", { "semantic": semDiags }, verdict = semVerdict)
+        else:
+            code = comp.generate(pout)
+            if (code == None):
+                entry = CacheEntry(
+                    "CODEGEN", { "semantic": [], "codegen": comp.getCodegenDiagnostics() }, verdict = semVerdict
+                )
+            else: entry = CacheEntry("OK", { "semantic": [] }, code.encode("utf-8"), verdict = semVerdict)
+        cache.put(STAGE_CODE, source, entry)
+
+    res.status = entry.status
+    res.semanticDiagnostics = entry.diagnostics["semantic"]
+    res.codegenDiagnostics = entry.diagnostics.get("codegen", [])
+    res.semVerdict = entry.extra["verdict"]
+    if (res.status == "OK"): res.code = entry.payload.decode("utf-8")
+
+    return res
+#endregion ------- Compilation -------
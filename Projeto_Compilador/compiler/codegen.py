@@ -1,24 +1,47 @@
 from __future__ import annotations
 from enum import Enum, auto
+from array import array
 import os
 
 import compiler.ast as ast
 from compiler.sastate import *
 from compiler.symbols import *
 from compiler.runtime.builtin import *
+from compiler.compilation import getCompilation
+from compiler.diag import Diagnostic, DiagnosticSource, DiagnosticType, DiagnosticKind
 
-_LABEL_ID = -1
+# Labels and activatables are held by the current compilation (see compilation.py).
 def getLabelId():
-    global _LABEL_ID
-    _LABEL_ID = _LABEL_ID + 1
-    return _LABEL_ID
+    comp = getCompilation()
+    comp.labelId = comp.labelId + 1
+    return comp.labelId
 
-_ACTIVATABLE_MAP = {}
 def addActivatable(name: str, bld: "CodeTree"):
-    _ACTIVATABLE_MAP[name] = bld
-
-def getActivatable(name: str) -> "CodeTree":
-    return _ACTIVATABLE_MAP[name]
+    getCompilation().activatables[name] = bld
+
+def getActivatable(name: str, n: ast.Node = None) -> "CodeTree":
+    # The semantic analyser does not check nested statements, so calls to undeclared activatables may get here.
+    act = getCompilation().activatables.get(name)
+    if (act == None):
+        diag = Diagnostic(
+            DiagnosticSource.CODEGEN, DiagnosticType.UNDECLARED_ACTIVATABLE, DiagnosticKind.ERROR,
+            *((n.pos.getStart(), n.pos.getEnd()) if (n != None) else ()), { "value": name }
+        )
+        print(
+            f"\x1b[31mCODEGEN ERROR{f' {n.pos.fullString}' if (n != None) else ''}:\x1b[0m" \
+            f" {diag.toString(None, emitMark = False, emitPos = False)}"
+        )
+        raise CodegenError(diag)
+    return act
+
+class CodegenError(Exception):
+    """
+    Raised when the code of a program cannot be generated. Holds the diagnostic of the error, which the compilation
+    reports (see Compilation.generate).
+    """
+    def __init__(self, diagnostic: Diagnostic):
+        super().__init__(diagnostic.toString(None, emitMark = False))
+        self.diagnostic = diagnostic
 
 class CodeID(Enum):
     # Integer Arithmetic
@@ -124,6 +147,9 @@ class CodeID(Enum):
 # Stack is described through a sequence of tuples (CodeID, [args])
 CodePoint = (CodeID, list)
 
+# Instructions without operands are never modified, so a single (immutable) code point is shared by every occurrence.
+_NULLARY: dict[CodeID, CodePoint] = { c: (c, ()) for c in CodeID }
+
 class CodeTree:
     def __init__(self):
         self._labelId = getLabelId()
@@ -132,9 +158,18 @@ class CodeTree:
         self._varMap: dict[str, int] = {}
         self._varId = 0
 
+        # The PUSHN allocating the whole frame (see reserveFrame), and the slots of the temporaries no longer live.
+        self._frame: CodePoint = None
+        self._freeSlots: list[int] = []
+        # The temporaries holding the loop invariants being hoisted, by the id of their expression.
+        self._hoisted: dict[int, str] = {}
+
         self._argMap: dict[str, int] = {}
         self._argId = 0
 
+        # The entry labels of the user activatables called from this tree, by name (see incremental.py).
+        self._calls: dict[int, str] = {}
+
         self._builtin = None
 
     @classmethod
@@ -166,10 +201,10 @@ class CodeTree:
         self.stack.append((p, args))
 
     def _mono(self, id: CodeID):
-        self.stack.append((id, []))
+        self.stack.append(_NULLARY[id])
 
     def nop(self):
-        self.stack.append((CodeID.NOP, []))
+        self.stack.append(_NULLARY[CodeID.NOP])
     
     def int(self, i: int):
         self.stack.append((CodeID.PUSHI, [i]))
@@ -184,13 +219,44 @@ class CodeTree:
                 self._argId = self._argId - 1
         return self
 
-    # Optimally, should only be used at the start.
-    def allocVariable(self, name: str, size: int = 1):
-        self.stack.append((CodeID.PUSHN, [size]))
-        self._varMap[name] = self._varId
+    #region ------- Frame Layout -------
+    # The frame (variables and temporaries) is allocated by a single PUSHN, where the frame is reserved (the entry of
+    #   the tree), which is sized as slots are allocated. Temporaries are given fixed slots, which are reused once
+    #   they are freed, so code run repeatedly (e.g. nested loops) never grows the frame.
+    def reserveFrame(self):
+        self._frame = (CodeID.PUSHN, [0])
+        self.stack.append(self._frame)
+        return self
+
+    def _allocSlots(self, size: int) -> int:
+        if (self._frame == None): self.reserveFrame()
+        slot = self._varId
         self._varId = self._varId + size
+        self._frame[1][0] += size
+        return slot
+
+    def allocVariable(self, name: str, size: int = 1):
+        self._varMap[name] = self._allocSlots(size)
         return self
 
+    def allocTemporary(self, name: str):
+        self._varMap[name] = self._freeSlots.pop() if (len(self._freeSlots) != 0) else self._allocSlots(1)
+        return self
+
+    def freeTemporary(self, name: str):
+        self._freeSlots.append(self._varMap.pop(name))
+        return self
+
+    def layoutFrame(self):
+        """
+            Finishes the layout of the frame, once the whole tree was generated. An empty frame is not allocated.
+        """
+        if (self._frame != None and self._frame[1][0] == 0):
+            del self.stack[next(i for (i, p) in enumerate(self.stack) if p is self._frame)]
+            self._frame = None
+        return self
+    #endregion ------- Frame Layout -------
+
     def setVariable(self, name: str):
         self.stack.append((CodeID.STOREL, [self._varMap[name]]))
 
@@ -208,11 +274,11 @@ class CodeTree:
         # self.stack.append((CodeID.ADD, []))
         # self.stack.append((CodeID.STOREN, []))
 
-        self.stack.append((CodeID.PUSHFP, []))
+        self._mono(CodeID.PUSHFP)
         self.stack.append((CodeID.PUSHI, [self._varMap[name]]))
-        self.stack.append((CodeID.PUSHSP, []))
+        self._mono(CodeID.PUSHSP)
         self.stack.append((CodeID.LOAD, [-2]))
-        self.stack.append((CodeID.STOREN, []))
+        self._mono(CodeID.STOREN)
         self.stack.append((CodeID.POP, [1]))
 
     # Dynamically gets the value of a variable. Requires that the desired offset be known beforehand.
@@ -232,8 +298,8 @@ class CodeTree:
         self.stack.append((CodeID.PUSHI, [ind]))
         self._mono(CodeID.ADD)
 
-        self.stack.append((CodeID.PUSHFP, []))
-        self.stack.append((CodeID.SWAP, []))
+        self._mono(CodeID.PUSHFP)
+        self._mono(CodeID.SWAP)
         self.stack.append((CodeID.LOAD, [0]))
 
         return self
@@ -242,12 +308,13 @@ class CodeTree:
         self.stack.append((CodeID._LABEL, [label]))
 
     # Here, we assume the parameters were already passed in the correct order.
-    def call(self, name: str, typeHints = []):
-        act = getActivatable(name)
+    def call(self, name: str, typeHints = [], n: ast.Node = None):
+        act = getActivatable(name, n)
         if (act._builtin): 
             if (act._builtin(self, typeHints)):
                 self._mono(CodeID.CALL)
         else: 
+            self._calls[act._labelId] = name
             self.stack.append((CodeID.PUSHA, [act._labelId]))
             self._mono(CodeID.CALL)
 
@@ -257,11 +324,80 @@ class CodeTree:
     def jz(self, label: int):
         self.stack.append((CodeID.JZ, [label]))
 
+#region ------- Code Buffers -------
+_CODE_IDS: list[CodeID] = list(CodeID)
+_CODE_INDEX = { c: i for (i, c) in enumerate(_CODE_IDS) }
+
+# Operands held inline, as they are, or as an index on the constant pool of the buffer.
+_OPERAND_NONE = 0
+_OPERAND_INLINE = 1
+_OPERAND_POOLED = 2
+
+class CodeBuffer:
+    """
+    Represents the stack of a code tree compactly, for it to be kept around (e.g. by incremental compilation, see
+    incremental.py): the opcode, operand kind and operand of each instruction are held by arrays, instead of a tuple and
+    list per instruction. Integer operands are stored inline, while any other operand (strings, reals and subtrees) is
+    stored on a constant pool, each (equal) string or real once. Instructions have at most one operand.
+    """
+    def __init__(self):
+        self.opcodes = array("B")
+        self.kinds = array("B")
+        self.operands = array("q")
+        self.pool: list = []
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    @classmethod
+    def fromStack(cls, stack: list[CodePoint]) -> "CodeBuffer":
+        res = cls()
+        (opcodes, kinds, operands, pool) = (res.opcodes, res.kinds, res.operands, res.pool)
+        interned: dict = {}
+        for (p, args) in stack:
+            opcodes.append(_CODE_INDEX[p])
+            if (len(args) == 0):
+                kinds.append(_OPERAND_NONE)
+                operands.append(0)
+                continue
+            if (len(args) > 1): raise ValueError(f"{p.name} takes more than one operand, and cannot be buffered.")
+
+            v = args[0]
+            if (type(v) is int and -2 ** 63 <= v < 2 ** 63):
+                kinds.append(_OPERAND_INLINE)
+                operands.append(v)
+                continue
+
+            # Strings and reals are interned by value (reals by representation, as 0.0 == -0.0), anything else is not.
+            key = (type(v), repr(v)) if isinstance(v, (str, float)) else (type(v), id(v))
+            i = interned.get(key)
+            if (i == None):
+                i = interned[key] = len(pool)
+                pool.append(v)
+            kinds.append(_OPERAND_POOLED)
+            operands.append(i)
+
+        return res
+
+    def __iter__(self):
+        """
+            Iterates over the instructions of the buffer, as new code points.
+        """
+        pool = self.pool
+        for (op, kind, v) in zip(self.opcodes, self.kinds, self.operands):
+            p = _CODE_IDS[op]
+            if (kind == _OPERAND_NONE): yield _NULLARY[p]
+            else: yield (p, [v if (kind == _OPERAND_INLINE) else pool[v]])
+
+    def toStack(self) -> list[CodePoint]:
+        return list(self)
+#endregion ------- Code Buffers -------
+
 def variableAccess(bld: CodeTree, n: ast.VariableNode, setMode = False, _apply = True):
     match (n.kind):
         case ast.VariableKind.VARIABLE_ENTIRE:
             # print("MOTHERFUCKING VARIABLE:", n)
-            # _nv = SA_STATE["scopes"][0].getSymbolByNameAndKind(n.value)
+            # _nv = getState()["scopes"][0].getSymbolByNameAndKind(n.value)
             # nv = _nv if _nv else n.value
 
             if (_apply):
@@ -328,6 +464,12 @@ _OP_MAP_COMMON = {
 }
 def emitExpression(bld: CodeTree, n: ast.ExpressionLikeNode):
     # print("FUCKING EXPRESSION:", bld, n)
+    # Loop invariants are read from the temporary they were evaluated onto (see hoistInvariants).
+    hoisted = bld._hoisted.get(id(n))
+    if (hoisted != None):
+        bld.getVariable(hoisted)
+        return
+
     if (n.ist(ast.ExpressionNode)):
         if (n.lhs != None and n.rhs != None):
             emitExpression(bld, n.lhs)
@@ -356,8 +498,8 @@ def emitExpression(bld: CodeTree, n: ast.ExpressionLikeNode):
             emitExpression(bld, n.lhs)
         elif (n.rhs != None):
             bld._inst(CodeID.PUSHI, [0])
-            bld._mono(_OP_MAP_INT[n.op.value]) # SHOULD only be the unary plus and unary minus operators.
             emitExpression(bld, n.rhs)
+            bld._mono(_OP_MAP_INT[n.op.value]) # SHOULD only be the unary plus and unary minus operators.
     elif (n.ist(ast.ElementDescriptionNode)):
         pass # TODO: Set initialization
     elif (n.ist(ast.SetConstructorNode)):
@@ -366,7 +508,7 @@ def emitExpression(bld: CodeTree, n: ast.ExpressionLikeNode):
         for param in n.params.value:
             emitExpression(bld, param)
 
-        bld.call(n.key.value, n.params.value)
+        bld.call(n.key.value, n.params.value, n.key)
     else:
         if (n.value.ist(ast.UnsignedConstantNode)):
             if (n.value.value.ist(ast.NumberNode)):
@@ -379,10 +521,12 @@ def emitExpression(bld: CodeTree, n: ast.ExpressionLikeNode):
             else:
                 pass # TODO: SpecialSymbolNode
         elif (n.value.ist(ast.VariableNode)):
-            _nv = SA_STATE["scopes"][0].getSymbolByNameAndKind(n.value.value)
-            if (_nv):
-                if (isinstance(_nv.value, EnumeratedTypeSymbolValue)):
-                    bld._inst(CodeID.PUSHI, [_nv.value._ord])
+            # The symbol bound by the semantic analyser (see SymbolTable.resolveBinding). Nested statements are not
+            #   analysed, so their nodes are unbound, and may only name builtins directly.
+            _nv = n.value.symbol
+            if (_nv == None): _nv = getState()["scopes"][0].getSymbolByNameAndKind(n.value.value)
+            if (_nv != None and isinstance(_nv.value, EnumeratedTypeSymbolValue)):
+                bld._inst(CodeID.PUSHI, [_nv.value._ord])
             else:
                 variableAccess(bld, n.value)
         else:
@@ -398,7 +542,7 @@ def emitStatement(bld: CodeTree, n: ast.StatementNode):
         for param in n.params.value:
             emitExpression(bld, param)
 
-        bld.call(n.key.value, n.params.value)
+        bld.call(n.key.value, n.params.value, n.key)
     elif (n.ist(ast.GotoStatementNode)):
         bld.goto(n.label.value)
     elif (n.ist(ast.CompoundStatementNode)):
@@ -426,68 +570,294 @@ def emitStatement(bld: CodeTree, n: ast.StatementNode):
     elif (n.ist(ast.CaseStatementNode)):
         pass # TODO: Not enough time
     elif (n.ist(ast.WhileStatementNode)):
-        if (n._label != None): l = n._label.value
-        else:
-            l = getLabelId()
-            bld.markLabel(l)
-
-        el = getLabelId()
+        emitWhile(bld, n)
+    elif (n.ist(ast.RepeatStatementNode)):
+        emitRepeat(bld, n)
+    elif (n.ist(ast.ForStatementNode)):
+        emitFor(bld, n)
+
+#region ------- Loop Lowering -------
+# Loops are laid out with their test at the bottom, jumping back to the top of the body while the loop goes on, and are
+#   guarded once on entry (except repeat, whose body always runs once). The final value of a for loop is evaluated
+#   once, before the guard. Loop invariants (pure expressions over variables the loop never assigns, see
+#   hoistInvariants) are evaluated once, ahead of the body, onto temporaries which the loop reads instead.
+
+# Builtin functions computing their result from their arguments alone.
+_PURE_FUNCTIONS = { "Length", "Atoi" }
+# Builtin procedures which assign none of their arguments, and those assigning every (variable) argument.
+_PURE_PROCEDURES = { "Write", "WriteLn" }
+_READ_PROCEDURES = { "ReadLn" }
+
+# Integer comparisons, by the comparison which holds exactly when they do not. Real comparisons do not hold on NaN, so
+#   those are negated instead.
+_COMPLEMENTS = {
+    CodeID.INF: CodeID.SUPEQ, CodeID.SUPEQ: CodeID.INF, CodeID.INFEQ: CodeID.SUP, CodeID.SUP: CodeID.INFEQ
+}
 
-        emitExpression(bld, n.cond)
-        bld._inst(CodeID.JZ, [el])
-        emitStatement(bld, n.body)
+def _isBuiltin(name: str, builtins: set[str]) -> bool:
+    act = getCompilation().activatables.get(name)
+    return name in builtins and act != None and act._builtin != None
+
+def _literal(n: ast.ExpressionLikeNode):
+    # The value of a numeric literal expression, or None.
+    while (n != None and not n.ist(ast.ExpressionNode) and isinstance(n.value, ast.ExpressionLikeNode)): n = n.value
+    if (n == None or not n.ist(ast.ExpressionLikeNode) or n.ist(ast.ExpressionNode)): return None
+    if (n.ist(ast.FunctionDesignatorNode) or not n.value.ist(ast.UnsignedConstantNode)): return None
+    return n.value.value.value if (n.value.value.ist(ast.NumberNode)) else None
+
+def _intLiteral(n: ast.ExpressionLikeNode) -> int:
+    v = _literal(n)
+    return v if (type(v) is int) else None
+
+def _rootVariable(n: ast.VariableNode) -> str:
+    # The variable a (component) variable access is on, or None if it is not known.
+    while (n.ist(ast.IndexedVariableNode) or n.ist(ast.IdentifiedVariableNode) or n.ist(ast.FieldDesignatorNode)):
+        n = n.key if (n.ist(ast.FieldDesignatorNode)) else n.value
+    return n.value if (n.ist(ast.EntireVariableNode) or n.ist(ast.IdentifierNode)) else None
+
+def _isPure(n: ast.ExpressionLikeNode) -> bool:
+    # Whether evaluating an expression calls no activatable which may assign variables.
+    if (n == None or not isinstance(n, ast.ExpressionLikeNode)): return True
+    if (n.ist(ast.ExpressionNode)): return _isPure(n.lhs) and _isPure(n.rhs)
+    if (n.ist(ast.FunctionDesignatorNode)):
+        return _isBuiltin(n.key.value, _PURE_FUNCTIONS) and all(_isPure(p) for p in n.params.value)
+    if (isinstance(n.value, ast.ExpressionLikeNode)): return _isPure(n.value)
+    return not n.value.ist(ast.VariableNode) or n.value.ist(ast.EntireVariableNode) or _isPureAccess(n.value)
+
+def _isPureAccess(n: ast.VariableNode) -> bool:
+    while (n.ist(ast.IndexedVariableNode) or n.ist(ast.IdentifiedVariableNode) or n.ist(ast.FieldDesignatorNode)):
+        if (n.ist(ast.IndexedVariableNode) and not (_isPure(n.lbindex) and _isPure(n.hbindex))): return False
+        n = n.key if (n.ist(ast.FieldDesignatorNode)) else n.value
+    return True
+
+def _collectAssignments(n: ast.StatementNode, assigned: set[str]) -> bool:
+    """
+        Collects the variables a statement may assign. Returns False if it may assign variables it does not name (calls
+        to user activatables), or control may enter or leave it other than through it's start and end (labels, goto).
+    """
+    if (n == None): return True
+    if (n._label != None): return False
 
-        bld.markLabel(el)
-        bld.nop()
+    if (n.ist(ast.AssignmentStatementNode)):
+        name = _rootVariable(n.key)
+        if (name == None): return False
+        assigned.add(name)
+        return _isPure(n.value) and _isPureAccess(n.key)
+    elif (n.ist(ast.ProcedureStatementNode)):
+        params = n.params.value if (n.params != None) else []
+        if (_isBuiltin(n.key.value, _READ_PROCEDURES)):
+            for param in params:
+                if (not param.ist(ast.ExpressionNode) and isinstance(param.value, ast.VariableNode)):
+                    assigned.add(_rootVariable(param.value))
+            return all(_isPure(p) for p in params)
+        return _isBuiltin(n.key.value, _PURE_PROCEDURES) and all(_isPure(p) for p in params)
+    elif (n.ist(ast.CompoundStatementNode)):
+        return all(_collectAssignments(stmt, assigned) for stmt in n.value)
+    elif (n.ist(ast.ConditionalStatementNode)):
+        return _isPure(n.cond) and _collectAssignments(n.ifStmt, assigned) and _collectAssignments(n.elseStmt, assigned)
+    elif (n.ist(ast.WhileStatementNode)):
+        return _isPure(n.cond) and _collectAssignments(n.body, assigned)
     elif (n.ist(ast.RepeatStatementNode)):
-        pass # TODO: Not enough time
+        return _isPure(n.cond) and all(_collectAssignments(stmt, assigned) for stmt in n.body)
     elif (n.ist(ast.ForStatementNode)):
-        # print("MOTHERFUCKING EMIT STATEMENT:", n)
-        # print("MOTHERFUCKING TREE:", bld)
+        assigned.add(n.controlVar.value)
+        return _isPure(n.initial) and _isPure(n.final) and _collectAssignments(n.body, assigned)
+    elif (type(n) is ast.StatementNode):
+        return True # Empty statement
 
-        emitExpression(bld, n.initial)
-        # variableAccess(bld, n.controlVar, True)
-        bld.setVariable(n.controlVar.value)
+    return False
 
-        _counter = f"@FSN_{getLabelId()}"
-
-        bld.allocVariable(_counter, 1)
+def _statementExpressions(n: ast.StatementNode):
+    # The expressions evaluated by a statement, and by those nested in it.
+    if (n == None): return
+    if (n.ist(ast.AssignmentStatementNode)):
+        yield n.value
+    elif (n.ist(ast.ProcedureStatementNode)):
+        if (n.params != None): yield from n.params.value
+    elif (n.ist(ast.CompoundStatementNode)):
+        for stmt in n.value: yield from _statementExpressions(stmt)
+    elif (n.ist(ast.ConditionalStatementNode)):
+        yield n.cond
+        yield from _statementExpressions(n.ifStmt)
+        yield from _statementExpressions(n.elseStmt)
+    elif (n.ist(ast.WhileStatementNode)):
+        yield n.cond
+        yield from _statementExpressions(n.body)
+    elif (n.ist(ast.RepeatStatementNode)):
+        for stmt in n.body: yield from _statementExpressions(stmt)
+        yield n.cond
+    elif (n.ist(ast.ForStatementNode)):
+        yield n.initial
+        yield n.final
+        yield from _statementExpressions(n.body)
+
+def _isInvariant(n: ast.ExpressionLikeNode, assigned: set[str]) -> bool:
+    # Whether an expression only reads literals and variables not assigned, and can not fail (divides by a non-zero
+    #   literal), as it is evaluated even on iterations where it would not be.
+    if (n == None): return True
+    if (n.ist(ast.ExpressionNode)):
+        if (n.op.value in (ast.OpKind.OP_DIV, ast.OpKind.OP_MOD) and _literal(n.rhs) in (None, 0)): return False
+        return _isInvariant(n.lhs, assigned) and _isInvariant(n.rhs, assigned)
+    if (n.ist(ast.FunctionDesignatorNode)): return False
+    value = n.value
+    if (isinstance(value, ast.ExpressionLikeNode)): return _isInvariant(value, assigned)
+    if (value.ist(ast.UnsignedConstantNode)):
+        if (value.value.ist(ast.NumberNode) or value.value.ist(ast.StringNode)): return True
+        return value.value.ist(ast.IdentifierNode) and value.value.value not in assigned
+    return value.ist(ast.EntireVariableNode) and value.value not in assigned
+
+def _collectInvariants(bld: CodeTree, n: ast.ExpressionLikeNode, assigned: set[str], res: list):
+    # The largest binary invariant expressions of an expression, not yet hoisted by an enclosing loop.
+    if (n == None or not isinstance(n, ast.ExpressionLikeNode) or id(n) in bld._hoisted): return
+    if (n.ist(ast.ExpressionNode)):
+        if (n.lhs != None and n.rhs != None and _isInvariant(n, assigned)):
+            res.append(n)
+            return
+        _collectInvariants(bld, n.lhs, assigned, res)
+        _collectInvariants(bld, n.rhs, assigned, res)
+    elif (n.ist(ast.FunctionDesignatorNode)):
+        for param in n.params.value: _collectInvariants(bld, param, assigned, res)
+    elif (isinstance(n.value, ast.ExpressionLikeNode)):
+        _collectInvariants(bld, n.value, assigned, res)
+
+def hoistInvariants(
+    bld: CodeTree, exprs: list[ast.ExpressionLikeNode], stmts: list[ast.StatementNode], assigned: set[str] = ()
+) -> list[int]:
+    """
+        Evaluates the invariants of a loop, given the expressions it evaluates on every iteration and it's body, onto
+        temporaries, which the code of those expressions reads instead (see emitExpression). Loops calling user
+        activatables, or with labels or gotos, are left as they are. Returns the hoisted expressions, to be released
+        once the loop was emitted (see releaseInvariants).
+    """
+    assigned = set(assigned)
+    if (not all(_collectAssignments(stmt, assigned) for stmt in stmts) or not all(_isPure(e) for e in exprs)): return []
+
+    invariants = []
+    for e in [*exprs, *(e for stmt in stmts for e in _statementExpressions(stmt))]:
+        _collectInvariants(bld, e, assigned, invariants)
+
+    for e in invariants:
+        name = f"@INV_{getLabelId()}"
+        bld.allocTemporary(name)
+        emitExpression(bld, e)
+        bld.setVariable(name)
+        bld._hoisted[id(e)] = name
+    return [id(e) for e in invariants]
+
+def releaseInvariants(bld: CodeTree, hoisted: list[int]):
+    for key in hoisted: bld.freeTemporary(bld._hoisted.pop(key))
+
+def emitLoopTest(bld: CodeTree, cond: ast.ExpressionLikeNode, target: int):
+    # Jumps back to the target while the condition holds, by jumping on it's complement.
+    emitExpression(bld, cond)
+    op = bld.stack[-1][0]
+    if (op in _COMPLEMENTS): bld.stack[-1] = _NULLARY[_COMPLEMENTS[op]]
+    else: bld._mono(CodeID.NOT)
+    bld.jz(target)
+
+def emitWhile(bld: CodeTree, n: ast.WhileStatementNode):
+    # As invariants can not fail, they are evaluated before the guard, which reads them as well.
+    hoisted = hoistInvariants(bld, [n.cond], [n.body])
+    el = getLabelId()
+    emitExpression(bld, n.cond)
+    bld.jz(el)
+
+    sl = getLabelId()
+    bld.markLabel(sl)
+    emitStatement(bld, n.body)
+    emitLoopTest(bld, n.cond, sl)
+
+    bld.markLabel(el)
+    releaseInvariants(bld, hoisted)
+
+def emitRepeat(bld: CodeTree, n: ast.RepeatStatementNode):
+    # The body always runs once, so the invariants are evaluated before it.
+    hoisted = hoistInvariants(bld, [n.cond], n.body)
+    sl = getLabelId()
+    bld.markLabel(sl)
+    for stmt in n.body: emitStatement(bld, stmt)
+
+    emitExpression(bld, n.cond)
+    bld.jz(sl)
+    releaseInvariants(bld, hoisted)
+
+def emitFor(bld: CodeTree, n: ast.ForStatementNode):
+    var = n.controlVar.value
+    up = n.traversalMode == ast.ForTraversalMode.FOR_TO
+    (initial, final) = (_intLiteral(n.initial), _intLiteral(n.final))
+
+    # The final value is read as it is if it is a literal, or a variable the loop does not assign (which it can not
+    #   be, on a loop calling user activatables), and is otherwise evaluated onto a temporary, before the control
+    #   variable is assigned.
+    assigned = { var }
+    limit = None
+    if (final == None and not (
+        not n.final.ist(ast.ExpressionNode) and not n.final.ist(ast.FunctionDesignatorNode) and
+        _collectAssignments(n.body, assigned) and _isInvariant(n.final, assigned)
+    )):
+        limit = f"@FSN_{getLabelId()}"
+        bld.allocTemporary(limit)
+    def pushLimit():
+        if (limit != None): bld.getVariable(limit)
+        else: emitExpression(bld, n.final)
+
+    emitExpression(bld, n.initial)
+    if (limit != None):
         emitExpression(bld, n.final)
-        bld.int(1)
-        bld._mono(CodeID.ADD)
-        bld.setVariable(_counter)
-
-        sl = getLabelId()
-        bld.markLabel(sl)
-        emitStatement(bld, n.body)
-
-        travMode = n.traversalMode
-        # bld.getVariable(_counter)
-        # bld.int(1)
-        bld.getVariable(n.controlVar.value)
-        bld.int(1)
-        if (travMode == ast.ForTraversalMode.FOR_TO): bld._mono(CodeID.ADD)
-        else: bld._mono(CodeID.SUB)
-
-        bld._inst(CodeID.DUP, [1])
-        bld.setVariable(n.controlVar.value)
-        bld.getVariable(_counter)
-        bld._mono(CodeID.EQUAL)
-        bld.jz(sl)
-
-
-        # el = getLabelId()
-        # bld.jz(el)
-        # bld.markLabel(el)
-        # print("MOTHERFUCKING TREE 2:", bld)
+        bld.setVariable(limit)
+    bld.setVariable(var)
+
+    el = getLabelId()
+    if (initial == None or final == None or (initial > final if (up) else initial < final)):
+        bld.getVariable(var)
+        pushLimit()
+        bld._mono(CodeID.INFEQ if (up) else CodeID.SUPEQ)
+        bld.jz(el)
+
+    hoisted = hoistInvariants(bld, [], [n.body], { var })
+    sl = getLabelId()
+    bld.markLabel(sl)
+    emitStatement(bld, n.body)
+
+    # Steps the control variable, and jumps back unless it stepped past the final value.
+    bld.getVariable(var)
+    bld.int(1)
+    bld._mono(CodeID.ADD if (up) else CodeID.SUB)
+    bld._inst(CodeID.DUP, [1])
+    bld.setVariable(var)
+    pushLimit()
+    bld._mono(CodeID.SUP if (up) else CodeID.INF)
+    bld.jz(sl)
+
+    bld.markLabel(el)
+    releaseInvariants(bld, hoisted)
+    if (limit != None): bld.freeTemporary(limit)
+#endregion ------- Loop Lowering -------
+
+# Activatables are declared before any code is emitted, in order for calls to be able to reference their entry label
+#   regardless of the order they were declared in.
+def declareActivatable(n: ProcedureOrFunctionSymbolValue) -> CodeTree:
+    if (n.body == None): return None # Forward declaration
+
+    bld = CodeTree()
+    addActivatable(n.parent.heading.name, bld)
+    return bld
 
 def emitActivatable(obld: CodeTree, n: ProcedureOrFunctionSymbolValue):
     if (n.body == None): return None # Forward declaration
 
-    bld = CodeTree()
+    bld = getActivatable(n.parent.heading.name)
     obld._inst(CodeID._SUBTREE, [bld])
+    bld.markLabel(bld._labelId)
+
+    # Unchanged activatables are spliced back from the previous compilation of the program (see incremental.py).
+    comp = getCompilation()
+    if (comp.unit != None and comp.unit.spliceCode(n.parent, bld)): return bld
+
+    firstLabel = comp.labelId + 1
     bld.loadArgs(n.parent.heading.params, len(n.params))
 
+    bld.reserveFrame()
     bld.allocVariable(n.parent.heading.name) # Allocate return value
     # # print("EA FUCKING STARTING TREE:", bld)
     
@@ -497,6 +867,11 @@ def emitActivatable(obld: CodeTree, n: ProcedureOrFunctionSymbolValue):
             bld.allocVariable(key.value)
 
     emitStatement(bld, n.body.stmt)
+    bld._mono(CodeID.RETURN)
+    bld.layoutFrame()
+
+    if (comp.unit != None): comp.unit.storeCode(n.parent, bld, firstLabel, comp.labelId)
+    return bld
 
 def __builtin_write(ln: bool, bld: CodeTree, typeHints):
     # print("MOTHERFUCKING BUILTIN WRITE:", ln, typeHints)
@@ -521,28 +896,39 @@ def __builtin_atoi(bld: CodeTree, typeHints):
     bld._mono(CodeID.ATOI)
 
 def emitBuiltin(bld: CodeTree):
-    root: SymbolTable = SA_STATE["scopes"][0] 
+    root: SymbolTable = getState()["scopes"][0] 
     procedures = root.getSymbolsByKind(SymbolKind.SYM_ACTIVATABLE, True)
 
-    addActivatable("ReadLn", CodeTree.builtin(lambda bld, _ : bld._inst(CodeID.READ, []) ))
+    addActivatable("ReadLn", CodeTree.builtin(lambda bld, _ : bld._mono(CodeID.READ) ))
     addActivatable("Write", CodeTree.builtin(lambda b, t: __builtin_write(False, b, t)))
     addActivatable("WriteLn", CodeTree.builtin(lambda b, t: __builtin_write(True, b, t)))
     addActivatable("Length", CodeTree.builtin(lambda bld, _ : bld._mono(CodeID.STRLEN)))
     addActivatable("Atoi", CodeTree.builtin(lambda b, t: __builtin_atoi(b, t)))
 
 
-    # print("FUCKING ACTIVATABLES:", _ACTIVATABLE_MAP)
+    # print("FUCKING ACTIVATABLES:", getCompilation().activatables)
+
+def buildCode(pout: ast.ProgramNode) -> CodeTree:
+    """
+        Generates the code tree of a given (semantically valid) program, folded and optimized if the compilation was
+        given a constant folder, peephole optimizer and control flow optimizer (see compilation.py).
+    """
+    comp = getCompilation()
+    if (comp.folder != None): comp.folder.run(pout)
 
-def emitCode(pout: ast.ProgramNode, outFile):
     bld = CodeTree()
 
     # Load builtins.
     emitBuiltin(bld)
 
     # Built-in Table does not have a real presence. Skip it and go to the user root.
-    root: SymbolTable = SA_STATE["scopes"][1] 
+    root: SymbolTable = getState()["scopes"][1] 
+    procedures = root.getSymbolsByKind(SymbolKind.SYM_ACTIVATABLE, True)
+    for proc in procedures:
+        declareActivatable(proc.value)
 
     # Process root block
+    bld.reserveFrame()
     if (pout.body.variables):
         for nvar in pout.body.variables.value:
             # dtype = root.getSymbolByNameAndKind()
@@ -551,36 +937,81 @@ def emitCode(pout: ast.ProgramNode, outFile):
                 bld.allocVariable(key.value)
 
     emitStatement(bld, pout.body.stmt)
+    bld.layoutFrame()
 
-    # Process all procedures
-    procedures = root.getSymbolsByKind(SymbolKind.SYM_ACTIVATABLE, True)
+    # Process all procedures, after the program, which must not fall through into them.
+    if (any(proc.value.body != None for proc in procedures)): bld._mono(CodeID.STOP)
     for proc in procedures:
         emitActivatable(bld, proc.value)
 
+    if (comp.optimizer != None): comp.optimizer.run(bld)
+    if (comp.flow != None): comp.flow.run(bld)
+
     # print("FINAL CODE STRUCT:", bld)
-    code = transformCode(bld)
-    # print("FINAL MOTHERFUCKING CODE:\n", code)
+    return bld
+
+def generateCode(pout: ast.ProgramNode) -> str:
+    return transformCode(buildCode(pout))
+
+def emitCode(pout: ast.ProgramNode, outFile, packed = False):
+    """
+        Generates the code of a given program, and streams it to the given file, as text or, if requested, packed (see
+        packed.py).
+    """
+    bld = buildCode(pout)
 
     if (not os.path.exists(os.path.dirname(outFile))): os.mkdir(os.path.dirname(outFile))
-    with open(outFile, "w+") as f:
-        f.write(code)
-
-def transformCode(bld: CodeTree):
-    code = ""
-
-    for p in bld.stack:
-        match (p[0]):
-            case CodeID._LABEL:
-                code += f"L{p[1][0]}: "
-            case CodeID._SUBTREE:
-                code += transformCode(p[1][0])
-            case CodeID.JZ:
-                code += f"JZ L{p[1][0]}"
-            case CodeID.JUMP:
-                code += f"JUMP L{p[1][0]}"
-            case _:
-                code += f"{p[0].name} "
-                if (len(p[1]) > 0): code += " ".join(map(lambda e: f"{e}", p[1]))
-        code += "\n"
-
-    return code
+    if (packed):
+        from compiler.packed import packCode
+        with open(outFile, "wb") as f: f.write(packCode(bld))
+    else:
+        with open(outFile, "w+") as f: writeCode(bld, f)
+
+#region ------- Emission -------
+def iterCode(bld: CodeTree):
+    """
+        Iterates over the instructions (and labels) of a code tree, in order, descending into it's subtrees. Each
+        subtree entry is yielded once it's instructions were, as it ends with a blank line on the textual program. The
+        tree is walked iteratively, so deeply nested subtrees do not hit the recursion limit.
+    """
+    pending = [(iter(bld.stack), None)]
+    while (len(pending) > 0):
+        (it, subtree) = pending[-1]
+        for p in it:
+            if (p[0] == CodeID._SUBTREE):
+                pending.append((iter(p[1][0].stack), p))
+                break
+            yield p
+        else:
+            pending.pop()
+            if (subtree != None): yield subtree
+
+def formatInstruction(p: CodePoint) -> str:
+    """
+        Formats an instruction (or label) as a line of the textual program, without the line break.
+    """
+    match (p[0]):
+        case CodeID._LABEL:
+            return f"L{p[1][0]}: "
+        case CodeID._SUBTREE:
+            return ""
+        case CodeID.JZ:
+            return f"JZ L{p[1][0]}"
+        case CodeID.JUMP:
+            return f"JUMP L{p[1][0]}"
+        case CodeID.PUSHA:
+            return f"PUSHA L{p[1][0]}"
+        case _:
+            if (len(p[1]) == 0): return f"{p[0].name} "
+            return f"{p[0].name} " + " ".join(map(str, p[1]))
+
+def writeCode(bld: CodeTree, out):
+    """
+        Writes the textual program of a code tree to a text stream, one line at a time.
+    """
+    out.writelines(f"{formatInstruction(p)}\n" for p in iterCode(bld))
+
+def transformCode(bld: CodeTree) -> str:
+    # Joined once, instead of concatenating every line onto the program so far.
+    return "".join([f"{formatInstruction(p)}\n" for p in iterCode(bld)])
+#endregion ------- Emission -------
@@ -0,0 +1,171 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+#
+# Compilation Context
+#
+#   This module defines the state of a single compilation: the lexer and parser instances, the state of the Semantic
+# Analyser (see sastate.py), the scope stack and symbol identifiers (see symbols.py) and the label and activatable
+# tables of the Code Generator (see codegen.py).
+#   Every phase fetches the compilation it is running on through getCompilation(), which returns the compilation that
+# was activated on the calling thread / asyncio task (see Compilation.activate), in order for multiple compilations to
+# be able to run concurrently on the same process. If no compilation was activated, a default compilation, which wraps
+# the module-level lexer and parser instances, is used instead.
+#   A compilation may also be given an incremental unit (see incremental.py), holding the results of a previous
+# compilation of the same program, in order for the unchanged activatables not to be analysed and generated again, a
+# constant folder (see constfold.py), run over the AST before it's code is generated, and a peephole optimizer (see
+# optim.py) and control flow optimizer (see flow.py), run over the generated code before it is written out.
+#
+#   All imports of the phase modules are deferred, as those modules depend on this one.
+#
+
+_CURRENT: ContextVar["Compilation"] = ContextVar("compilation", default = None)
+_DEFAULT: "Compilation" = None
+
+def getCompilation() -> "Compilation":
+    """
+        Gets the compilation active on the calling thread / task, or the default compilation if there is none.
+    """
+    comp = _CURRENT.get()
+    if (comp != None): return comp
+
+    return getDefaultCompilation()
+
+def getDefaultCompilation() -> "Compilation":
+    """
+        Gets the default compilation, which wraps the module-level lexer and parser instances.
+    """
+    global _DEFAULT
+    if (_DEFAULT == None): _DEFAULT = Compilation(_default = True)
+    return _DEFAULT
+
+class Compilation:
+    """
+    Represents the state of a single compilation. Each phase is run on this compilation through the methods below, which
+    activate it for the duration of the phase.
+    """
+    # Identifiers for symbols and symbol tables start after the builtin ones. Set when the builtin table is built.
+    baseSymbolId = 0
+    baseSymbolTableId = 0
+
+    def __init__(self, debug = False, unit = None, optimizer = None, folder = None, flow = None, _default = False):
+        self._default = _default
+        self.unit = unit
+        self.optimizer = optimizer
+        self.folder = folder
+        self.flow = flow
+        self.source = None # The source text last parsed, unless it was streamed.
+        self._lexer = None
+        self._parser = None
+
+        if (not _default):
+            # Ensure the base identifiers are set.
+            from compiler.runtime.builtin import getBuiltinSymtable
+            getBuiltinSymtable()
+
+        self.saState = {
+            "diagnostics": [],
+            "debug": debug,
+
+            "scopes": []
+        }
+        self.scopeStack = []
+        self.symbolId = self.baseSymbolId
+        self.symbolTableId = self.baseSymbolTableId
+
+        self.labelId = -1
+        self.activatables = {}
+        self.optimDiagnostics = []
+        self.codegenDiagnostics = []
+
+    #region ------- Instances -------
+    def _getLexer(self):
+        if (self._lexer == None):
+            if (self._default): from compiler.lexer import lexer as l
+            else:
+                from compiler.lexer import buildLexer
+                l = buildLexer()
+            self._lexer = l
+
+        return self._lexer
+    lexer = property(_getLexer)
+
+    def _getParser(self):
+        if (self._parser == None):
+            if (self._default): from compiler.synanaler import parser as p
+            else:
+                from compiler.synanaler import buildParser
+                p = buildParser()
+                p.options["debug"] = self.saState["debug"]
+            self._parser = p
+
+        return self._parser
+    parser = property(_getParser)
+    #endregion ------- Instances -------
+
+    @contextmanager
+    def activate(self):
+        """
+            Makes this compilation the active compilation on the calling thread / task, until the context is exited.
+        """
+        token = _CURRENT.set(self)
+        try:
+            yield self
+        finally:
+            _CURRENT.reset(token)
+
+    #region ------- Phases -------
+    def parse(self, inp: str = None, stream = None, debug = False):
+        """
+            Runs the lexical and syntatic analysis on a given source text, or stream (see lexer.inputStream).
+            Returns the resulting AST, or None if the syntatic analyser errored out with a critical error.
+        """
+        with self.activate():
+            self.lexer.options["printDiags"] = False
+            self.lexer.reset()
+            if (stream != None): self.lexer.inputStream(stream)
+
+            self.source = inp
+            return self.parser.parse(inp, self.lexer, debug, False, self.lexer.getExtendedToken)
+
+    def analyze(self, pout) -> bool:
+        """
+            Runs the semantic analysis on a given AST. Returns whether it succeeded.
+        """
+        import compiler.semanaler as semanal
+        with self.activate():
+            if (self.unit != None): self.unit.prepare(pout, self.source)
+            return semanal.analyzeSemantics(pout)
+
+    def generate(self, pout, packed = False) -> str | bytes:
+        """
+            Generates the code for a given (semantically valid) AST, as text or, if requested, packed (see packed.py).
+            Returns None if the code generator errored out (see getCodegenDiagnostics).
+        """
+        import compiler.codegen as codegen
+        with self.activate():
+            try:
+                if (not packed): return codegen.generateCode(pout)
+                from compiler.packed import packCode
+                return packCode(codegen.buildCode(pout))
+            except codegen.CodegenError as e:
+                self.codegenDiagnostics.append(e.diagnostic)
+                return None
+    #endregion ------- Phases -------
+
+    #region ------- Diagnostics -------
+    def getLexerDiagnostics(self):
+        return self.lexer.diagnostics
+
+    def getParserDiagnostics(self):
+        return self.parser.diagnostics
+
+    def getSemanticDiagnostics(self):
+        return self.saState["diagnostics"]
+
+    def getOptimizerDiagnostics(self):
+        return self.optimDiagnostics
+
+    def getCodegenDiagnostics(self):
+        return self.codegenDiagnostics
+    #endregion ------- Diagnostics -------
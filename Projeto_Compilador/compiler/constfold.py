@@ -0,0 +1,339 @@
+import operator as o
+import compiler.ast as ast
+from compiler.sastate import SemanticError
+from compiler.compilation import getCompilation
+from compiler.runtime.builtin import BUILTINS
+from compiler.diag import Diagnostic, DiagnosticSource, DiagnosticType, DiagnosticKind
+
+#
+# Constant Folding
+#
+#   This module defines the constant folding pass, run over the AST of a (semantically valid) program before it's code
+# is generated (see codegen.generateCode). The pass replaces, in place, every expression whose value is known at compile
+# time with a literal of that value:
+#
+#   - References to constants (see the constant definition part of each block) are replaced with their value.
+#   - Operations over literals are evaluated with the operations of the builtin types (see runtime/builtin.py).
+#     Operations that error out (e.g. a division by zero) are left as they are, and reported as a warning. So are the
+#     operations whose result is out of the range of their type: the builtin operations clamp it, while the machine
+#     runs the unfolded operation without clamping (as does the peephole optimizer, see optim.foldConstants).
+#   - References to variables of the block being folded, after a straight-line assignment of a known value, are
+#     replaced with that value. The values are forgotten on every statement control may reach from elsewhere (labeled
+#     statements, loops), after every call (which may assign any variable), and merged after conditionals.
+#
+#   Integer divisions are never folded, as both the '/' and 'div' operators are parsed into OP_DIV, and are thus
+# generated as a real division.
+#
+#   The pass reports the expressions it folded, and the references it replaced, as a diagnostic of the compilation (see
+# Compilation.getOptimizerDiagnostics).
+#
+
+# A folded value: a number or string literal, or a boolean.
+Constant = ast.NumberNode | ast.StringNode | bool
+
+# Builtin procedures and functions known not to assign any variable.
+_PURE_ACTIVATABLES = { "Write", "WriteLn", "Length" }
+
+_ARITHMETIC = {
+    ast.OpKind.OP_ADD: "op_add",
+    ast.OpKind.OP_SUB: "op_sub",
+    ast.OpKind.OP_MUL: "op_mul",
+    ast.OpKind.OP_DIV: "op_div",
+}
+
+# The unclamped operations, checked against the range of their type.
+_NATIVE = {
+    ast.OpKind.OP_ADD: o.add,
+    ast.OpKind.OP_SUB: o.sub,
+    ast.OpKind.OP_MUL: o.mul,
+    ast.OpKind.OP_DIV: o.truediv,
+}
+
+_RELATIONAL = {
+    ast.OpKind.OP_EQ: "op_eq",
+    ast.OpKind.OP_NEQ: "op_neq",
+    ast.OpKind.OP_LT: "op_lt",
+    ast.OpKind.OP_LTE: "op_lte",
+    ast.OpKind.OP_GT: "op_gt",
+    ast.OpKind.OP_GTE: "op_gte",
+}
+
+_LOGICAL = {
+    ast.OpKind.OP_AND: "op_and",
+    ast.OpKind.OP_OR: "op_or",
+}
+
+#region ------- Literals -------
+def toLiteral(v: Constant, n: ast.Node) -> ast.ExpressionLikeNode:
+    """
+        Builds the literal expression of a given folded value, spanning the given node.
+    """
+    # Literals are built anew, as nodes are not shared between subtrees.
+    if (isinstance(v, bool)):
+        # Left unbound, in order for the code generator to resolve it to the builtin, even if shadowed.
+        value = ast.EntireVariableNode("true" if v else "false")
+    elif (isinstance(v, ast.NumberNode)):
+        value = ast.UnsignedConstantNode(toNumber(v.value, n))
+    else:
+        value = ast.UnsignedConstantNode(ast.StringNode(v.value).setStartTokenPos(n).setEndTokenPos(n))
+
+    value.setStartTokenPos(n).setEndTokenPos(n)
+    return ast.ExpressionLikeNode(value).setStartTokenPos(n).setEndTokenPos(n)
+
+def toNumber(v: int | float, n: ast.Node) -> ast.NumberNode:
+    if (isinstance(v, int)):
+        kind = ast.NumberKind.SIGNED_INTEGER if (v < 0) else ast.NumberKind.UNSIGNED_INTEGER
+    else:
+        kind = ast.NumberKind.SIGNED_REAL if (v < 0) else ast.NumberKind.UNSIGNED_REAL
+    return ast.NumberNode(repr(v), kind).setStartTokenPos(n).setEndTokenPos(n)
+#endregion ------- Literals -------
+
+class ConstantFolder:
+    """
+    Folds the constant expressions of programs, in place (see the module description).
+    """
+    def __init__(self, propagate = True):
+        self.propagate = propagate
+        self.folded = 0   # The expressions folded, over every run.
+        self.replaced = 0 # The constant and variable references replaced, over every run.
+
+        self._scopes: list[dict[str, Constant]] = []
+        self._locals: set[str] = set()
+        self._values: dict[str, Constant] = {}
+        self._called = False
+        self._diagnostics: list[Diagnostic] = []
+
+    #region ------- Scopes -------
+    def _lookup(self, name: str, propagate: bool) -> Constant:
+        if (propagate and name in self._values): return self._values[name]
+        for scope in reversed(self._scopes):
+            # Names declared as anything other than a constant shadow those of the outer blocks.
+            if (name in scope): return scope[name]
+
+        return None
+
+    def _enterBlock(self, n: ast.BlockNode, params: list[ast.ParameterSpecificationNode] = ()):
+        scope = {}
+        self._scopes.append(scope)
+        for spec in params:
+            for iden in spec.identifiers: scope[iden] = None
+
+        if (n.consts != None):
+            for const in n.consts.value:
+                value = const.value
+                if (value.ist(ast.IdentifierNode)): value = self._lookup(value.value, False)
+                elif (not value.ist(ast.NumberNode) and not value.ist(ast.StringNode)): value = None
+                scope[const.key] = value
+        if (n.types != None):
+            for btype in n.types.value:
+                scope[btype.key] = None
+                if (btype.value.ist(ast.EnumeratedTypeNode)):
+                    for iden in btype.value.value: scope[iden.value] = None
+        if (n.variables != None):
+            for bvar in n.variables.value:
+                for key in bvar.keys: scope[key.value] = None
+        if (n.subfuncs != None):
+            for sub in n.subfuncs.value: scope[sub.heading.name] = None
+
+        # Only the variables of the block itself are propagated.
+        self._locals = { key.value for bvar in n.variables.value for key in bvar.keys } if (n.variables) else set()
+        self._values = {}
+    #endregion ------- Scopes -------
+
+    #region ------- Expressions -------
+    def _evaluate(self, n: ast.ExpressionNode, a: Constant, b: Constant) -> Constant:
+        op = n.op.value
+        if (n.rhs == None): return a
+        if (n.lhs == None):
+            # Unary plus and minus, generated as an operation over 0.
+            if (not isinstance(b, ast.NumberNode)): return None
+            a = toNumber(0, n)
+
+        if (isinstance(a, bool) and isinstance(b, bool)):
+            if (op in _LOGICAL):
+                boolean = BUILTINS["Boolean"]
+                return getattr(boolean, _LOGICAL[op])(boolean.fromNative(a), boolean.fromNative(b))
+            if (op == ast.OpKind.OP_EQ): return a == b
+            if (op == ast.OpKind.OP_NEQ): return a != b
+            return None
+        if (not isinstance(a, ast.NumberNode) or not isinstance(b, ast.NumberNode)): return None
+
+        real = not (a.isInt() and b.isInt())
+        if (op == ast.OpKind.OP_DIV and not real): return None # See the module description.
+        ntype = BUILTINS["Real"] if (real) else BUILTINS["Integer"]
+        try:
+            if (op in _RELATIONAL): return getattr(ntype, _RELATIONAL[op])(a, b)
+            if (op in _ARITHMETIC):
+                v = getattr(ntype, _ARITHMETIC[op])(a, b)
+                exact = _NATIVE[op](ntype.toNative(a), ntype.toNative(b))
+                if (ntype.inBounds(exact)): return toNumber(v, n)
+                self._diagnostics.append(Diagnostic(
+                    DiagnosticSource.OPTIM, DiagnosticType.OUT_OF_RANGE_RESULT, DiagnosticKind.WARN, n.pos.getStart(),
+                    n.pos.getEnd(), { "type": "Real" if (real) else "Integer", "value": exact }
+                ))
+        except SemanticError as e:
+            self._diagnostics.append(Diagnostic(
+                DiagnosticSource.OPTIM, e.diagnostic.type, DiagnosticKind.WARN, n.pos.getStart(), n.pos.getEnd()
+            ))
+
+        return None
+
+    def foldExpression(self, n: ast.ExpressionLikeNode, propagate = True) -> (ast.ExpressionLikeNode, Constant):
+        """
+            Folds an expression, in place. Returns the folded expression, which is a literal if the whole expression was
+            folded, along with it's value, or None if it is not known.
+        """
+        if (n == None or not isinstance(n, ast.ExpressionLikeNode)): return (n, None)
+
+        if (n.ist(ast.ExpressionNode)):
+            (n.lhs, a) = self.foldExpression(n.lhs, propagate)
+            # Variables read after a call, which may assign them, are not propagated.
+            (n.rhs, b) = self.foldExpression(n.rhs, propagate and not self._called)
+            if ((a == None and n.lhs != None) or (b == None and n.rhs != None)): return (n, None)
+
+            v = self._evaluate(n, a, b)
+            if (v == None): return (n, None)
+            self.folded += 1
+            return (toLiteral(v, n), v)
+        elif (n.ist(ast.FunctionDesignatorNode)):
+            if (n.params != None): self.foldParameters(n.key.value, n.params.value, propagate)
+            if (n.key.value not in _PURE_ACTIVATABLES or self._lookup(n.key.value, False) != None): self._called = True
+            return (n, None)
+
+        value = n.value
+        if (isinstance(value, ast.ExpressionLikeNode)):
+            (n.value, v) = self.foldExpression(value, propagate)
+            return (n, v)
+        if (value.ist(ast.UnsignedConstantNode)):
+            if (value.value.ist(ast.NumberNode) or value.value.ist(ast.StringNode)): return (n, value.value)
+            if (not value.value.ist(ast.IdentifierNode)): return (n, None)
+            name = value.value.value
+        elif (value.ist(ast.EntireVariableNode)):
+            name = value.value
+        else:
+            if (value.ist(ast.VariableNode)): self.foldIndices(value, propagate)
+            return (n, None)
+
+        v = self._lookup(name, propagate)
+        if (v == None): return (n, None)
+        if (isinstance(v, bool) and name == ("true" if v else "false")): return (n, v) # Already a literal.
+
+        self.replaced += 1
+        return (toLiteral(v, n), v)
+
+    def foldIndices(self, n: ast.VariableNode, propagate = True):
+        """
+            Folds the index expressions of a variable access, in place.
+        """
+        while (n != None and n.ist(ast.VariableNode) and not n.ist(ast.EntireVariableNode)):
+            if (n.ist(ast.IndexedVariableNode)):
+                (n.lbindex, _) = self.foldExpression(n.lbindex, propagate)
+                (n.hbindex, _) = self.foldExpression(n.hbindex, propagate)
+            n = n.value if (n.ist(ast.IndexedVariableNode) or n.ist(ast.IdentifiedVariableNode)) else n.key
+
+    def foldParameters(self, name: str, params: list[ast.ExpressionLikeNode], propagate = True):
+        """
+            Folds the actual parameters of a call, in place. Variables passed on their own may be passed by reference,
+            so they are only replaced with their value on calls to procedures known not to assign them.
+        """
+        pure = name in _PURE_ACTIVATABLES and self._lookup(name, False) == None
+        for (i, param) in enumerate(params):
+            bare = param.kind == ast.ExpressionKind.EXP_UNARY and isinstance(param.value, ast.EntireVariableNode)
+            (params[i], _) = self.foldExpression(param, propagate and (pure or not bare))
+    #endregion ------- Expressions -------
+
+    #region ------- Statements -------
+    def foldStatement(self, n: ast.StatementNode):
+        """
+            Folds the expressions of a statement, in place, propagating the values of the variables assigned.
+        """
+        if (n == None): return
+        if (n._label != None): self._values.clear()
+        self._called = False
+
+        if (n.ist(ast.AssignmentStatementNode)):
+            (n.value, v) = self.foldExpression(n.value, self.propagate)
+            key = n.key
+            if (key.ist(ast.EntireVariableNode)):
+                if (self.propagate and v != None and key.value in self._locals): self._values[key.value] = v
+                else: self._values.pop(key.value, None)
+            else:
+                self.foldIndices(key, self.propagate)
+        elif (n.ist(ast.ProcedureStatementNode)):
+            if (n.params != None): self.foldParameters(n.key.value, n.params.value, self.propagate)
+            if (n.key.value not in _PURE_ACTIVATABLES or self._lookup(n.key.value, False) != None): self._called = True
+        elif (n.ist(ast.CompoundStatementNode)):
+            for stmt in n.value: self.foldStatement(stmt)
+        elif (n.ist(ast.ConditionalStatementNode)):
+            (n.cond, _) = self.foldExpression(n.cond, self.propagate)
+            if (self._called): self._values.clear()
+
+            before = dict(self._values)
+            self.foldStatement(n.ifStmt)
+            after = self._values
+            self._values = before
+            self.foldStatement(n.elseStmt)
+
+            # Only the values assigned on both branches are known.
+            self._values = { k: v for (k, v) in self._values.items() if k in after and after[k] is v }
+        elif (n.ist(ast.WhileStatementNode)):
+            self._values.clear()
+            (n.cond, _) = self.foldExpression(n.cond, self.propagate)
+            self.foldStatement(n.body)
+        elif (n.ist(ast.RepeatStatementNode)):
+            # The condition is evaluated after the body, on each iteration, so it sees the values the body assigned.
+            self._values.clear()
+            for stmt in n.body: self.foldStatement(stmt)
+            (n.cond, _) = self.foldExpression(n.cond, self.propagate)
+        elif (n.ist(ast.ForStatementNode)):
+            (n.initial, _) = self.foldExpression(n.initial, self.propagate)
+            (n.final, _) = self.foldExpression(n.final, self.propagate)
+            self._values.clear()
+            self.foldStatement(n.body)
+
+        # Calls may assign any variable, and loops and jumps leave for statements that are reached from elsewhere. Case
+        #   statements are not generated (see codegen.emitStatement), so they are not folded.
+        if (self._called or n.ist(ast.GotoStatementNode) or n.ist(ast.WhileStatementNode) or
+            n.ist(ast.ForStatementNode) or n.ist(ast.RepeatStatementNode) or n.ist(ast.CaseStatementNode)):
+            self._values.clear()
+        self._called = False
+
+    def foldBlock(self, n: ast.BlockNode, params: list[ast.ParameterSpecificationNode] = ()):
+        """
+            Folds the statements of a block, and of the activatables declared on it, in place.
+        """
+        self._enterBlock(n, params)
+        (locals, values) = (self._locals, self._values)
+
+        if (n.subfuncs != None):
+            for sub in n.subfuncs.value:
+                if (not isinstance(sub.body, ast.BlockNode)): continue # Forward declaration
+                self.foldBlock(sub.body, sub.heading.params or ())
+
+        (self._locals, self._values) = (locals, values)
+        self.foldStatement(n.stmt)
+        self._scopes.pop()
+    #endregion ------- Statements -------
+
+    def run(self, pout: ast.ProgramNode) -> int:
+        """
+            Folds the constant expressions of a program in place, and reports them on the active compilation (see
+            compilation.py). Returns the number of expressions folded and references replaced.
+        """
+        (folded, replaced) = (self.folded, self.replaced)
+        self._scopes = [{ "true": True, "false": False }]
+        self._diagnostics = []
+        self.foldBlock(pout.body)
+
+        comp = getCompilation()
+        comp.optimDiagnostics.extend(self._diagnostics)
+        (folded, replaced) = (self.folded - folded, self.replaced - replaced)
+        if (folded + replaced > 0):
+            comp.optimDiagnostics.append(Diagnostic(
+                DiagnosticSource.OPTIM, DiagnosticType.CONSTANTS_FOLDED, DiagnosticKind.INFO, args = {
+                    "folded": folded,
+                    "replaced": replaced
+                }
+            ))
+
+        return folded + replaced
@@ -1,3 +1,4 @@
+import sys
 from enum import Enum, auto
 
 class DiagnosticSource(Enum):
@@ -47,6 +48,7 @@ class DiagnosticType(Enum):
     ZERO_DIV = auto(),
     NAN_RESULT = auto(),
     INFINITY_RESULT = auto(),
+    OUT_OF_RANGE_RESULT = auto(),
 
     UNDEFINED_REFERENCE = auto(),
     TYPE_MISMATCH = auto(),
@@ -56,6 +58,12 @@ class DiagnosticType(Enum):
     UNDECLARED_ACTIVATABLE = auto(),
     #endregion -------------- Semantic Diagnostics --------------
 
+    #region -------------- Optimization Diagnostics --------------
+    INSTRUCTIONS_REMOVED = auto(),
+    CONSTANTS_FOLDED = auto(),
+    FLOW_SIMPLIFIED = auto(),
+    #endregion -------------- Optimization Diagnostics --------------
+
 DIAGNOSTIC_MESSAGES = {
     #region -------------- Lexical Diagnostics --------------
     DiagnosticType.UNEXPECTED_CHARACTER: "Unexpected character: {character}",
@@ -91,6 +99,7 @@ DIAGNOSTIC_MESSAGES = {
     DiagnosticType.ZERO_DIV: "Division by zero.",
     DiagnosticType.NAN_RESULT: "Operation resulted in NaN value.",
     DiagnosticType.INFINITY_RESULT: "Operation resulted in Infinity value.",
+    DiagnosticType.OUT_OF_RANGE_RESULT: "Operation resulted in a value out of the {type} range: {value}.",
 
     DiagnosticType.UNDEFINED_REFERENCE: "Undefined reference: {value}.",
     DiagnosticType.TYPE_MISMATCH: "Type Mismatch. Expected {aType}, got {bType}.",
@@ -99,6 +108,12 @@ DIAGNOSTIC_MESSAGES = {
     DiagnosticType.INCOMPATIBLE_VARIABLE: "Incompatible variable. Expected '{expected}', got '{actual}'.",
     DiagnosticType.UNDECLARED_ACTIVATABLE: "Procedure / Function not declared: {value}.",
     #endregion -------------- Semantic Diagnostics --------------
+
+    #region -------------- Optimization Diagnostics --------------
+    DiagnosticType.INSTRUCTIONS_REMOVED: "Peephole optimizer removed {count} instructions ({rules}).",
+    DiagnosticType.CONSTANTS_FOLDED: "Constant folder folded {folded} expressions and replaced {replaced} references.",
+    DiagnosticType.FLOW_SIMPLIFIED: "Control flow optimizer removed {count} instructions and labels ({steps}).",
+    #endregion -------------- Optimization Diagnostics --------------
 }
 
 class Diagnostic:
@@ -169,4 +184,15 @@ class Diagnostic:
         if (doEmitPos): ret += f"[{self.startPos[1]}:{self.startPos[2]} - {self.endPos[1]}:{self.endPos[2]}] "
         ret += self.msgTemplate.format(**self.args)
 
-        return ret
\ No newline at end of file
+        return ret
+
+def getCallerHeader(depth: int = 1) -> str:
+    """
+        Gets the location of the caller of the function calling this one, as a "[file:line] " header for printed 
+        diagnostics. The given depth is the number of frames to go up from the calling function.
+        Only the frame itself is fetched (unlike inspect.stack, which builds every frame of the stack along with it's
+        source context), so it's cheap enough to be called per diagnostic, but should still only be called when the 
+        header is going to be printed.
+    """
+    frame = sys._getframe(depth + 1)
+    return f"[{frame.f_code.co_filename}:{frame.f_lineno}] "
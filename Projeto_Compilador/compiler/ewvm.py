@@ -0,0 +1,531 @@
+import math
+import operator
+from compiler.codegen import CodeID
+
+#
+# EWVM Interpreter
+#
+#   This module runs the programs written by the code generator (see codegen.transformCode) locally, in order for the
+# generated code to be executed, tested and profiled without the web VM.
+#
+#   A program is assembled once (see assemble): each instruction is decoded into it's opcode (the index of it's CodeID)
+# and a single operand, with labels resolved to instruction indexes and strings unquoted. The machine (see Machine)
+# binds every instruction to the handler of it's opcode, from a table, so running a program only dispatches through
+# those pairs. Jumps resolve to their target index, and CALL to the index it returns to.
+#
+#   The machine follows the EWVM: a single stack holding the global variables (from gp, which is 0), the frames of the
+# activations (from fp) and the operands, along with a call stack of the saved pc and fp. As the web VM is written in
+# JS, it represents integers and reals alike as numbers (see runtime/builtin.py), so are they mixed freely here, while
+# strings, addresses and out-of-bounds accesses raise an EWVMError.
+#
+#   Executing a program counts the times each instruction was executed (see ExecutionResult.hits), from which the
+# number of instructions executed, in total and by opcode, is reported.
+#
+
+OPCODES: list[CodeID] = [c for c in CodeID if (not c.name.startswith("_"))]
+_OPCODE_IDS = { c.name: i for (i, c) in enumerate(OPCODES) }
+
+# Opcodes whose operand is a label.
+_LABEL_OPERANDS = { "JUMP", "JZ", "PUSHA" }
+
+class EWVMError(Exception):
+    """
+    Raised when a program cannot be assembled, or errors out while running.
+    """
+    def __init__(self, message: str, line: int = None):
+        super().__init__(message if (line == None) else f"Line {line}: {message}")
+        self.line = line
+
+class Address:
+    """
+    Represents an address: an index on a block, which is the stack, a heap block (see ALLOC), or the code, when the
+    block is None.
+    """
+    __slots__ = ("block", "index")
+
+    def __init__(self, block: list, index: int):
+        self.block = block
+        self.index = index
+
+    def __eq__(self, other):
+        return isinstance(other, Address) and self.block is other.block and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.block), self.index))
+
+    def __repr__(self):
+        return f"#{'code' if (self.block == None) else hex(id(self.block))}:{self.index}"
+
+#region ------- Assembler -------
+class Program:
+    """
+    Represents an assembled program: the opcode and operand of each instruction, and the source line it was read from.
+    Columns may be any sequence (e.g. the arrays of a packed program, see packed.py).
+    """
+    def __init__(self, opcodes: list[int], operands: list, lines: list[int], labels: dict[str, int]):
+        self.opcodes = opcodes
+        self.operands = operands
+        self.lines = lines
+        self.labels = labels
+
+    def __len__(self):
+        return len(self.opcodes)
+
+def unquote(text: str, line: int = None) -> str:
+    """
+        Decodes a string operand: the text between double quotes, with "\\n", "\\t" and "\\x" escapes.
+    """
+    if (len(text) < 2 or text[0] != '"' or text[-1] != '"'): raise EWVMError(f"Malformed string {text}.", line)
+
+    res = []
+    escaped = False
+    for c in text[1:-1]:
+        if (escaped):
+            res.append({ "n": "\n", "t": "\t" }.get(c, c))
+            escaped = False
+        elif (c == "\\"): escaped = True
+        else: res.append(c)
+
+    return "".join(res)
+
+def _number(text: str, line: int):
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        raise EWVMError(f"Expected a number, got '{text}'.", line)
+
+def assemble(text: str) -> Program:
+    """
+        Assembles the text of an EWVM program: one instruction per line, each optionally preceded by labels ("L1:"),
+        with "//" comments. Labels are resolved once every instruction was read.
+        Raises an EWVMError if the program is malformed.
+    """
+    opcodes = []
+    operands = []
+    lines = []
+    labels = {}
+
+    for (lineNo, line) in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if (line.startswith("//")): continue
+
+        # Labels are read up to the instruction. Strings may hold colons, so those are not searched for.
+        while True:
+            (head, sep, rest) = line.partition(":")
+            if (sep == "" or head == "" or '"' in head or not head.replace("_", "").isalnum()): break
+            labels[head] = len(opcodes)
+            line = rest.strip()
+
+        if (line == ""): continue
+        (name, _, arg) = line.partition(" ")
+        arg = arg.strip()
+        op = _OPCODE_IDS.get(name.upper())
+        if (op == None): raise EWVMError(f"Unknown instruction '{name}'.", lineNo)
+
+        name = OPCODES[op].name
+        if (arg == ""): operand = None
+        elif (name in _LABEL_OPERANDS): operand = arg
+        elif (name == "PUSHS" or name == "ERR"): operand = unquote(arg, lineNo)
+        elif (name == "CHECK"): operand = tuple(_number(a, lineNo) for a in arg.split())
+        else: operand = _number(arg, lineNo)
+
+        opcodes.append(op)
+        operands.append(operand)
+        lines.append(lineNo)
+
+    for (i, op) in enumerate(opcodes):
+        if (OPCODES[op].name in _LABEL_OPERANDS):
+            target = labels.get(operands[i])
+            if (target == None): raise EWVMError(f"Unknown label '{operands[i]}'.", lines[i])
+            operands[i] = target
+        # The operand of CALL is the index it returns to.
+        elif (OPCODES[op] == CodeID.CALL): operands[i] = i + 1
+
+    return Program(opcodes, operands, lines, labels)
+#endregion ------- Assembler -------
+
+#region ------- Machine -------
+class ExecutionResult:
+    """
+    Represents the outcome of running a program: it's output, the times each instruction was executed, the size of the
+    operand stack when it stopped, and the error it errored out with, if any.
+    """
+    def __init__(self, program: Program, output: str, hits: list[int], error: EWVMError = None, stackSize: int = 0):
+        self.program = program
+        self.output = output
+        self.hits = hits
+        self.error = error
+        self.stackSize = stackSize
+
+    @property
+    def steps(self) -> int:
+        """
+            The number of instructions executed.
+        """
+        return sum(self.hits)
+
+    def counts(self) -> dict[str, int]:
+        """
+            Gets the number of instructions executed by opcode, from the most executed.
+        """
+        counts = [0] * len(OPCODES)
+        for (op, hits) in zip(self.program.opcodes, self.hits): counts[op] += hits
+        return dict(sorted(
+            ((OPCODES[op].name, n) for (op, n) in enumerate(counts) if (n > 0)), key = lambda e: (-e[1], e[0])
+        ))
+
+def _formatNumber(v) -> str:
+    # As JS formats numbers.
+    if (isinstance(v, float)):
+        if (v.is_integer() and abs(v) < 1e21): return str(int(v))
+        if (v != v): return "NaN"
+        if (math.isinf(v)): return "Infinity" if (v > 0) else "-Infinity"
+        return repr(v).replace("e-0", "e-")
+    return str(v)
+
+def _truncDiv(a, b):
+    if (b == 0): raise ZeroDivisionError()
+    if (type(a) is int and type(b) is int):
+        q = abs(a) // abs(b)
+        return q if ((a < 0) == (b < 0)) else -q
+    return math.trunc(a / b)
+
+def _mod(a, b):
+    # Takes the sign of the dividend, as JS does.
+    if (b == 0): raise ZeroDivisionError()
+    if (type(a) is int and type(b) is int): return a - b * _truncDiv(a, b)
+    return math.fmod(a, b)
+
+_NUMBERS = (int, float)
+
+class Machine:
+    """
+    Runs an assembled program, reading the lines of a scripted input (see READ) and collecting it's output.
+    """
+    def __init__(self, program: Program, input = (), stdout = None):
+        self.program = program
+        self.input = iter(input.splitlines() if isinstance(input, str) else input)
+        self.stdout = stdout
+        self._stack = [] # The operand stack of the last run.
+
+    def _bind(self, out: list) -> list:
+        """
+            Builds the handler table, with the handlers closing over the registers of a new run.
+            Handlers return the index of the next instruction if they jump, None otherwise.
+        """
+        stack = self._stack = []
+        push = stack.append
+        pop = stack.pop
+        frames = []
+        heap = []
+        fp = 0
+        inp = self.input
+
+        def num(v):
+            if (v.__class__ not in _NUMBERS): raise TypeError(f"Expected a number, got {v!r}.")
+            return v
+
+        def string(v):
+            if (v.__class__ is not str): raise TypeError(f"Expected a string, got {v!r}.")
+            return v
+
+        def address(v, code = False):
+            if (v.__class__ is not Address or (v.block == None) != code):
+                raise TypeError(f"Expected {'a code' if code else 'an'} address, got {v!r}.")
+            return v
+
+        def slot(a: Address, offset: int) -> int:
+            i = a.index + offset
+            if (i < 0 or i >= len(a.block)): raise IndexError(f"Access out of bounds at {a!r}{offset:+}.")
+            return i
+
+        def local(offset: int) -> int:
+            i = fp + offset
+            if (i < 0 or i >= len(stack)): raise IndexError(f"Access out of bounds at fp{offset:+}.")
+            return i
+
+        def binary(fn):
+            def h(_):
+                b = pop()
+                a = pop()
+                if (a.__class__ not in _NUMBERS or b.__class__ not in _NUMBERS):
+                    raise TypeError(f"Expected numbers, got {a!r} and {b!r}.")
+                push(fn(a, b))
+            return h
+
+        def real(fn):
+            return binary(lambda a, b: fn(float(a), float(b)))
+
+        def compare(fn):
+            return binary(lambda a, b: 1 if fn(a, b) else 0)
+
+        def unary(fn, check = num):
+            def h(_): push(fn(check(pop())))
+            return h
+
+        # Data Manip
+        def PUSHN(n):
+            stack.extend([0] * n)
+        def PUSHG(n):
+            push(stack[slot(Address(stack, 0), n)])
+        def PUSHL(n):
+            push(stack[local(n)])
+        def PUSHSP(_):
+            push(Address(stack, len(stack)))
+        def PUSHFP(_):
+            push(Address(stack, fp))
+        def PUSHGP(_):
+            push(Address(stack, 0))
+        def PUSHST(n):
+            if (n < 0 or n >= len(heap)): raise IndexError(f"No structure {n}.")
+            push(Address(heap[n], 0))
+        def LOAD(n):
+            a = address(pop())
+            push(a.block[slot(a, n)])
+        def LOADN(_):
+            n = num(pop())
+            a = address(pop())
+            push(a.block[slot(a, n)])
+        def DUP(n):
+            if (n > len(stack)): raise IndexError("Stack underflow.")
+            stack.extend(stack[len(stack) - n:])
+        def DUPN(_):
+            DUP(num(pop()))
+        def POP(n):
+            if (n > len(stack)): raise IndexError("Stack underflow.")
+            del stack[len(stack) - n:]
+        def POPN(_):
+            POP(num(pop()))
+
+        # OpStack Manip
+        def STOREL(n):
+            v = pop()
+            stack[local(n)] = v
+        def STOREG(n):
+            v = pop()
+            stack[slot(Address(stack, 0), n)] = v
+        def STORE(n):
+            v = pop()
+            a = address(pop())
+            a.block[slot(a, n)] = v
+        def STOREN(_):
+            v = pop()
+            n = num(pop())
+            a = address(pop())
+            a.block[slot(a, n)] = v
+        def SWAP(_):
+            b = pop()
+            a = pop()
+            push(b)
+            push(a)
+
+        # Heap ops
+        def ALLOC(n):
+            block = [0] * n
+            heap.append(block)
+            push(Address(block, 0))
+        def ALLOCN(_):
+            ALLOC(num(pop()))
+        def FREE(_):
+            address(pop())
+        def POPST(_):
+            if (len(heap) == 0): raise IndexError("No structure to pop.")
+            heap.pop()
+
+        # I/O
+        def write(v):
+            out.append(v)
+        def READ(_):
+            line = next(inp, None)
+            if (line == None): raise EOFError("End of input.")
+            push(line)
+
+        # Control
+        def PUSHA(target):
+            push(Address(None, target))
+        def JUMP(target):
+            return target
+        def JZ(target):
+            if (num(pop()) == 0): return target
+        def CALL(ret):
+            nonlocal fp
+            a = address(pop(), True)
+            frames.append((ret, fp))
+            fp = len(stack)
+            return a.index
+        def RETURN(_):
+            nonlocal fp
+            if (len(frames) == 0): raise IndexError("Return outside of a call.")
+            del stack[fp:]
+            (ret, fp) = frames.pop()
+            return ret
+        def START(_):
+            nonlocal fp
+            fp = len(stack)
+        def NOP(_):
+            pass
+        def ERR(msg):
+            raise RuntimeError(msg)
+        def STOP(_):
+            return -1
+        def CHECK(bounds):
+            v = num(stack[-1])
+            if (v < bounds[0] or v > bounds[1]): raise IndexError(f"{v} is out of the range {bounds[0]}..{bounds[1]}.")
+
+        def charAt(_):
+            i = num(pop())
+            s = string(pop())
+            if (i < 0 or i >= len(s)): raise IndexError(f"Character {i} is out of bounds.")
+            push(ord(s[i]))
+        def concat(_):
+            b = string(pop())
+            a = string(pop())
+            push(a + b)
+
+        handlers = {
+            # Integer Arithmetic
+            "ADD": binary(operator.add),
+            "SUB": binary(operator.sub),
+            "MUL": binary(operator.mul),
+            "DIV": binary(_truncDiv),
+            "MOD": binary(_mod),
+            "NOT": unary(lambda v: 1 if (v == 0) else 0),
+            "INF": compare(operator.lt),
+            "INFEQ": compare(operator.le),
+            "SUP": compare(operator.gt),
+            "SUPEQ": compare(operator.ge),
+
+            # Real Arithmetic
+            "FADD": real(operator.add),
+            "FSUB": real(operator.sub),
+            "FMUL": real(operator.mul),
+            "FDIV": real(operator.truediv),
+            "FINF": compare(operator.lt),
+            "FSIN": unary(lambda v: math.sin(v)),
+            "FCOS": unary(lambda v: math.cos(v)),
+            "FINFEQ": compare(operator.le),
+            "FSUP": compare(operator.gt),
+            "FSUPEQ": compare(operator.ge),
+
+            # String Ops
+            "CONCAT": concat,
+            "CHRCODE": unary(lambda s: ord(s[0]), string),
+            "STRLEN": unary(len, string),
+            "CHARAT": charAt,
+
+            # Binary Ops
+            "CHECK": CHECK,
+            "AND": binary(lambda a, b: 1 if (a != 0 and b != 0) else 0),
+            "OR": binary(lambda a, b: 1 if (a != 0 or b != 0) else 0),
+            "EQUAL": lambda _: push(1 if (pop() == pop()) else 0),
+
+            # Conversion
+            "ATOI": unary(int, string),
+            "ATOF": unary(float, string),
+            "ITOF": unary(float),
+            "FTOI": unary(math.trunc),
+            "STRI": unary(_formatNumber),
+            "STRF": unary(_formatNumber),
+
+            # Data Manip
+            "PUSHI": push,
+            "PUSHN": PUSHN,
+            "PUSHF": lambda v: push(float(v)),
+            "PUSHS": push,
+            "PUSHG": PUSHG,
+            "PUSHL": PUSHL,
+            "PUSHSP": PUSHSP,
+            "PUSHFP": PUSHFP,
+            "PUSHGP": PUSHGP,
+            "PUSHST": PUSHST,
+            "LOAD": LOAD,
+            "LOADN": LOADN,
+            "DUP": DUP,
+            "DUPN": DUPN,
+            "POP": POP,
+            "POPN": POPN,
+
+            # OpStack Manip
+            "STOREL": STOREL,
+            "STOREG": STOREG,
+            "STORE": STORE,
+            "STOREN": STOREN,
+            "SWAP": SWAP,
+
+            # Heap ops
+            "ALLOC": ALLOC,
+            "ALLOCN": ALLOCN,
+            "FREE": FREE,
+            "POPST": POPST,
+
+            # I/O
+            "WRITEI": lambda _: write(_formatNumber(num(pop()))),
+            "WRITEF": lambda _: write(_formatNumber(num(pop()))),
+            "WRITES": lambda _: write(string(pop())),
+            "WRITELN": lambda _: write("\n"),
+            "WRITECHR": lambda _: write(chr(num(pop()))),
+            "READ": READ,
+
+            # Control
+            "PUSHA": PUSHA,
+            "JUMP": JUMP,
+            "JZ": JZ,
+            "CALL": CALL,
+            "RETURN": RETURN,
+            "START": START,
+            "NOP": NOP,
+            "ERR": ERR,
+            "STOP": STOP,
+        }
+
+        return [handlers[c.name] for c in OPCODES]
+
+    def run(self, maxSteps: int = None) -> ExecutionResult:
+        """
+            Runs the program from it's first instruction until it stops, falls through it's last instruction, or errors
+            out. If a maximum number of steps is given, running more instructions than that is an error.
+        """
+        program = self.program
+        out = []
+        table = self._bind(out)
+
+        # Every instruction is bound to it's handler, and a STOP is appended for the program to fall through into.
+        code = [(table[op], arg) for (op, arg) in zip(program.opcodes, program.operands)]
+        code.append((table[_OPCODE_IDS["STOP"]], None))
+        hits = [0] * len(code)
+
+        error = None
+        pc = 0
+        steps = 0
+        try:
+            while True:
+                i = pc
+                (h, arg) = code[i]
+                hits[i] += 1
+                pc = h(arg)
+                if (pc == None): pc = i + 1
+                elif (pc < 0): break
+
+                if (maxSteps != None):
+                    steps += 1
+                    if (steps > maxSteps): raise RuntimeError(f"Exceeded {maxSteps} steps.")
+        except (ArithmeticError, TypeError, ValueError, LookupError, EOFError, RuntimeError) as e:
+            if (isinstance(e, ZeroDivisionError)): e = "Division by zero."
+            line = program.lines[i] if (i < len(program)) else None
+            error = EWVMError(f"{OPCODES[program.opcodes[i]].name if (line != None) else 'STOP'}: {e}", line)
+
+        hits.pop() # The appended STOP.
+        output = "".join(out)
+        if (self.stdout != None): self.stdout.write(output)
+        return ExecutionResult(program, output, hits, error, len(self._stack))
+#endregion ------- Machine -------
+
+def runProgram(text: str, input = (), maxSteps: int = None) -> ExecutionResult:
+    """
+        Assembles and runs the text of an EWVM program, with the given input lines.
+    """
+    return Machine(assemble(text), input).run(maxSteps)
@@ -0,0 +1,306 @@
+import sys
+import json
+import struct
+from array import array
+from enum import Enum
+import compiler.ast as ast
+from compiler.lexer import TokenPos
+
+#
+# Flat AST
+#
+#   This module defines an alternative encoding of an AST (see ast.py), in which the nodes are stored on array-backed
+# columns instead of one object per node:
+#
+#   - kinds:      The kind of each node, as an index on NODE_KINDS.
+#   - spans:      The source span of each node, as (start pos, row, column, end pos, row, column) sextuples. A start or
+#                 end pos of NO_OFFSET stands for a node that was not positioned by the parser (see ast._NO_POS).
+#   - fieldEnds:  The end offset of the fields of each node on the fields column. The fields of a node are the slots
+#                 declared by its class (see nodeFields), in declaration order.
+#   - fields:     The references to the field values (see below).
+#   - listEnds:   The end offset of the items of each list on the items column.
+#   - items:      The references to the list items.
+#   - consts:     A pool of the primitive values (strings, numbers, booleans, None and enumeration members) of the tree,
+#                 each stored once.
+#
+#   References are tagged integers, holding the index of a node, list or constant on the high bits and the tag on the
+# low bits. Shared nodes and lists are encoded once, so the sharing is preserved when the tree is decoded.
+#   All columns but the kinds are 32-bit, which limits a flat AST to sources of up to 4 GiB and 2^30 nodes.
+#
+#   The phases read the attributes of node objects, so a flat AST is materialized back into nodes (see FlatAST.node)
+# before it is analysed or generated. Keeping the flat encoding instead of the nodes (e.g. for a cache of many
+# compilation units) takes roughly a quarter of the memory, and it is serialized with a single buffer write (see
+# FlatAST.toBytes).
+#
+
+#region ------- Layout -------
+# All node classes, indexed by kind.
+NODE_KINDS: list[type] = sorted(
+    (cls for cls in vars(ast).values() if isinstance(cls, type) and issubclass(cls, ast.Node)),
+    key = lambda cls: cls.__name__
+)
+_KIND_IDS = { cls: i for (i, cls) in enumerate(NODE_KINDS) }
+
+# Slots that are not fields: the position is stored on the spans column, and symbol bindings are only set by the
+#   semantic analyser.
+_NON_FIELDS = ("_start", "_end", "symbol")
+
+def nodeFields(cls: type) -> tuple[str]:
+    """
+        Gets the names of the fields of a given node class, that is, the slots declared along it's hierarchy.
+    """
+    fields = []
+    for base in reversed(cls.__mro__):
+        for name in base.__dict__.get("__slots__", ()):
+            if (name not in _NON_FIELDS and name not in fields): fields.append(name)
+
+    return tuple(fields)
+
+_FIELDS = [nodeFields(cls) for cls in NODE_KINDS]
+
+TAG_NODE  = 0
+TAG_LIST  = 1
+TAG_CONST = 2
+TAG_UNSET = 3 # A slot that was never set.
+_TAG_BITS = 2
+_TAG_MASK = (1 << _TAG_BITS) - 1
+_UNSET = object()
+
+NO_OFFSET = 0xFFFFFFFF
+
+FORMAT_MAGIC = b"PFAST"
+FORMAT_VERSION = 1
+#endregion ------- Layout -------
+
+class FlatAST:
+    """
+    Represents an AST encoded on array-backed columns (see the module description). Use FlatAST.fromNode to encode a
+    tree, and FlatAST.node to materialize it (or any of it's subtrees) back into nodes.
+    """
+    def __init__(self):
+        self.kinds = array("B")
+        self.spans = array("I")
+        self.fieldEnds = array("I")
+        self.fields = array("I")
+        self.listEnds = array("I")
+        self.items = array("I")
+        self.consts = []
+        self.root = TAG_UNSET
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def _getNBytes(self) -> int:
+        return sum(
+            len(col) * col.itemsize
+            for col in (self.kinds, self.spans, self.fieldEnds, self.fields, self.listEnds, self.items)
+        )
+    nbytes = property(_getNBytes)
+
+    #region ------- Encoding -------
+    @classmethod
+    def fromNode(cls, root: ast.Node) -> "FlatAST":
+        """
+            Encodes the tree rooted at a given node.
+        """
+        flat = cls()
+        flat._encode(root)
+        return flat
+
+    def _encode(self, root):
+        constIds = {}
+        refs = {} # Encoded nodes and lists, by identity.
+        pending = []
+
+        def addSpan(n: ast.Node):
+            start = n._start
+            end = n._end
+            if (start is ast._NO_POS): self.spans.extend((NO_OFFSET, 0, 0))
+            else: self.spans.extend((start._startPos, start.startRow, start.startCol))
+            if (end is ast._NO_POS): self.spans.extend((NO_OFFSET, 0, 0))
+            else: self.spans.extend((end._endPos, end.endRow, end.endCol))
+
+        def ref(v) -> int:
+            if (v is _UNSET): return TAG_UNSET
+
+            if (isinstance(v, (ast.Node, list))):
+                r = refs.get(id(v))
+                if (r != None): return r
+
+                if (isinstance(v, ast.Node)):
+                    kind = _KIND_IDS.get(type(v))
+                    if (kind == None): raise TypeError(f"Cannot encode a node of type '{type(v).__name__}'.")
+
+                    values = [getattr(v, name, _UNSET) for name in _FIELDS[kind]]
+                    r = (len(self.kinds) << _TAG_BITS) | TAG_NODE
+                    self.kinds.append(kind)
+                    addSpan(v)
+                    col = self.fields
+                    self.fieldEnds.append(len(col) + len(values))
+                else:
+                    values = v
+                    r = (len(self.listEnds) << _TAG_BITS) | TAG_LIST
+                    col = self.items
+                    self.listEnds.append(len(col) + len(values))
+
+                # The references of the values are filled in later, in order not to recurse on deep trees.
+                refs[id(v)] = r
+                pending.append((col, len(col), values))
+                col.extend([TAG_UNSET] * len(values))
+                return r
+
+            if (v != None and not isinstance(v, (str, int, float, Enum))):
+                raise TypeError(f"Cannot encode a value of type '{type(v).__name__}'.")
+
+            # Reals that compare equal (0.0 and -0.0) are told apart.
+            key = (type(v), repr(v) if isinstance(v, float) else v)
+            c = constIds.get(key)
+            if (c == None):
+                c = constIds[key] = len(self.consts)
+                self.consts.append(v)
+
+            return (c << _TAG_BITS) | TAG_CONST
+
+        # Nodes and lists are keyed by identity, which is stable as they are all reachable from the root.
+        self.root = ref(root)
+        while (len(pending) > 0):
+            (col, base, values) = pending.pop()
+            for (i, v) in enumerate(values): col[base + i] = ref(v)
+    #endregion ------- Encoding -------
+
+    #region ------- Decoding -------
+    def node(self, index: int = None) -> ast.Node:
+        """
+            Materializes the node at a given index, with all of it's subtree, back into node objects. If no index is
+            given, the whole tree is materialized.
+        """
+        return self._decode(self.root if (index == None) else (index << _TAG_BITS) | TAG_NODE)
+
+    def kindOf(self, index: int) -> type:
+        """
+            Gets the class of the node at a given index, without materializing it.
+        """
+        return NODE_KINDS[self.kinds[index]]
+
+    def spanOf(self, index: int) -> tuple[int]:
+        """
+            Gets the (start pos, row, column, end pos, row, column) span of the node at a given index.
+        """
+        return tuple(self.spans[index * 6:index * 6 + 6])
+
+    def _decode(self, root: int):
+        objs = {}
+        pending = []
+
+        def value(r: int):
+            tag = r & _TAG_MASK
+            i = r >> _TAG_BITS
+            if (tag == TAG_CONST): return self.consts[i]
+            elif (tag == TAG_UNSET): return _UNSET
+
+            # Nodes may override __eq__, hence the identity checks.
+            v = objs.get(r)
+            if (v is not None): return v
+
+            if (tag == TAG_NODE):
+                kind = self.kinds[i]
+                cls = NODE_KINDS[kind]
+                v = cls.__new__(cls)
+                v.symbol = None
+                (v._start, v._end) = self._positions(i)
+
+                start = self.fieldEnds[i - 1] if (i > 0) else 0
+                pending.append((v, _FIELDS[kind], self.fields[start:self.fieldEnds[i]]))
+            else:
+                start = self.listEnds[i - 1] if (i > 0) else 0
+                v = []
+                pending.append((v, None, self.items[start:self.listEnds[i]]))
+
+            objs[r] = v
+            return v
+
+        ret = value(root)
+        while (len(pending) > 0):
+            (v, names, refs) = pending.pop()
+            if (names == None):
+                v.extend(value(r) for r in refs)
+                continue
+
+            for (name, r) in zip(names, refs):
+                field = value(r)
+                if (field is not _UNSET): setattr(v, name, field)
+
+        return None if (ret is _UNSET) else ret
+
+    def _positions(self, i: int) -> (TokenPos, TokenPos):
+        (sp, sr, sc, ep, er, ec) = self.spans[i * 6:i * 6 + 6]
+        if (sp == NO_OFFSET and ep == NO_OFFSET): return (ast._NO_POS, ast._NO_POS)
+        elif (sp == NO_OFFSET): return (ast._NO_POS, TokenPos.resolved((ep, er, ec), (ep, er, ec)))
+        elif (ep == NO_OFFSET): return (TokenPos.resolved((sp, sr, sc), (sp, sr, sc)), ast._NO_POS)
+
+        # Only the start of the start position and the end of the end position are read, so both can be shared.
+        pos = TokenPos.resolved((sp, sr, sc), (ep, er, ec))
+        return (pos, pos)
+    #endregion ------- Decoding -------
+
+    #region ------- Serialization -------
+    def _columns(self):
+        return (self.kinds, self.spans, self.fieldEnds, self.fields, self.listEnds, self.items)
+
+    def toBytes(self) -> bytes:
+        """
+            Serializes this flat AST into a single buffer: a header, the columns in little-endian byte order, and the
+            constant pool as JSON.
+        """
+        def encodeConst(c):
+            if (isinstance(c, Enum)): return { "enum": type(c).__name__, "name": c.name }
+            return c
+
+        meta = json.dumps({
+            "kinds": [[cls.__name__, list(fields)] for (cls, fields) in zip(NODE_KINDS, _FIELDS)],
+            "consts": [encodeConst(c) for c in self.consts],
+            "root": self.root
+        }, ensure_ascii=False).encode("utf-8")
+
+        columns = self._columns()
+        chunks = [FORMAT_MAGIC, struct.pack("<H7I", FORMAT_VERSION, *(len(col) for col in columns), len(meta))]
+        for col in columns:
+            if (sys.byteorder == "big"):
+                col = array(col.typecode, col)
+                col.byteswap()
+            chunks.append(col.tobytes())
+        chunks.append(meta)
+
+        return b"".join(chunks)
+
+    @classmethod
+    def fromBytes(cls, data: bytes) -> "FlatAST":
+        """
+            Deserializes a flat AST from a buffer written by FlatAST.toBytes.
+            Raises a ValueError if the buffer is malformed, or was written for a different set of node classes.
+        """
+        if (data[:len(FORMAT_MAGIC)] != FORMAT_MAGIC): raise ValueError("Not a flat AST buffer.")
+        offset = len(FORMAT_MAGIC)
+        header = struct.unpack_from("<H7I", data, offset)
+        offset += struct.calcsize("<H7I")
+        if (header[0] != FORMAT_VERSION): raise ValueError(f"Unsupported flat AST version {header[0]}.")
+
+        flat = cls()
+        for (col, length) in zip(flat._columns(), header[1:7]):
+            size = length * col.itemsize
+            col.frombytes(data[offset:offset + size])
+            if (sys.byteorder == "big"): col.byteswap()
+            offset += size
+
+        meta = json.loads(data[offset:offset + header[7]].decode("utf-8"))
+        if (meta["kinds"] != [[c.__name__, list(fields)] for (c, fields) in zip(NODE_KINDS, _FIELDS)]):
+            raise ValueError("The flat AST was written for a different set of node classes.")
+
+        def decodeConst(c):
+            if (isinstance(c, dict)): return getattr(ast, c["enum"])[c["name"]]
+            return c
+
+        flat.consts = [decodeConst(c) for c in meta["consts"]]
+        flat.root = meta["root"]
+        return flat
+    #endregion ------- Serialization -------
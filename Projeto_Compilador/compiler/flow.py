@@ -0,0 +1,222 @@
+from compiler.codegen import CodeID, CodeTree, CodePoint
+from compiler.compilation import getCompilation
+from compiler.diag import Diagnostic, DiagnosticSource, DiagnosticType, DiagnosticKind
+
+#
+# Control Flow Optimizer
+#
+#   This module defines a control flow pass run over the code tree of a program (see codegen.CodeTree), after it was
+# generated and peephole optimized (see optim.py). Unlike peephole rules, which only see a short sequence of a single
+# tree, the pass sees every label of the program, along with every jump to it, and simplifies the flow between them:
+#
+#   - merge:        Adjacent labels are merged into the first, and jumps to the others are redirected to it (e.g. the
+#                   else and end labels of a conditional statement without an else clause).
+#   - thread:       Jumps to a label followed by a JUMP are redirected to the target of that JUMP, and so on.
+#   - fallthrough:  Jumps to one of the labels immediately after them fall through instead. As JZ pops the condition,
+#                   it is replaced with a POP.
+#   - unreachable:  Instructions which no path from the entry of a tree reaches (e.g. blocks after a JUMP, STOP or
+#                   RETURN, only jumped to from such blocks) are removed.
+#   - labels:       Labels no instruction refers to are removed.
+#
+#   The steps are repeated until none of them changes the program, as each may expose work for the others. Subtrees are
+# kept where they are, and the entry of each tree is assumed to be reachable, as activatables are entered through CALL.
+# Programs marking a label more than once (e.g. a statement label colliding with a generated one) are left as they are.
+#
+#   The pass reports the instructions and labels it removed, by step, as a diagnostic of the compilation (see
+# Compilation.getOptimizerDiagnostics).
+#
+
+# The steps are repeated at most this many times, in case jumps keep being threaded around a cycle.
+_MAX_ROUNDS = 16
+
+_JUMPS = { CodeID.JUMP, CodeID.JZ, CodeID.PUSHA }
+_TERMINATORS = { CodeID.JUMP, CodeID.STOP, CodeID.RETURN }
+
+def _collectTrees(bld: CodeTree) -> list[CodeTree]:
+    res = []
+    pending = [bld]
+    while (len(pending) > 0):
+        tree = pending.pop()
+        res.append(tree)
+        pending += [args[0] for (p, args) in reversed(tree.stack) if (p == CodeID._SUBTREE)]
+    return res
+
+class FlowOptimizer:
+    """
+    Runs the steps of the control flow pass (see the module description) over code trees, until the code no longer
+    changes.
+    """
+    def __init__(self):
+        self.removed: dict[str, int] = {} # The instructions and labels removed by each step, over every run.
+        self.threaded = 0 # The jumps redirected by the thread step, over every run.
+
+    #region ------- Steps -------
+    def _labels(self, trees: list[CodeTree]) -> dict[int, (list[CodePoint], int)]:
+        # The stack and index each label is marked at, or None if a label is marked more than once.
+        res = {}
+        for tree in trees:
+            for (i, (p, args)) in enumerate(tree.stack):
+                if (p != CodeID._LABEL): continue
+                if (args[0] in res): return None
+                res[args[0]] = (tree.stack, i)
+        return res
+
+    def _redirect(self, trees: list[CodeTree], targets: dict[int, int]) -> int:
+        # Redirects the jumps to each of the given labels. Code points are replaced, as they may be shared.
+        count = 0
+        for tree in trees:
+            stack = tree.stack
+            for (i, (p, args)) in enumerate(stack):
+                if (p in _JUMPS and args[0] in targets):
+                    stack[i] = (p, [targets[args[0]]])
+                    count += 1
+        return count
+
+    def mergeLabels(self, trees: list[CodeTree]) -> int:
+        aliases = {}
+        for tree in trees:
+            stack = tree.stack
+            kept = []
+            for (i, p) in enumerate(stack):
+                if (p[0] == CodeID._LABEL and i > 0 and stack[i - 1][0] == CodeID._LABEL):
+                    # Chained aliases resolve to the first label of the run.
+                    aliases[p[1][0]] = aliases.get(stack[i - 1][1][0], stack[i - 1][1][0])
+                    continue
+                kept.append(p)
+            stack[:] = kept
+
+        self._redirect(trees, aliases)
+        return len(aliases)
+
+    def threadJumps(self, trees: list[CodeTree], labels: dict[int, (list[CodePoint], int)]) -> int:
+        def follow(label: int) -> CodePoint:
+            # The first instruction after a label, if it is on the same tree.
+            (stack, i) = labels[label]
+            while (i < len(stack) and stack[i][0] == CodeID._LABEL): i += 1
+            return stack[i] if (i < len(stack) and stack[i][0] != CodeID._SUBTREE) else None
+
+        targets = {}
+        for label in labels:
+            seen = { label }
+            target = label
+            while True:
+                p = follow(target)
+                if (p == None or p[0] != CodeID.JUMP or p[1][0] in seen or p[1][0] not in labels): break
+                target = p[1][0]
+                seen.add(target)
+            if (target != label): targets[label] = target
+
+        # PUSHA takes the address of an activatable, which is entered through CALL and never threaded.
+        count = 0
+        for tree in trees:
+            stack = tree.stack
+            for (i, (p, args)) in enumerate(stack):
+                if ((p == CodeID.JUMP or p == CodeID.JZ) and args[0] in targets):
+                    stack[i] = (p, [targets[args[0]]])
+                    count += 1
+        return count
+
+    def removeFallthroughs(self, trees: list[CodeTree]) -> int:
+        count = 0
+        for tree in trees:
+            stack = tree.stack
+            kept = []
+            for (i, p) in enumerate(stack):
+                if (p[0] == CodeID.JUMP or p[0] == CodeID.JZ):
+                    j = i + 1
+                    while (j < len(stack) and stack[j][0] == CodeID._LABEL and stack[j][1][0] != p[1][0]): j += 1
+                    if (j < len(stack) and stack[j][0] == CodeID._LABEL):
+                        if (p[0] == CodeID.JZ): kept.append((CodeID.POP, [1]))
+                        else: count += 1
+                        continue
+                kept.append(p)
+            stack[:] = kept
+        return count
+
+    def removeUnreachable(self, trees: list[CodeTree], labels: dict[int, (list[CodePoint], int)]) -> int:
+        reached = { id(tree.stack): set() for tree in trees }
+        pending = [(tree.stack, 0) for tree in trees]
+        while (len(pending) > 0):
+            (stack, i) = pending.pop()
+            seen = reached[id(stack)]
+            while (i < len(stack) and i not in seen):
+                seen.add(i)
+                (p, args) = stack[i]
+                if (p in _JUMPS and args[0] in labels): pending.append(labels[args[0]])
+                if (p in _TERMINATORS): break
+                i += 1
+
+        # Unreached labels are left for the labels step, as no reached instruction refers to them.
+        count = 0
+        for tree in trees:
+            stack = tree.stack
+            seen = reached[id(stack)]
+            kept = [
+                p for (i, p) in enumerate(stack) if (i in seen or p[0] == CodeID._SUBTREE or p[0] == CodeID._LABEL)
+            ]
+            count += len(stack) - len(kept)
+            stack[:] = kept
+        return count
+
+    def removeLabels(self, trees: list[CodeTree]) -> int:
+        referenced = { args[0] for tree in trees for (p, args) in tree.stack if (p in _JUMPS) }
+        count = 0
+        for tree in trees:
+            stack = tree.stack
+            kept = [p for p in stack if (p[0] != CodeID._LABEL or p[1][0] in referenced)]
+            count += len(stack) - len(kept)
+            stack[:] = kept
+        return count
+    #endregion ------- Steps -------
+
+    def optimizeTree(self, bld: CodeTree, removed: dict[str, int]):
+        """
+            Simplifies the control flow of a code tree in place, along with it's subtrees, counting the instructions and
+            labels removed by each step. Threaded jumps are not removed, and thus are not counted.
+        """
+        trees = _collectTrees(bld)
+        if (self._labels(trees) == None): return
+
+        for _ in range(0, _MAX_ROUNDS):
+            changed = 0
+            n = self.mergeLabels(trees)
+            removed["merge"] = removed.get("merge", 0) + n
+            changed += n
+
+            n = self.threadJumps(trees, self._labels(trees))
+            self.threaded += n
+            changed += n
+
+            n = self.removeFallthroughs(trees)
+            removed["fallthrough"] = removed.get("fallthrough", 0) + n
+            changed += n
+
+            n = self.removeUnreachable(trees, self._labels(trees))
+            removed["unreachable"] = removed.get("unreachable", 0) + n
+            changed += n
+
+            n = self.removeLabels(trees)
+            removed["labels"] = removed.get("labels", 0) + n
+            changed += n
+
+            if (changed == 0): break
+
+    def run(self, bld: CodeTree) -> dict[str, int]:
+        """
+            Simplifies the control flow of the code tree of a program in place, and reports the instructions and labels
+            removed on the active compilation (see compilation.py). Returns the number removed by each step.
+        """
+        removed = {}
+        self.optimizeTree(bld, removed)
+        for (name, n) in removed.items(): self.removed[name] = self.removed.get(name, 0) + n
+
+        total = sum(removed.values())
+        if (total > 0):
+            getCompilation().optimDiagnostics.append(Diagnostic(
+                DiagnosticSource.OPTIM, DiagnosticType.FLOW_SIMPLIFIED, DiagnosticKind.INFO, args = {
+                    "count": total,
+                    "steps": ", ".join(f"{name}: {n}" for (name, n) in removed.items() if (n != 0))
+                }
+            ))
+
+        return removed
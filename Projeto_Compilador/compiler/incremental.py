@@ -0,0 +1,251 @@
+import re
+import hashlib
+from enum import Enum
+import compiler.ast as ast
+from compiler.flatast import nodeFields
+from compiler.codegen import CodeBuffer, CodeID, CodeTree, getActivatable, getLabelId
+
+#
+# Incremental Compilation
+#
+#   This module defines the incremental unit of a program: the results of analysing and generating each of it's
+# (top-level) activatables, kept across successive compilations of the program (e.g. while it is being edited), in
+# order for the activatables that did not change not to be analysed and generated again.
+#
+#   Each top-level declaration (constant, type, variable or activatable) of a program is fingerprinted with a hash over
+# it's source text or, if the source text is not available (e.g. the program was streamed), over it's structure (see
+# fingerprint). Neither depends on where the declaration is, so moving a declaration around does not change it. An
+# activatable depends on every top-level declaration whose name it mentions (which over-approximates the names it
+# resolves), and, transitively, on their dependencies. The key of an activatable is a hash over it's fingerprint and
+# the fingerprints of all of it's dependencies, so changing a declaration changes the key of every activatable that
+# depends on it.
+#
+#   When an activatable is analysed (see semanaler.s_procedureOrFunctionCommon), if the unit holds a successful
+# analysis of the same key, only it's heading is analysed, which declares the symbols other declarations depend on.
+# When it is generated (see codegen.emitActivatable), if the unit holds a code tree of the same key, that tree is
+# spliced back instead, with it's labels renumbered as if it was generated again: the entry label is the one of the
+# new tree, the labels it allocated are allocated again, in the same order, and the entry labels of the activatables it
+# calls are the ones of the new trees of those activatables. The generated code is thus identical to the code of a
+# compilation from scratch.
+#
+#   The main program block is always analysed and generated.
+#
+
+#region ------- Fingerprints -------
+_END = object()
+_FIELDS: dict[type, tuple[str]] = {}
+_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+def fingerprint(n: ast.Node, source: str = None) -> (bytes, set[str]):
+    """
+        Computes the fingerprint of a given subtree. Returns the fingerprint along with the set of names (identifiers,
+        keys and literals) found on the subtree.
+        If the source text the subtree was parsed from is given, the fingerprint is a hash over the text the subtree
+        spans. Otherwise, it is a hash over the node types and field values, in order, excluding the positions and
+        symbol bindings.
+    """
+    if (source != None and n._start is not ast._NO_POS and n._end is not ast._NO_POS):
+        text = source[n._startPos:n._endPos]
+        return (hashlib.sha256(text.encode("utf-8", "surrogatepass")).digest(), set(_NAME.findall(text)))
+
+    parts = []
+    names = set()
+
+    stack = [n]
+    while (len(stack) > 0):
+        v = stack.pop()
+        if (isinstance(v, ast.Node)):
+            cls = type(v)
+            fields = _FIELDS.get(cls)
+            if (fields == None): fields = _FIELDS[cls] = tuple(reversed(nodeFields(cls)))
+
+            parts.append(f"<{cls.__name__}")
+            stack.append(_END)
+            stack.extend(getattr(v, name, None) for name in fields)
+        elif (isinstance(v, list)):
+            parts.append(f"[{len(v)}")
+            stack.extend(reversed(v))
+        elif (v is _END): parts.append(">")
+        else:
+            if (isinstance(v, str)): names.add(v)
+            parts.append(f"{type(v).__name__}:{v.name if isinstance(v, Enum) else v!r};")
+
+    return (hashlib.sha256("".join(parts).encode("utf-8", "surrogatepass")).digest(), names)
+
+def topLevelDeclarations(pout: ast.ProgramNode) -> dict[str, ast.Node]:
+    """
+        Gets the top-level declarations of a program, by name.
+    """
+    body = pout.body
+    decls = {}
+    if (body.consts != None):
+        for const in body.consts.value: decls[const.key] = const
+    if (body.types != None):
+        for btype in body.types.value: decls[btype.key] = btype
+    if (body.variables != None):
+        for bvar in body.variables.value:
+            for key in bvar.keys: decls[key.value] = bvar
+    if (body.subfuncs != None):
+        for sub in body.subfuncs.value: decls[sub.heading.name] = sub
+
+    return decls
+#endregion ------- Fingerprints -------
+
+class ActivatableRecord:
+    """
+    Represents the results of analysing and generating an activatable, for a given key.
+    """
+    def __init__(self, key: bytes):
+        self.key = key
+        self.analysed = False
+
+        # Code Generation (see IncrementalUnit.storeCode)
+        self.stack = None
+        self.firstLabel = 0
+        self.lastLabel = -1
+        self.entryLabel = None
+        self.calls = {}
+        self.frame = None
+
+class IncrementalUnit:
+    """
+    Represents the incremental unit of a program (see the module description). Pass it to every compilation of the
+    program (see Compilation), which updates it.
+    """
+    def __init__(self):
+        self.records: dict[str, ActivatableRecord] = {}
+        self._current: dict[int, (str, bytes)] = {} # The name and key of the activatables being compiled, by node.
+
+        # The activatables analysed and generated on the last compilation, and those that were skipped.
+        self.analysed: list[str] = []
+        self.skippedAnalysis: list[str] = []
+        self.generated: list[str] = []
+        self.spliced: list[str] = []
+
+    def prepare(self, pout: ast.ProgramNode, source: str = None):
+        """
+            Computes the keys of the activatables of a program, before it is analysed. If given, the declarations are
+            fingerprinted over the source text the program was parsed from.
+        """
+        decls = topLevelDeclarations(pout)
+        prints = {}
+        deps = {}
+        for (name, n) in decls.items():
+            if (id(n) in prints): continue
+            prints[id(n)] = fingerprint(n, source)
+        for (name, n) in decls.items():
+            deps[name] = { d for d in prints[id(n)][1] if d in decls and d != name }
+
+        self._current = {}
+        for (name, n) in decls.items():
+            if (not isinstance(n, (ast.ProcedureDeclarationNode, ast.FunctionDeclarationNode))): continue
+
+            # All of the transitive dependencies, in a stable order.
+            closure = set()
+            pending = [name]
+            while (len(pending) > 0):
+                for d in deps[pending.pop()]:
+                    if (d not in closure):
+                        closure.add(d)
+                        pending.append(d)
+
+            h = hashlib.sha256(prints[id(n)][0])
+            for d in sorted(closure): h.update(d.encode() + b"\0" + prints[id(decls[d])][0])
+            self._current[id(n)] = (name, h.digest())
+
+        # Records of activatables that no longer exist are dropped.
+        names = { name for (name, _) in self._current.values() }
+        self.records = { name: rec for (name, rec) in self.records.items() if name in names }
+
+        self.analysed.clear()
+        self.skippedAnalysis.clear()
+        self.generated.clear()
+        self.spliced.clear()
+
+    def getKeys(self) -> dict[str, bytes]:
+        """
+            Gets the keys of the activatables of the program being compiled, by name.
+        """
+        return { name: key for (name, key) in self._current.values() }
+
+    def _record(self, n: ast.Node, create = False) -> ActivatableRecord:
+        cur = self._current.get(id(n))
+        if (cur == None): return None # Not a top-level activatable.
+
+        (name, key) = cur
+        rec = self.records.get(name)
+        if (rec != None and rec.key == key): return rec
+        if (not create): return None
+
+        rec = self.records[name] = ActivatableRecord(key)
+        return rec
+
+    #region ------- Semantic Analysis -------
+    def isAnalysed(self, n: ast.Node) -> bool:
+        """
+            Checks whether a given activatable was successfully analysed on a previous compilation, with the same key.
+        """
+        rec = self._record(n)
+        if (rec == None or not rec.analysed): return False
+
+        self.skippedAnalysis.append(self._current[id(n)][0])
+        return True
+
+    def storeAnalysis(self, n: ast.Node, ok: bool):
+        """
+            Records the outcome of analysing a given activatable. Only analyses that succeeded without any diagnostics
+            are reused, as the diagnostics are not kept.
+        """
+        rec = self._record(n, True)
+        if (rec == None): return
+
+        rec.analysed = ok
+        self.analysed.append(self._current[id(n)][0])
+    #endregion ------- Semantic Analysis -------
+
+    #region ------- Code Generation -------
+    def storeCode(self, n: ast.Node, bld: CodeTree, firstLabel: int, lastLabel: int):
+        """
+            Records the code tree generated for a given activatable, along with the range of labels allocated while it
+            was generated.
+        """
+        rec = self._record(n, True)
+        if (rec == None): return
+
+        # The stack is copied, as later passes may rewrite the tree, onto a compact buffer (see codegen.CodeBuffer).
+        rec.stack = CodeBuffer.fromStack(bld.stack)
+        rec.firstLabel = firstLabel
+        rec.lastLabel = lastLabel
+        rec.entryLabel = bld._labelId
+        rec.calls = dict(bld._calls)
+        rec.frame = (dict(bld._varMap), bld._varId, dict(bld._argMap), bld._argId)
+        self.generated.append(self._current[id(n)][0])
+
+    def spliceCode(self, n: ast.Node, bld: CodeTree) -> bool:
+        """
+            Splices the code tree generated for a given activatable on a previous compilation, with the same key, onto
+            the given (new) tree of the activatable. Returns whether there was such a tree.
+        """
+        rec = self._record(n)
+        if (rec == None or rec.stack == None): return False
+
+        # Labels are allocated again in increasing order, which is the order they were allocated in.
+        labels = { rec.entryLabel: bld._labelId }
+        for label in range(rec.firstLabel, rec.lastLabel + 1): labels[label] = getLabelId()
+        calls = { label: getActivatable(name)._labelId for (label, name) in rec.calls.items() }
+
+        # The entry label was already marked on the new tree.
+        code = iter(rec.stack)
+        next(code)
+        for (p, args) in code:
+            if (p == CodeID._LABEL or p == CodeID.JZ or p == CodeID.JUMP): args[0] = labels.get(args[0], args[0])
+            elif (p == CodeID.PUSHA): args[0] = calls.get(args[0], args[0])
+            bld.stack.append((p, args))
+
+        bld._calls = { calls[label]: name for (label, name) in rec.calls.items() }
+        (varMap, bld._varId, argMap, bld._argId) = rec.frame
+        bld._varMap = dict(varMap)
+        bld._argMap = dict(argMap)
+        self.spliced.append(self._current[id(n)][0])
+        return True
+    #endregion ------- Code Generation -------
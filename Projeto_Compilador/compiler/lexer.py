@@ -1,48 +1,53 @@
+import sys
+from threading import Lock
 from ply import lex
+from array import array
+from bisect import bisect_left
+import codecs
+from types import MethodType
 from enum import Enum, auto
 from typing import Callable
-from util.classUtil import externalinstancemethod
 from .diag import Diagnostic, DiagnosticType, DiagnosticKind, DiagnosticSource
 
 # Section 1.B 
 #region ------- Keywords -------
-# reserved = {
-#     "and": "KW_AND",
-#     "array": "KW_ARRAY",
-#     "begin": "KW_BEGIN",
-#     "case": "KW_CASE",
-#     "const": "KW_CONST",
-#     "div": "KW_DIV",
-#     "do": "KW_DO",
-#     "downto": "KW_DOWNTO",
-#     "else": "KW_ELSE",
-#     "end": "KW_END",
-#     "file": "KW_FILE",
-#     "for": "KW_FOR",
-#     "function": "KW_FUNCTION",
-#     "goto": "KW_GOTO",
-#     "if": "KW_IF",
-#     "in": "KW_IN",
-#     "label": "KW_LABEL",
-#     "mod": "KW_MOD",
-#     "nil": "KW_NIL",
-#     "not": "KW_NOT",
-#     "of": "KW_OF",
-#     "or": "KW_OR",
-#     "packed": "KW_PACKED",
-#     "procedure": "KW_PROCEDURE",
-#     "program": "KW_PROGRAM",
-#     "record": "KW_RECORD",
-#     "repeat": "KW_REPEAT",
-#     "set": "KW_SET",
-#     "then": "KW_THEN",
-#     "to": "KW_TO",
-#     "type": "KW_TYPE",
-#     "until": "KW_UNTIL",
-#     "var": "KW_VAR",
-#     "while": "KW_WHILE",
-#     "with": "KW_WITH",
-# }
+reserved = {
+    "and": "KW_AND",
+    "array": "KW_ARRAY",
+    "begin": "KW_BEGIN",
+    "case": "KW_CASE",
+    "const": "KW_CONST",
+    "div": "KW_DIV",
+    "do": "KW_DO",
+    "downto": "KW_DOWNTO",
+    "else": "KW_ELSE",
+    "end": "KW_END",
+    "file": "KW_FILE",
+    "for": "KW_FOR",
+    "function": "KW_FUNCTION",
+    "goto": "KW_GOTO",
+    "if": "KW_IF",
+    "in": "KW_IN",
+    "label": "KW_LABEL",
+    "mod": "KW_MOD",
+    "nil": "KW_NIL",
+    "not": "KW_NOT",
+    "of": "KW_OF",
+    "or": "KW_OR",
+    "packed": "KW_PACKED",
+    "procedure": "KW_PROCEDURE",
+    "program": "KW_PROGRAM",
+    "record": "KW_RECORD",
+    "repeat": "KW_REPEAT",
+    "set": "KW_SET",
+    "then": "KW_THEN",
+    "to": "KW_TO",
+    "type": "KW_TYPE",
+    "until": "KW_UNTIL",
+    "var": "KW_VAR",
+    "while": "KW_WHILE",
+    "with": "KW_WITH",
+}
 #endregion ------- Keywords -------
 
 tokens = [
@@ -185,119 +190,19 @@ def t_UNSIGNED_INTEGER(t):
 #     return t
 
 #region ------- Section 1.B -------
-# Reserved Keywords MUST be defined before IDENTIFIER, otherwise the later will capture all input before the former 
-# have a chance to process the input.
-def t_KW_AND(t):
-    r"and\b"
-    return t
-def t_KW_ARRAY(t):
-    r"array\b"
-    return t
-def t_KW_BEGIN(t):
-    r"begin\b"
-    return t
-def t_KW_CASE(t):
-    r"case\b"
-    return t
-def t_KW_CONST(t):
-    r"const\b"
-    return t
-def t_KW_DIV(t):
-    r"div\b"
-    return t
-def t_KW_DO(t):
-    r"do\b"
-    return t
-def t_KW_DOWNTO(t):
-    r"downto\b"
-    return t
-def t_KW_ELSE(t):
-    r"else\b"
-    return t
-def t_KW_END(t):
-    r"end\b"
-    return t
-def t_KW_FILE(t):
-    r"file\b"
-    return t
-def t_KW_FOR(t):
-    r"for\b"
-    return t
-def t_KW_FUNCTION(t):
-    r"function\b"
-    return t
-def t_KW_GOTO(t):
-    r"goto\b"
-    return t
-def t_KW_IF(t):
-    r"if\b"
-    return t
-def t_KW_IN(t):
-    r"in\b"
-    return t
-def t_KW_LABEL(t):
-    r"label\b"
-    return t
-def t_KW_MOD(t):
-    r"mod\b"
-    return t
-def t_KW_NIL(t):
-    r"nil\b"
-    return t
-def t_KW_NOT(t):
-    r"not\b"
-    return t
-def t_KW_OF(t):
-    r"of\b"
-    return t
-def t_KW_OR(t):
-    r"or\b"
-    return t
-def t_KW_PACKED(t):
-    r"packed\b"
-    return t
-def t_KW_PROCEDURE(t):
-    r"procedure\b"
-    return t
-def t_KW_PROGRAM(t):
-    r"program\b"
-    return t
-def t_KW_RECORD(t):
-    r"record\b"
-    return t
-def t_KW_REPEAT(t):
-    r"repeat\b"
-    return t
-def t_KW_SET(t):
-    r"set\b"
-    return t
-def t_KW_THEN(t):
-    r"then\b"
-    return t
-def t_KW_TO(t):
-    r"to\b"
-    return t
-def t_KW_TYPE(t):
-    r"type\b"
-    return t
-def t_KW_UNTIL(t):
-    r"until\b"
-    return t
-def t_KW_VAR(t):
-    r"var\b"
-    return t
-def t_KW_WHILE(t):
-    r"while\b"
-    return t
-def t_KW_WITH(t):
-    r"with\b"
-    return t
-#region ------- Section 1.B -------
-
+# Reserved Keywords are not defined as individual rules. Instead, IDENTIFIER is matched once and then classified through
+#   the reserved table, which avoids trying every keyword pattern at each identifier position.
+# Keywords are matched exactly as they appear on the table (lowercase). Furthermore, a keyword immediately followed by
+#   a word character that is not part of an IDENTIFIER (such as "_") is kept as an IDENTIFIER, as the former keyword 
+#   rules required a word boundary after the keyword.
 def t_IDENTIFIER(t): # Section 1.C
     r"[a-zA-Z0-9]+"
-    # t.type = reserved.get(t.value, "IDENTIFIER")
+    kw = reserved.get(t.value)
+    if (kw != None):
+        nxt = t.lexer.lexdata[t.lexer.lexpos:t.lexer.lexpos + 1]
+        if (nxt != "_" and not nxt.isalnum()): t.type = kw
     return t
+#endregion ------- Section 1.B -------
 
 # Section 1.E
 # A string is defined as a sequence of characters enclosed between the character "'" (ASCII 39).
@@ -323,10 +228,10 @@ def t_SEP(t):
     for i in range(0, tvlen):
         c = t.value[i]
         if (c == "\n"):
-            offset = t.lexer.lexpos - (tvlen - i)
+            offset = getLexPos(t.lexer) - (tvlen - i)
             # print("NEWLINE", t.lexer.lineno, t.lexer.lexpos, offset, t.lexer._lastLineLexPos)
             t.lexer.lineno += 1
-            t.lexer.lineLens.append(offset - t.lexer._lastLineLexPos)
+            pushLineLen(t.lexer, offset - t.lexer._lastLineLexPos)
             t.lexer._lastLineLexPos = offset
 
     return t
@@ -349,47 +254,42 @@ class CommentBraceKind(Enum):
 
 # This rule stores metadata required during comment processing, which is cleaned up after the comment is closed:
 #   - _braceKind: Indicates which Comment Brace Kind initiated the comment. Used only for diagnostics.
-#   - _commentPos: Indicates the position at which the comment started. Used to retroactively recalculate the 
-# line positions on the lexer (see lexer.lineLens).
+#   - _commentPos: Indicates the position at which the comment started. Used for diagnostics.
+#   - _commentLines: The number of lines the comment body has spanned so far (see t_comment_COMMENT_BODY).
 # This rule changes the lexer state to "comment".
 def t_LBRACE(t):
     r"\{|(?:\(\*)"
     t.lexer._braceKind = CommentBraceKind.getKind(t.value)
-    t.lexer._commentPos = t.lexer.lexpos
+    t.lexer._commentPos = getLexPos(t.lexer)
+    t.lexer._commentLines = 0
     t.lexer.begin("comment")
     # return t
 
-# The comment body is kept purely for internal usage, to calculate the line metadata retroactively. 
-# It is not possible to access the comment body data beyond lextime.
+# The comment body is not kept. Instead, the lengths of the lines within it are accounted as the body is consumed, which
+#   allows a comment to be lexed in multiple pieces (see lexer.inputStream).
+# Each newline ends a line right after itself, unlike separators (see t_SEP), where the newline starts the next line.
 def t_comment_COMMENT_BODY(t): # Section 1.A
     r"(?!(?:\*\))|})[\s\S]+?(?=\*\)|}|$)"
-    t.lexer._commentBody = t.value
-
-# This rule closes the comment and retroactively calculates the lengths of the lines within the comment body.
+    l = t.lexer
+    bodyPos = getLexPos(l) - len(t.value)
+
+    i = t.value.find("\n")
+    while (i != -1):
+        pushLineLen(l, bodyPos + i + 1 - l._lastLineLexPos)
+        l._lastLineLexPos = bodyPos + i + 1
+        l.lineno += 1
+        l._commentLines += 1
+        i = t.value.find("\n", i + 1)
+
+# This rule closes the comment. If the comment spanned multiple lines, the line position is pushed past the closing 
+#   delimiter, minus one character.
 # Additionally, a diagnostic for mismatched comment delimiters is also evaluated here.
 # The metadata defined by t_LBRACE is cleared at the end of this function and the lexer state is returned to INITIAL.
 def t_comment_RBRACE(t):
     r"\}|(?:\*\))"
 
-    cbLines = t.lexer._commentBody.split("\n")
-
-    # If comment spans multiple lines, process them. Otherwise just advance the character counter.
-    if (len(cbLines) != 1):
-        for i in range(0, len(cbLines)):
-            if (i == 0): # Comment probably started not at the beginning of the line. Handle it.
-                t.lexer.lineLens.append(len(cbLines[i]) + (t.lexer._commentPos - t.lexer._lastLineLexPos) + 1)
-                t.lexer._lastLineLexPos = t.lexer._commentPos + len(cbLines[i]) + 1
-            elif (i == len(cbLines) - 1):
-                # Early break. Let the t_ANY_NEWLINE rule handle the line.
-                break
-            else:
-                t.lexer.lineLens.append(len(cbLines[i]) + 1)
-                t.lexer._lastLineLexPos = t.lexer._lastLineLexPos + len(cbLines[i]) + 1
-            
-        t.lexer.lineno += len(cbLines) - 1
+    if (t.lexer._commentLines != 0):
         t.lexer._lastLineLexPos += len(t.value) - 1
-    else:
-        t.lexer._lastLineLexPos = t.lexer._lastLineLexPos
 
     # According to Section 4, the definition of a comment defines that a comment is valid, even if it's delimiters
     #  are mismatched. For diagnostic purposes, mismatches are caught and reported, but do not halt.
@@ -402,27 +302,25 @@ def t_comment_RBRACE(t):
 
     t.lexer._braceKind = None
     t.lexer._commentPos = None
-    t.lexer._commentBody = None
+    t.lexer._commentLines = None
     t.lexer.begin("INITIAL")
 
-# This rule triggers if a comment was opened, but never closed. When it is triggered, it will retroactively calculate
-#   the line metadata captured by the comment body (in this specific case, the entire file after the comment starter),
-#   mostly for diagnostic purposes.
+# This rule triggers if a comment was opened, but never closed. When it is triggered, the rest of the file after the
+#   comment starter has already been accounted for by t_comment_COMMENT_BODY, except for the last line, which is 
+#   pushed here, mostly for diagnostic purposes.
+# When lexing from a stream, reaching the end of the buffered input does not mean the comment is unterminated. In that
+#   case, the next chunk is buffered instead and the lexer resumes (see lexer.inputStream).
 # While this rule will emit an ERROR diagnostic, it is not a fatal error and the next phase can still attempt to process
 #   the token stream without prejudice, as there might be a valid program before the comment.
 def t_comment_eof(t):
-    # Process caught lines for diagnostic
-    cbLines = t.lexer._commentBody.split("\n")
-    for i in range(0, len(cbLines)):
-        if (i == 0): # Comment probably started not at the beginning of the line. Handle it.
-            t.lexer.lineLens.append(len(cbLines[i]) + (t.lexer._commentPos - t.lexer._lastLineLexPos) + 1)
-            t.lexer._lastLineLexPos = t.lexer._commentPos + len(cbLines[i]) + 1
-        else:
-            t.lexer.lineLens.append(len(cbLines[i]) + 1)
-            t.lexer._lastLineLexPos = t.lexer._lastLineLexPos + len(cbLines[i]) + 1
+    if (refillStream(t.lexer)): return t
 
-    t.lexer.lineLens[-1] = t.lexer.lineLens[-1] + len(t.value)
-    t.lexer.lineno += len(cbLines)
+    eofPos = getLexPos(t.lexer)
+    pushLineLen(t.lexer, eofPos - t.lexer._lastLineLexPos + 1)
+    t.lexer._lastLineLexPos = eofPos + 1
+
+    growLastLineLen(t.lexer, len(t.value))
+    t.lexer.lineno += 1
     t.lexer._lastLineLexPos += len(t.value)
     comment_error(t.lexer, DiagnosticType.NONTERMINATED_COMMENT, {})
 
@@ -444,7 +342,7 @@ def comment_warn(l, dType, dArgs = {}):
             DiagnosticKind.WARN, 
             dArgs,
             l._commentPos,
-            l.lexpos
+            getLexPos(l)
     )
     if (l.options["printDiags"]): 
     # if True:
@@ -457,7 +355,7 @@ def comment_error(l, dType, dArgs = {}):
             DiagnosticKind.ERROR, 
             dArgs,
             l._commentPos,
-            l.lexpos
+            getLexPos(l)
     )
     if (l.options["printDiags"]): 
     # if True:
@@ -483,10 +381,11 @@ def emitDiagnostic(
     dStartPos: int = None, 
     dEndPos: int = None
 ):
-    tStartPos = dStartPos if (dStartPos != None) else l.lexpos
-    tEndPos = dEndPos if (dEndPos != None) else l.lexpos
-    rcStartPos = posToRowCol(l, tStartPos)
-    rcEndPos = posToRowCol(l, tEndPos)
+    tStartPos = dStartPos if (dStartPos != None) else getLexPos(l)
+    tEndPos = dEndPos if (dEndPos != None) else getLexPos(l)
+    # Positions are (pos, row, column) tuples, as on every other diagnostic.
+    rcStartPos = (tStartPos, *posToRowCol(l, tStartPos))
+    rcEndPos = (tEndPos, *posToRowCol(l, tEndPos))
 
     diag = Diagnostic(DiagnosticSource.LEXER, dtype, dkind, rcStartPos, rcEndPos, args)
     l.diagnostics.append(diag)
@@ -496,17 +395,50 @@ def emitDiagnostic(
 
 #region ------- Lexer Utils -------
 class TokenPos:
+    """
+    Represents the location of a token on the source text.
+
+    Only the raw offsets are stored when a token is produced. The rows and columns are resolved on first access (usually
+    when a diagnostic is emitted or the AST is dumped) and cached. In order for the lazy resolution to yield the same 
+    result as resolving at creation time, the line accounting state of the lexer at creation time is captured as well.
+    """
+    __slots__ = ("_startPos", "_endPos", "_lines", "_nLines", "_lineno", "_lastLineLexPos", "_rowCol")
+
     def __init__(self, l, startPos = 0, endPos = 0):
         self._startPos = startPos
         self._endPos = endPos
-        
-        (sr, sc) = posToRowCol(l, startPos)
-        self.startRow = sr
-        self.startCol = sc
-        
-        (er, ec) = posToRowCol(l, endPos)
-        self.endRow = er
-        self.endCol = ec
+
+        self._lines = l.lineOffsets
+        self._nLines = len(l.lineOffsets)
+        self._lineno = l.lineno
+        self._lastLineLexPos = l._lastLineLexPos
+        self._rowCol = None
+
+    @classmethod
+    def resolved(cls, start: (int, int, int), end: (int, int, int)) -> "TokenPos":
+        """
+            Creates an already resolved position from (pos, row, column) tuples.
+        """
+        ins = cls.__new__(cls)
+        ins._startPos = start[0]
+        ins._endPos = end[0]
+        ins._lines = None
+        ins._rowCol = (start[1], start[2], end[1], end[2])
+        return ins
+
+    def _resolve(self):
+        if (self._rowCol == None):
+            (sr, sc) = _rowCol(self._lines, self._nLines, self._lineno, self._lastLineLexPos, self._startPos)
+            (er, ec) = _rowCol(self._lines, self._nLines, self._lineno, self._lastLineLexPos, self._endPos)
+            self._rowCol = (sr, sc, er, ec)
+            self._lines = None # The line index is no longer needed.
+
+        return self._rowCol
+
+    startRow = property(lambda self: self._resolve()[0])
+    startCol = property(lambda self: self._resolve()[1])
+    endRow = property(lambda self: self._resolve()[2])
+    endCol = property(lambda self: self._resolve()[3])
 
     def _getstart(self):
         return (self._startPos, self.startRow, self.startCol)
@@ -519,55 +451,140 @@ class TokenPos:
     def __repr__(self):
         return f"TokenPos[{self.startRow}:{self.startCol} - {self.endRow}:{self.endCol}]{{{self._startPos} - {self._endPos}}}"
 
+def getLexPos(l):
+    """
+        Gets the global position of the lexer on the source text.
+        When lexing from a stream, lexer.lexpos is relative to the buffered chunk, which starts at lexer._base.
+    """
+    return l._base + l.lexpos
+
 def getCurLineLen(l):
     """
         Gets the length of the current line on the source text.
     """
-    return l.lexpos - l._lastLineLexPos
+    return getLexPos(l) - l._lastLineLexPos
+
+def pushLineLen(l, length):
+    """
+        Records the length of a finished line on the source text, keeping the line offset index in sync.
+        The line offset index (lexer.lineOffsets) is the prefix sum of lexer.lineLens, that is, lineOffsets[i] is the
+        global position at which line i + 1 ends, as accounted by lineLens.
+    """
+    l.lineLens.append(length)
+    l.lineOffsets.append((l.lineOffsets[-1] if l.lineOffsets else 0) + length)
+
+def refillStream(l) -> bool:
+    """
+        Replaces the buffered input of a streaming lexer with the next chunk of the stream, once the former has been
+        fully consumed. Returns whether there was any input left on the stream.
+        Chunks always end at a newline (or at the end of the stream), so that no token other than separators, strings
+        and comment bodies spans two chunks. Separators and comment bodies are accounted per line, and therefore can be
+        safely split. A line longer than the chunk size is buffered whole.
+    """
+    if (l._stream == None): return False
+
+    data = l._pending
+    cut = data.rfind("\n")
+    while (cut == -1 and l._stream != None):
+        raw = l._stream.read(l._chunkSize)
+        chunk = l._decoder.decode(raw, final = (len(raw) == 0)) if (isinstance(raw, bytes)) else raw
+
+        if (len(raw) == 0): 
+            data += chunk
+            l._stream = None
+            cut = len(data) - 1
+        else:
+            cut = chunk.rfind("\n")
+            if (cut != -1): cut += len(data)
+            data += chunk
+
+    l._pending = data[cut + 1:]
+    if (cut == -1): return False
+
+    l._base += l.lexlen
+    l.input(data[:cut + 1])
+    return True
+
+def growLastLineLen(l, length):
+    """
+        Extends the length of the last recorded line on the source text, keeping the line offset index in sync.
+    """
+    l.lineLens[-1] += length
+    l.lineOffsets[-1] += length
 
 def posToRowCol(l, pos):
     """
         Converts a global position offset on the source text to a (row, column) tuple.
         The row is 1-indexed, and the column is 0-indexed
     """
-    acc = 0
-    i = 0
-    found = False
-    for i in range(0, len(l.lineLens)):
-        if (acc + l.lineLens[i] >= pos): 
-            found = True
-            break
-        acc += l.lineLens[i]
+    return _rowCol(l.lineOffsets, len(l.lineOffsets), l.lineno, l._lastLineLexPos, pos)
+
+def _rowCol(lines, nLines, lineno, lastLineLexPos, pos):
+    # The line offset index is sorted, so the first line whose end offset is at or past the position is found through 
+    #   binary search, instead of accumulating the line lengths from the start of the file.
+    i = bisect_left(lines, pos, 0, nLines)
 
     # If position is not on any of the previously recorded lines, it is on the current line. The line length hasn't
     #   been pushed to the lineLens list yet, so manually set it and get the position offset.
-    if (not found):
-        return (l.lineno, pos - l._lastLineLexPos)
+    if (i == nLines):
+        return (lineno, pos - lastLineLexPos)
     else:
-        return (i + 1, pos - acc)
+        return (i + 1, pos - (lines[i - 1] if i > 0 else 0))
 #endregion ------- Lexer Utils -------
 
 #region ------- Lexer Build -------
-lexer = lex.lex()
-lexer._lastLineLexPos = 0
-lexer.lineLens = []
-lexer.diagnostics = []
-lexer.options = {
-    "printDiags": False
-}
-lexer._peek = None
-lexer._cur = None
-lexer._lastSep = None
+# The module-level lexer is only built on first use (see getLexer), as building it requires PLY to introspect and 
+#   compile every rule above. The functions below are attached to each lexer instance as methods (see initLexer).
+_LEXER: lex.Lexer = None
+_LEXER_LOCK = Lock()
+_LEXER_METHODS: dict[str, Callable] = {}
+
+def lexermethod(name: str):
+    def decorator(func):
+        _LEXER_METHODS[name] = func
+        return func
+    return decorator
+
+def initLexer(l: lex.Lexer) -> lex.Lexer:
+    """
+        Attaches the lexer methods and initializes the lexing state of a given lexer.
+    """
+    for (name, func) in _LEXER_METHODS.items(): setattr(l, name, MethodType(func, l))
+
+    l.options = { "printDiags": False }
+    l._peek = None
+    l._cur = None
+    l._lastSep = None
+    l.begin("INITIAL")
+    l.reset()
+
+    return l
+
+def getLexer() -> lex.Lexer:
+    """
+        Gets the module-level lexer, building it if it wasn't yet.
+    """
+    global _LEXER
+    if (_LEXER == None):
+        with _LEXER_LOCK:
+            if (_LEXER == None): _LEXER = initLexer(lex.lex(module=sys.modules[__name__]))
+
+    return _LEXER
+
+def __getattr__(name):
+    # Keeps "from compiler.lexer import lexer" working, while only building the lexer when it's first imported.
+    if (name == "lexer"): return getLexer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # This function is attached to the lexer instance, and is used to finalize the lexical analysis phase.
 # It adds the last buffered line length to the lineLens property and moves the character pointer to EOF.
 # As of the time of writing this documentation, this results of this function are purely for diagnostic purposes.
-@externalinstancemethod(lexer, "finish")
+@lexermethod("finish")
 def _finish(self):
-    self.lineLens.append(self.lexpos - self._lastLineLexPos)
-    self._lastLineLexPos = self.lexpos
+    pushLineLen(self, getLexPos(self) - self._lastLineLexPos)
+    self._lastLineLexPos = getLexPos(self)
 
-@externalinstancemethod(lexer, "getExtendedToken")
+@lexermethod("getExtendedToken")
 def _getExtendedToken(self):
     if (self._peek): 
         token = self._peek
@@ -579,7 +596,7 @@ def _getExtendedToken(self):
         if (token == None): break
         if (token.type == "SEP"): 
             token.pos = TokenPos(self, token.lexpos, token.lexpos + len(token.value))
-            lexer._lastSep = token
+            self._lastSep = token
             token = self.token()
             continue
 
@@ -591,17 +608,60 @@ def _getExtendedToken(self):
     self._cur = token
     return token
 
-@externalinstancemethod(lexer, "peek")
+@lexermethod("peek")
 def _peek(self):
     if (self._peek == None): self._peek = self.token()
     self._peek.pos = TokenPos(self, self._peek.lexpos, self._peek.lexpos + len(self._peek.value))
     return self._peek
 
-@externalinstancemethod(lexer, "reset")
+@lexermethod("reset")
 def _reset(self):
     self.lineno = 1
     self.lexpos = 0
     self._lastLineLexPos = 0
     self.lineLens = []
+    self.lineOffsets = array("q")
     self.diagnostics = []
+    self._base = 0
+    self._stream = None
+    if ("token" in vars(self)): del self.token
+
+# This function is attached to the lexer instance, and is used to lex from a file object (text or binary, in which case
+#   it is decoded as UTF-8) or a mmap, instead of a string. The stream is read in chunks of (approximately) the given 
+#   size, so that only the current chunk is kept in memory, instead of the whole source text.
+# Token positions (token.lexpos) are global, as if the whole source text was given to lexer.input. The stream is only
+#   read as tokens are requested, so it must be kept open until the lexical analysis is done.
+# When parsing, no input should be given to the parser, as it would replace the stream (ie. parser.parse(None, ...)).
+@lexermethod("inputStream")
+def _inputStream(self, stream, chunkSize: int = 1 << 20):
+    self._stream = stream
+    self._chunkSize = chunkSize
+    self._decoder = codecs.getincrementaldecoder("utf-8")()
+    self._pending = ""
+    self._base = 0
+    self.input("")
+    self.token = self.streamToken
+    refillStream(self)
+
+# Replaces lexer.token while lexing from a stream. Chunks are refilled once fully consumed, and token positions are 
+#   translated to global positions.
+@lexermethod("streamToken")
+def _streamToken(self):
+    while (True):
+        token = lex.Lexer.token(self)
+        if (token == None):
+            if (refillStream(self)): continue
+            return None
+
+        # Comment reached the end of the chunk and was refilled (see t_comment_eof).
+        if (token.type == "eof"): continue
+
+        token.lexpos += self._base
+        return token
+
+# Builds a new lexer, independent from the module-level one, in order for multiple compilations to be able to lex 
+#   concurrently (see compilation.py). The lexing rules and tables are shared with the module-level lexer, while the
+#   lexing state is reset and the lexer methods are rebound to the new lexer.
+def buildLexer():
+    return initLexer(getLexer().clone())
 #endregion ------- Lexer Build -------
@@ -0,0 +1,1184 @@
+# This file is automatically generated by compiler/buildtables.py. Do not edit.
+# fmt: off
+
+TABLES_VERSION = 1
+GRAMMAR_HASH = 'eb1e9d68390b177d681311aefa8d1191a8cd374931edc4f074a0bd03ff4b08e5'
+METHOD = 'LALR'
+
+ACTION = (
+    (0, (('KW_PROGRAM', 3),)),
+    (1, (('$end', 0),)),
+    (2, (('SEMICOLON', 4),)),
+    (3, (('IDENTIFIER', 5),)),
+    (4, (('KW_BEGIN', -270), ('KW_CONST', -270), ('KW_FUNCTION', -270), ('KW_LABEL', 8), ('KW_PROCEDURE', -270), ('KW_TYPE', -270), ('KW_VAR', -270))),
+    (5, (('LPAREN', 11), ('SEMICOLON', -270))),
+    (6, (('DOT', 13),)),
+    (7, (('KW_BEGIN', -270), ('KW_CONST', 15), ('KW_FUNCTION', -270), ('KW_PROCEDURE', -270), ('KW_TYPE', -270), ('KW_VAR', -270))),
+    (8, (('COMMA', -270), ('SEMICOLON', -270), ('UNSIGNED_INTEGER', 19), ('error', 18))),
+    (9, (('KW_BEGIN', -20), ('KW_CONST', -20), ('KW_FUNCTION', -20), ('KW_PROCEDURE', -20), ('KW_TYPE', -20), ('KW_VAR', -20))),
+    (10, (('SEMICOLON', -11),)),
+    (11, (('COMMA', -270), ('IDENTIFIER', 23), ('RPAREN', -270), ('error', 22))),
+    (12, (('SEMICOLON', -13),)),
+    (13, (('$end', -10),)),
+    (14, (('KW_BEGIN', -270), ('KW_FUNCTION', -270), ('KW_PROCEDURE', -270), ('KW_TYPE', 26), ('KW_VAR', -270))),
+    (15, (('IDENTIFIER', 31), ('error', 29))),
+    (16, (('KW_BEGIN', -26), ('KW_FUNCTION', -26), ('KW_PROCEDURE', -26), ('KW_TYPE', -26), ('KW_VAR', -26))),
+    (17, (('COMMA', 33), ('SEMICOLON', 32))),
+    (18, (('SEMICOLON', 34),)),
+    (19, (('COMMA', -23), ('SEMICOLON', -23))),
+    (20, (('COMMA', -24), ('SEMICOLON', -24))),
+    (21, (('COMMA', 36), ('RPAREN', 35))),
+    (22, (('RPAREN', 37),)),
+    (23, (('COMMA', -16), ('RPAREN', -16))),
+    (24, (('COMMA', -17), ('RPAREN', -17))),
+    (25, (('KW_BEGIN', -270), ('KW_FUNCTION', -270), ('KW_PROCEDURE', -270), ('KW_VAR', 39))),
+    (26, (('IDENTIFIER', 44), ('error', 43))),
+    (27, (('KW_BEGIN', -37), ('KW_FUNCTION', -37), ('KW_PROCEDURE', -37), ('KW_VAR', -37))),
+    (28, (('SEMICOLON', 45),)),
+    (29, (('SEMICOLON', 46),)),
+    (30, (('SEMICOLON', -29),)),
+    (31, (('OP_EQ', 47),)),
+    (32, (('KW_BEGIN', -19), ('KW_CONST', -19), ('KW_FUNCTION', -19), ('KW_PROCEDURE', -19), ('KW_TYPE', -19), ('KW_VAR', -19))),
+    (33, (('UNSIGNED_INTEGER', 48),)),
+    (34, (('KW_BEGIN', -21), ('KW_CONST', -21), ('KW_FUNCTION', -21), ('KW_PROCEDURE', -21), ('KW_TYPE', -21), ('KW_VAR', -21))),
+    (35, (('SEMICOLON', -12),)),
+    (36, (('IDENTIFIER', 49),)),
+    (37, (('SEMICOLON', -14),)),
+    (38, (('KW_BEGIN', -270), ('KW_FUNCTION', 58), ('KW_PROCEDURE', 57))),
+    (39, (('IDENTIFIER', 63), ('error', 61))),
+    (40, (('KW_BEGIN', -100), ('KW_FUNCTION', -100), ('KW_PROCEDURE', -100))),
+    (41, (('SEMICOLON', 64), ('error', 65))),
+    (42, (('SEMICOLON', -39), ('error', -39))),
+    (43, (('SEMICOLON', -42), ('error', -42))),
+    (44, (('OP_EQ', 66),)),
+    (45, (('IDENTIFIER', 31), ('KW_BEGIN', -25), ('KW_FUNCTION', -25), ('KW_PROCEDURE', -25), ('KW_TYPE', -25), ('KW_VAR', -25))),
+    (46, (('KW_BEGIN', -27), ('KW_FUNCTION', -27), ('KW_PROCEDURE', -27), ('KW_TYPE', -27), ('KW_VAR', -27))),
+    (47, (('IDENTIFIER', 68), ('OP_MINUS', 72), ('OP_PLUS', 71), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (48, (('COMMA', -22), ('SEMICOLON', -22))),
+    (49, (('COMMA', -15), ('RPAREN', -15))),
+    (50, (('KW_BEGIN', 78),)),
+    (51, (('SEMICOLON', 79),)),
+    (52, (('KW_BEGIN', -110),)),
+    (53, (('SEMICOLON', -112),)),
+    (54, (('SEMICOLON', 80),)),
+    (55, (('RPAREN', -114), ('SEMICOLON', -114))),
+    (56, (('RPAREN', -115), ('SEMICOLON', -115))),
+    (57, (('IDENTIFIER', 81),)),
+    (58, (('IDENTIFIER', 82),)),
+    (59, (('SEMICOLON', 83), ('error', 84))),
+    (60, (('SEMICOLON', -102), ('error', -102))),
+    (61, (('SEMICOLON', -105), ('error', -105))),
+    (62, (('COLON', 85), ('COMMA', 86))),
+    (63, (('COLON', -108), ('COMMA', -108))),
+    (64, (('IDENTIFIER', 44), ('KW_BEGIN', -36), ('KW_FUNCTION', -36), ('KW_PROCEDURE', -36), ('KW_VAR', -36), ('error', 88))),
+    (65, (('SEMICOLON', -40), ('error', -40))),
+    (66, (('IDENTIFIER', 89), ('KW_ARRAY', 105), ('KW_PACKED', 95), ('KW_RECORD', 106), ('KW_SET', 107), ('LPAREN', 103), ('OP_MINUS', 72), ('OP_PLUS', 71), ('OP_UPARROW', 97), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (67, (('SEMICOLON', -28),)),
+    (68, (('COLON', -34), ('COMMA', -34), ('KW_END', -34), ('RPAREN', -34), ('RSBRACKET', -34), ('SEMICOLON', -34), ('error', -34))),
+    (69, (('SEMICOLON', -30),)),
+    (70, (('COLON', -31), ('COMMA', -31), ('KW_END', -31), ('OP_RANGE', -31), ('RPAREN', -31), ('RSBRACKET', -31), ('SEMICOLON', -31), ('error', -31))),
+    (71, (('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (72, (('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (73, (('COLON', -35), ('COMMA', -35), ('KW_END', -35), ('OP_RANGE', -35), ('RPAREN', -35), ('RSBRACKET', -35), ('SEMICOLON', -35), ('error', -35))),
+    (74, (('COLON', -3), ('COMMA', -3), ('KW_END', -3), ('OP_RANGE', -3), ('RPAREN', -3), ('RSBRACKET', -3), ('SEMICOLON', -3), ('error', -3))),
+    (75, (('COLON', -4), ('COMMA', -4), ('KW_END', -4), ('OP_RANGE', -4), ('RPAREN', -4), ('RSBRACKET', -4), ('SEMICOLON', -4), ('error', -4))),
+    (76, (('DOT', -18), ('SEMICOLON', -18))),
+    (77, (('DOT', -206), ('SEMICOLON', -206))),
+    (78, (('IDENTIFIER', -270), ('KW_BEGIN', -270), ('KW_CASE', -270), ('KW_END', -270), ('KW_FOR', -270), ('KW_GOTO', -270), ('KW_IF', -270), ('KW_REPEAT', -270), ('KW_WHILE', -270), ('KW_WITH', -270), ('SEMICOLON', -270), ('UNSIGNED_INTEGER', 116), ('error', 111))),
+    (79, (('KW_BEGIN', -109), ('KW_FUNCTION', 58), ('KW_PROCEDURE', 57))),
+    (80, (('IDENTIFIER', 122), ('KW_BEGIN', -270), ('KW_CONST', -270), ('KW_FUNCTION', -270), ('KW_LABEL', 8), ('KW_PROCEDURE', -270), ('KW_TYPE', -270), ('KW_VAR', -270))),
+    (81, (('LPAREN', 125), ('RPAREN', -270), ('SEMICOLON', -270))),
+    (82, (('COLON', -270), ('LPAREN', 125), ('RPAREN', -270), ('SEMICOLON', -270))),
+    (83, (('IDENTIFIER', 63), ('KW_BEGIN', -99), ('KW_FUNCTION', -99), ('KW_PROCEDURE', -99), ('error', 132))),
+    (84, (('SEMICOLON', -103), ('error', -103))),
+    (85, (('IDENTIFIER', 89), ('KW_ARRAY', 105), ('KW_PACKED', 95), ('KW_RECORD', 106), ('KW_SET', 107), ('LPAREN', 103), ('OP_MINUS', 72), ('OP_PLUS', 71), ('OP_UPARROW', 97), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (86, (('IDENTIFIER', 134),)),
+    (87, (('SEMICOLON', -38), ('error', -38))),
+    (88, (('SEMICOLON', -41), ('error', -41))),
+    (89, (('COMMA', -50), ('KW_END', -50), ('OP_RANGE', -34), ('RPAREN', -50), ('RSBRACKET', -50), ('SEMICOLON', -50), ('error', -50))),
+    (90, (('SEMICOLON', -43), ('error', -43))),
+    (91, (('KW_END', -44), ('RPAREN', -44), ('SEMICOLON', -44), ('error', -44))),
+    (92, (('KW_END', -45), ('RPAREN', -45), ('SEMICOLON', -45), ('error', -45))),
+    (93, (('KW_END', -46), ('RPAREN', -46), ('SEMICOLON', -46), ('error', -46))),
+    (94, (('KW_END', -47), ('RPAREN', -47), ('SEMICOLON', -47), ('error', -47))),
+    (95, (('KW_ARRAY', 105), ('KW_RECORD', 106), ('KW_SET', 107))),
+    (96, (('KW_END', -59), ('RPAREN', -59), ('SEMICOLON', -59), ('error', -59))),
+    (97, (('IDENTIFIER', 89), ('KW_ARRAY', 105), ('KW_PACKED', 95), ('KW_RECORD', 106), ('KW_SET', 107), ('LPAREN', 103), ('OP_MINUS', 72), ('OP_PLUS', 71), ('OP_UPARROW', 97), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (98, (('COMMA', -48), ('KW_END', -48), ('RPAREN', -48), ('RSBRACKET', -48), ('SEMICOLON', -48), ('error', -48))),
+    (99, (('COMMA', -49), ('KW_END', -49), ('RPAREN', -49), ('RSBRACKET', -49), ('SEMICOLON', -49), ('error', -49))),
+    (100, (('KW_END', -60), ('RPAREN', -60), ('SEMICOLON', -60), ('error', -60))),
+    (101, (('KW_END', -61), ('RPAREN', -61), ('SEMICOLON', -61), ('error', -61))),
+    (102, (('KW_END', -62), ('RPAREN', -62), ('SEMICOLON', -62), ('error', -62))),
+    (103, (('IDENTIFIER', 139), ('error', 138))),
+    (104, (('OP_RANGE', 140),)),
+    (105, (('LSBRACKET', 141),)),
+    (106, (('IDENTIFIER', 150), ('KW_CASE', 149), ('KW_END', -270), ('error', -270))),
+    (107, (('KW_OF', 151),)),
+    (108, (('COLON', -32), ('COMMA', -32), ('KW_END', -32), ('OP_RANGE', -32), ('RPAREN', -32), ('RSBRACKET', -32), ('SEMICOLON', -32), ('error', -32))),
+    (109, (('COLON', -33), ('COMMA', -33), ('KW_END', -33), ('OP_RANGE', -33), ('RPAREN', -33), ('RSBRACKET', -33), ('SEMICOLON', -33), ('error', -33))),
+    (110, (('KW_END', 152), ('SEMICOLON', 153))),
+    (111, (('KW_END', 154),)),
+    (112, (('KW_END', -210), ('KW_UNTIL', -210), ('SEMICOLON', -210))),
+    (113, (('KW_ELSE', -211), ('KW_END', -211), ('KW_UNTIL', -211), ('SEMICOLON', -211))),
+    (114, (('KW_ELSE', -212), ('KW_END', -212), ('KW_UNTIL', -212), ('SEMICOLON', -212))),
+    (115, (('IDENTIFIER', 170), ('KW_BEGIN', 78), ('KW_CASE', 180), ('KW_ELSE', -270), ('KW_END', -270), ('KW_FOR', 183), ('KW_GOTO', 171), ('KW_IF', 178), ('KW_REPEAT', 182), ('KW_UNTIL', -270), ('KW_WHILE', 181), ('KW_WITH', 177), ('SEMICOLON', -270))),
+    (116, (('COLON', 190),)),
+    (117, (('IDENTIFIER', -219), ('KW_BEGIN', -219), ('KW_CASE', -219), ('KW_ELSE', -219), ('KW_END', -219), ('KW_FOR', -219), ('KW_GOTO', -219), ('KW_IF', -219), ('KW_REPEAT', -219), ('KW_UNTIL', -219), ('KW_WHILE', -219), ('KW_WITH', -219), ('SEMICOLON', -219))),
+    (118, (('SEMICOLON', -111),)),
+    (119, (('SEMICOLON', -113),)),
+    (120, (('SEMICOLON', -116),)),
+    (121, (('SEMICOLON', -117),)),
+    (122, (('SEMICOLON', -9),)),
+    (123, (('RPAREN', -118), ('SEMICOLON', -118))),
+    (124, (('RPAREN', -119), ('SEMICOLON', -119))),
+    (125, (('IDENTIFIER', -270), ('KW_FUNCTION', 58), ('KW_PROCEDURE', 57), ('KW_VAR', 197), ('error', 192))),
+    (126, (('RPAREN', -125), ('SEMICOLON', -125))),
+    (127, (('RPAREN', -120), ('SEMICOLON', -120))),
+    (128, (('COLON', 200),)),
+    (129, (('COLON', -125), ('RPAREN', -123), ('SEMICOLON', -123))),
+    (130, (('COLON', -121),)),
+    (131, (('SEMICOLON', -101), ('error', -101))),
+    (132, (('SEMICOLON', -104), ('error', -104))),
+    (133, (('SEMICOLON', -106), ('error', -106))),
+    (134, (('COLON', -107), ('COMMA', -107))),
+    (135, (('KW_END', -58), ('RPAREN', -58), ('SEMICOLON', -58), ('error', -58))),
+    (136, (('KW_END', -98), ('RPAREN', -98), ('SEMICOLON', -98), ('error', -98))),
+    (137, (('COMMA', 202), ('RPAREN', 201))),
+    (138, (('RPAREN', 203),)),
+    (139, (('COMMA', -54), ('RPAREN', -54), ('error', 204))),
+    (140, (('IDENTIFIER', 68), ('OP_MINUS', 72), ('OP_PLUS', 71), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (141, (('IDENTIFIER', 89), ('LPAREN', 103), ('OP_MINUS', 72), ('OP_PLUS', 71), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74), ('error', 207))),
+    (142, (('KW_END', 209), ('error', 210))),
+    (143, (('KW_END', -270), ('RPAREN', -270), ('SEMICOLON', 212), ('error', -270))),
+    (144, (('KW_END', -71), ('RPAREN', -71), ('error', -71))),
+    (145, (('KW_END', -72), ('RPAREN', -72), ('error', -72))),
+    (146, (('KW_END', -79), ('RPAREN', -79), ('SEMICOLON', -79), ('error', -79))),
+    (147, (('KW_END', -270), ('RPAREN', -270), ('SEMICOLON', 216), ('error', -270))),
+    (148, (('COLON', 217), ('COMMA', 218))),
+    (149, (('IDENTIFIER', 220),)),
+    (150, (('COLON', -82), ('COMMA', -82))),
+    (151, (('IDENTIFIER', 89), ('LPAREN', 103), ('OP_MINUS', 72), ('OP_PLUS', 71), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (152, (('DOT', -207), ('KW_ELSE', -207), ('KW_END', -207), ('KW_UNTIL', -207), ('SEMICOLON', -207))),
+    (153, (('IDENTIFIER', -270), ('KW_BEGIN', -270), ('KW_CASE', -270), ('KW_END', -270), ('KW_FOR', -270), ('KW_GOTO', -270), ('KW_IF', -270), ('KW_REPEAT', -270), ('KW_UNTIL', -270), ('KW_WHILE', -270), ('KW_WITH', -270), ('SEMICOLON', -270), ('UNSIGNED_INTEGER', 116))),
+    (154, (('DOT', -208), ('KW_ELSE', -208), ('KW_END', -208), ('KW_UNTIL', -208), ('SEMICOLON', -208))),
+    (155, (('KW_ELSE', -213), ('KW_END', -213), ('KW_UNTIL', -213), ('SEMICOLON', -213))),
+    (156, (('KW_ELSE', -216), ('KW_END', -216), ('KW_UNTIL', -216), ('SEMICOLON', -216))),
+    (157, (('KW_ELSE', -214), ('KW_END', -214), ('KW_UNTIL', -214), ('SEMICOLON', -214))),
+    (158, (('KW_ELSE', -215), ('KW_END', -215), ('KW_UNTIL', -215), ('SEMICOLON', -215))),
+    (159, (('KW_ELSE', -217), ('KW_END', -217), ('KW_UNTIL', -217), ('SEMICOLON', -217))),
+    (160, (('KW_ELSE', -220), ('KW_END', -220), ('KW_UNTIL', -220), ('SEMICOLON', -220))),
+    (161, (('KW_ELSE', -221), ('KW_END', -221), ('KW_UNTIL', -221), ('SEMICOLON', -221))),
+    (162, (('KW_ELSE', -222), ('KW_END', -222), ('KW_UNTIL', -222), ('SEMICOLON', -222))),
+    (163, (('KW_ELSE', -223), ('KW_END', -223), ('KW_UNTIL', -223), ('SEMICOLON', -223))),
+    (164, (('KW_ELSE', -230), ('KW_END', -230), ('KW_UNTIL', -230), ('SEMICOLON', -230))),
+    (165, (('KW_ELSE', -231), ('KW_END', -231), ('KW_UNTIL', -231), ('SEMICOLON', -231))),
+    (166, (('KW_ELSE', -232), ('KW_END', -232), ('KW_UNTIL', -232), ('SEMICOLON', -232))),
+    (167, (('KW_ELSE', -233), ('KW_END', -233), ('KW_UNTIL', -233), ('SEMICOLON', -233))),
+    (168, (('KW_ELSE', -236), ('KW_END', -236), ('KW_UNTIL', -236), ('SEMICOLON', -236))),
+    (169, (('OP_ASSIGN', 223),)),
+    (170, (('DOT', -152), ('KW_ELSE', -270), ('KW_END', -270), ('KW_UNTIL', -270), ('LPAREN', 227), ('LSBRACKET', -152), ('OP_ASSIGN', -152), ('OP_UPARROW', -152), ('SEMICOLON', -270))),
+    (171, (('UNSIGNED_INTEGER', 228),)),
+    (172, (('KW_ELSE', -234), ('KW_END', -234), ('KW_UNTIL', -234), ('SEMICOLON', -234))),
+    (173, (('KW_ELSE', -235), ('KW_END', -235), ('KW_UNTIL', -235), ('SEMICOLON', -235))),
+    (174, (('KW_ELSE', -251), ('KW_END', -251), ('KW_UNTIL', -251), ('SEMICOLON', -251))),
+    (175, (('KW_ELSE', -252), ('KW_END', -252), ('KW_UNTIL', -252), ('SEMICOLON', -252))),
+    (176, (('KW_ELSE', -253), ('KW_END', -253), ('KW_UNTIL', -253), ('SEMICOLON', -253))),
+    (177, (('IDENTIFIER', 232), ('error', 230))),
+    (178, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (179, (('DOT', 254), ('LSBRACKET', -153), ('OP_ASSIGN', -225), ('OP_UPARROW', 253))),
+    (180, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247), ('error', 256))),
+    (181, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (182, (('IDENTIFIER', -270), ('KW_BEGIN', -270), ('KW_CASE', -270), ('KW_FOR', -270), ('KW_GOTO', -270), ('KW_IF', -270), ('KW_REPEAT', -270), ('KW_UNTIL', -270), ('KW_WHILE', -270), ('KW_WITH', -270), ('SEMICOLON', -270), ('UNSIGNED_INTEGER', 116))),
+    (183, (('IDENTIFIER', 260), ('error', 261))),
+    (184, (('COMMA', -149), ('DOT', -149), ('KW_AND', -149), ('KW_DIV', -149), ('KW_DO', -149), ('KW_DOWNTO', -149), ('KW_ELSE', -149), ('KW_END', -149), ('KW_IN', -149), ('KW_MOD', -149), ('KW_OF', -149), ('KW_OR', -149), ('KW_THEN', -149), ('KW_TO', -149), ('KW_UNTIL', -149), ('LPAREN', -149), ('LSBRACKET', -149), ('OP_ASSIGN', -149), ('OP_DIV', -149), ('OP_EQ', -149), ('OP_GT', -149), ('OP_GTE', -149), ('OP_LT', -149), ('OP_LTE', -149), ('OP_MINUS', -149), ('OP_MULT', -149), ('OP_NEQ', -149), ('OP_PLUS', -149), ('OP_RANGE', -149), ('OP_UPARROW', -149), ('RPAREN', -149), ('RSBRACKET', -149), ('SEMICOLON', -149))),
+    (185, (('COMMA', -150), ('DOT', -150), ('KW_AND', -150), ('KW_DIV', -150), ('KW_DO', -150), ('KW_DOWNTO', -150), ('KW_ELSE', -150), ('KW_END', -150), ('KW_IN', -150), ('KW_MOD', -150), ('KW_OF', -150), ('KW_OR', -150), ('KW_THEN', -150), ('KW_TO', -150), ('KW_UNTIL', -150), ('LPAREN', -150), ('LSBRACKET', -150), ('OP_ASSIGN', -150), ('OP_DIV', -150), ('OP_EQ', -150), ('OP_GT', -150), ('OP_GTE', -150), ('OP_LT', -150), ('OP_LTE', -150), ('OP_MINUS', -150), ('OP_MULT', -150), ('OP_NEQ', -150), ('OP_PLUS', -150), ('OP_RANGE', -150), ('OP_UPARROW', -150), ('RPAREN', -150), ('RSBRACKET', -150), ('SEMICOLON', -150))),
+    (186, (('COMMA', -151), ('DOT', -151), ('KW_AND', -151), ('KW_DIV', -151), ('KW_DO', -151), ('KW_DOWNTO', -151), ('KW_ELSE', -151), ('KW_END', -151), ('KW_IN', -151), ('KW_MOD', -151), ('KW_OF', -151), ('KW_OR', -151), ('KW_THEN', -151), ('KW_TO', -151), ('KW_UNTIL', -151), ('LPAREN', -151), ('LSBRACKET', -151), ('OP_ASSIGN', -151), ('OP_DIV', -151), ('OP_EQ', -151), ('OP_GT', -151), ('OP_GTE', -151), ('OP_LT', -151), ('OP_LTE', -151), ('OP_MINUS', -151), ('OP_MULT', -151), ('OP_NEQ', -151), ('OP_PLUS', -151), ('OP_RANGE', -151), ('OP_UPARROW', -151), ('RPAREN', -151), ('RSBRACKET', -151), ('SEMICOLON', -151))),
+    (187, (('COMMA', -154), ('DOT', -154), ('KW_AND', -154), ('KW_DIV', -154), ('KW_DO', -154), ('KW_DOWNTO', -154), ('KW_ELSE', -154), ('KW_END', -154), ('KW_IN', -154), ('KW_MOD', -154), ('KW_OF', -154), ('KW_OR', -154), ('KW_THEN', -154), ('KW_TO', -154), ('KW_UNTIL', -154), ('LPAREN', -154), ('LSBRACKET', -154), ('OP_ASSIGN', -154), ('OP_DIV', -154), ('OP_EQ', -154), ('OP_GT', -154), ('OP_GTE', -154), ('OP_LT', -154), ('OP_LTE', -154), ('OP_MINUS', -154), ('OP_MULT', -154), ('OP_NEQ', -154), ('OP_PLUS', -154), ('OP_RANGE', -154), ('OP_UPARROW', -154), ('RPAREN', -154), ('RSBRACKET', -154), ('SEMICOLON', -154))),
+    (188, (('COMMA', -155), ('DOT', -155), ('KW_AND', -155), ('KW_DIV', -155), ('KW_DO', -155), ('KW_DOWNTO', -155), ('KW_ELSE', -155), ('KW_END', -155), ('KW_IN', -155), ('KW_MOD', -155), ('KW_OF', -155), ('KW_OR', -155), ('KW_THEN', -155), ('KW_TO', -155), ('KW_UNTIL', -155), ('LPAREN', -155), ('LSBRACKET', -155), ('OP_ASSIGN', -155), ('OP_DIV', -155), ('OP_EQ', -155), ('OP_GT', -155), ('OP_GTE', -155), ('OP_LT', -155), ('OP_LTE', -155), ('OP_MINUS', -155), ('OP_MULT', -155), ('OP_NEQ', -155), ('OP_PLUS', -155), ('OP_RANGE', -155), ('OP_UPARROW', -155), ('RPAREN', -155), ('RSBRACKET', -155), ('SEMICOLON', -155))),
+    (189, (('LSBRACKET', 262),)),
+    (190, (('IDENTIFIER', -218), ('KW_BEGIN', -218), ('KW_CASE', -218), ('KW_ELSE', -218), ('KW_END', -218), ('KW_FOR', -218), ('KW_GOTO', -218), ('KW_IF', -218), ('KW_REPEAT', -218), ('KW_UNTIL', -218), ('KW_WHILE', -218), ('KW_WITH', -218), ('SEMICOLON', -218))),
+    (191, (('RPAREN', 263), ('SEMICOLON', 264))),
+    (192, (('RPAREN', 265),)),
+    (193, (('RPAREN', -128), ('SEMICOLON', -128))),
+    (194, (('RPAREN', -129), ('SEMICOLON', -129))),
+    (195, (('RPAREN', -130), ('SEMICOLON', -130))),
+    (196, (('RPAREN', -131), ('SEMICOLON', -131))),
+    (197, (('IDENTIFIER', -270),)),
+    (198, (('IDENTIFIER', 268),)),
+    (199, (('IDENTIFIER', -2), ('KW_END', -2), ('RPAREN', -2), ('error', -2))),
+    (200, (('IDENTIFIER', 269),)),
+    (201, (('COMMA', -51), ('KW_END', -51), ('RPAREN', -51), ('RSBRACKET', -51), ('SEMICOLON', -51), ('error', -51))),
+    (202, (('IDENTIFIER', 270),)),
+    (203, (('COMMA', -52), ('KW_END', -52), ('RPAREN', -52), ('RSBRACKET', -52), ('SEMICOLON', -52), ('error', -52))),
+    (204, (('COMMA', -56), ('RPAREN', -56))),
+    (205, (('COMMA', -57), ('KW_END', -57), ('RPAREN', -57), ('RSBRACKET', -57), ('SEMICOLON', -57), ('error', -57))),
+    (206, (('COMMA', 272), ('RSBRACKET', 271))),
+    (207, (('KW_END', -65), ('RPAREN', -65), ('SEMICOLON', -65), ('error', -65))),
+    (208, (('COMMA', -67), ('RSBRACKET', -67))),
+    (209, (('KW_END', -68), ('RPAREN', -68), ('SEMICOLON', -68), ('error', -68))),
+    (210, (('KW_END', -69), ('RPAREN', -69), ('SEMICOLON', -69), ('error', -69))),
+    (211, (('KW_END', -70), ('RPAREN', -70), ('error', -70))),
+    (212, (('IDENTIFIER', 150), ('KW_CASE', 149), ('KW_END', -270), ('RPAREN', -270), ('error', -270))),
+    (213, (('KW_END', -75), ('RPAREN', -75), ('error', -75))),
+    (214, (('KW_END', -77), ('RPAREN', -77), ('error', -77))),
+    (215, (('KW_END', -73), ('RPAREN', -73), ('error', -73))),
+    (216, (('KW_END', -270), ('RPAREN', -270), ('error', -270))),
+    (217, (('IDENTIFIER', 89), ('KW_ARRAY', 105), ('KW_PACKED', 95), ('KW_RECORD', 106), ('KW_SET', 107), ('LPAREN', 103), ('OP_MINUS', 72), ('OP_PLUS', 71), ('OP_UPARROW', 97), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (218, (('IDENTIFIER', 277),)),
+    (219, (('KW_OF', 278),)),
+    (220, (('COLON', 280), ('KW_OF', -270))),
+    (221, (('KW_END', -97), ('RPAREN', -97), ('SEMICOLON', -97), ('error', -97))),
+    (222, (('KW_END', -209), ('KW_UNTIL', -209), ('SEMICOLON', -209))),
+    (223, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (224, (('KW_ELSE', -226), ('KW_END', -226), ('KW_UNTIL', -226), ('SEMICOLON', -226))),
+    (225, (('KW_ELSE', -227), ('KW_END', -227), ('KW_UNTIL', -227), ('SEMICOLON', -227))),
+    (226, (('KW_ELSE', -228), ('KW_END', -228), ('KW_UNTIL', -228), ('SEMICOLON', -228))),
+    (227, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (228, (('KW_ELSE', -229), ('KW_END', -229), ('KW_UNTIL', -229), ('SEMICOLON', -229))),
+    (229, (('COMMA', 287), ('KW_DO', 286))),
+    (230, (('KW_DO', 288),)),
+    (231, (('COMMA', -269), ('DOT', 254), ('KW_DO', -269), ('LSBRACKET', -153), ('OP_UPARROW', 253))),
+    (232, (('COMMA', -152), ('DOT', -152), ('KW_AND', -152), ('KW_DIV', -152), ('KW_DO', -152), ('KW_DOWNTO', -152), ('KW_ELSE', -152), ('KW_END', -152), ('KW_IN', -152), ('KW_MOD', -152), ('KW_OF', -152), ('KW_OR', -152), ('KW_THEN', -152), ('KW_TO', -152), ('KW_UNTIL', -152), ('LPAREN', -152), ('LSBRACKET', -152), ('OP_DIV', -152), ('OP_EQ', -152), ('OP_GT', -152), ('OP_GTE', -152), ('OP_LT', -152), ('OP_LTE', -152), ('OP_MINUS', -152), ('OP_MULT', -152), ('OP_NEQ', -152), ('OP_PLUS', -152), ('OP_RANGE', -152), ('OP_UPARROW', -152), ('RPAREN', -152), ('RSBRACKET', -152), ('SEMICOLON', -152))),
+    (233, (('KW_THEN', 289),)),
+    (234, (('KW_DO', -204), ('KW_ELSE', -204), ('KW_END', -204), ('KW_THEN', -204), ('KW_UNTIL', -204), ('SEMICOLON', -204))),
+    (235, (('COMMA', -270), ('KW_DO', -270), ('KW_DOWNTO', -270), ('KW_ELSE', -270), ('KW_END', -270), ('KW_IN', 299), ('KW_OF', -270), ('KW_THEN', -270), ('KW_TO', -270), ('KW_UNTIL', -270), ('OP_EQ', 293), ('OP_GT', 297), ('OP_GTE', 298), ('OP_LT', 295), ('OP_LTE', 296), ('OP_NEQ', 294), ('OP_RANGE', -270), ('RPAREN', -270), ('RSBRACKET', -270), ('SEMICOLON', -270))),
+    (236, (('COMMA', -181), ('KW_DO', -181), ('KW_DOWNTO', -181), ('KW_ELSE', -181), ('KW_END', -181), ('KW_IN', -181), ('KW_OF', -181), ('KW_OR', 303), ('KW_THEN', -181), ('KW_TO', -181), ('KW_UNTIL', -181), ('OP_EQ', -181), ('OP_GT', -181), ('OP_GTE', -181), ('OP_LT', -181), ('OP_LTE', -181), ('OP_MINUS', 302), ('OP_NEQ', -181), ('OP_PLUS', 301), ('OP_RANGE', -181), ('RPAREN', -181), ('RSBRACKET', -181), ('SEMICOLON', -181))),
+    (237, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (238, (('COMMA', -184), ('KW_AND', 310), ('KW_DIV', 308), ('KW_DO', -184), ('KW_DOWNTO', -184), ('KW_ELSE', -184), ('KW_END', -184), ('KW_IN', -184), ('KW_MOD', 309), ('KW_OF', -184), ('KW_OR', -184), ('KW_THEN', -184), ('KW_TO', -184), ('KW_UNTIL', -184), ('OP_DIV', 307), ('OP_EQ', -184), ('OP_GT', -184), ('OP_GTE', -184), ('OP_LT', -184), ('OP_LTE', -184), ('OP_MINUS', -184), ('OP_MULT', 306), ('OP_NEQ', -184), ('OP_PLUS', -184), ('OP_RANGE', -184), ('RPAREN', -184), ('RSBRACKET', -184), ('SEMICOLON', -184))),
+    (239, (('IDENTIFIER', -164), ('KW_NIL', -164), ('KW_NOT', -164), ('LPAREN', -164), ('LSBRACKET', -164), ('STRING', -164), ('UNSIGNED_INTEGER', -164), ('UNSIGNED_REAL', -164))),
+    (240, (('IDENTIFIER', -165), ('KW_NIL', -165), ('KW_NOT', -165), ('LPAREN', -165), ('LSBRACKET', -165), ('STRING', -165), ('UNSIGNED_INTEGER', -165), ('UNSIGNED_REAL', -165))),
+    (241, (('COMMA', -186), ('KW_AND', -186), ('KW_DIV', -186), ('KW_DO', -186), ('KW_DOWNTO', -186), ('KW_ELSE', -186), ('KW_END', -186), ('KW_IN', -186), ('KW_MOD', -186), ('KW_OF', -186), ('KW_OR', -186), ('KW_THEN', -186), ('KW_TO', -186), ('KW_UNTIL', -186), ('OP_DIV', -186), ('OP_EQ', -186), ('OP_GT', -186), ('OP_GTE', -186), ('OP_LT', -186), ('OP_LTE', -186), ('OP_MINUS', -186), ('OP_MULT', -186), ('OP_NEQ', -186), ('OP_PLUS', -186), ('OP_RANGE', -186), ('RPAREN', -186), ('RSBRACKET', -186), ('SEMICOLON', -186))),
+    (242, (('COMMA', -187), ('KW_AND', -187), ('KW_DIV', -187), ('KW_DO', -187), ('KW_DOWNTO', -187), ('KW_ELSE', -187), ('KW_END', -187), ('KW_IN', -187), ('KW_MOD', -187), ('KW_OF', -187), ('KW_OR', -187), ('KW_THEN', -187), ('KW_TO', -187), ('KW_UNTIL', -187), ('OP_DIV', -187), ('OP_EQ', -187), ('OP_GT', -187), ('OP_GTE', -187), ('OP_LT', -187), ('OP_LTE', -187), ('OP_MINUS', -187), ('OP_MULT', -187), ('OP_NEQ', -187), ('OP_PLUS', -187), ('OP_RANGE', -187), ('RPAREN', -187), ('RSBRACKET', -187), ('SEMICOLON', -187))),
+    (243, (('COMMA', -188), ('KW_AND', -188), ('KW_DIV', -188), ('KW_DO', -188), ('KW_DOWNTO', -188), ('KW_ELSE', -188), ('KW_END', -188), ('KW_IN', -188), ('KW_MOD', -188), ('KW_OF', -188), ('KW_OR', -188), ('KW_THEN', -188), ('KW_TO', -188), ('KW_UNTIL', -188), ('OP_DIV', -188), ('OP_EQ', -188), ('OP_GT', -188), ('OP_GTE', -188), ('OP_LT', -188), ('OP_LTE', -188), ('OP_MINUS', -188), ('OP_MULT', -188), ('OP_NEQ', -188), ('OP_PLUS', -188), ('OP_RANGE', -188), ('RPAREN', -188), ('RSBRACKET', -188), ('SEMICOLON', -188))),
+    (244, (('COMMA', -189), ('KW_AND', -189), ('KW_DIV', -189), ('KW_DO', -189), ('KW_DOWNTO', -189), ('KW_ELSE', -189), ('KW_END', -189), ('KW_IN', -189), ('KW_MOD', -189), ('KW_OF', -189), ('KW_OR', -189), ('KW_THEN', -189), ('KW_TO', -189), ('KW_UNTIL', -189), ('OP_DIV', -189), ('OP_EQ', -189), ('OP_GT', -189), ('OP_GTE', -189), ('OP_LT', -189), ('OP_LTE', -189), ('OP_MINUS', -189), ('OP_MULT', -189), ('OP_NEQ', -189), ('OP_PLUS', -189), ('OP_RANGE', -189), ('RPAREN', -189), ('RSBRACKET', -189), ('SEMICOLON', -189))),
+    (245, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (246, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (247, (('COMMA', -5), ('KW_AND', -5), ('KW_DIV', -5), ('KW_DO', -5), ('KW_DOWNTO', -5), ('KW_ELSE', -5), ('KW_END', -5), ('KW_IN', -5), ('KW_MOD', -5), ('KW_OF', -5), ('KW_OR', -5), ('KW_THEN', -5), ('KW_TO', -5), ('KW_UNTIL', -5), ('OP_DIV', -5), ('OP_EQ', -5), ('OP_GT', -5), ('OP_GTE', -5), ('OP_LT', -5), ('OP_LTE', -5), ('OP_MINUS', -5), ('OP_MULT', -5), ('OP_NEQ', -5), ('OP_PLUS', -5), ('OP_RANGE', -5), ('RPAREN', -5), ('RSBRACKET', -5), ('SEMICOLON', -5))),
+    (248, (('COMMA', -6), ('KW_AND', -6), ('KW_DIV', -6), ('KW_DO', -6), ('KW_DOWNTO', -6), ('KW_ELSE', -6), ('KW_END', -6), ('KW_IN', -6), ('KW_MOD', -6), ('KW_OF', -6), ('KW_OR', -6), ('KW_THEN', -6), ('KW_TO', -6), ('KW_UNTIL', -6), ('OP_DIV', -6), ('OP_EQ', -6), ('OP_GT', -6), ('OP_GTE', -6), ('OP_LT', -6), ('OP_LTE', -6), ('OP_MINUS', -6), ('OP_MULT', -6), ('OP_NEQ', -6), ('OP_PLUS', -6), ('OP_RANGE', -6), ('RPAREN', -6), ('RSBRACKET', -6), ('SEMICOLON', -6))),
+    (249, (('COMMA', -7), ('KW_AND', -7), ('KW_DIV', -7), ('KW_DO', -7), ('KW_DOWNTO', -7), ('KW_ELSE', -7), ('KW_END', -7), ('KW_IN', -7), ('KW_MOD', -7), ('KW_OF', -7), ('KW_OR', -7), ('KW_THEN', -7), ('KW_TO', -7), ('KW_UNTIL', -7), ('OP_DIV', -7), ('OP_EQ', -7), ('OP_GT', -7), ('OP_GTE', -7), ('OP_LT', -7), ('OP_LTE', -7), ('OP_MINUS', -7), ('OP_MULT', -7), ('OP_NEQ', -7), ('OP_PLUS', -7), ('OP_RANGE', -7), ('RPAREN', -7), ('RSBRACKET', -7), ('SEMICOLON', -7))),
+    (250, (('COMMA', -8), ('KW_AND', -8), ('KW_DIV', -8), ('KW_DO', -8), ('KW_DOWNTO', -8), ('KW_ELSE', -8), ('KW_END', -8), ('KW_IN', -8), ('KW_MOD', -8), ('KW_OF', -8), ('KW_OR', -8), ('KW_THEN', -8), ('KW_TO', -8), ('KW_UNTIL', -8), ('OP_DIV', -8), ('OP_EQ', -8), ('OP_GT', -8), ('OP_GTE', -8), ('OP_LT', -8), ('OP_LTE', -8), ('OP_MINUS', -8), ('OP_MULT', -8), ('OP_NEQ', -8), ('OP_PLUS', -8), ('OP_RANGE', -8), ('RPAREN', -8), ('RSBRACKET', -8), ('SEMICOLON', -8))),
+    (251, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('RSBRACKET', -270), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (252, (('COMMA', -270), ('DOT', 254), ('KW_AND', -270), ('KW_DIV', -270), ('KW_DO', -270), ('KW_DOWNTO', -270), ('KW_ELSE', -270), ('KW_END', -270), ('KW_IN', -270), ('KW_MOD', -270), ('KW_OF', -270), ('KW_OR', -270), ('KW_THEN', -270), ('KW_TO', -270), ('KW_UNTIL', -270), ('LPAREN', 227), ('LSBRACKET', -153), ('OP_DIV', -270), ('OP_EQ', -270), ('OP_GT', -270), ('OP_GTE', -270), ('OP_LT', -270), ('OP_LTE', -270), ('OP_MINUS', -270), ('OP_MULT', -270), ('OP_NEQ', -270), ('OP_PLUS', -270), ('OP_RANGE', -270), ('OP_UPARROW', 253), ('RPAREN', -270), ('RSBRACKET', -270), ('SEMICOLON', -270))),
+    (253, (('COMMA', -160), ('DOT', -160), ('KW_AND', -160), ('KW_DIV', -160), ('KW_DO', -160), ('KW_DOWNTO', -160), ('KW_ELSE', -160), ('KW_END', -160), ('KW_IN', -160), ('KW_MOD', -160), ('KW_OF', -160), ('KW_OR', -160), ('KW_THEN', -160), ('KW_TO', -160), ('KW_UNTIL', -160), ('LPAREN', -160), ('LSBRACKET', -160), ('OP_ASSIGN', -160), ('OP_DIV', -160), ('OP_EQ', -160), ('OP_GT', -160), ('OP_GTE', -160), ('OP_LT', -160), ('OP_LTE', -160), ('OP_MINUS', -160), ('OP_MULT', -160), ('OP_NEQ', -160), ('OP_PLUS', -160), ('OP_RANGE', -160), ('OP_UPARROW', -160), ('RPAREN', -160), ('RSBRACKET', -160), ('SEMICOLON', -160))),
+    (254, (('IDENTIFIER', 321),)),
+    (255, (('KW_OF', 322),)),
+    (256, (('KW_OF', 323),)),
+    (257, (('COMMA', -203), ('KW_DO', -203), ('KW_DOWNTO', -203), ('KW_OF', -203), ('KW_TO', -203), ('OP_RANGE', -203), ('RSBRACKET', -203))),
+    (258, (('KW_DO', 324),)),
+    (259, (('KW_UNTIL', 325), ('SEMICOLON', 153))),
+    (260, (('OP_ASSIGN', 326),)),
+    (261, (('OP_ASSIGN', 327),)),
+    (262, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (263, (('COLON', -124), ('RPAREN', -124), ('SEMICOLON', -124))),
+    (264, (('IDENTIFIER', -270), ('KW_FUNCTION', 58), ('KW_PROCEDURE', 57), ('KW_VAR', 197))),
+    (265, (('COLON', -126), ('RPAREN', -126), ('SEMICOLON', -126))),
+    (266, (('RPAREN', -132), ('SEMICOLON', -132))),
+    (267, (('COLON', 330), ('COMMA', 331))),
+    (268, (('COLON', -135), ('COMMA', -135))),
+    (269, (('RPAREN', -122), ('SEMICOLON', -122))),
+    (270, (('COMMA', -53), ('RPAREN', -53), ('error', 332))),
+    (271, (('KW_OF', 334),)),
+    (272, (('IDENTIFIER', 89), ('LPAREN', 103), ('OP_MINUS', 72), ('OP_PLUS', 71), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (273, (('KW_END', -78), ('RPAREN', -78), ('SEMICOLON', -78), ('error', -78))),
+    (274, (('KW_END', -270), ('RPAREN', -270), ('SEMICOLON', 216), ('error', -270))),
+    (275, (('KW_END', -76), ('RPAREN', -76), ('error', -76))),
+    (276, (('KW_END', -80), ('RPAREN', -80), ('SEMICOLON', -80), ('error', -80))),
+    (277, (('COLON', -81), ('COMMA', -81))),
+    (278, (('IDENTIFIER', 68), ('OP_MINUS', 72), ('OP_PLUS', 71), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (279, (('KW_OF', -84),)),
+    (280, (('IDENTIFIER', 341),)),
+    (281, (('KW_OF', -86),)),
+    (282, (('KW_ELSE', -224), ('KW_END', -224), ('KW_UNTIL', -224), ('SEMICOLON', -224))),
+    (283, (('COMMA', 343), ('RPAREN', 342))),
+    (284, (('COMMA', -147), ('RPAREN', -147))),
+    (285, (('COMMA', -148), ('RPAREN', -148))),
+    (286, (('IDENTIFIER', -270), ('KW_BEGIN', -270), ('KW_CASE', -270), ('KW_ELSE', -270), ('KW_END', -270), ('KW_FOR', -270), ('KW_GOTO', -270), ('KW_IF', -270), ('KW_REPEAT', -270), ('KW_UNTIL', -270), ('KW_WHILE', -270), ('KW_WITH', -270), ('SEMICOLON', -270), ('UNSIGNED_INTEGER', 116), ('error', 345))),
+    (287, (('IDENTIFIER', 232),)),
+    (288, (('IDENTIFIER', -270), ('KW_BEGIN', -270), ('KW_CASE', -270), ('KW_ELSE', -270), ('KW_END', -270), ('KW_FOR', -270), ('KW_GOTO', -270), ('KW_IF', -270), ('KW_REPEAT', -270), ('KW_UNTIL', -270), ('KW_WHILE', -270), ('KW_WITH', -270), ('SEMICOLON', -270), ('UNSIGNED_INTEGER', 116))),
+    (289, (('IDENTIFIER', -270), ('KW_BEGIN', -270), ('KW_CASE', -270), ('KW_ELSE', -270), ('KW_END', -270), ('KW_FOR', -270), ('KW_GOTO', -270), ('KW_IF', -270), ('KW_REPEAT', -270), ('KW_UNTIL', -270), ('KW_WHILE', -270), ('KW_WITH', -270), ('SEMICOLON', -270), ('UNSIGNED_INTEGER', 116))),
+    (290, (('COMMA', -161), ('KW_DO', -161), ('KW_DOWNTO', -161), ('KW_ELSE', -161), ('KW_END', -161), ('KW_OF', -161), ('KW_THEN', -161), ('KW_TO', -161), ('KW_UNTIL', -161), ('OP_RANGE', -161), ('RPAREN', -161), ('RSBRACKET', -161), ('SEMICOLON', -161))),
+    (291, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (292, (('COMMA', -163), ('KW_DO', -163), ('KW_DOWNTO', -163), ('KW_ELSE', -163), ('KW_END', -163), ('KW_OF', -163), ('KW_THEN', -163), ('KW_TO', -163), ('KW_UNTIL', -163), ('OP_RANGE', -163), ('RPAREN', -163), ('RSBRACKET', -163), ('SEMICOLON', -163))),
+    (293, (('IDENTIFIER', -174), ('KW_NIL', -174), ('KW_NOT', -174), ('LPAREN', -174), ('LSBRACKET', -174), ('OP_MINUS', -174), ('OP_PLUS', -174), ('STRING', -174), ('UNSIGNED_INTEGER', -174), ('UNSIGNED_REAL', -174))),
+    (294, (('IDENTIFIER', -175), ('KW_NIL', -175), ('KW_NOT', -175), ('LPAREN', -175), ('LSBRACKET', -175), ('OP_MINUS', -175), ('OP_PLUS', -175), ('STRING', -175), ('UNSIGNED_INTEGER', -175), ('UNSIGNED_REAL', -175))),
+    (295, (('IDENTIFIER', -176), ('KW_NIL', -176), ('KW_NOT', -176), ('LPAREN', -176), ('LSBRACKET', -176), ('OP_MINUS', -176), ('OP_PLUS', -176), ('STRING', -176), ('UNSIGNED_INTEGER', -176), ('UNSIGNED_REAL', -176))),
+    (296, (('IDENTIFIER', -177), ('KW_NIL', -177), ('KW_NOT', -177), ('LPAREN', -177), ('LSBRACKET', -177), ('OP_MINUS', -177), ('OP_PLUS', -177), ('STRING', -177), ('UNSIGNED_INTEGER', -177), ('UNSIGNED_REAL', -177))),
+    (297, (('IDENTIFIER', -178), ('KW_NIL', -178), ('KW_NOT', -178), ('LPAREN', -178), ('LSBRACKET', -178), ('OP_MINUS', -178), ('OP_PLUS', -178), ('STRING', -178), ('UNSIGNED_INTEGER', -178), ('UNSIGNED_REAL', -178))),
+    (298, (('IDENTIFIER', -179), ('KW_NIL', -179), ('KW_NOT', -179), ('LPAREN', -179), ('LSBRACKET', -179), ('OP_MINUS', -179), ('OP_PLUS', -179), ('STRING', -179), ('UNSIGNED_INTEGER', -179), ('UNSIGNED_REAL', -179))),
+    (299, (('IDENTIFIER', -180), ('KW_NIL', -180), ('KW_NOT', -180), ('LPAREN', -180), ('LSBRACKET', -180), ('OP_MINUS', -180), ('OP_PLUS', -180), ('STRING', -180), ('UNSIGNED_INTEGER', -180), ('UNSIGNED_REAL', -180))),
+    (300, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (301, (('IDENTIFIER', -166), ('KW_NIL', -166), ('KW_NOT', -166), ('LPAREN', -166), ('LSBRACKET', -166), ('STRING', -166), ('UNSIGNED_INTEGER', -166), ('UNSIGNED_REAL', -166))),
+    (302, (('IDENTIFIER', -167), ('KW_NIL', -167), ('KW_NOT', -167), ('LPAREN', -167), ('LSBRACKET', -167), ('STRING', -167), ('UNSIGNED_INTEGER', -167), ('UNSIGNED_REAL', -167))),
+    (303, (('IDENTIFIER', -168), ('KW_NIL', -168), ('KW_NOT', -168), ('LPAREN', -168), ('LSBRACKET', -168), ('STRING', -168), ('UNSIGNED_INTEGER', -168), ('UNSIGNED_REAL', -168))),
+    (304, (('COMMA', -182), ('KW_DO', -182), ('KW_DOWNTO', -182), ('KW_ELSE', -182), ('KW_END', -182), ('KW_IN', -182), ('KW_OF', -182), ('KW_OR', 303), ('KW_THEN', -182), ('KW_TO', -182), ('KW_UNTIL', -182), ('OP_EQ', -182), ('OP_GT', -182), ('OP_GTE', -182), ('OP_LT', -182), ('OP_LTE', -182), ('OP_MINUS', 302), ('OP_NEQ', -182), ('OP_PLUS', 301), ('OP_RANGE', -182), ('RPAREN', -182), ('RSBRACKET', -182), ('SEMICOLON', -182))),
+    (305, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (306, (('IDENTIFIER', -169), ('KW_NIL', -169), ('KW_NOT', -169), ('LPAREN', -169), ('LSBRACKET', -169), ('STRING', -169), ('UNSIGNED_INTEGER', -169), ('UNSIGNED_REAL', -169))),
+    (307, (('IDENTIFIER', -170), ('KW_NIL', -170), ('KW_NOT', -170), ('LPAREN', -170), ('LSBRACKET', -170), ('STRING', -170), ('UNSIGNED_INTEGER', -170), ('UNSIGNED_REAL', -170))),
+    (308, (('IDENTIFIER', -171), ('KW_NIL', -171), ('KW_NOT', -171), ('LPAREN', -171), ('LSBRACKET', -171), ('STRING', -171), ('UNSIGNED_INTEGER', -171), ('UNSIGNED_REAL', -171))),
+    (309, (('IDENTIFIER', -172), ('KW_NIL', -172), ('KW_NOT', -172), ('LPAREN', -172), ('LSBRACKET', -172), ('STRING', -172), ('UNSIGNED_INTEGER', -172), ('UNSIGNED_REAL', -172))),
+    (310, (('IDENTIFIER', -173), ('KW_NIL', -173), ('KW_NOT', -173), ('LPAREN', -173), ('LSBRACKET', -173), ('STRING', -173), ('UNSIGNED_INTEGER', -173), ('UNSIGNED_REAL', -173))),
+    (311, (('COMMA', -190), ('KW_AND', -190), ('KW_DIV', -190), ('KW_DO', -190), ('KW_DOWNTO', -190), ('KW_ELSE', -190), ('KW_END', -190), ('KW_IN', -190), ('KW_MOD', -190), ('KW_OF', -190), ('KW_OR', -190), ('KW_THEN', -190), ('KW_TO', -190), ('KW_UNTIL', -190), ('OP_DIV', -190), ('OP_EQ', -190), ('OP_GT', -190), ('OP_GTE', -190), ('OP_LT', -190), ('OP_LTE', -190), ('OP_MINUS', -190), ('OP_MULT', -190), ('OP_NEQ', -190), ('OP_PLUS', -190), ('OP_RANGE', -190), ('RPAREN', -190), ('RSBRACKET', -190), ('SEMICOLON', -190))),
+    (312, (('RPAREN', 353),)),
+    (313, (('RSBRACKET', 354),)),
+    (314, (('COMMA', 355), ('RSBRACKET', -193))),
+    (315, (('RSBRACKET', -194),)),
+    (316, (('COMMA', -196), ('RSBRACKET', -196))),
+    (317, (('COMMA', -270), ('OP_RANGE', 357), ('RSBRACKET', -270))),
+    (318, (('COMMA', -200), ('KW_AND', -200), ('KW_DIV', -200), ('KW_DO', -200), ('KW_DOWNTO', -200), ('KW_ELSE', -200), ('KW_END', -200), ('KW_IN', -200), ('KW_MOD', -200), ('KW_OF', -200), ('KW_OR', -200), ('KW_THEN', -200), ('KW_TO', -200), ('KW_UNTIL', -200), ('OP_DIV', -200), ('OP_EQ', -200), ('OP_GT', -200), ('OP_GTE', -200), ('OP_LT', -200), ('OP_LTE', -200), ('OP_MINUS', -200), ('OP_MULT', -200), ('OP_NEQ', -200), ('OP_PLUS', -200), ('OP_RANGE', -200), ('RPAREN', -200), ('RSBRACKET', -200), ('SEMICOLON', -200))),
+    (319, (('COMMA', -201), ('KW_AND', -201), ('KW_DIV', -201), ('KW_DO', -201), ('KW_DOWNTO', -201), ('KW_ELSE', -201), ('KW_END', -201), ('KW_IN', -201), ('KW_MOD', -201), ('KW_OF', -201), ('KW_OR', -201), ('KW_THEN', -201), ('KW_TO', -201), ('KW_UNTIL', -201), ('OP_DIV', -201), ('OP_EQ', -201), ('OP_GT', -201), ('OP_GTE', -201), ('OP_LT', -201), ('OP_LTE', -201), ('OP_MINUS', -201), ('OP_MULT', -201), ('OP_NEQ', -201), ('OP_PLUS', -201), ('OP_RANGE', -201), ('RPAREN', -201), ('RSBRACKET', -201), ('SEMICOLON', -201))),
+    (320, (('COMMA', -202), ('KW_AND', -202), ('KW_DIV', -202), ('KW_DO', -202), ('KW_DOWNTO', -202), ('KW_ELSE', -202), ('KW_END', -202), ('KW_IN', -202), ('KW_MOD', -202), ('KW_OF', -202), ('KW_OR', -202), ('KW_THEN', -202), ('KW_TO', -202), ('KW_UNTIL', -202), ('OP_DIV', -202), ('OP_EQ', -202), ('OP_GT', -202), ('OP_GTE', -202), ('OP_LT', -202), ('OP_LTE', -202), ('OP_MINUS', -202), ('OP_MULT', -202), ('OP_NEQ', -202), ('OP_PLUS', -202), ('OP_RANGE', -202), ('RPAREN', -202), ('RSBRACKET', -202), ('SEMICOLON', -202))),
+    (321, (('COMMA', -159), ('DOT', -159), ('KW_AND', -159), ('KW_DIV', -159), ('KW_DO', -159), ('KW_DOWNTO', -159), ('KW_ELSE', -159), ('KW_END', -159), ('KW_IN', -159), ('KW_MOD', -159), ('KW_OF', -159), ('KW_OR', -159), ('KW_THEN', -159), ('KW_TO', -159), ('KW_UNTIL', -159), ('LPAREN', -159), ('LSBRACKET', -159), ('OP_ASSIGN', -159), ('OP_DIV', -159), ('OP_EQ', -159), ('OP_GT', -159), ('OP_GTE', -159), ('OP_LT', -159), ('OP_LTE', -159), ('OP_MINUS', -159), ('OP_MULT', -159), ('OP_NEQ', -159), ('OP_PLUS', -159), ('OP_RANGE', -159), ('OP_UPARROW', -159), ('RPAREN', -159), ('RSBRACKET', -159), ('SEMICOLON', -159))),
+    (322, (('IDENTIFIER', 68), ('OP_MINUS', 72), ('OP_PLUS', 71), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74), ('error', 360))),
+    (323, (('IDENTIFIER', 68), ('OP_MINUS', 72), ('OP_PLUS', 71), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (324, (('IDENTIFIER', -270), ('KW_BEGIN', -270), ('KW_CASE', -270), ('KW_ELSE', -270), ('KW_END', -270), ('KW_FOR', -270), ('KW_GOTO', -270), ('KW_IF', -270), ('KW_REPEAT', -270), ('KW_UNTIL', -270), ('KW_WHILE', -270), ('KW_WITH', -270), ('SEMICOLON', -270), ('UNSIGNED_INTEGER', 116))),
+    (325, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (326, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247), ('error', 368))),
+    (327, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (328, (('COMMA', 371), ('RSBRACKET', 372))),
+    (329, (('RPAREN', -127), ('SEMICOLON', -127))),
+    (330, (('IDENTIFIER', 374), ('KW_ARRAY', 379), ('KW_PACKED', 378))),
+    (331, (('IDENTIFIER', 380),)),
+    (332, (('COMMA', -55), ('RPAREN', -55))),
+    (333, (('IDENTIFIER', 89), ('KW_ARRAY', 105), ('KW_PACKED', 95), ('KW_RECORD', 106), ('KW_SET', 107), ('LPAREN', 103), ('OP_MINUS', 72), ('OP_PLUS', 71), ('OP_UPARROW', 97), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74), ('error', 382))),
+    (334, (('IDENTIFIER', -1), ('KW_ARRAY', -1), ('KW_PACKED', -1), ('KW_RECORD', -1), ('KW_SET', -1), ('LPAREN', -1), ('OP_MINUS', -1), ('OP_PLUS', -1), ('OP_UPARROW', -1), ('STRING', -1), ('UNSIGNED_INTEGER', -1), ('UNSIGNED_REAL', -1), ('error', -1))),
+    (335, (('COMMA', -66), ('RSBRACKET', -66))),
+    (336, (('KW_END', -74), ('RPAREN', -74), ('error', -74))),
+    (337, (('KW_END', -83), ('RPAREN', -83), ('SEMICOLON', 383), ('error', -83))),
+    (338, (('KW_END', -92), ('RPAREN', -92), ('SEMICOLON', -92), ('error', -92))),
+    (339, (('COLON', 384), ('COMMA', 385))),
+    (340, (('COLON', -96), ('COMMA', -96))),
+    (341, (('KW_OF', -85),)),
+    (342, (('COMMA', -145), ('KW_AND', -145), ('KW_DIV', -145), ('KW_DO', -145), ('KW_DOWNTO', -145), ('KW_ELSE', -145), ('KW_END', -145), ('KW_IN', -145), ('KW_MOD', -145), ('KW_OF', -145), ('KW_OR', -145), ('KW_THEN', -145), ('KW_TO', -145), ('KW_UNTIL', -145), ('OP_DIV', -145), ('OP_EQ', -145), ('OP_GT', -145), ('OP_GTE', -145), ('OP_LT', -145), ('OP_LTE', -145), ('OP_MINUS', -145), ('OP_MULT', -145), ('OP_NEQ', -145), ('OP_PLUS', -145), ('OP_RANGE', -145), ('RPAREN', -145), ('RSBRACKET', -145), ('SEMICOLON', -145))),
+    (343, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (344, (('KW_ELSE', -265), ('KW_END', -265), ('KW_UNTIL', -265), ('SEMICOLON', -265))),
+    (345, (('KW_ELSE', -267), ('KW_END', -267), ('KW_UNTIL', -267), ('SEMICOLON', -267))),
+    (346, (('COMMA', -268), ('DOT', 254), ('KW_DO', -268), ('LSBRACKET', -153), ('OP_UPARROW', 253))),
+    (347, (('KW_ELSE', -266), ('KW_END', -266), ('KW_UNTIL', -266), ('SEMICOLON', -266))),
+    (348, (('KW_ELSE', -238), ('KW_END', -238), ('KW_UNTIL', -238), ('SEMICOLON', -238))),
+    (349, (('KW_ELSE', 387), ('KW_END', -211), ('KW_UNTIL', -211), ('SEMICOLON', -211))),
+    (350, (('COMMA', -162), ('KW_DO', -162), ('KW_DOWNTO', -162), ('KW_ELSE', -162), ('KW_END', -162), ('KW_OF', -162), ('KW_THEN', -162), ('KW_TO', -162), ('KW_UNTIL', -162), ('OP_RANGE', -162), ('RPAREN', -162), ('RSBRACKET', -162), ('SEMICOLON', -162))),
+    (351, (('COMMA', -183), ('KW_AND', 310), ('KW_DIV', 308), ('KW_DO', -183), ('KW_DOWNTO', -183), ('KW_ELSE', -183), ('KW_END', -183), ('KW_IN', -183), ('KW_MOD', 309), ('KW_OF', -183), ('KW_OR', -183), ('KW_THEN', -183), ('KW_TO', -183), ('KW_UNTIL', -183), ('OP_DIV', 307), ('OP_EQ', -183), ('OP_GT', -183), ('OP_GTE', -183), ('OP_LT', -183), ('OP_LTE', -183), ('OP_MINUS', -183), ('OP_MULT', 306), ('OP_NEQ', -183), ('OP_PLUS', -183), ('OP_RANGE', -183), ('RPAREN', -183), ('RSBRACKET', -183), ('SEMICOLON', -183))),
+    (352, (('COMMA', -185), ('KW_AND', -185), ('KW_DIV', -185), ('KW_DO', -185), ('KW_DOWNTO', -185), ('KW_ELSE', -185), ('KW_END', -185), ('KW_IN', -185), ('KW_MOD', -185), ('KW_OF', -185), ('KW_OR', -185), ('KW_THEN', -185), ('KW_TO', -185), ('KW_UNTIL', -185), ('OP_DIV', -185), ('OP_EQ', -185), ('OP_GT', -185), ('OP_GTE', -185), ('OP_LT', -185), ('OP_LTE', -185), ('OP_MINUS', -185), ('OP_MULT', -185), ('OP_NEQ', -185), ('OP_PLUS', -185), ('OP_RANGE', -185), ('RPAREN', -185), ('RSBRACKET', -185), ('SEMICOLON', -185))),
+    (353, (('COMMA', -191), ('KW_AND', -191), ('KW_DIV', -191), ('KW_DO', -191), ('KW_DOWNTO', -191), ('KW_ELSE', -191), ('KW_END', -191), ('KW_IN', -191), ('KW_MOD', -191), ('KW_OF', -191), ('KW_OR', -191), ('KW_THEN', -191), ('KW_TO', -191), ('KW_UNTIL', -191), ('OP_DIV', -191), ('OP_EQ', -191), ('OP_GT', -191), ('OP_GTE', -191), ('OP_LT', -191), ('OP_LTE', -191), ('OP_MINUS', -191), ('OP_MULT', -191), ('OP_NEQ', -191), ('OP_PLUS', -191), ('OP_RANGE', -191), ('RPAREN', -191), ('RSBRACKET', -191), ('SEMICOLON', -191))),
+    (354, (('COMMA', -192), ('KW_AND', -192), ('KW_DIV', -192), ('KW_DO', -192), ('KW_DOWNTO', -192), ('KW_ELSE', -192), ('KW_END', -192), ('KW_IN', -192), ('KW_MOD', -192), ('KW_OF', -192), ('KW_OR', -192), ('KW_THEN', -192), ('KW_TO', -192), ('KW_UNTIL', -192), ('OP_DIV', -192), ('OP_EQ', -192), ('OP_GT', -192), ('OP_GTE', -192), ('OP_LT', -192), ('OP_LTE', -192), ('OP_MINUS', -192), ('OP_MULT', -192), ('OP_NEQ', -192), ('OP_PLUS', -192), ('OP_RANGE', -192), ('RPAREN', -192), ('RSBRACKET', -192), ('SEMICOLON', -192))),
+    (355, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (356, (('COMMA', -197), ('RSBRACKET', -197))),
+    (357, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (358, (('COMMA', -199), ('RSBRACKET', -199))),
+    (359, (('KW_END', 392), ('SEMICOLON', 391))),
+    (360, (('KW_END', 392), ('SEMICOLON', 394))),
+    (361, (('KW_END', -244), ('SEMICOLON', -244))),
+    (362, (('COLON', 395), ('COMMA', 396))),
+    (363, (('COLON', -248), ('COMMA', -248))),
+    (364, (('KW_END', 392), ('SEMICOLON', 391))),
+    (365, (('KW_ELSE', -254), ('KW_END', -254), ('KW_UNTIL', -254), ('SEMICOLON', -254))),
+    (366, (('KW_ELSE', -255), ('KW_END', -255), ('KW_UNTIL', -255), ('SEMICOLON', -255))),
+    (367, (('KW_DOWNTO', 400), ('KW_TO', 399))),
+    (368, (('KW_DOWNTO', 400), ('KW_TO', 399))),
+    (369, (('KW_DOWNTO', 400), ('KW_TO', 399))),
+    (370, (('COMMA', -156), ('DOT', -156), ('KW_AND', -156), ('KW_DIV', -156), ('KW_DO', -156), ('KW_DOWNTO', -156), ('KW_ELSE', -156), ('KW_END', -156), ('KW_IN', -156), ('KW_MOD', -156), ('KW_OF', -156), ('KW_OR', -156), ('KW_THEN', -156), ('KW_TO', -156), ('KW_UNTIL', -156), ('LPAREN', -156), ('LSBRACKET', -156), ('OP_ASSIGN', -156), ('OP_DIV', -156), ('OP_EQ', -156), ('OP_GT', -156), ('OP_GTE', -156), ('OP_LT', -156), ('OP_LTE', -156), ('OP_MINUS', -156), ('OP_MULT', -156), ('OP_NEQ', -156), ('OP_PLUS', -156), ('OP_RANGE', -156), ('OP_UPARROW', -156), ('RPAREN', -156), ('RSBRACKET', -156), ('SEMICOLON', -156))),
+    (371, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247))),
+    (372, (('COMMA', -158), ('DOT', -158), ('KW_AND', -158), ('KW_DIV', -158), ('KW_DO', -158), ('KW_DOWNTO', -158), ('KW_ELSE', -158), ('KW_END', -158), ('KW_IN', -158), ('KW_MOD', -158), ('KW_OF', -158), ('KW_OR', -158), ('KW_THEN', -158), ('KW_TO', -158), ('KW_UNTIL', -158), ('LPAREN', -158), ('LSBRACKET', -158), ('OP_ASSIGN', -158), ('OP_DIV', -158), ('OP_EQ', -158), ('OP_GT', -158), ('OP_GTE', -158), ('OP_LT', -158), ('OP_LTE', -158), ('OP_MINUS', -158), ('OP_MULT', -158), ('OP_NEQ', -158), ('OP_PLUS', -158), ('OP_RANGE', -158), ('OP_UPARROW', -158), ('RPAREN', -158), ('RSBRACKET', -158), ('SEMICOLON', -158))),
+    (373, (('RPAREN', -133), ('SEMICOLON', -133))),
+    (374, (('RPAREN', -136), ('SEMICOLON', -136))),
+    (375, (('RPAREN', -137), ('SEMICOLON', -137))),
+    (376, (('RPAREN', -138), ('SEMICOLON', -138))),
+    (377, (('RPAREN', -139), ('SEMICOLON', -139))),
+    (378, (('KW_ARRAY', 404),)),
+    (379, (('LSBRACKET', 405),)),
+    (380, (('COLON', -134), ('COMMA', -134))),
+    (381, (('KW_END', -63), ('RPAREN', -63), ('SEMICOLON', -63), ('error', -63))),
+    (382, (('KW_END', -64), ('RPAREN', -64), ('SEMICOLON', -64), ('error', -64))),
+    (383, (('IDENTIFIER', 68), ('OP_MINUS', 72), ('OP_PLUS', 71), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (384, (('LPAREN', 407),)),
+    (385, (('IDENTIFIER', 68), ('OP_MINUS', 72), ('OP_PLUS', 71), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (386, (('COMMA', -146), ('RPAREN', -146))),
+    (387, (('IDENTIFIER', -270), ('KW_BEGIN', -270), ('KW_CASE', -270), ('KW_ELSE', -270), ('KW_END', -270), ('KW_FOR', -270), ('KW_GOTO', -270), ('KW_IF', -270), ('KW_REPEAT', -270), ('KW_UNTIL', -270), ('KW_WHILE', -270), ('KW_WITH', -270), ('SEMICOLON', -270), ('UNSIGNED_INTEGER', 116))),
+    (388, (('COMMA', -195), ('RSBRACKET', -195))),
+    (389, (('COMMA', -198), ('RSBRACKET', -198))),
+    (390, (('KW_ELSE', -240), ('KW_END', -240), ('KW_UNTIL', -240), ('SEMICOLON', -240))),
+    (391, (('IDENTIFIER', 68), ('KW_END', 413), ('OP_MINUS', 72), ('OP_PLUS', 71), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (392, (('KW_ELSE', -250), ('KW_END', -250), ('KW_UNTIL', -250), ('SEMICOLON', -250))),
+    (393, (('KW_ELSE', -242), ('KW_END', -242), ('KW_UNTIL', -242), ('SEMICOLON', -242))),
+    (394, (('KW_END', 413),)),
+    (395, (('IDENTIFIER', -270), ('KW_BEGIN', -270), ('KW_CASE', -270), ('KW_END', -270), ('KW_FOR', -270), ('KW_GOTO', -270), ('KW_IF', -270), ('KW_REPEAT', -270), ('KW_WHILE', -270), ('KW_WITH', -270), ('SEMICOLON', -270), ('UNSIGNED_INTEGER', 116), ('error', 415))),
+    (396, (('IDENTIFIER', 68), ('OP_MINUS', 72), ('OP_PLUS', 71), ('STRING', 73), ('UNSIGNED_INTEGER', 75), ('UNSIGNED_REAL', 74))),
+    (397, (('KW_ELSE', -241), ('KW_END', -241), ('KW_UNTIL', -241), ('SEMICOLON', -241))),
+    (398, (('KW_ELSE', -256), ('KW_END', -256), ('KW_UNTIL', -256), ('SEMICOLON', -256))),
+    (399, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247), ('error', 418))),
+    (400, (('IDENTIFIER', 232), ('KW_NIL', 250), ('KW_NOT', 245), ('LPAREN', 246), ('LSBRACKET', 251), ('OP_MINUS', 240), ('OP_PLUS', 239), ('STRING', 249), ('UNSIGNED_INTEGER', 248), ('UNSIGNED_REAL', 247), ('error', 420))),
+    (401, (('KW_ELSE', -258), ('KW_END', -258), ('KW_UNTIL', -258), ('SEMICOLON', -258))),
+    (402, (('KW_ELSE', -257), ('KW_END', -257), ('KW_UNTIL', -257), ('SEMICOLON', -257))),
+    (403, (('RSBRACKET', 421),)),
+    (404, (('LSBRACKET', 422),)),
+    (405, (('IDENTIFIER', 424),)),
+    (406, (('KW_END', -91), ('RPAREN', -91), ('SEMICOLON', -91), ('error', -91))),
+    (407, (('IDENTIFIER', 150), ('KW_CASE', 149), ('RPAREN', -270), ('error', -270))),
+    (408, (('COLON', -95), ('COMMA', -95))),
+    (409, (('KW_ELSE', -237), ('KW_END', -237), ('KW_UNTIL', -237), ('SEMICOLON', -237))),
+    (410, (('KW_ELSE', -239), ('KW_END', -239), ('KW_UNTIL', -239), ('SEMICOLON', -239))),
+    (411, (('IDENTIFIER', 170), ('KW_BEGIN', 78), ('KW_CASE', 180), ('KW_ELSE', -270), ('KW_END', -270), ('KW_FOR', 183), ('KW_GOTO', 171), ('KW_IF', 178), ('KW_REPEAT', 182), ('KW_UNTIL', -270), ('KW_WHILE', 181), ('KW_WITH', 177), ('SEMICOLON', -270))),
+    (412, (('KW_END', -243), ('SEMICOLON', -243))),
+    (413, (('KW_ELSE', -249), ('KW_END', -249), ('KW_UNTIL', -249), ('SEMICOLON', -249))),
+    (414, (('KW_END', -245), ('SEMICOLON', -245))),
+    (415, (('KW_END', -246), ('SEMICOLON', -246))),
+    (416, (('COLON', -247), ('COMMA', -247))),
+    (417, (('KW_DO', 426),)),
+    (418, (('KW_DO', 427),)),
+    (419, (('KW_DO', 428),)),
+    (420, (('KW_DO', 429),)),
+    (421, (('COMMA', -157), ('DOT', -157), ('KW_AND', -157), ('KW_DIV', -157), ('KW_DO', -157), ('KW_DOWNTO', -157), ('KW_ELSE', -157), ('KW_END', -157), ('KW_IN', -157), ('KW_MOD', -157), ('KW_OF', -157), ('KW_OR', -157), ('KW_THEN', -157), ('KW_TO', -157), ('KW_UNTIL', -157), ('LPAREN', -157), ('LSBRACKET', -157), ('OP_ASSIGN', -157), ('OP_DIV', -157), ('OP_EQ', -157), ('OP_GT', -157), ('OP_GTE', -157), ('OP_LT', -157), ('OP_LTE', -157), ('OP_MINUS', -157), ('OP_MULT', -157), ('OP_NEQ', -157), ('OP_PLUS', -157), ('OP_RANGE', -157), ('OP_UPARROW', -157), ('RPAREN', -157), ('RSBRACKET', -157), ('SEMICOLON', -157))),
+    (422, (('IDENTIFIER', 424),)),
+    (423, (('RSBRACKET', 431),)),
+    (424, (('OP_RANGE', 432),)),
+    (425, (('RPAREN', 433), ('error', 434))),
+    (426, (('IDENTIFIER', -270), ('KW_BEGIN', -270), ('KW_CASE', -270), ('KW_ELSE', -270), ('KW_END', -270), ('KW_FOR', -270), ('KW_GOTO', -270), ('KW_IF', -270), ('KW_REPEAT', -270), ('KW_UNTIL', -270), ('KW_WHILE', -270), ('KW_WITH', -270), ('SEMICOLON', -270), ('UNSIGNED_INTEGER', 116), ('error', 436))),
+    (427, (('IDENTIFIER', -270), ('KW_BEGIN', -270), ('KW_CASE', -270), ('KW_ELSE', -270), ('KW_END', -270), ('KW_FOR', -270), ('KW_GOTO', -270), ('KW_IF', -270), ('KW_REPEAT', -270), ('KW_UNTIL', -270), ('KW_WHILE', -270), ('KW_WITH', -270), ('SEMICOLON', -270), ('UNSIGNED_INTEGER', 116))),
+    (428, (('IDENTIFIER', -270), ('KW_BEGIN', -270), ('KW_CASE', -270), ('KW_ELSE', -270), ('KW_END', -270), ('KW_FOR', -270), ('KW_GOTO', -270), ('KW_IF', -270), ('KW_REPEAT', -270), ('KW_UNTIL', -270), ('KW_WHILE', -270), ('KW_WITH', -270), ('SEMICOLON', -270), ('UNSIGNED_INTEGER', 116), ('error', 439))),
+    (429, (('IDENTIFIER', -270), ('KW_BEGIN', -270), ('KW_CASE', -270), ('KW_ELSE', -270), ('KW_END', -270), ('KW_FOR', -270), ('KW_GOTO', -270), ('KW_IF', -270), ('KW_REPEAT', -270), ('KW_UNTIL', -270), ('KW_WHILE', -270), ('KW_WITH', -270), ('SEMICOLON', -270), ('UNSIGNED_INTEGER', 116))),
+    (430, (('RSBRACKET', 441),)),
+    (431, (('KW_OF', 442),)),
+    (432, (('IDENTIFIER', 443),)),
+    (433, (('KW_END', -93), ('RPAREN', -93), ('SEMICOLON', -93), ('error', -93))),
+    (434, (('KW_END', -94), ('RPAREN', -94), ('SEMICOLON', -94), ('error', -94))),
+    (435, (('KW_ELSE', -259), ('KW_END', -259), ('KW_UNTIL', -259), ('SEMICOLON', -259))),
+    (436, (('KW_ELSE', -263), ('KW_END', -263), ('KW_UNTIL', -263), ('SEMICOLON', -263))),
+    (437, (('KW_ELSE', -261), ('KW_END', -261), ('KW_UNTIL', -261), ('SEMICOLON', -261))),
+    (438, (('KW_ELSE', -260), ('KW_END', -260), ('KW_UNTIL', -260), ('SEMICOLON', -260))),
+    (439, (('KW_ELSE', -264), ('KW_END', -264), ('KW_UNTIL', -264), ('SEMICOLON', -264))),
+    (440, (('KW_ELSE', -262), ('KW_END', -262), ('KW_UNTIL', -262), ('SEMICOLON', -262))),
+    (441, (('KW_OF', 444),)),
+    (442, (('IDENTIFIER', 445),)),
+    (443, (('COLON', 446),)),
+    (444, (('IDENTIFIER', 447),)),
+    (445, (('RPAREN', -141), ('SEMICOLON', -141))),
+    (446, (('IDENTIFIER', 448),)),
+    (447, (('RPAREN', -140), ('SEMICOLON', -140))),
+    (448, (('RSBRACKET', -144),)),
+)
+
+GOTO = (
+    (0, (('program', 1), ('programHeading', 2))),
+    (1, ()),
+    (2, ()),
+    (3, ()),
+    (4, (('block', 6), ('empty', 9), ('labelDeclarationPart', 7))),
+    (5, (('empty', 12), ('programExternals', 10))),
+    (6, ()),
+    (7, (('constDefinitionPart', 14), ('empty', 16))),
+    (8, (('empty', 20), ('labelDeclarationPartBody', 17))),
+    (9, ()),
+    (10, ()),
+    (11, (('empty', 24), ('programExternalsBody', 21))),
+    (12, ()),
+    (13, ()),
+    (14, (('empty', 27), ('typeDefinitionPart', 25))),
+    (15, (('constDefinition', 30), ('constDefinitionPartBody', 28))),
+    (16, ()),
+    (17, ()),
+    (18, ()),
+    (19, ()),
+    (20, ()),
+    (21, ()),
+    (22, ()),
+    (23, ()),
+    (24, ()),
+    (25, (('empty', 40), ('variableDeclarationPart', 38))),
+    (26, (('typeDefinition', 42), ('typeDefinitionPartBody', 41))),
+    (27, ()),
+    (28, ()),
+    (29, ()),
+    (30, ()),
+    (31, ()),
+    (32, ()),
+    (33, ()),
+    (34, ()),
+    (35, ()),
+    (36, ()),
+    (37, ()),
+    (38, (('empty', 52), ('functionHeading', 56), ('procedureAndFunctionDefinition', 53), ('procedureAndFunctionDefinitionPart', 50), ('procedureAndFunctionDefinitionPartList', 51), ('procedureHeading', 55), ('procedureOrFunctionHeading', 54))),
+    (39, (('variableDeclaration', 60), ('variableDeclarationHead', 62), ('variableDeclarationPartBody', 59))),
+    (40, ()),
+    (41, ()),
+    (42, ()),
+    (43, ()),
+    (44, ()),
+    (45, (('constDefinition', 67),)),
+    (46, ()),
+    (47, (('constElem', 69), ('number', 70))),
+    (48, ()),
+    (49, ()),
+    (50, (('compoundStatement', 77), ('statementPart', 76))),
+    (51, ()),
+    (52, ()),
+    (53, ()),
+    (54, ()),
+    (55, ()),
+    (56, ()),
+    (57, ()),
+    (58, ()),
+    (59, ()),
+    (60, ()),
+    (61, ()),
+    (62, ()),
+    (63, ()),
+    (64, (('typeDefinition', 87),)),
+    (65, ()),
+    (66, (('arrayType', 100), ('constElem', 104), ('enumeratedType', 98), ('number', 70), ('ordinalType', 94), ('pointerType', 93), ('recordType', 101), ('setType', 102), ('simpleType', 91), ('structuredType', 92), ('subrangeType', 99), ('type', 90), ('unpackedStructuredType', 96))),
+    (67, ()),
+    (68, ()),
+    (69, ()),
+    (70, ()),
+    (71, (('number', 108),)),
+    (72, (('number', 109),)),
+    (73, ()),
+    (74, ()),
+    (75, ()),
+    (76, ()),
+    (77, ()),
+    (78, (('empty', 117), ('matchedStatement', 113), ('statement', 112), ('statementLabel', 115), ('statementSequence', 110), ('unmatchedStatement', 114))),
+    (79, (('functionHeading', 56), ('procedureAndFunctionDefinition', 118), ('procedureHeading', 55), ('procedureOrFunctionHeading', 54))),
+    (80, (('block', 120), ('directive', 121), ('empty', 9), ('labelDeclarationPart', 7), ('procedureOrFunctionBody', 119))),
+    (81, (('empty', 126), ('formalParameterList', 124), ('procedureHeadingParams', 123))),
+    (82, (('empty', 129), ('formalParameterList', 130), ('functionHeadingParams', 128), ('functionHeadingTail', 127))),
+    (83, (('variableDeclaration', 131), ('variableDeclarationHead', 62))),
+    (84, ()),
+    (85, (('arrayType', 100), ('constElem', 104), ('enumeratedType', 98), ('number', 70), ('ordinalType', 94), ('pointerType', 93), ('recordType', 101), ('setType', 102), ('simpleType', 91), ('structuredType', 92), ('subrangeType', 99), ('type', 133), ('unpackedStructuredType', 96))),
+    (86, ()),
+    (87, ()),
+    (88, ()),
+    (89, ()),
+    (90, ()),
+    (91, ()),
+    (92, ()),
+    (93, ()),
+    (94, ()),
+    (95, (('arrayType', 100), ('recordType', 101), ('setType', 102), ('unpackedStructuredType', 135))),
+    (96, ()),
+    (97, (('arrayType', 100), ('constElem', 104), ('enumeratedType', 98), ('number', 70), ('ordinalType', 94), ('pointerType', 93), ('recordType', 101), ('setType', 102), ('simpleType', 91), ('structuredType', 92), ('subrangeType', 99), ('type', 136), ('unpackedStructuredType', 96))),
+    (98, ()),
+    (99, ()),
+    (100, ()),
+    (101, ()),
+    (102, ()),
+    (103, (('enumeratedTypeList', 137),)),
+    (104, ()),
+    (105, ()),
+    (106, (('empty', 145), ('fieldList', 142), ('fieldListDirectTail', 144), ('fixedPart', 143), ('recordSection', 146), ('recordSectionHead', 148), ('variantPart', 147))),
+    (107, ()),
+    (108, ()),
+    (109, ()),
+    (110, ()),
+    (111, ()),
+    (112, ()),
+    (113, ()),
+    (114, ()),
+    (115, (('arrayVariable', 189), ('assignmentStatement', 160), ('assignmentStatementHead', 169), ('caseStatement', 173), ('componentVariable', 185), ('compoundStatement', 164), ('empty', 163), ('entireVariable', 184), ('fieldDesignator', 188), ('forStatement', 176), ('gotoStatement', 162), ('identifiedVariable', 186), ('indexedVariable', 187), ('matchedConditionalStatement', 165), ('matchedIfStatement', 172), ('matchedStatementBody', 155), ('matchedStructuredStatement', 158), ('procedureStatement', 161), ('repeatStatement', 175), ('repetitiveStatement', 166), ('simpleStatement', 157), ('unmatchedConditionalStatement', 159), ('unmatchedIfStatement', 168), ('unmatchedStatementBody', 156), ('variable', 179), ('whileStatement', 174), ('withStatement', 167))),
+    (116, ()),
+    (117, ()),
+    (118, ()),
+    (119, ()),
+    (120, ()),
+    (121, ()),
+    (122, ()),
+    (123, ()),
+    (124, ()),
+    (125, (('bt_GENERIC', 198), ('empty', 199), ('formalParameterListBody', 191), ('formalParameterSection', 193), ('functionHeading', 56), ('procedureHeading', 55), ('procedureOrFunctionHeading', 196), ('valueParameterSpecification', 195), ('variableParameterSpecification', 194))),
+    (126, ()),
+    (127, ()),
+    (128, ()),
+    (129, ()),
+    (130, ()),
+    (131, ()),
+    (132, ()),
+    (133, ()),
+    (134, ()),
+    (135, ()),
+    (136, ()),
+    (137, ()),
+    (138, ()),
+    (139, ()),
+    (140, (('constElem', 205), ('number', 70))),
+    (141, (('constElem', 104), ('enumeratedType', 98), ('indexTypeList', 206), ('number', 70), ('ordinalType', 208), ('subrangeType', 99))),
+    (142, ()),
+    (143, (('bt_GENERIC', 214), ('empty', 199), ('fieldListTail', 211), ('fieldListTerminator', 213))),
+    (144, ()),
+    (145, ()),
+    (146, ()),
+    (147, (('bt_GENERIC', 214), ('empty', 199), ('fieldListTerminator', 215))),
+    (148, ()),
+    (149, (('variantSelector', 219),)),
+    (150, ()),
+    (151, (('constElem', 104), ('enumeratedType', 98), ('number', 70), ('ordinalType', 221), ('subrangeType', 99))),
+    (152, ()),
+    (153, (('empty', 117), ('matchedStatement', 113), ('statement', 222), ('statementLabel', 115), ('unmatchedStatement', 114))),
+    (154, ()),
+    (155, ()),
+    (156, ()),
+    (157, ()),
+    (158, ()),
+    (159, ()),
+    (160, ()),
+    (161, ()),
+    (162, ()),
+    (163, ()),
+    (164, ()),
+    (165, ()),
+    (166, ()),
+    (167, ()),
+    (168, ()),
+    (169, ()),
+    (170, (('actualParameterList', 225), ('empty', 226), ('procedureStatementTail', 224))),
+    (171, ()),
+    (172, ()),
+    (173, ()),
+    (174, ()),
+    (175, ()),
+    (176, ()),
+    (177, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('recordVariableList', 229), ('variable', 231))),
+    (178, (('arrayVariable', 189), ('booleanExpression', 233), ('componentVariable', 185), ('entireVariable', 184), ('expression', 234), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (179, ()),
+    (180, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('expression', 257), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('ordinalExpression', 255), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (181, (('arrayVariable', 189), ('booleanExpression', 258), ('componentVariable', 185), ('entireVariable', 184), ('expression', 234), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (182, (('empty', 117), ('matchedStatement', 113), ('statement', 112), ('statementLabel', 115), ('statementSequence', 259), ('unmatchedStatement', 114))),
+    (183, ()),
+    (184, ()),
+    (185, ()),
+    (186, ()),
+    (187, ()),
+    (188, ()),
+    (189, ()),
+    (190, ()),
+    (191, ()),
+    (192, ()),
+    (193, ()),
+    (194, ()),
+    (195, ()),
+    (196, ()),
+    (197, (('bt_GENERIC', 198), ('empty', 199), ('valueParameterSpecification', 266))),
+    (198, (('identifierList', 267),)),
+    (199, ()),
+    (200, ()),
+    (201, ()),
+    (202, ()),
+    (203, ()),
+    (204, ()),
+    (205, ()),
+    (206, ()),
+    (207, ()),
+    (208, ()),
+    (209, ()),
+    (210, ()),
+    (211, ()),
+    (212, (('bt_GENERIC', 275), ('empty', 199), ('recordSection', 273), ('recordSectionHead', 148), ('variantPart', 274))),
+    (213, ()),
+    (214, ()),
+    (215, ()),
+    (216, (('bt_GENERIC', 275), ('empty', 199))),
+    (217, (('arrayType', 100), ('constElem', 104), ('enumeratedType', 98), ('number', 70), ('ordinalType', 94), ('pointerType', 93), ('recordType', 101), ('setType', 102), ('simpleType', 91), ('structuredType', 92), ('subrangeType', 99), ('type', 276), ('unpackedStructuredType', 96))),
+    (218, ()),
+    (219, ()),
+    (220, (('empty', 281), ('variantIdentifier', 279))),
+    (221, ()),
+    (222, ()),
+    (223, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('expression', 282), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (224, ()),
+    (225, ()),
+    (226, ()),
+    (227, (('actualParameter', 284), ('actualParameterListBody', 283), ('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('expression', 285), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (228, ()),
+    (229, ()),
+    (230, ()),
+    (231, ()),
+    (232, ()),
+    (233, ()),
+    (234, ()),
+    (235, (('empty', 292), ('expressionTail', 290), ('relationalOperator', 291))),
+    (236, (('addingOperator', 300),)),
+    (237, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('setConstructor', 243), ('simpleExpressionBody', 304), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (238, (('multiplyingOperator', 305),)),
+    (239, ()),
+    (240, ()),
+    (241, ()),
+    (242, ()),
+    (243, ()),
+    (244, ()),
+    (245, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('factor', 311), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('setConstructor', 243), ('unsignedConstant', 242), ('variable', 252))),
+    (246, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('expression', 312), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (247, ()),
+    (248, ()),
+    (249, ()),
+    (250, ()),
+    (251, (('arrayVariable', 189), ('componentVariable', 185), ('elementDescription', 316), ('empty', 315), ('entireVariable', 184), ('expression', 257), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('ordinalExpression', 317), ('setConstructor', 243), ('setConstructorBody', 313), ('setConstructorBodyList', 314), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (252, (('actualParameterList', 319), ('empty', 320), ('functionDesignatorTail', 318))),
+    (253, ()),
+    (254, ()),
+    (255, ()),
+    (256, ()),
+    (257, ()),
+    (258, ()),
+    (259, ()),
+    (260, ()),
+    (261, ()),
+    (262, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('expression', 257), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('ordinalExpression', 328), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (263, ()),
+    (264, (('bt_GENERIC', 198), ('empty', 199), ('formalParameterSection', 329), ('functionHeading', 56), ('procedureHeading', 55), ('procedureOrFunctionHeading', 196), ('valueParameterSpecification', 195), ('variableParameterSpecification', 194))),
+    (265, ()),
+    (266, ()),
+    (267, ()),
+    (268, ()),
+    (269, ()),
+    (270, ()),
+    (271, (('bt_KW_OF', 333),)),
+    (272, (('constElem', 104), ('enumeratedType', 98), ('number', 70), ('ordinalType', 335), ('subrangeType', 99))),
+    (273, ()),
+    (274, (('bt_GENERIC', 214), ('empty', 199), ('fieldListTerminator', 336))),
+    (275, ()),
+    (276, ()),
+    (277, ()),
+    (278, (('constElem', 340), ('number', 70), ('variantCase', 338), ('variantCaseConsts', 339), ('variantPartBody', 337))),
+    (279, ()),
+    (280, ()),
+    (281, ()),
+    (282, ()),
+    (283, ()),
+    (284, ()),
+    (285, ()),
+    (286, (('empty', 117), ('matchedStatement', 113), ('statement', 344), ('statementLabel', 115), ('unmatchedStatement', 114))),
+    (287, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('variable', 346))),
+    (288, (('empty', 117), ('matchedStatement', 113), ('statement', 347), ('statementLabel', 115), ('unmatchedStatement', 114))),
+    (289, (('empty', 117), ('matchedStatement', 349), ('statement', 348), ('statementLabel', 115), ('unmatchedStatement', 114))),
+    (290, ()),
+    (291, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 350), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (292, ()),
+    (293, ()),
+    (294, ()),
+    (295, ()),
+    (296, ()),
+    (297, ()),
+    (298, ()),
+    (299, ()),
+    (300, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('setConstructor', 243), ('term', 351), ('unsignedConstant', 242), ('variable', 252))),
+    (301, ()),
+    (302, ()),
+    (303, ()),
+    (304, (('addingOperator', 300),)),
+    (305, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('factor', 352), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('setConstructor', 243), ('unsignedConstant', 242), ('variable', 252))),
+    (306, ()),
+    (307, ()),
+    (308, ()),
+    (309, ()),
+    (310, ()),
+    (311, ()),
+    (312, ()),
+    (313, ()),
+    (314, ()),
+    (315, ()),
+    (316, ()),
+    (317, (('elementDescriptionTail', 356), ('empty', 358))),
+    (318, ()),
+    (319, ()),
+    (320, ()),
+    (321, ()),
+    (322, (('case', 361), ('caseHeading', 362), ('caseStatementBody', 359), ('constElem', 363), ('number', 70))),
+    (323, (('case', 361), ('caseHeading', 362), ('caseStatementBody', 364), ('constElem', 363), ('number', 70))),
+    (324, (('empty', 117), ('matchedStatement', 113), ('statement', 365), ('statementLabel', 115), ('unmatchedStatement', 114))),
+    (325, (('arrayVariable', 189), ('booleanExpression', 366), ('componentVariable', 185), ('entireVariable', 184), ('expression', 234), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (326, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('expression', 257), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('ordinalExpression', 367), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (327, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('expression', 257), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('ordinalExpression', 369), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (328, (('indexedVariableTail', 370),)),
+    (329, ()),
+    (330, (('conformantArraySchema', 375), ('formalParameterSpecificationBody', 373), ('packedConformantArraySchema', 376), ('unpackedConformantArraySchema', 377))),
+    (331, ()),
+    (332, ()),
+    (333, (('arrayType', 100), ('constElem', 104), ('enumeratedType', 98), ('number', 70), ('ordinalType', 94), ('pointerType', 93), ('recordType', 101), ('setType', 102), ('simpleType', 91), ('structuredType', 92), ('subrangeType', 99), ('type', 381), ('unpackedStructuredType', 96))),
+    (334, ()),
+    (335, ()),
+    (336, ()),
+    (337, ()),
+    (338, ()),
+    (339, ()),
+    (340, ()),
+    (341, ()),
+    (342, ()),
+    (343, (('actualParameter', 386), ('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('expression', 285), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (344, ()),
+    (345, ()),
+    (346, ()),
+    (347, ()),
+    (348, ()),
+    (349, ()),
+    (350, ()),
+    (351, (('multiplyingOperator', 305),)),
+    (352, ()),
+    (353, ()),
+    (354, ()),
+    (355, (('arrayVariable', 189), ('componentVariable', 185), ('elementDescription', 388), ('entireVariable', 184), ('expression', 257), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('ordinalExpression', 317), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (356, ()),
+    (357, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('expression', 389), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (358, ()),
+    (359, (('caseStatementTail', 390),)),
+    (360, (('caseStatementTail', 393),)),
+    (361, ()),
+    (362, ()),
+    (363, ()),
+    (364, (('caseStatementTail', 397),)),
+    (365, ()),
+    (366, ()),
+    (367, (('forStatementTail', 398),)),
+    (368, (('forStatementTail', 401),)),
+    (369, (('forStatementTail', 402),)),
+    (370, ()),
+    (371, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('expression', 257), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('ordinalExpression', 403), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (372, ()),
+    (373, ()),
+    (374, ()),
+    (375, ()),
+    (376, ()),
+    (377, ()),
+    (378, ()),
+    (379, ()),
+    (380, ()),
+    (381, ()),
+    (382, ()),
+    (383, (('constElem', 340), ('number', 70), ('variantCase', 406), ('variantCaseConsts', 339))),
+    (384, ()),
+    (385, (('constElem', 408), ('number', 70))),
+    (386, ()),
+    (387, (('empty', 117), ('matchedStatement', 409), ('statementLabel', 411), ('unmatchedStatement', 410))),
+    (388, ()),
+    (389, ()),
+    (390, ()),
+    (391, (('case', 412), ('caseHeading', 362), ('constElem', 363), ('number', 70))),
+    (392, ()),
+    (393, ()),
+    (394, ()),
+    (395, (('empty', 117), ('matchedStatement', 113), ('statement', 414), ('statementLabel', 115), ('unmatchedStatement', 114))),
+    (396, (('constElem', 416), ('number', 70))),
+    (397, ()),
+    (398, ()),
+    (399, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('expression', 257), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('ordinalExpression', 417), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (400, (('arrayVariable', 189), ('componentVariable', 185), ('entireVariable', 184), ('expression', 257), ('factor', 241), ('factorVariableFunctionDesignator', 244), ('fieldDesignator', 188), ('identifiedVariable', 186), ('indexedVariable', 187), ('ordinalExpression', 419), ('setConstructor', 243), ('sign', 237), ('simpleExpression', 235), ('simpleExpressionBody', 236), ('term', 238), ('unsignedConstant', 242), ('variable', 252))),
+    (401, ()),
+    (402, ()),
+    (403, ()),
+    (404, ()),
+    (405, (('indexTypeSpecification', 423),)),
+    (406, ()),
+    (407, (('empty', 145), ('fieldList', 425), ('fieldListDirectTail', 144), ('fixedPart', 143), ('recordSection', 146), ('recordSectionHead', 148), ('variantPart', 147))),
+    (408, ()),
+    (409, ()),
+    (410, ()),
+    (411, (('arrayVariable', 189), ('assignmentStatement', 160), ('assignmentStatementHead', 169), ('caseStatement', 173), ('componentVariable', 185), ('compoundStatement', 164), ('empty', 163), ('entireVariable', 184), ('fieldDesignator', 188), ('forStatement', 176), ('gotoStatement', 162), ('identifiedVariable', 186), ('indexedVariable', 187), ('matchedConditionalStatement', 165), ('matchedIfStatement', 172), ('matchedStatementBody', 155), ('matchedStructuredStatement', 158), ('procedureStatement', 161), ('repeatStatement', 175), ('repetitiveStatement', 166), ('simpleStatement', 157), ('unmatchedConditionalStatement', 159), ('unmatchedIfStatement', 168), ('unmatchedStatementBody', 156), ('variable', 179), ('whileStatement', 174), ('withStatement', 167))),
+    (412, ()),
+    (413, ()),
+    (414, ()),
+    (415, ()),
+    (416, ()),
+    (417, ()),
+    (418, ()),
+    (419, ()),
+    (420, ()),
+    (421, ()),
+    (422, (('indexTypeSpecification', 430),)),
+    (423, ()),
+    (424, ()),
+    (425, ()),
+    (426, (('empty', 117), ('matchedStatement', 113), ('statement', 435), ('statementLabel', 115), ('unmatchedStatement', 114))),
+    (427, (('empty', 117), ('matchedStatement', 113), ('statement', 437), ('statementLabel', 115), ('unmatchedStatement', 114))),
+    (428, (('empty', 117), ('matchedStatement', 113), ('statement', 438), ('statementLabel', 115), ('unmatchedStatement', 114))),
+    (429, (('empty', 117), ('matchedStatement', 113), ('statement', 440), ('statementLabel', 115), ('unmatchedStatement', 114))),
+    (430, ()),
+    (431, ()),
+    (432, ()),
+    (433, ()),
+    (434, ()),
+    (435, ()),
+    (436, ()),
+    (437, ()),
+    (438, ()),
+    (439, ()),
+    (440, ()),
+    (441, ()),
+    (442, ()),
+    (443, ()),
+    (444, ()),
+    (445, ()),
+    (446, ()),
+    (447, ()),
+    (448, ()),
+)
+
+PRODUCTIONS = (
+    ("S' -> program", "S'", 1, None, '', 0),
+    ('bt_KW_OF -> KW_OF', 'bt_KW_OF', 1, 'p_bt_KW_OF', 'synanaler.py', 57),
+    ('bt_GENERIC -> empty', 'bt_GENERIC', 1, 'p_bt_GENERIC', 'synanaler.py', 64),
+    ('number -> UNSIGNED_REAL', 'number', 1, 'p_number', 'synanaler.py', 72),
+    ('number -> UNSIGNED_INTEGER', 'number', 1, 'p_number', 'synanaler.py', 73),
+    ('unsignedConstant -> UNSIGNED_REAL', 'unsignedConstant', 1, 'p_unsignedConstant', 'synanaler.py', 85),
+    ('unsignedConstant -> UNSIGNED_INTEGER', 'unsignedConstant', 1, 'p_unsignedConstant', 'synanaler.py', 86),
+    ('unsignedConstant -> STRING', 'unsignedConstant', 1, 'p_unsignedConstant', 'synanaler.py', 87),
+    ('unsignedConstant -> KW_NIL', 'unsignedConstant', 1, 'p_unsignedConstant', 'synanaler.py', 88),
+    ('directive -> IDENTIFIER', 'directive', 1, 'p_directive', 'synanaler.py', 101),
+    ('program -> programHeading SEMICOLON block DOT', 'program', 4, 'p_program', 'synanaler.py', 109),
+    ('programHeading -> KW_PROGRAM IDENTIFIER programExternals', 'programHeading', 3, 'p_programHeading', 'synanaler.py', 117),
+    ('programExternals -> LPAREN programExternalsBody RPAREN', 'programExternals', 3, 'p_programExternals', 'synanaler.py', 124),
+    ('programExternals -> empty', 'programExternals', 1, 'p_programExternals', 'synanaler.py', 125),
+    ('programExternals -> LPAREN error RPAREN', 'programExternals', 3, 'p_programExternals_error', 'synanaler.py', 131),
+    ('programExternalsBody -> programExternalsBody COMMA IDENTIFIER', 'programExternalsBody', 3, 'p_programExternalsBody', 'synanaler.py', 139),
+    ('programExternalsBody -> IDENTIFIER', 'programExternalsBody', 1, 'p_programExternalsBody', 'synanaler.py', 140),
+    ('programExternalsBody -> empty', 'programExternalsBody', 1, 'p_programExternalsBody', 'synanaler.py', 141),
+    ('block -> labelDeclarationPart constDefinitionPart typeDefinitionPart variableDeclarationPart procedureAndFunctionDefinitionPart statementPart', 'block', 6, 'p_block', 'synanaler.py', 152),
+    ('labelDeclarationPart -> KW_LABEL labelDeclarationPartBody SEMICOLON', 'labelDeclarationPart', 3, 'p_labelDeclarationPart', 'synanaler.py', 167),
+    ('labelDeclarationPart -> empty', 'labelDeclarationPart', 1, 'p_labelDeclarationPart', 'synanaler.py', 168),
+    ('labelDeclarationPart -> KW_LABEL error SEMICOLON', 'labelDeclarationPart', 3, 'p_labelDeclarationPart_error', 'synanaler.py', 174),
+    ('labelDeclarationPartBody -> labelDeclarationPartBody COMMA UNSIGNED_INTEGER', 'labelDeclarationPartBody', 3, 'p_labelDeclarationPartBody', 'synanaler.py', 182),
+    ('labelDeclarationPartBody -> UNSIGNED_INTEGER', 'labelDeclarationPartBody', 1, 'p_labelDeclarationPartBody', 'synanaler.py', 183),
+    ('labelDeclarationPartBody -> empty', 'labelDeclarationPartBody', 1, 'p_labelDeclarationPartBody', 'synanaler.py', 184),
+    ('constDefinitionPart -> KW_CONST constDefinitionPartBody SEMICOLON', 'constDefinitionPart', 3, 'p_constDefinitionPart', 'synanaler.py', 199),
+    ('constDefinitionPart -> empty', 'constDefinitionPart', 1, 'p_constDefinitionPart', 'synanaler.py', 200),
+    ('constDefinitionPart -> KW_CONST error SEMICOLON', 'constDefinitionPart', 3, 'p_constDefinitionPart_error', 'synanaler.py', 207),
+    ('constDefinitionPartBody -> constDefinitionPartBody SEMICOLON constDefinition', 'constDefinitionPartBody', 3, 'p_constDefinitionPartBody', 'synanaler.py', 215),
+    ('constDefinitionPartBody -> constDefinition', 'constDefinitionPartBody', 1, 'p_constDefinitionPartBody', 'synanaler.py', 216),
+    ('constDefinition -> IDENTIFIER OP_EQ constElem', 'constDefinition', 3, 'p_constDefinition', 'synanaler.py', 223),
+    ('constElem -> number', 'constElem', 1, 'p_constElem', 'synanaler.py', 238),
+    ('constElem -> OP_PLUS number', 'constElem', 2, 'p_constElem', 'synanaler.py', 239),
+    ('constElem -> OP_MINUS number', 'constElem', 2, 'p_constElem', 'synanaler.py', 240),
+    ('constElem -> IDENTIFIER', 'constElem', 1, 'p_constElem', 'synanaler.py', 241),
+    ('constElem -> STRING', 'constElem', 1, 'p_constElem', 'synanaler.py', 242),
+    ('typeDefinitionPart -> KW_TYPE typeDefinitionPartBody SEMICOLON', 'typeDefinitionPart', 3, 'p_typeDefinitionPart', 'synanaler.py', 255),
+    ('typeDefinitionPart -> empty', 'typeDefinitionPart', 1, 'p_typeDefinitionPart', 'synanaler.py', 256),
+    ('typeDefinitionPartBody -> typeDefinitionPartBody SEMICOLON typeDefinition', 'typeDefinitionPartBody', 3, 'p_typeDefinitionPartBody', 'synanaler.py', 263),
+    ('typeDefinitionPartBody -> typeDefinition', 'typeDefinitionPartBody', 1, 'p_typeDefinitionPartBody', 'synanaler.py', 264),
+    ('typeDefinitionPartBody -> typeDefinitionPartBody error', 'typeDefinitionPartBody', 2, 'p_typeDefinitionPartBody_error', 'synanaler.py', 272),
+    ('typeDefinitionPartBody -> typeDefinitionPartBody SEMICOLON error', 'typeDefinitionPartBody', 3, 'p_typeDefinitionPartBody_error', 'synanaler.py', 273),
+    ('typeDefinitionPartBody -> error', 'typeDefinitionPartBody', 1, 'p_typeDefinitionPartBody_error', 'synanaler.py', 274),
+    ('typeDefinition -> IDENTIFIER OP_EQ type', 'typeDefinition', 3, 'p_typeDefinition', 'synanaler.py', 288),
+    ('type -> simpleType', 'type', 1, 'p_type', 'synanaler.py', 294),
+    ('type -> structuredType', 'type', 1, 'p_type', 'synanaler.py', 295),
+    ('type -> pointerType', 'type', 1, 'p_type', 'synanaler.py', 296),
+    ('simpleType -> ordinalType', 'simpleType', 1, 'p_simpleType', 'synanaler.py', 303),
+    ('ordinalType -> enumeratedType', 'ordinalType', 1, 'p_ordinalType', 'synanaler.py', 312),
+    ('ordinalType -> subrangeType', 'ordinalType', 1, 'p_ordinalType', 'synanaler.py', 313),
+    ('ordinalType -> IDENTIFIER', 'ordinalType', 1, 'p_ordinalType', 'synanaler.py', 314),
+    ('enumeratedType -> LPAREN enumeratedTypeList RPAREN', 'enumeratedType', 3, 'p_enumeratedType', 'synanaler.py', 323),
+    ('enumeratedType -> LPAREN error RPAREN', 'enumeratedType', 3, 'p_enumeratedType_error', 'synanaler.py', 328),
+    ('enumeratedTypeList -> enumeratedTypeList COMMA IDENTIFIER', 'enumeratedTypeList', 3, 'p_enumeratedTypeList', 'synanaler.py', 342),
+    ('enumeratedTypeList -> IDENTIFIER', 'enumeratedTypeList', 1, 'p_enumeratedTypeList', 'synanaler.py', 343),
+    ('enumeratedTypeList -> enumeratedTypeList COMMA IDENTIFIER error', 'enumeratedTypeList', 4, 'p_enumeratedTypeList_error', 'synanaler.py', 349),
+    ('enumeratedTypeList -> IDENTIFIER error', 'enumeratedTypeList', 2, 'p_enumeratedTypeList_error', 'synanaler.py', 350),
+    ('subrangeType -> constElem OP_RANGE constElem', 'subrangeType', 3, 'p_subrangeType', 'synanaler.py', 359),
+    ('structuredType -> KW_PACKED unpackedStructuredType', 'structuredType', 2, 'p_structuredType', 'synanaler.py', 368),
+    ('structuredType -> unpackedStructuredType', 'structuredType', 1, 'p_structuredType', 'synanaler.py', 369),
+    ('unpackedStructuredType -> arrayType', 'unpackedStructuredType', 1, 'p_unpackedStructuredType', 'synanaler.py', 384),
+    ('unpackedStructuredType -> recordType', 'unpackedStructuredType', 1, 'p_unpackedStructuredType', 'synanaler.py', 385),
+    ('unpackedStructuredType -> setType', 'unpackedStructuredType', 1, 'p_unpackedStructuredType', 'synanaler.py', 386),
+    ('arrayType -> KW_ARRAY LSBRACKET indexTypeList RSBRACKET bt_KW_OF type', 'arrayType', 6, 'p_arrayType', 'synanaler.py', 394),
+    ('arrayType -> KW_ARRAY LSBRACKET indexTypeList RSBRACKET bt_KW_OF error', 'arrayType', 6, 'p_arrayType_error', 'synanaler.py', 399),
+    ('arrayType -> KW_ARRAY LSBRACKET error', 'arrayType', 3, 'p_arrayType_error', 'synanaler.py', 400),
+    ('indexTypeList -> indexTypeList COMMA ordinalType', 'indexTypeList', 3, 'p_indexTypeList', 'synanaler.py', 414),
+    ('indexTypeList -> ordinalType', 'indexTypeList', 1, 'p_indexTypeList', 'synanaler.py', 415),
+    ('recordType -> KW_RECORD fieldList KW_END', 'recordType', 3, 'p_recordType', 'synanaler.py', 426),
+    ('recordType -> KW_RECORD fieldList error', 'recordType', 3, 'p_recordType_error', 'synanaler.py', 437),
+    ('fieldList -> fixedPart fieldListTail', 'fieldList', 2, 'p_fieldList', 'synanaler.py', 452),
+    ('fieldList -> fieldListDirectTail', 'fieldList', 1, 'p_fieldList', 'synanaler.py', 453),
+    ('fieldList -> empty', 'fieldList', 1, 'p_fieldList', 'synanaler.py', 454),
+    ('fieldListDirectTail -> variantPart fieldListTerminator', 'fieldListDirectTail', 2, 'p_fieldListDirectTail', 'synanaler.py', 472),
+    ('fieldListTail -> SEMICOLON variantPart fieldListTerminator', 'fieldListTail', 3, 'p_fieldListTail', 'synanaler.py', 478),
+    ('fieldListTail -> fieldListTerminator', 'fieldListTail', 1, 'p_fieldListTail', 'synanaler.py', 479),
+    ('fieldListTerminator -> SEMICOLON bt_GENERIC', 'fieldListTerminator', 2, 'p_fieldListTerminator', 'synanaler.py', 486),
+    ('fieldListTerminator -> bt_GENERIC', 'fieldListTerminator', 1, 'p_fieldListTerminator', 'synanaler.py', 487),
+    ('fixedPart -> fixedPart SEMICOLON recordSection', 'fixedPart', 3, 'p_fixedPart', 'synanaler.py', 494),
+    ('fixedPart -> recordSection', 'fixedPart', 1, 'p_fixedPart', 'synanaler.py', 495),
+    ('recordSection -> recordSectionHead COLON type', 'recordSection', 3, 'p_recordSection', 'synanaler.py', 502),
+    ('recordSectionHead -> recordSectionHead COMMA IDENTIFIER', 'recordSectionHead', 3, 'p_recordSectionHead', 'synanaler.py', 514),
+    ('recordSectionHead -> IDENTIFIER', 'recordSectionHead', 1, 'p_recordSectionHead', 'synanaler.py', 515),
+    ('variantPart -> KW_CASE variantSelector KW_OF variantPartBody', 'variantPart', 4, 'p_variantPart', 'synanaler.py', 532),
+    ('variantSelector -> IDENTIFIER variantIdentifier', 'variantSelector', 2, 'p_variantSelector', 'synanaler.py', 547),
+    ('variantIdentifier -> COLON IDENTIFIER', 'variantIdentifier', 2, 'p_variantIdentifier', 'synanaler.py', 554),
+    ('variantIdentifier -> empty', 'variantIdentifier', 1, 'p_variantIdentifier', 'synanaler.py', 555),
+    ('variantPartTerminator -> SEMICOLON', 'variantPartTerminator', 1, 'p_variantPartTerminator', 'synanaler.py', 562),
+    ('variantPartTerminator -> empty', 'variantPartTerminator', 1, 'p_variantPartTerminator', 'synanaler.py', 563),
+    ('variantPartBodyList -> variantPartBody', 'variantPartBodyList', 1, 'p_variantPartBodyList', 'synanaler.py', 568),
+    ('variantPartBodyList -> variantPartBody SEMICOLON', 'variantPartBodyList', 2, 'p_variantPartBodyList', 'synanaler.py', 569),
+    ('variantPartBody -> variantPartBody SEMICOLON variantCase', 'variantPartBody', 3, 'p_variantPartBody', 'synanaler.py', 576),
+    ('variantPartBody -> variantCase', 'variantPartBody', 1, 'p_variantPartBody', 'synanaler.py', 577),
+    ('variantCase -> variantCaseConsts COLON LPAREN fieldList RPAREN', 'variantCase', 5, 'p_variantCase', 'synanaler.py', 584),
+    ('variantCase -> variantCaseConsts COLON LPAREN fieldList error', 'variantCase', 5, 'p_variantCase_error', 'synanaler.py', 594),
+    ('variantCaseConsts -> variantCaseConsts COMMA constElem', 'variantCaseConsts', 3, 'p_variantCaseConsts', 'synanaler.py', 601),
+    ('variantCaseConsts -> constElem', 'variantCaseConsts', 1, 'p_variantCaseConsts', 'synanaler.py', 602),
+    ('setType -> KW_SET KW_OF ordinalType', 'setType', 3, 'p_setType', 'synanaler.py', 613),
+    ('pointerType -> OP_UPARROW type', 'pointerType', 2, 'p_pointerType', 'synanaler.py', 631),
+    ('variableDeclarationPart -> KW_VAR variableDeclarationPartBody SEMICOLON', 'variableDeclarationPart', 3, 'p_variableDeclarationPart', 'synanaler.py', 643),
+    ('variableDeclarationPart -> empty', 'variableDeclarationPart', 1, 'p_variableDeclarationPart', 'synanaler.py', 644),
+    ('variableDeclarationPartBody -> variableDeclarationPartBody SEMICOLON variableDeclaration', 'variableDeclarationPartBody', 3, 'p_variableDeclarationPartBody', 'synanaler.py', 652),
+    ('variableDeclarationPartBody -> variableDeclaration', 'variableDeclarationPartBody', 1, 'p_variableDeclarationPartBody', 'synanaler.py', 653),
+    ('variableDeclarationPartBody -> variableDeclarationPartBody error', 'variableDeclarationPartBody', 2, 'p_variableDeclarationPartBody_error', 'synanaler.py', 661),
+    ('variableDeclarationPartBody -> variableDeclarationPartBody SEMICOLON error', 'variableDeclarationPartBody', 3, 'p_variableDeclarationPartBody_error', 'synanaler.py', 662),
+    ('variableDeclarationPartBody -> error', 'variableDeclarationPartBody', 1, 'p_variableDeclarationPartBody_error', 'synanaler.py', 663),
+    ('variableDeclaration -> variableDeclarationHead COLON type', 'variableDeclaration', 3, 'p_variableDeclaration', 'synanaler.py', 675),
+    ('variableDeclarationHead -> variableDeclarationHead COMMA IDENTIFIER', 'variableDeclarationHead', 3, 'p_variableDeclarationHead', 'synanaler.py', 681),
+    ('variableDeclarationHead -> IDENTIFIER', 'variableDeclarationHead', 1, 'p_variableDeclarationHead', 'synanaler.py', 682),
+    ('procedureAndFunctionDefinitionPart -> procedureAndFunctionDefinitionPartList SEMICOLON', 'procedureAndFunctionDefinitionPart', 2, 'p_procedureAndFunctionDefinitionPart', 'synanaler.py', 693),
+    ('procedureAndFunctionDefinitionPart -> empty', 'procedureAndFunctionDefinitionPart', 1, 'p_procedureAndFunctionDefinitionPart', 'synanaler.py', 694),
+    ('procedureAndFunctionDefinitionPartList -> procedureAndFunctionDefinitionPartList SEMICOLON procedureAndFunctionDefinition', 'procedureAndFunctionDefinitionPartList', 3, 'p_procedureAndFunctionDefinitionPartList', 'synanaler.py', 701),
+    ('procedureAndFunctionDefinitionPartList -> procedureAndFunctionDefinition', 'procedureAndFunctionDefinitionPartList', 1, 'p_procedureAndFunctionDefinitionPartList', 'synanaler.py', 702),
+    ('procedureAndFunctionDefinition -> procedureOrFunctionHeading SEMICOLON procedureOrFunctionBody', 'procedureAndFunctionDefinition', 3, 'p_procedureAndFunctionDefinition', 'synanaler.py', 709),
+    ('procedureOrFunctionHeading -> procedureHeading', 'procedureOrFunctionHeading', 1, 'p_procedureOrFunctionHeading', 'synanaler.py', 717),
+    ('procedureOrFunctionHeading -> functionHeading', 'procedureOrFunctionHeading', 1, 'p_procedureOrFunctionHeading', 'synanaler.py', 718),
+    ('procedureOrFunctionBody -> block', 'procedureOrFunctionBody', 1, 'p_procedureOrFunctionBody', 'synanaler.py', 724),
+    ('procedureOrFunctionBody -> directive', 'procedureOrFunctionBody', 1, 'p_procedureOrFunctionBody', 'synanaler.py', 725),
+    ('procedureHeading -> KW_PROCEDURE IDENTIFIER procedureHeadingParams', 'procedureHeading', 3, 'p_procedureHeading', 'synanaler.py', 733),
+    ('procedureHeadingParams -> formalParameterList', 'procedureHeadingParams', 1, 'p_procedureHeadingParams', 'synanaler.py', 741),
+    ('functionHeading -> KW_FUNCTION IDENTIFIER functionHeadingTail', 'functionHeading', 3, 'p_functionHeading', 'synanaler.py', 750),
+    ('functionHeadingParams -> formalParameterList', 'functionHeadingParams', 1, 'p_functionHeadingParams', 'synanaler.py', 759),
+    ('functionHeadingTail -> functionHeadingParams COLON IDENTIFIER', 'functionHeadingTail', 3, 'p_functionHeadingTail', 'synanaler.py', 766),
+    ('functionHeadingTail -> empty', 'functionHeadingTail', 1, 'p_functionHeadingTail', 'synanaler.py', 767),
+    ('formalParameterList -> LPAREN formalParameterListBody RPAREN', 'formalParameterList', 3, 'p_formalParameterList', 'synanaler.py', 777),
+    ('formalParameterList -> empty', 'formalParameterList', 1, 'p_formalParameterList', 'synanaler.py', 778),
+    ('formalParameterList -> LPAREN error RPAREN', 'formalParameterList', 3, 'p_formalParameterList_error', 'synanaler.py', 784),
+    ('formalParameterListBody -> formalParameterListBody SEMICOLON formalParameterSection', 'formalParameterListBody', 3, 'p_formalParameterListBody', 'synanaler.py', 792),
+    ('formalParameterListBody -> formalParameterSection', 'formalParameterListBody', 1, 'p_formalParameterListBody', 'synanaler.py', 793),
+    ('formalParameterSection -> variableParameterSpecification', 'formalParameterSection', 1, 'p_formalParameterSection', 'synanaler.py', 800),
+    ('formalParameterSection -> valueParameterSpecification', 'formalParameterSection', 1, 'p_formalParameterSection', 'synanaler.py', 801),
+    ('formalParameterSection -> procedureOrFunctionHeading', 'formalParameterSection', 1, 'p_formalParameterSection', 'synanaler.py', 802),
+    ('variableParameterSpecification -> KW_VAR valueParameterSpecification', 'variableParameterSpecification', 2, 'p_variableParameterSpecification', 'synanaler.py', 808),
+    ('valueParameterSpecification -> bt_GENERIC identifierList COLON formalParameterSpecificationBody', 'valueParameterSpecification', 4, 'p_valueParameterSpecification', 'synanaler.py', 814),
+    ('identifierList -> identifierList COMMA IDENTIFIER', 'identifierList', 3, 'p_identifierList', 'synanaler.py', 822),
+    ('identifierList -> IDENTIFIER', 'identifierList', 1, 'p_identifierList', 'synanaler.py', 823),
+    ('formalParameterSpecificationBody -> IDENTIFIER', 'formalParameterSpecificationBody', 1, 'p_formalParameterSpecificationBody', 'synanaler.py', 830),
+    ('formalParameterSpecificationBody -> conformantArraySchema', 'formalParameterSpecificationBody', 1, 'p_formalParameterSpecificationBody', 'synanaler.py', 831),
+    ('conformantArraySchema -> packedConformantArraySchema', 'conformantArraySchema', 1, 'p_conformantArraySchema', 'synanaler.py', 838),
+    ('conformantArraySchema -> unpackedConformantArraySchema', 'conformantArraySchema', 1, 'p_conformantArraySchema', 'synanaler.py', 839),
+    ('packedConformantArraySchema -> KW_PACKED KW_ARRAY LSBRACKET indexTypeSpecification RSBRACKET KW_OF IDENTIFIER', 'packedConformantArraySchema', 7, 'p_packedConformantArraySchema', 'synanaler.py', 845),
+    ('unpackedConformantArraySchema -> KW_ARRAY LSBRACKET indexTypeSpecification RSBRACKET KW_OF IDENTIFIER', 'unpackedConformantArraySchema', 6, 'p_unpackedConformantArraySchema', 'synanaler.py', 851),
+    ('indexTypeSpecificationList -> indexTypeSpecificationList SEMICOLON indexTypeSpecification', 'indexTypeSpecificationList', 3, 'p_indexTypeSpecificationList', 'synanaler.py', 858),
+    ('indexTypeSpecificationList -> indexTypeSpecification', 'indexTypeSpecificationList', 1, 'p_indexTypeSpecificationList', 'synanaler.py', 859),
+    ('indexTypeSpecification -> IDENTIFIER OP_RANGE IDENTIFIER COLON IDENTIFIER', 'indexTypeSpecification', 5, 'p_indexTypeSpecification', 'synanaler.py', 866),
+    ('actualParameterList -> LPAREN actualParameterListBody RPAREN', 'actualParameterList', 3, 'p_actualParameterList', 'synanaler.py', 874),
+    ('actualParameterListBody -> actualParameterListBody COMMA actualParameter', 'actualParameterListBody', 3, 'p_actualParameterListBody', 'synanaler.py', 880),
+    ('actualParameterListBody -> actualParameter', 'actualParameterListBody', 1, 'p_actualParameterListBody', 'synanaler.py', 881),
+    ('actualParameter -> expression', 'actualParameter', 1, 'p_actualParameter', 'synanaler.py', 891),
+    ('variable -> entireVariable', 'variable', 1, 'p_variable', 'synanaler.py', 907),
+    ('variable -> componentVariable', 'variable', 1, 'p_variable', 'synanaler.py', 908),
+    ('variable -> identifiedVariable', 'variable', 1, 'p_variable', 'synanaler.py', 909),
+    ('entireVariable -> IDENTIFIER', 'entireVariable', 1, 'p_entireVariable', 'synanaler.py', 916),
+    ('arrayVariable -> variable', 'arrayVariable', 1, 'p_arrayVariable', 'synanaler.py', 923),
+    ('componentVariable -> indexedVariable', 'componentVariable', 1, 'p_componentVariable', 'synanaler.py', 929),
+    ('componentVariable -> fieldDesignator', 'componentVariable', 1, 'p_componentVariable', 'synanaler.py', 930),
+    ('indexedVariable -> arrayVariable LSBRACKET ordinalExpression indexedVariableTail', 'indexedVariable', 4, 'p_indexedVariable', 'synanaler.py', 936),
+    ('indexedVariableTail -> COMMA ordinalExpression RSBRACKET', 'indexedVariableTail', 3, 'p_indexedVariableTail', 'synanaler.py', 943),
+    ('indexedVariableTail -> RSBRACKET', 'indexedVariableTail', 1, 'p_indexedVariableTail', 'synanaler.py', 944),
+    ('fieldDesignator -> variable DOT IDENTIFIER', 'fieldDesignator', 3, 'p_fieldDesignator', 'synanaler.py', 953),
+    ('identifiedVariable -> variable OP_UPARROW', 'identifiedVariable', 2, 'p_identifiedVariable', 'synanaler.py', 967),
+    ('expression -> simpleExpression expressionTail', 'expression', 2, 'p_expression', 'synanaler.py', 1002),
+    ('expressionTail -> relationalOperator simpleExpression', 'expressionTail', 2, 'p_expressionTail', 'synanaler.py', 1010),
+    ('expressionTail -> empty', 'expressionTail', 1, 'p_expressionTail', 'synanaler.py', 1011),
+    ('sign -> OP_PLUS', 'sign', 1, 'p_sign', 'synanaler.py', 1018),
+    ('sign -> OP_MINUS', 'sign', 1, 'p_sign', 'synanaler.py', 1019),
+    ('addingOperator -> OP_PLUS', 'addingOperator', 1, 'p_addingOperator', 'synanaler.py', 1027),
+    ('addingOperator -> OP_MINUS', 'addingOperator', 1, 'p_addingOperator', 'synanaler.py', 1028),
+    ('addingOperator -> KW_OR', 'addingOperator', 1, 'p_addingOperator', 'synanaler.py', 1029),
+    ('multiplyingOperator -> OP_MULT', 'multiplyingOperator', 1, 'p_multiplyingOperator', 'synanaler.py', 1038),
+    ('multiplyingOperator -> OP_DIV', 'multiplyingOperator', 1, 'p_multiplyingOperator', 'synanaler.py', 1039),
+    ('multiplyingOperator -> KW_DIV', 'multiplyingOperator', 1, 'p_multiplyingOperator', 'synanaler.py', 1040),
+    ('multiplyingOperator -> KW_MOD', 'multiplyingOperator', 1, 'p_multiplyingOperator', 'synanaler.py', 1041),
+    ('multiplyingOperator -> KW_AND', 'multiplyingOperator', 1, 'p_multiplyingOperator', 'synanaler.py', 1042),
+    ('relationalOperator -> OP_EQ', 'relationalOperator', 1, 'p_relationalOperator', 'synanaler.py', 1053),
+    ('relationalOperator -> OP_NEQ', 'relationalOperator', 1, 'p_relationalOperator', 'synanaler.py', 1054),
+    ('relationalOperator -> OP_LT', 'relationalOperator', 1, 'p_relationalOperator', 'synanaler.py', 1055),
+    ('relationalOperator -> OP_LTE', 'relationalOperator', 1, 'p_relationalOperator', 'synanaler.py', 1056),
+    ('relationalOperator -> OP_GT', 'relationalOperator', 1, 'p_relationalOperator', 'synanaler.py', 1057),
+    ('relationalOperator -> OP_GTE', 'relationalOperator', 1, 'p_relationalOperator', 'synanaler.py', 1058),
+    ('relationalOperator -> KW_IN', 'relationalOperator', 1, 'p_relationalOperator', 'synanaler.py', 1059),
+    ('simpleExpression -> simpleExpressionBody', 'simpleExpression', 1, 'p_simpleExpression', 'synanaler.py', 1072),
+    ('simpleExpression -> sign simpleExpressionBody', 'simpleExpression', 2, 'p_simpleExpression', 'synanaler.py', 1073),
+    ('simpleExpressionBody -> simpleExpressionBody addingOperator term', 'simpleExpressionBody', 3, 'p_simpleExpressionBody', 'synanaler.py', 1082),
+    ('simpleExpressionBody -> term', 'simpleExpressionBody', 1, 'p_simpleExpressionBody', 'synanaler.py', 1083),
+    ('term -> term multiplyingOperator factor', 'term', 3, 'p_term', 'synanaler.py', 1090),
+    ('term -> factor', 'term', 1, 'p_term', 'synanaler.py', 1091),
+    ('factor -> unsignedConstant', 'factor', 1, 'p_factor', 'synanaler.py', 1098),
+    ('factor -> setConstructor', 'factor', 1, 'p_factor', 'synanaler.py', 1099),
+    ('factor -> factorVariableFunctionDesignator', 'factor', 1, 'p_factor', 'synanaler.py', 1100),
+    ('factor -> KW_NOT factor', 'factor', 2, 'p_factor', 'synanaler.py', 1101),
+    ('factor -> LPAREN expression RPAREN', 'factor', 3, 'p_factor', 'synanaler.py', 1102),
+    ('setConstructor -> LSBRACKET setConstructorBody RSBRACKET', 'setConstructor', 3, 'p_setConstructor', 'synanaler.py', 1120),
+    ('setConstructorBody -> setConstructorBodyList', 'setConstructorBody', 1, 'p_setConstructorBody', 'synanaler.py', 1126),
+    ('setConstructorBody -> empty', 'setConstructorBody', 1, 'p_setConstructorBody', 'synanaler.py', 1127),
+    ('setConstructorBodyList -> setConstructorBodyList COMMA elementDescription', 'setConstructorBodyList', 3, 'p_setConstructorBodyList', 'synanaler.py', 1133),
+    ('setConstructorBodyList -> elementDescription', 'setConstructorBodyList', 1, 'p_setConstructorBodyList', 'synanaler.py', 1134),
+    ('elementDescription -> ordinalExpression elementDescriptionTail', 'elementDescription', 2, 'p_elementDescription', 'synanaler.py', 1141),
+    ('elementDescriptionTail -> OP_RANGE expression', 'elementDescriptionTail', 2, 'p_elementDescriptionTail', 'synanaler.py', 1148),
+    ('elementDescriptionTail -> empty', 'elementDescriptionTail', 1, 'p_elementDescriptionTail', 'synanaler.py', 1149),
+    ('factorVariableFunctionDesignator -> variable functionDesignatorTail', 'factorVariableFunctionDesignator', 2, 'p_factorVariableFunctionDesignator', 'synanaler.py', 1165),
+    ('functionDesignatorTail -> actualParameterList', 'functionDesignatorTail', 1, 'p_functionDesignatorTail', 'synanaler.py', 1178),
+    ('functionDesignatorTail -> empty', 'functionDesignatorTail', 1, 'p_functionDesignatorTail', 'synanaler.py', 1179),
+    ('ordinalExpression -> expression', 'ordinalExpression', 1, 'p_ordinalExpression', 'synanaler.py', 1185),
+    ('booleanExpression -> expression', 'booleanExpression', 1, 'p_booleanExpression', 'synanaler.py', 1191),
+    ('integerExpression -> expression', 'integerExpression', 1, 'p_integerExpression', 'synanaler.py', 1197),
+    ('statementPart -> compoundStatement', 'statementPart', 1, 'p_statementPart', 'synanaler.py', 1205),
+    ('compoundStatement -> KW_BEGIN statementSequence KW_END', 'compoundStatement', 3, 'p_compoundStatement', 'synanaler.py', 1211),
+    ('compoundStatement -> KW_BEGIN error KW_END', 'compoundStatement', 3, 'p_compoundStatement_error', 'synanaler.py', 1219),
+    ('statementSequence -> statementSequence SEMICOLON statement', 'statementSequence', 3, 'p_statementSequence', 'synanaler.py', 1227),
+    ('statementSequence -> statement', 'statementSequence', 1, 'p_statementSequence', 'synanaler.py', 1228),
+    ('statement -> matchedStatement', 'statement', 1, 'p_statement', 'synanaler.py', 1258),
+    ('statement -> unmatchedStatement', 'statement', 1, 'p_statement', 'synanaler.py', 1259),
+    ('matchedStatement -> statementLabel matchedStatementBody', 'matchedStatement', 2, 'p_matchedStatement', 'synanaler.py', 1265),
+    ('matchedStatementBody -> simpleStatement', 'matchedStatementBody', 1, 'p_matchedStatementBody', 'synanaler.py', 1277),
+    ('matchedStatementBody -> matchedStructuredStatement', 'matchedStatementBody', 1, 'p_matchedStatementBody', 'synanaler.py', 1278),
+    ('unmatchedStatement -> statementLabel unmatchedStatementBody', 'unmatchedStatement', 2, 'p_unmatchedStatement', 'synanaler.py', 1284),
+    ('unmatchedStatementBody -> unmatchedConditionalStatement', 'unmatchedStatementBody', 1, 'p_unmatchedStatementBody', 'synanaler.py', 1296),
+    ('statementLabel -> UNSIGNED_INTEGER COLON', 'statementLabel', 2, 'p_statementLabel', 'synanaler.py', 1302),
+    ('statementLabel -> empty', 'statementLabel', 1, 'p_statementLabel', 'synanaler.py', 1303),
+    ('simpleStatement -> assignmentStatement', 'simpleStatement', 1, 'p_simpleStatement', 'synanaler.py', 1319),
+    ('simpleStatement -> procedureStatement', 'simpleStatement', 1, 'p_simpleStatement', 'synanaler.py', 1320),
+    ('simpleStatement -> gotoStatement', 'simpleStatement', 1, 'p_simpleStatement', 'synanaler.py', 1321),
+    ('simpleStatement -> empty', 'simpleStatement', 1, 'p_simpleStatement', 'synanaler.py', 1322),
+    ('assignmentStatement -> assignmentStatementHead OP_ASSIGN expression', 'assignmentStatement', 3, 'p_assignmentStatement', 'synanaler.py', 1328),
+    ('assignmentStatementHead -> variable', 'assignmentStatementHead', 1, 'p_assignmentStatementHead', 'synanaler.py', 1334),
+    ('procedureStatement -> IDENTIFIER procedureStatementTail', 'procedureStatement', 2, 'p_procedureStatement', 'synanaler.py', 1342),
+    ('procedureStatementTail -> actualParameterList', 'procedureStatementTail', 1, 'p_procedureStatementTail', 'synanaler.py', 1351),
+    ('procedureStatementTail -> empty', 'procedureStatementTail', 1, 'p_procedureStatementTail', 'synanaler.py', 1352),
+    ('gotoStatement -> KW_GOTO UNSIGNED_INTEGER', 'gotoStatement', 2, 'p_gotoStatement', 'synanaler.py', 1358),
+    ('matchedStructuredStatement -> compoundStatement', 'matchedStructuredStatement', 1, 'p_matchedStructuredStatement', 'synanaler.py', 1375),
+    ('matchedStructuredStatement -> matchedConditionalStatement', 'matchedStructuredStatement', 1, 'p_matchedStructuredStatement', 'synanaler.py', 1376),
+    ('matchedStructuredStatement -> repetitiveStatement', 'matchedStructuredStatement', 1, 'p_matchedStructuredStatement', 'synanaler.py', 1377),
+    ('matchedStructuredStatement -> withStatement', 'matchedStructuredStatement', 1, 'p_matchedStructuredStatement', 'synanaler.py', 1378),
+    ('matchedConditionalStatement -> matchedIfStatement', 'matchedConditionalStatement', 1, 'p_matchedConditionalStatement', 'synanaler.py', 1392),
+    ('matchedConditionalStatement -> caseStatement', 'matchedConditionalStatement', 1, 'p_matchedConditionalStatement', 'synanaler.py', 1393),
+    ('unmatchedConditionalStatement -> unmatchedIfStatement', 'unmatchedConditionalStatement', 1, 'p_unmatchedConditionalStatement', 'synanaler.py', 1399),
+    ('matchedIfStatement -> KW_IF booleanExpression KW_THEN matchedStatement KW_ELSE matchedStatement', 'matchedIfStatement', 6, 'p_matchedIfStatement', 'synanaler.py', 1421),
+    ('unmatchedIfStatement -> KW_IF booleanExpression KW_THEN statement', 'unmatchedIfStatement', 4, 'p_unmatchedIfStatement', 'synanaler.py', 1427),
+    ('unmatchedIfStatement -> KW_IF booleanExpression KW_THEN matchedStatement KW_ELSE unmatchedStatement', 'unmatchedIfStatement', 6, 'p_unmatchedIfStatement', 'synanaler.py', 1428),
+    ('caseStatement -> KW_CASE ordinalExpression KW_OF caseStatementBody caseStatementTail', 'caseStatement', 5, 'p_caseStatement', 'synanaler.py', 1437),
+    ('caseStatement -> KW_CASE error KW_OF caseStatementBody caseStatementTail', 'caseStatement', 5, 'p_caseStatement_error', 'synanaler.py', 1442),
+    ('caseStatement -> KW_CASE ordinalExpression KW_OF error caseStatementTail', 'caseStatement', 5, 'p_caseStatement_error', 'synanaler.py', 1443),
+    ('caseStatementBody -> caseStatementBody SEMICOLON case', 'caseStatementBody', 3, 'p_caseStatementBody', 'synanaler.py', 1454),
+    ('caseStatementBody -> case', 'caseStatementBody', 1, 'p_caseStatementBody', 'synanaler.py', 1455),
+    ('case -> caseHeading COLON statement', 'case', 3, 'p_case', 'synanaler.py', 1462),
+    ('case -> caseHeading COLON error', 'case', 3, 'p_case_error', 'synanaler.py', 1467),
+    ('caseHeading -> caseHeading COMMA constElem', 'caseHeading', 3, 'p_caseHeading', 'synanaler.py', 1475),
+    ('caseHeading -> constElem', 'caseHeading', 1, 'p_caseHeading', 'synanaler.py', 1476),
+    ('caseStatementTail -> SEMICOLON KW_END', 'caseStatementTail', 2, 'p_caseStatementTail', 'synanaler.py', 1483),
+    ('caseStatementTail -> KW_END', 'caseStatementTail', 1, 'p_caseStatementTail', 'synanaler.py', 1484),
+    ('repetitiveStatement -> whileStatement', 'repetitiveStatement', 1, 'p_repetitiveStatement', 'synanaler.py', 1492),
+    ('repetitiveStatement -> repeatStatement', 'repetitiveStatement', 1, 'p_repetitiveStatement', 'synanaler.py', 1493),
+    ('repetitiveStatement -> forStatement', 'repetitiveStatement', 1, 'p_repetitiveStatement', 'synanaler.py', 1494),
+    ('whileStatement -> KW_WHILE booleanExpression KW_DO statement', 'whileStatement', 4, 'p_whileStatement', 'synanaler.py', 1500),
+    ('repeatStatement -> KW_REPEAT statementSequence KW_UNTIL booleanExpression', 'repeatStatement', 4, 'p_repeatStatement', 'synanaler.py', 1506),
+    ('forStatement -> KW_FOR IDENTIFIER OP_ASSIGN ordinalExpression forStatementTail', 'forStatement', 5, 'p_forStatement', 'synanaler.py', 1515),
+    ('forStatement -> KW_FOR error OP_ASSIGN ordinalExpression forStatementTail', 'forStatement', 5, 'p_forStatement_error', 'synanaler.py', 1529),
+    ('forStatement -> KW_FOR IDENTIFIER OP_ASSIGN error forStatementTail', 'forStatement', 5, 'p_forStatement_error', 'synanaler.py', 1530),
+    ('forStatementTail -> KW_TO ordinalExpression KW_DO statement', 'forStatementTail', 4, 'p_forStatementTail', 'synanaler.py', 1541),
+    ('forStatementTail -> KW_DOWNTO ordinalExpression KW_DO statement', 'forStatementTail', 4, 'p_forStatementTail', 'synanaler.py', 1542),
+    ('forStatementTail -> KW_TO error KW_DO statement', 'forStatementTail', 4, 'p_forStatementTail_error', 'synanaler.py', 1547),
+    ('forStatementTail -> KW_DOWNTO error KW_DO statement', 'forStatementTail', 4, 'p_forStatementTail_error', 'synanaler.py', 1548),
+    ('forStatementTail -> KW_TO ordinalExpression KW_DO error', 'forStatementTail', 4, 'p_forStatementTail_error', 'synanaler.py', 1549),
+    ('forStatementTail -> KW_DOWNTO ordinalExpression KW_DO error', 'forStatementTail', 4, 'p_forStatementTail_error', 'synanaler.py', 1550),
+    ('withStatement -> KW_WITH recordVariableList KW_DO statement', 'withStatement', 4, 'p_withStatement', 'synanaler.py', 1558),
+    ('withStatement -> KW_WITH error KW_DO statement', 'withStatement', 4, 'p_withStatement_error', 'synanaler.py', 1563),
+    ('withStatement -> KW_WITH recordVariableList KW_DO error', 'withStatement', 4, 'p_withStatement_error', 'synanaler.py', 1564),
+    ('recordVariableList -> recordVariableList COMMA variable', 'recordVariableList', 3, 'p_recordVariableList', 'synanaler.py', 1570),
+    ('recordVariableList -> variable', 'recordVariableList', 1, 'p_recordVariableList', 'synanaler.py', 1571),
+    ('empty -> <empty>', 'empty', 0, 'p_empty', 'synanaler.py', 1581),
+)
@@ -0,0 +1,186 @@
+from typing import Callable
+from compiler.codegen import CodeID, CodeTree, CodePoint
+from compiler.compilation import getCompilation
+from compiler.runtime.builtin import BUILTINS
+from compiler.diag import Diagnostic, DiagnosticSource, DiagnosticType, DiagnosticKind
+
+#
+# Peephole Optimizer
+#
+#   This module defines the peephole pass run over the code tree of a program (see codegen.CodeTree), after it was
+# generated and before it is written out (see codegen.transformCode). The pass slides over the stack of each tree,
+# rewriting short sequences of instructions into equivalent, shorter ones, as defined by the rules below.
+#
+#   A rule is registered for the opcodes the sequences it rewrites start with (see peepholeRule), and is called with the
+# stack of a tree and the index of such an opcode. It returns the number of entries it rewrites along with their
+# replacement, or None if it does not apply. After a rewrite, the pass steps back, as the replacement may complete a
+# sequence another rule rewrites. Rules never look past the tree they are given, nor into it's subtrees, which are
+# optimized on their own.
+#
+#   Rules must keep the operand stack exactly as it was, as the code generator reads and writes variables relative to
+# fp, and may leave values on the stack (e.g. Write pushes it's argument twice).
+#
+#   The optimizer reports the instructions it removed, by rule, as a diagnostic of the compilation (see
+# Compilation.getOptimizerDiagnostics).
+#
+
+# (stack, index) -> (rewritten count, replacement) | None
+PeepholeRule = Callable[[list[CodePoint], int], tuple[int, list[CodePoint]]]
+PEEPHOLE_RULES: dict[str, (tuple[CodeID], PeepholeRule)] = {}
+
+# How far back the pass steps after a rewrite. Must be at least the longest sequence a rule matches, minus one.
+_BACKTRACK = 2
+
+def peepholeRule(name: str, *opcodes: CodeID):
+    """
+        Registers a peephole rule, under a given name, for sequences starting with the given opcodes.
+    """
+    def register(rule: PeepholeRule):
+        PEEPHOLE_RULES[name] = (opcodes, rule)
+        return rule
+    return register
+
+def _at(stack: list[CodePoint], i: int) -> CodeID:
+    return stack[i][0] if (i < len(stack)) else None
+
+#region ------- Rules -------
+_FOLDABLE = {
+    CodeID.ADD: lambda a, b: a + b,
+    CodeID.SUB: lambda a, b: a - b,
+    CodeID.MUL: lambda a, b: a * b,
+    CodeID.EQUAL: lambda a, b: int(a == b),
+    CodeID.INF: lambda a, b: int(a < b),
+    CodeID.INFEQ: lambda a, b: int(a <= b),
+    CodeID.SUP: lambda a, b: int(a > b),
+    CodeID.SUPEQ: lambda a, b: int(a >= b),
+}
+
+_IDENTITIES = {
+    0: (CodeID.ADD, CodeID.SUB),
+    1: (CodeID.MUL,),
+}
+
+@peepholeRule("fold", CodeID.PUSHI)
+def foldConstants(stack: list[CodePoint], i: int):
+    # PUSHI a, PUSHI b, <op> -> PUSHI (a <op> b). Also folds unary minus (PUSHI 0, PUSHI k, SUB).
+    if (_at(stack, i + 1) != CodeID.PUSHI or _at(stack, i + 2) not in _FOLDABLE): return None
+    (a, b) = (stack[i][1][0], stack[i + 1][1][0])
+    if (type(a) is not int or type(b) is not int): return None
+
+    # Results out of the Integer range (see runtime/builtin.py) are left to overflow on the machine, as they would have.
+    v = _FOLDABLE[stack[i + 2][0]](a, b)
+    if (not BUILTINS["Integer"].inBounds(v)): return None
+    return (3, [(CodeID.PUSHI, [v])])
+
+@peepholeRule("identity", CodeID.PUSHI)
+def removeIdentities(stack: list[CodePoint], i: int):
+    # PUSHI 0, ADD | SUB and PUSHI 1, MUL leave the value below as it was.
+    if (type(stack[i][1][0]) is not int or _at(stack, i + 1) not in _IDENTITIES.get(stack[i][1][0], ())): return None
+    return (2, [])
+
+@peepholeRule("branch", CodeID.PUSHI)
+def foldBranches(stack: list[CodePoint], i: int):
+    # PUSHI k, JZ L -> JUMP L if k is 0, nothing otherwise.
+    if (_at(stack, i + 1) != CodeID.JZ): return None
+    return (2, [(CodeID.JUMP, list(stack[i + 1][1]))] if (stack[i][1][0] == 0) else [])
+
+@peepholeRule("alloc", CodeID.PUSHN)
+def mergeAllocations(stack: list[CodePoint], i: int):
+    # PUSHN a, PUSHN b -> PUSHN (a + b), and PUSHN 0 -> nothing.
+    if (stack[i][1][0] == 0): return (1, [])
+    if (_at(stack, i + 1) != CodeID.PUSHN): return None
+    return (2, [(CodeID.PUSHN, [stack[i][1][0] + stack[i + 1][1][0]])])
+
+@peepholeRule("reload", CodeID.STOREL, CodeID.PUSHL)
+def reuseStores(stack: list[CodePoint], i: int):
+    # PUSHL n, STOREL n -> nothing, and STOREL n, PUSHL n -> DUP 1, STOREL n, which does not read the frame again.
+    nxt = CodeID.STOREL if (stack[i][0] == CodeID.PUSHL) else CodeID.PUSHL
+    if (_at(stack, i + 1) != nxt or stack[i + 1][1] != stack[i][1]): return None
+    if (nxt == CodeID.STOREL): return (2, [])
+    return (2, [(CodeID.DUP, [1]), stack[i]])
+
+@peepholeRule("nop", CodeID.NOP)
+def removeNops(stack: list[CodePoint], i: int):
+    # A NOP is only kept if only labels follow it, as it holds those labels.
+    j = i + 1
+    while (_at(stack, j) == CodeID._LABEL): j += 1
+    return (1, []) if (j < len(stack)) else None
+
+@peepholeRule("jump", CodeID.JUMP)
+def removeJumpsToNext(stack: list[CodePoint], i: int):
+    # A JUMP to one of the labels immediately after it falls through instead.
+    target = stack[i][1][0]
+    j = i + 1
+    while (_at(stack, j) == CodeID._LABEL):
+        if (stack[j][1][0] == target): return (1, [])
+        j += 1
+    return None
+
+@peepholeRule("unreachable", CodeID.JUMP, CodeID.STOP, CodeID.RETURN)
+def removeUnreachable(stack: list[CodePoint], i: int):
+    # Instructions after a JUMP, STOP or RETURN are unreachable until the next label, or subtree.
+    j = i + 1
+    while (j < len(stack) and stack[j][0] != CodeID._LABEL and stack[j][0] != CodeID._SUBTREE): j += 1
+    return (j - i, [stack[i]]) if (j > i + 1) else None
+#endregion ------- Rules -------
+
+class PeepholeOptimizer:
+    """
+    Runs the given peephole rules (by name) over code trees, in the order they were registered. If no rules are given,
+    every registered rule is run.
+    """
+    def __init__(self, rules: list[str] = None):
+        names = list(PEEPHOLE_RULES) if (rules == None) else rules
+        unknown = [name for name in names if (name not in PEEPHOLE_RULES)]
+        if (len(unknown) != 0): raise ValueError(f"Unknown peephole rules: {', '.join(unknown)}.")
+
+        self.rules = names
+        self.removed: dict[str, int] = {} # The instructions removed by each rule, over every run.
+        self._byOpcode: dict[CodeID, list[(str, PeepholeRule)]] = {}
+        for name in PEEPHOLE_RULES:
+            if (name not in names): continue
+            (opcodes, rule) = PEEPHOLE_RULES[name]
+            for op in opcodes: self._byOpcode.setdefault(op, []).append((name, rule))
+
+    def optimizeTree(self, bld: CodeTree, removed: dict[str, int]):
+        """
+            Optimizes a code tree in place, along with it's subtrees, counting the instructions removed by each rule.
+        """
+        byOpcode = self._byOpcode
+        stack = bld.stack
+        for (p, args) in stack:
+            if (p == CodeID._SUBTREE): self.optimizeTree(args[0], removed)
+
+        i = 0
+        while (i < len(stack)):
+            for (name, rule) in byOpcode.get(stack[i][0], ()):
+                res = rule(stack, i)
+                if (res == None): continue
+
+                (count, replacement) = res
+                stack[i:i + count] = replacement
+                removed[name] = removed.get(name, 0) + count - len(replacement)
+                i = max(i - _BACKTRACK, 0)
+                break
+            else:
+                i += 1
+
+    def run(self, bld: CodeTree) -> dict[str, int]:
+        """
+            Optimizes the code tree of a program in place, and reports the instructions removed on the active
+            compilation (see compilation.py). Returns the number of instructions removed by each rule.
+        """
+        removed = {}
+        self.optimizeTree(bld, removed)
+        for (name, n) in removed.items(): self.removed[name] = self.removed.get(name, 0) + n
+
+        total = sum(removed.values())
+        if (total > 0):
+            getCompilation().optimDiagnostics.append(Diagnostic(
+                DiagnosticSource.OPTIM, DiagnosticType.INSTRUCTIONS_REMOVED, DiagnosticKind.INFO, args = {
+                    "count": total,
+                    "rules": ", ".join(f"{name}: {n}" for (name, n) in removed.items() if (n != 0))
+                }
+            ))
+
+        return removed
@@ -0,0 +1,264 @@
+import struct
+from array import array
+from compiler.codegen import CodeID, CodeTree, iterCode
+from compiler.ewvm import OPCODES, ExecutionResult, Machine, Program, unquote
+
+#
+# Packed Programs
+#
+#   This module defines a binary encoding of the programs written by the code generator, alongside the textual EWVM
+# programs (see codegen.writeCode). A packed program is already assembled: it is loaded straight into a program of the
+# local EWVM interpreter (see ewvm.Program), without parsing any text. It is stored on the following columns:
+#
+#   - opcodes:    The opcode of each instruction, as an index on ewvm.OPCODES, on a byte.
+#   - kinds:      The kind of the operand of each instruction (see the KIND_* constants), two to a byte.
+#   - operands:   The operand of each instruction that has one: integers and code indexes are stored as they are, while
+#                 reals and strings are stored as an index on the constant pool.
+#   - labels:     Each label, along with the index of the instruction it marks.
+#   - blanks:     The index of the instruction following each blank line (the end of a subtree, see codegen.iterCode).
+#   - consts:     A pool of the real and string operands of the program, each stored once.
+#
+#   Labels are resolved as the program is packed, on a single pass over it's instructions: jumps to labels that were
+# not yet marked are patched once the label is. As in the assembled program, the operand of CALL is the index it returns
+# to. Strings are stored unquoted.
+#   Every number is serialized as a variable length integer (7 bits to a byte, signed integers zigzag encoded), and the
+# instruction indexes of labels and blanks as the difference to the previous one, as most are small. The line of each
+# instruction, on the textual program, is not stored: every line holds either an instruction, a label or a blank, so it
+# is the index of the instruction plus the labels and blanks that precede it.
+#
+
+KIND_NONE = 0
+KIND_INT = 1
+KIND_REAL = 2
+KIND_STRING = 3
+KIND_ADDRESS = 4 # The index of an instruction.
+
+FORMAT_MAGIC = b"PEWVM"
+FORMAT_VERSION = 2
+_OPCODE_IDS = { op: i for (i, op) in enumerate(OPCODES) }
+
+_CONST_REAL = 0
+_CONST_STRING = 1
+
+class PackedProgram:
+    """
+    Represents a packed program (see the module description). Use PackedProgram.fromTree to pack a code tree, and
+    PackedProgram.program to load it on the local EWVM interpreter.
+    """
+    def __init__(self):
+        self.opcodes = array("B")
+        self.kinds = array("B")
+        self.operands = array("q")
+        self.lines = array("I")
+        self.labels = array("q")
+        self.blanks = array("I")
+        self.consts: list[float | str] = []
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    @classmethod
+    def fromTree(cls, bld: CodeTree) -> "PackedProgram":
+        """
+            Packs the program of a code tree, as it's text would be assembled.
+            Raises a ValueError if a jump targets a label that is never marked, or an instruction has many operands.
+        """
+        res = cls()
+        (opcodes, kinds, operands, lines) = (res.opcodes, res.kinds, res.operands, res.lines)
+        interned: dict[(type, float | str), int] = {}
+        def const(v) -> int:
+            # Reals and strings are told apart, as are the reals that compare equal (e.g. 0.0 and -0.0).
+            key = (type(v), repr(v) if isinstance(v, float) else v)
+            i = interned.get(key)
+            if (i == None):
+                i = interned[key] = len(res.consts)
+                res.consts.append(v)
+            return i
+
+        marked: dict[int, int] = {}
+        fixups: dict[int, list[int]] = {}
+        for (lineNo, (p, args)) in enumerate(iterCode(bld), 1):
+            if (p == CodeID._SUBTREE):
+                res.blanks.append(len(opcodes))
+                continue
+            if (p == CodeID._LABEL):
+                label = args[0]
+                marked[label] = len(opcodes)
+                for i in fixups.pop(label, ()): operands[i] = marked[label]
+                res.labels.extend((label, marked[label]))
+                continue
+
+            opcodes.append(_OPCODE_IDS[p])
+            lines.append(lineNo)
+            if (p == CodeID.JUMP or p == CodeID.JZ or p == CodeID.PUSHA):
+                kinds.append(KIND_ADDRESS)
+                target = marked.get(args[0])
+                if (target == None): fixups.setdefault(args[0], []).append(len(operands))
+                operands.append(target if (target != None) else -1)
+            elif (p == CodeID.CALL):
+                kinds.append(KIND_ADDRESS)
+                operands.append(len(opcodes))
+            elif (len(args) == 0):
+                kinds.append(KIND_NONE)
+                operands.append(0)
+            elif (p == CodeID.PUSHS or p == CodeID.ERR):
+                kinds.append(KIND_STRING)
+                operands.append(const(unquote(str(args[0]))))
+            elif (len(args) > 1): raise ValueError(f"{p.name} takes more than one operand, and cannot be packed.")
+            else:
+                # Read as the assembler reads the text: an integer if it is one, a real otherwise.
+                try:
+                    value = int(str(args[0]))
+                    kinds.append(KIND_INT)
+                except ValueError:
+                    value = const(float(args[0]))
+                    kinds.append(KIND_REAL)
+                operands.append(value)
+
+        if (len(fixups) != 0): raise ValueError(f"Unknown labels: {', '.join(f'L{l}' for l in fixups)}.")
+        return res
+
+    def program(self) -> Program:
+        """
+            Loads the packed program as a program of the local EWVM interpreter.
+        """
+        consts = self.consts
+        operands = [
+            None if (kind == KIND_NONE) else consts[v] if (kind == KIND_REAL or kind == KIND_STRING) else v
+            for (kind, v) in zip(self.kinds, self.operands)
+        ]
+        labels = { f"L{self.labels[i]}": self.labels[i + 1] for i in range(0, len(self.labels), 2) }
+        # The opcode and line columns are read as they are, without being copied.
+        return Program(self.opcodes, operands, self.lines, labels)
+
+    #region ------- Serialization -------
+    def toBytes(self) -> bytes:
+        out = bytearray(FORMAT_MAGIC)
+        for n in (FORMAT_VERSION, len(self.opcodes), len(self.labels) // 2, len(self.blanks), len(self.consts)):
+            _writeVarint(out, n)
+
+        out += self.opcodes.tobytes()
+        kinds = self.kinds
+        out += bytes(kinds[i] | (kinds[i + 1] << 4 if (i + 1 < len(kinds)) else 0) for i in range(0, len(kinds), 2))
+        for (kind, v) in zip(kinds, self.operands):
+            if (kind == KIND_INT): _writeVarint(out, v << 1 if (v >= 0) else (-v << 1) - 1)
+            elif (kind != KIND_NONE): _writeVarint(out, v)
+
+        last = 0
+        for i in range(0, len(self.labels), 2):
+            _writeVarint(out, self.labels[i])
+            _writeVarint(out, self.labels[i + 1] - last)
+            last = self.labels[i + 1]
+        last = 0
+        for i in self.blanks:
+            _writeVarint(out, i - last)
+            last = i
+
+        for c in self.consts:
+            if (isinstance(c, float)): out += struct.pack("<Bd", _CONST_REAL, c)
+            else:
+                data = c.encode("utf-8", "surrogatepass")
+                out.append(_CONST_STRING)
+                _writeVarint(out, len(data))
+                out += data
+        return bytes(out)
+
+    @classmethod
+    def fromBytes(cls, data: bytes) -> "PackedProgram":
+        """
+            Deserializes a packed program written by PackedProgram#toBytes.
+            Raises a ValueError if the program is malformed.
+        """
+        if (data[:len(FORMAT_MAGIC)] != FORMAT_MAGIC): raise ValueError("Not a packed program.")
+        offset = len(FORMAT_MAGIC)
+        res = cls()
+        try:
+            (version, offset) = _readVarint(data, offset)
+            if (version != FORMAT_VERSION): raise ValueError(f"Unsupported packed program version {version}.")
+            header = []
+            for _ in range(0, 4):
+                (n, offset) = _readVarint(data, offset)
+                header.append(n)
+            (count, labelCount, blankCount, constCount) = header
+
+            if (offset + count + (count + 1) // 2 > len(data)): raise ValueError("Truncated packed program.")
+            res.opcodes.frombytes(data[offset:offset + count])
+            offset += count
+            for b in data[offset:offset + (count + 1) // 2]: res.kinds.extend((b & 0xF, b >> 4))
+            del res.kinds[count:]
+            offset += (count + 1) // 2
+
+            for kind in res.kinds:
+                if (kind == KIND_NONE):
+                    res.operands.append(0)
+                    continue
+                (v, offset) = _readVarint(data, offset)
+                res.operands.append((v >> 1) ^ -(v & 1) if (kind == KIND_INT) else v)
+
+            last = 0
+            for _ in range(0, labelCount):
+                (label, offset) = _readVarint(data, offset)
+                (delta, offset) = _readVarint(data, offset)
+                last += delta
+                res.labels.extend((label, last))
+            last = 0
+            for _ in range(0, blankCount):
+                (delta, offset) = _readVarint(data, offset)
+                last += delta
+                res.blanks.append(last)
+
+            for _ in range(0, constCount):
+                tag = data[offset]
+                if (tag == _CONST_REAL):
+                    res.consts.append(struct.unpack_from("<d", data, offset + 1)[0])
+                    offset += 9
+                else:
+                    (length, offset) = _readVarint(data, offset + 1)
+                    if (offset + length > len(data)): raise ValueError("Truncated packed program.")
+                    res.consts.append(data[offset:offset + length].decode("utf-8", "surrogatepass"))
+                    offset += length
+        except (IndexError, struct.error, UnicodeDecodeError, OverflowError) as e:
+            raise ValueError(f"Malformed packed program: {e!r}")
+        if (offset != len(data)): raise ValueError("Malformed packed program: trailing data.")
+
+        res._deriveLines()
+        return res
+
+    def _deriveLines(self):
+        """
+            Derives the line of each instruction from the labels and blanks that precede it (see the module description).
+        """
+        gaps = sorted(self.labels[1::2].tolist() + self.blanks.tolist())
+        (lines, g) = (self.lines, 0)
+        del lines[:]
+        for i in range(0, len(self.opcodes)):
+            while (g < len(gaps) and gaps[g] <= i): g += 1
+            lines.append(i + 1 + g)
+    #endregion ------- Serialization -------
+
+def _writeVarint(out: bytearray, v: int):
+    while (v >= 0x80):
+        out.append((v & 0x7F) | 0x80)
+        v >>= 7
+    out.append(v)
+
+def _readVarint(data: bytes, offset: int) -> (int, int):
+    (v, shift) = (0, 0)
+    while (True):
+        b = data[offset]
+        offset += 1
+        v |= (b & 0x7F) << shift
+        if (b < 0x80): return (v, offset)
+        shift += 7
+
+def packCode(bld: CodeTree) -> bytes:
+    """
+        Packs the program of a code tree (see PackedProgram), serialized.
+    """
+    return PackedProgram.fromTree(bld).toBytes()
+
+def runPacked(data: bytes, input = (), maxSteps: int = None) -> ExecutionResult:
+    """
+        Loads and runs a packed program, with the given input lines (see ewvm.runProgram).
+    """
+    return Machine(PackedProgram.fromBytes(data).program(), input).run(maxSteps)
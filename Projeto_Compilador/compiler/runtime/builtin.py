@@ -7,8 +7,12 @@ from __future__ import annotations
 import operator as o
 from math import *
 
+from copy import copy
+from threading import Lock
+
 from compiler.sastate import *
 from compiler.symbols import *
+from compiler.compilation import Compilation, getCompilation, getDefaultCompilation
 import compiler.ast as ast
 from compiler.diag import Diagnostic, DiagnosticType, DiagnosticKind, DiagnosticSource
 
@@ -378,23 +382,6 @@ __BUILTIN_WRITE__ = _Write()
 __BUILTIN_WRITELN__ = _Write(True)
 __BUILTIN_LENGTH__ = _Length()
 __BUILTIN_ATOI__ = _Atoi()
-__BUILTIN_SYMTABLE__ = SymbolTable([
-    Symbol(SymbolKind.SYM_TYPEDEF, "Real", __BUILTIN_REAL__),
-    Symbol(SymbolKind.SYM_TYPEDEF, "Integer", __BUILTIN_INTEGER__),
-    Symbol(SymbolKind.SYM_TYPEDEF, "Boolean", __BUILTIN_BOOLEAN__),
-    Symbol(SymbolKind.SYM_TYPEDEF, "Char", __BUILTIN_CHAR__),
-    Symbol(SymbolKind.SYM_TYPEDEF, "String", __BUILTIN_STRING__),
-    Symbol(SymbolKind.SYM_TYPEDEF, "Nil", __BUILTIN_NIL__),
-    # Symbol(SymbolKind.SYM_TYPEDEF, "Any", __BUILTIN_ANY__),
-    Symbol(SymbolKind.SYM_TYPELIT, "false", EnumeratedTypeSymbolValue(__BUILTIN_BOOLEAN__, 0)),
-    Symbol(SymbolKind.SYM_TYPELIT, "true", EnumeratedTypeSymbolValue(__BUILTIN_BOOLEAN__, 1)),
-    Symbol(SymbolKind.SYM_ACTIVATABLE, "ReadLn", __BUILTIN_READLN__),
-    Symbol(SymbolKind.SYM_ACTIVATABLE, "Write", __BUILTIN_WRITE__),
-    Symbol(SymbolKind.SYM_ACTIVATABLE, "WriteLn", __BUILTIN_WRITELN__),
-    Symbol(SymbolKind.SYM_ACTIVATABLE, "Length", __BUILTIN_LENGTH__),
-    Symbol(SymbolKind.SYM_ACTIVATABLE, "Atoi", __BUILTIN_ATOI__),
-])
-
 BUILTINS = {
     "_": __BUILTIN__,
     "Real": __BUILTIN_REAL__,
@@ -411,6 +398,53 @@ BUILTINS = {
 }
 #endregion -------------- System Constants --------------
 
+#region -------------- Builtin Symbol Table --------------
+# The builtin symbol table is only built on first use (see getBuiltinSymtable).
+_BUILTIN_SYMTABLE: SymbolTable = None
+_BUILTIN_LOCK = Lock()
+
+def getBuiltinSymtable() -> SymbolTable:
+    """
+        Gets the builtin symbol table, building it if it wasn't yet. The builtin symbols are numbered on the default
+        compilation, and the symbols and symbol tables of every other compilation are numbered after them.
+    """
+    global _BUILTIN_SYMTABLE
+    if (_BUILTIN_SYMTABLE != None): return _BUILTIN_SYMTABLE
+
+    with _BUILTIN_LOCK:
+        if (_BUILTIN_SYMTABLE != None): return _BUILTIN_SYMTABLE
+
+        comp = getDefaultCompilation()
+        with comp.activate():
+            table = SymbolTable([
+                Symbol(SymbolKind.SYM_TYPEDEF, "Real", __BUILTIN_REAL__),
+                Symbol(SymbolKind.SYM_TYPEDEF, "Integer", __BUILTIN_INTEGER__),
+                Symbol(SymbolKind.SYM_TYPEDEF, "Boolean", __BUILTIN_BOOLEAN__),
+                Symbol(SymbolKind.SYM_TYPEDEF, "Char", __BUILTIN_CHAR__),
+                Symbol(SymbolKind.SYM_TYPEDEF, "String", __BUILTIN_STRING__),
+                Symbol(SymbolKind.SYM_TYPEDEF, "Nil", __BUILTIN_NIL__),
+                # Symbol(SymbolKind.SYM_TYPEDEF, "Any", __BUILTIN_ANY__),
+                Symbol(SymbolKind.SYM_TYPELIT, "false", EnumeratedTypeSymbolValue(__BUILTIN_BOOLEAN__, 0)),
+                Symbol(SymbolKind.SYM_TYPELIT, "true", EnumeratedTypeSymbolValue(__BUILTIN_BOOLEAN__, 1)),
+                Symbol(SymbolKind.SYM_ACTIVATABLE, "ReadLn", __BUILTIN_READLN__),
+                Symbol(SymbolKind.SYM_ACTIVATABLE, "Write", __BUILTIN_WRITE__),
+                Symbol(SymbolKind.SYM_ACTIVATABLE, "WriteLn", __BUILTIN_WRITELN__),
+                Symbol(SymbolKind.SYM_ACTIVATABLE, "Length", __BUILTIN_LENGTH__),
+                Symbol(SymbolKind.SYM_ACTIVATABLE, "Atoi", __BUILTIN_ATOI__),
+            ])
+
+        Compilation.baseSymbolId = comp.symbolId
+        Compilation.baseSymbolTableId = comp.symbolTableId
+        _BUILTIN_SYMTABLE = table
+
+    return _BUILTIN_SYMTABLE
+
 def registerBuiltin():
-    SA_STATE["scopes"].append(__BUILTIN_SYMTABLE__)
-    SymbolTable._scopeStack.append(__BUILTIN_SYMTABLE__)
\ No newline at end of file
+    # The builtin table is shared by all compilations, so each compilation gets it's own copy, as the user root scope is
+    #   attached to it.
+    table = copy(getBuiltinSymtable())
+    table.scopes = []
+
+    getState()["scopes"].append(table)
+    getCompilation().scopeStack.append(table)
+#endregion -------------- Builtin Symbol Table --------------
@@ -2,26 +2,21 @@
 # This module contains the internal state of the Semantic Analyser (semanaler.py). It was extracted because the Symbol 
 # / Symbol Table requires it, and they had to be extracted into their own module because the builtin symbols are defined
 # on their own module.
+#   The state itself is held by the current compilation (see compilation.py), and is accessed through getState().
 #
-from inspect import getframeinfo, stack
 
 import compiler.ast as ast
-from compiler.diag import Diagnostic, DiagnosticType, DiagnosticKind, DiagnosticSource
+from compiler.diag import Diagnostic, DiagnosticType, DiagnosticKind, DiagnosticSource, getCallerHeader
+from compiler.compilation import getCompilation
 
-SA_STATE = {
-    "diagnostics": [],
-    "debug": False,
-
-    "scopes": []
-}
+def getState() -> dict:
+    return getCompilation().saState
 
 def reset():
-    SA_STATE = {
-        "diagnostics": [],
-        "debug": False,
-
-        "scopes": []
-    }
+    comp = getCompilation()
+    comp.saState["diagnostics"] = []
+    comp.saState["scopes"] = []
+    comp.scopeStack = []
 
 #region -------------- Diagnostics --------------
 class SemanticError(Exception):
@@ -38,8 +33,6 @@ class SemanticError(Exception):
         return cls(n, dType, dArgs, False)
 
 def sem_error(n: ast.Node, dType: DiagnosticType, dArgs, emit = True):
-    caller = getframeinfo(stack()[1][0])
-
     diag = emitDiagnostic(
         n, 
         dType, 
@@ -49,7 +42,7 @@ def sem_error(n: ast.Node, dType: DiagnosticType, dArgs, emit = True):
     )
 
     if (emit):
-        header = f"[{caller.filename}:{caller.lineno}] " if SA_STATE["debug"] else ""
+        header = getCallerHeader() if getState()["debug"] else ""
         print(
             f"\x1b[31m{header}SEMANTIC ERROR {n.pos.fullString}:\x1b[0m" \
             f" {diag.toString(None, emitMark = False, emitPos = False)}"
@@ -58,8 +51,6 @@ def sem_error(n: ast.Node, dType: DiagnosticType, dArgs, emit = True):
     return diag
 
 def sem_warn(n: ast.Node, dType: DiagnosticType, dArgs, emit = True):
-    caller = getframeinfo(stack()[1][0])
-
     diag = emitDiagnostic(
         n, 
         dType, 
@@ -69,7 +60,7 @@ def sem_warn(n: ast.Node, dType: DiagnosticType, dArgs, emit = True):
     )
 
     if (emit):
-        header = f"[{caller.filename}:{caller.lineno}] " if SA_STATE["debug"] else ""
+        header = getCallerHeader() if getState()["debug"] else ""
         print(
             f"\x1b[33m{header}SEMANTIC WARNING {n.pos.fullString}:\x1b[0m" \
             f" {diag.toString(None, emitMark = False, emitPos = False)}"
@@ -77,7 +68,7 @@ def sem_warn(n: ast.Node, dType: DiagnosticType, dArgs, emit = True):
 
     return diag
 
-# This function emits a semantic diagnostic. Diagnostics are defined on the property "diagnostics" on SA_STATE.
+# This function emits a semantic diagnostic. Diagnostics are defined on the property "diagnostics" on the state.
 def emitDiagnostic(
     node: ast.Node,
     dtype: DiagnosticType, 
@@ -89,11 +80,11 @@ def emitDiagnostic(
     rcEndPos = node.pos.getEnd()
 
     diag = Diagnostic(DiagnosticSource.SEMANAL, dtype, dkind, rcStartPos, rcEndPos, args)
-    if (addToState): SA_STATE["diagnostics"].append(diag)
+    if (addToState): getState()["diagnostics"].append(diag)
 
     return diag
 
 def getDiagnostics() -> list[Diagnostic]:
-    return SA_STATE["diagnostics"]
+    return getState()["diagnostics"]
 #endregion -------------- Diagnostics --------------
 
@@ -109,7 +109,7 @@ def s_enumeratedTypeDefinition(n: ast.EnumeratedTypeNode, nkey: str):
 
 def s_subrangeTypeDefinition(n: ast.SubrangeTypeNode, nkey: str):
     scope = SymbolTable.getCurrentScope()
-    parentSym = scope.getSymbolById(Symbol._ID)
+    parentSym = scope.getSymbolById(Symbol._getLatestId())
 
     if (isinstance(n, Symbol)): 
         raise SemanticError(BUILTINS["_"], DiagnosticType.TYPE_MISMATCH, { "aType": "OrdinalType", "bType": n.value })
@@ -360,7 +360,12 @@ def s_procedureOrFunctionCommon(n: ast.ProcedureDeclarationNode | ast.FunctionDe
 
     # Process Body
     if (n.body.ist(ast.BlockNode)):
-        assert s_block(n.body)
+        # Unchanged activatables are not analysed again (see incremental.py).
+        unit = getCompilation().unit
+        if (unit == None or not unit.isAnalysed(n)):
+            diagCount = len(getState()["diagnostics"])
+            assert s_block(n.body)
+            if (unit != None): unit.storeAnalysis(n, len(getState()["diagnostics"]) == diagCount)
         parentSym.value = ProcedureOrFunctionSymbolValue(n, paramSyms, retType, n.body)
     else:
         if (n.body.value == "Forward"): 
@@ -392,7 +397,7 @@ def s_block(n: ast.BlockNode):
     if (n.variables != None): assert s_blockVariables(n.variables)
     if (n.subfuncs != None): assert s_blockSubFuncs(n.subfuncs)
 
-    # print("FUCKING BLOCK SCOPES:", SA_STATE["scopes"])
+    # print("FUCKING BLOCK SCOPES:", getState()["scopes"])
     # assert s_assignmentStatement(n.stmt.value[2])
     assert s_compoundStatement(n.stmt)
 
@@ -407,7 +412,7 @@ def evaluateVariableType(n: ast.VariableNode):
     # print("FUCKING VARIABLE:", n)
     if (n.ist(ast.EntireVariableNode)):
         # print("FUCKING ENTIRE VARIABLE TYPE:", scope.resolvePossibleReference(n.value).value.value)
-        return scope.resolvePossibleReference(n.value).value.value
+        return scope.resolveBinding(n, n.value).value.value
     elif (n.ist(ast.IndexedVariableNode)):
         pass # TODO If I have the fucking time
     
@@ -427,7 +432,7 @@ def evaluateExpressionType(n: ast.ExpressionLikeNode):
                 return BUILTINS["Integer"] if n.value.value.isInt() else BUILTINS["Real"]
             elif (n.value.value.ist(ast.StringNode)): return BUILTINS["String"]
             elif (n.value.value.ist(ast.IdentifierNode)):
-                return scope.resolvePossibleReference(n.value.value)
+                return scope.resolvePossibleSymbolReference(scope.resolveBinding(n.value.value, n.value.value.value))
             else:
                 return BUILTINS["Nil"]
         elif (n.value.ist(ast.VariableNode)):
@@ -467,6 +472,9 @@ def s_expression(n: ast.ExpressionLikeNode):
         #             { "aType": actSym.value.params[i].value.value, "bType": exprParamType.value }
         #         )
         assert s_activation(n)
+    elif (isinstance(n.value, ast.EntireVariableNode)):
+        # A single variable isn't evaluated, but it is still bound for the code generator.
+        scope.resolveBinding(n.value, n.value.value)
 
     return True
 #endregion ------- Section R8 -------
@@ -475,10 +483,10 @@ def s_expression(n: ast.ExpressionLikeNode):
 def s_activation(n: ast.FunctionDesignatorNode):
     scope = SymbolTable.getCurrentScope()
 
-    if (not scope.hasSymbol(n.key.value, SymbolKind.SYM_ACTIVATABLE)):
+    actSym = scope.resolveBinding(n, n.key.value, SymbolKind.SYM_ACTIVATABLE)
+    if (actSym == None):
         raise SemanticError(n, DiagnosticType.UNDECLARED_ACTIVATABLE, { "value": n.key.value })
 
-    actSym = scope.getSymbolByNameAndKind(n.key.value, SymbolKind.SYM_ACTIVATABLE)
     # print("FUCKING FUNCTION:", actSym.value.params)
     # print("FUCKING FUNCTION ACTIVATION:", n)
 
@@ -505,7 +513,7 @@ def s_variableAccess(n: ast.VariableNode):
         case ast.VariableKind.VARIABLE_ENTIRE:
             # Enable assignment to the identifier of the procedure itself.
             if (
-                not scope.hasSymbol(n.value, SymbolKind.SYM_VAR) 
+                scope.resolveBinding(n, n.value, SymbolKind.SYM_VAR) == None
                 and not (scope.hasSymbol(n.value, SymbolKind.SYM_ACTIVATABLE) and n.value == scope._procedure)
             ):
                 raise SemanticError(n, DiagnosticType.UNDECLARED_VARIABLE, { "value": n.value })
@@ -530,12 +538,11 @@ def s_variableAccess(n: ast.VariableNode):
             else:
                 key = None
                 if (n.key.ist(ast.IdentifierNode)):
-                    if (not scope.hasSymbol(n.key.value, SymbolKind.SYM_VAR)):
+                    keySym = scope.resolveBinding(n.key, n.key.value, SymbolKind.SYM_VAR)
+                    if (keySym == None):
                         raise SemanticError(n.key, DiagnosticType.UNDECLARED_VARIABLE, { "value": n.key.value })
 
-                    key = scope.resolvePossibleSymbolReference(
-                        scope.getSymbolByNameAndKind(n.key.value, SymbolKind.SYM_VAR)
-                    )
+                    key = scope.resolvePossibleSymbolReference(keySym)
                 else:
                     assert s_variableAccess(n.key)
                     key = n.keys
@@ -563,7 +570,7 @@ def s_assignmentStatement(n: ast.AssignmentStatementNode):
 
     key = None
     if (n.key.ist(ast.IdentifierNode)):
-        if (not scope.hasSymbol(n.key.value, SymbolKind.SYM_VAR)):
+        if (scope.resolveBinding(n.key, n.key.value, SymbolKind.SYM_VAR) == None):
                 raise SemanticError(n, DiagnosticType.UNDECLARED_VARIABLE, { "value": n.key.value })
     else:
         assert s_variableAccess(n.key)
@@ -605,17 +612,17 @@ def analyzeSemantics(n: ast.ProgramNode):
         assert s_programHeading(n.heading)
         assert s_block(n.body)
 
-        # # print(SA_STATE["scopes"])
-        # # print(SA_STATE["scopes"][1].__repr__(0, True))
-        # print(*list(map(lambda s : s.__repr__(0, True), SA_STATE["scopes"])))
+        # # print(getState()["scopes"])
+        # # print(getState()["scopes"][1].__repr__(0, True))
+        # print(*list(map(lambda s : s.__repr__(0, True), getState()["scopes"])))
 
-        # # print(SA_STATE["scopes"][0].syms[0].value.op_add(ast.NumberNode("123.4", ast.NumberKind.UNSIGNED_REAL), ast.NumberNode("456.6", ast.NumberKind.UNSIGNED_REAL)))
-        # # print(SA_STATE["scopes"][0].syms[3].value.op_sub(ast.IdentifierNode("a"), ast.IdentifierNode("A")))
-        # # print(SA_STATE["scopes"][0].syms[3].value.chr(ast.NumberNode(65, ast.NumberKind.UNSIGNED_INTEGER)))
+        # # print(getState()["scopes"][0].syms[0].value.op_add(ast.NumberNode("123.4", ast.NumberKind.UNSIGNED_REAL), ast.NumberNode("456.6", ast.NumberKind.UNSIGNED_REAL)))
+        # # print(getState()["scopes"][0].syms[3].value.op_sub(ast.IdentifierNode("a"), ast.IdentifierNode("A")))
+        # # print(getState()["scopes"][0].syms[3].value.chr(ast.NumberNode(65, ast.NumberKind.UNSIGNED_INTEGER)))
 
         return True
     except Exception:
-        if (SA_STATE["debug"]):
+        if (getState()["debug"]):
             print(f"\x1b[31mBASE SEMANTIC ERROR:\x1b[0m")
             traceback.print_exc()
 
@@ -4,6 +4,7 @@ from enum import Enum, auto
 
 import compiler.ast as ast
 from compiler.sastate import *
+from compiler.compilation import getCompilation
 
 class Reference_Error:
     def __init__(self, sym: "Symbol"):
@@ -212,27 +213,35 @@ class Symbol:
         return f"<Symbol @ {self.id} ({self.name})>"
 
     #region ------- Static -------
-    _ID = 0
-
+    # Symbol identifiers are sequential within each compilation (see compilation.py).
     @classmethod
     def _getId(cls):
-        cls._ID = cls._ID + 1
-        return cls._ID
+        comp = getCompilation()
+        comp.symbolId = comp.symbolId + 1
+        return comp.symbolId
+
+    @classmethod
+    def _getLatestId(cls):
+        return getCompilation().symbolId
 
     @classmethod
     def _rollbackId(cls):
-        cls._ID = cls._ID - 1
-        return cls._ID
+        comp = getCompilation()
+        comp.symbolId = comp.symbolId - 1
+        return comp.symbolId
 
     @classmethod
     def _fromId(cls, id):
         sym = cls(SymbolKind.SYM_ANY, "__INTERNAL__")
-        cls._ID = cls._ID - 1
+        cls._rollbackId()
         sym.id = id
 
         return sym
     #endregion ------- Static -------
 
+# Symbols are kept on an ordered list (see getLatestSymbol), and indexed by id, name and (name, kind). When a table has
+#   multiple symbols with the same key, the index keeps the first one added, as a linear search on the list would find.
+#   Symbols must therefore be added and removed through addSymbol and removeSymbolById.
 class SymbolTable:
     def __init__(self, syms: list[Symbol] = None, scopes: list["SymbolTable"] = None, parent: "SymbolTable" = None):
         self.id = self._getId()
@@ -240,24 +249,43 @@ class SymbolTable:
 
         if (syms == None): self.syms: list[Symbol] = []
         else: self.syms = [*syms]
+        self._reindex()
 
         if (scopes == None): self.scopes: list["SymbolTable"] = []
         else: self.scopes = [*scopes]
 
         self._procedure = None
 
+    def __copy__(self):
+        # Copies keep the identifier of the original table, but have their own symbol list and indexes.
+        table = SymbolTable.__new__(SymbolTable)
+        table.__dict__.update(self.__dict__)
+        table.syms = [*self.syms]
+        table.scopes = [*self.scopes]
+        table._reindex()
+
+        return table
+
+    #region ------- Indexes -------
+    def _index(self, sym: Symbol):
+        self._byId.setdefault(sym.id, sym)
+        self._byName.setdefault(sym.name, sym)
+        self._byNameAndKind.setdefault((sym.name, sym.kind), sym)
+
+    def _reindex(self):
+        self._byId: dict[int, Symbol] = {}
+        self._byName: dict[str, Symbol] = {}
+        self._byNameAndKind: dict[(str, SymbolKind), Symbol] = {}
+        for sym in self.syms: self._index(sym)
+    #endregion ------- Indexes -------
+
     #region ------- Assertions -------
     def hasSymbolId(self, id, local = False) -> bool:
-        return any(sym.id == id for sym in self.syms) \
-            or (not local and (self.parent.hasSymbolId(id, kind) if self.parent else False))
+        return id in self._byId \
+            or (not local and (self.parent.hasSymbolId(id) if self.parent else False))
 
     def hasSymbol(self, name, kind: SymbolKind = SymbolKind.SYM_ANY, local = False) -> bool:
-        if (kind == SymbolKind.SYM_ANY):
-            return any(sym.name == name for sym in self.syms) \
-                or (not local and (self.parent.hasSymbol(name, kind) if self.parent else False))
-        else:
-            return any(sym.kind == kind and sym.name == name for sym in self.syms) \
-                or (not local and (self.parent.hasSymbol(name, kind) if self.parent else False))
+        return self.getSymbolByNameAndKind(name, kind, local) != None
 
     def hasSymbolValue(self, value, kind: SymbolKind = SymbolKind.SYM_ANY, local = False) -> bool:
         if (kind == SymbolKind.SYM_ANY):
@@ -273,17 +301,23 @@ class SymbolTable:
         return self.syms[-1]
 
     def getSymbolById(self, id, local = False) -> Symbol:
-        ownSym = list(filter(lambda s: s.id == id, self.syms))
-        if (len(ownSym) > 0): return ownSym[0]
-        if (not local and self.parent != None): return self.parent.getSymbolById(id)
+        scope = self
+        while (scope != None):
+            sym = scope._byId.get(id)
+            if (sym != None or local): return sym
+            scope = scope.parent
+
         return None
 
     def getSymbolByNameAndKind(self, name, kind: SymbolKind = SymbolKind.SYM_ANY, local = False) -> Symbol:
-        if (kind == SymbolKind.SYM_ANY): ownSym = list(filter(lambda s: s.name == name, self.syms))
-        else: ownSym = list(filter(lambda s: s.kind == kind and s.name == name, self.syms))
+        # The innermost scope declaring the name shadows the outer ones.
+        key = name if (kind == SymbolKind.SYM_ANY) else (name, kind)
+        scope = self
+        while (scope != None):
+            sym = (scope._byName if (kind == SymbolKind.SYM_ANY) else scope._byNameAndKind).get(key)
+            if (sym != None or local): return sym
+            scope = scope.parent
 
-        if (len(ownSym) > 0): return ownSym[0]
-        if (not local and self.parent != None): return self.parent.getSymbolByNameAndKind(name, kind)
         return None
 
     def getSymbolByValueAndKind(self, value, kind: SymbolKind = SymbolKind.SYM_ANY, local = False) -> Symbol:
@@ -309,8 +343,7 @@ class SymbolTable:
         kind: SymbolKind = SymbolKind.SYM_ANY
     ) -> Optional["SymbolTable"]:
         def search(scope: SymbolTable) -> Optional["SymbolTable"]:
-            for sym in scope.syms.values():
-                if (kind == SymbolKind.SYM_ANY or sym.kind == kind) and sym.name == name: return scope
+            if (scope.hasSymbol(name, kind, True)): return scope
             
             for child in scope.scopes:
                 result = search(child)
@@ -324,6 +357,22 @@ class SymbolTable:
 
         return search(root)
 
+    def resolveBinding(self, n: ast.Node, name, kind: SymbolKind = SymbolKind.SYM_ANY) -> Symbol:
+        """
+            Resolves the symbol of a given kind that a node refers to by name, from this scope.
+            The innermost symbol with that name is bound to the node on it's first resolution (see ast.Node.symbol), so
+            that further resolutions, including the ones of the code generator, don't walk the scope chain again.
+        """
+        sym = n.symbol
+        if (sym == None):
+            sym = self.getSymbolByNameAndKind(name)
+            if (sym == None): return None
+            n.symbol = sym
+
+        if (kind == SymbolKind.SYM_ANY or sym.kind == kind): return sym
+        # The name is shadowed by a symbol of another kind, so an outer symbol of this kind may still be visible.
+        return self.getSymbolByNameAndKind(name, kind)
+
     def resolveReference(self, ref: ast.IdentifierNode, kind: SymbolKind = SymbolKind.SYM_ANY):
         return self.getSymbolByNameAndKind(ref.value, kind)
 
@@ -348,12 +397,14 @@ class SymbolTable:
     #region ------- Setters -------
     def addSymbol(self, sym: Symbol) -> Symbol:
         self.syms.append(sym)
+        self._index(sym)
         return sym
 
     def removeSymbolById(self, id: int):
         try:
             si = self.syms.index(Symbol._fromId(id))
             self.syms.pop(si)
+            self._reindex() # A shadowed symbol with the same key might have to take it's place.
 
             return True
         except:
@@ -405,17 +456,17 @@ class SymbolTable:
         return f"<SymbolTable @ {self.id}>"
 
     #region ------- Static -------
-    _ID = 0
-    _scopeStack = []
-
+    # Symbol table identifiers and the scope stack are held by the current compilation (see compilation.py).
     @classmethod
     def _getId(cls):
-        cls._ID = cls._ID + 1
-        return cls._ID
+        comp = getCompilation()
+        comp.symbolTableId = comp.symbolTableId + 1
+        return comp.symbolTableId
 
     @classmethod
     def getCurrentScope(cls) -> SymbolTable:
-        return cls._scopeStack[-1] if (len(cls._scopeStack) > 0) else None
+        scopeStack = getCompilation().scopeStack
+        return scopeStack[-1] if (len(scopeStack) > 0) else None
 
     @classmethod
     def pushScope(cls, defer = False) -> SymbolTable:
@@ -428,19 +479,20 @@ class SymbolTable:
                 parent.addScope(scope)
                 scope.parent = parent
         else:
-            scope.parent = SA_STATE["scopes"][0] # Ensure builtin is always present.
+            scope.parent = getState()["scopes"][0] # Ensure builtin is always present.
         
-        SA_STATE["scopes"].append(scope)
-        cls._scopeStack.append(scope)
+        getState()["scopes"].append(scope)
+        getCompilation().scopeStack.append(scope)
         return scope
 
     @classmethod
     def popScope(cls, defer = False):
-        scope = cls._scopeStack.pop()
+        scope = getCompilation().scopeStack.pop()
         parent = cls.getCurrentScope()
 
         if (defer): 
-            print("ALLAHU AKBAR OR SOME SHIT:", scope, parent)
+            # Printing the scopes is linear on their size, so it's only done on debug mode.
+            if (getState()["debug"]): print("ALLAHU AKBAR OR SOME SHIT:", scope, parent)
             if (parent != None): 
                 parent.addScope(scope)
                 scope.parent = parent
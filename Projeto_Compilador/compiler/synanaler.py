@@ -1,7 +1,11 @@
+import sys
+from threading import Lock
+from hashlib import sha256
 from ply import yacc
-from inspect import getframeinfo, stack
-from .lexer import tokens, TokenPos, posToRowCol, lexer
-from .diag import Diagnostic, DiagnosticType, DiagnosticKind, DiagnosticSource
+from copy import copy
+from .lexer import tokens, TokenPos, posToRowCol, getLexPos
+from .diag import Diagnostic, DiagnosticType, DiagnosticKind, DiagnosticSource, getCallerHeader
+from .compilation import getCompilation
 import compiler.ast as ast
 
 #
@@ -14,6 +18,9 @@ import compiler.ast as ast
 #   When calling parser.parse, the lexer should be passed explicitly as an argument, along with it's custom token
 # mock, lexer.getExtendedToken, in order for the tokens passed to have their location metadata correctly mapped to the
 # source text.
+#   The module-level parser and lexer belong to the default compilation. In order to run multiple compilations
+# concurrently, each should be run on it's own Compilation (see compilation.py), which builds it's own parser and lexer
+# through buildParser and lexer.buildLexer.
 #
 #  On Error Handling:
 #    Error handling should be preferrably done through resynchronization rules (see Section 6.8.1 of 
@@ -49,14 +56,14 @@ def p_bt_KW_OF(p):
     """
     bt_KW_OF : KW_OF
     """
-    p.parser.backtracks["KW_OF"] = lexer._cur
+    p.parser.backtracks["KW_OF"] = p.lexer._cur
     p[0] = p[1]
 
 def p_bt_GENERIC(p):
     """
     bt_GENERIC : empty
     """
-    p.parser.backtracks["GENERIC"] = lexer._lastSep
+    p.parser.backtracks["GENERIC"] = p.lexer._lastSep
 #endregion ============== Backtracks =============
 
 #region ============== Compound Primitives =============
@@ -1579,27 +1586,26 @@ def p_error(t):
     print("ERR:", t)
 
     if t == None:
-        # Here, I cheat by fetching the lexer directly, in order to get the last position the lexer has processed, due 
-        #   to being unable to fetch it from the token, as it is None.
+        # Here, I cheat by fetching the lexer of the compilation directly, in order to get the last position the lexer 
+        #   has processed, due to being unable to fetch it from the token, as it is None.
+        l = getCompilation().lexer
         diag = emitDiagnostic(
-            lexer, 
+            l, 
             DiagnosticType.UNEXPECTED_EOF, 
             DiagnosticKind.ERROR, 
             {},
-            TokenPos(lexer, lexer.lexpos, lexer.lexpos)
+            TokenPos(l, getLexPos(l), getLexPos(l))
         )
         print(
-            f"\x1b[31mSYNTAX ERROR @{lexer.lexpos}:" \
-            f"\x1b[0m {diag.toString(lexer, emitMark = False, emitPos = False)}"
+            f"\x1b[31mSYNTAX ERROR @{getLexPos(l)}:" \
+            f"\x1b[0m {diag.toString(l, emitMark = False, emitPos = False)}"
         )
     else:
         print("NERR:", t.lexpos, t.pos)
         syn_error(t, DiagnosticType.UNEXPECTED_TOKEN, { "token": t.type })
 
 def syn_error(t, dType, dArgs):
-    caller = getframeinfo(stack()[1][0])
-
-    lex = getattr(t, "lexer", lexer)
+    lex = getattr(t, "lexer", None) or getCompilation().lexer
 
     diag = emitDiagnostic(
             lex, 
@@ -1608,13 +1614,15 @@ def syn_error(t, dType, dArgs):
             dArgs,
             t.pos
     )
+    header = getCallerHeader() if getCompilation().parser.options["debug"] else ""
     print(
-        f"\x1b[31m[{caller.filename}:{caller.lineno}] SYNTAX ERROR @{t.lexpos}:\x1b[0m" \
+        f"\x1b[31m{header}SYNTAX ERROR @{t.lexpos}:\x1b[0m" \
         f" {diag.toString(lex, emitMark = False, emitPos = False)}"
     )
 
 #region ------- Diagnostics -------
-# This function emits a syntatic diagnostic. Diagnostics are defined on the property "diagnostics" on the parser.
+# This function emits a syntatic diagnostic. Diagnostics are defined on the property "diagnostics" on the parser of the
+#   current compilation.
 def emitDiagnostic(
     l, 
     dtype: DiagnosticType, 
@@ -1627,20 +1635,21 @@ def emitDiagnostic(
     rcEndPos = _pos.end
 
     diag = Diagnostic(DiagnosticSource.SYNANAL, dtype, dkind, rcStartPos, rcEndPos, args)
-    parser.diagnostics.append(diag)
-    parser._diagnosticTrace.append(diag)
+    p = getCompilation().parser
+    p.diagnostics.append(diag)
+    p._diagnosticTrace.append(diag)
 
     return diag
 
 # This function removes the latest diagnostic from the parser list. Used on resynchronization rules for more specialized
 #   per-rule error handling.
 def popDiagnostic():
-    return parser.diagnostics.pop()
+    return getCompilation().parser.diagnostics.pop()
 #endregion ------- Diagnostics -------
 
 #region ------- Parser Utils -------
 def advanceUntil(cond, p = None):
-    if (p == None): p = parser
+    if (p == None): p = getCompilation().parser
 
     tok = p.token()
     trace("Eval skip:", tok)
@@ -1657,14 +1666,109 @@ def advanceUntilSemicolon():
     advanceUntil(lambda t: t.type == 'SEMICOLON')
 
 def trace(*args):
-    if (parser.options["verbose"]): print(*args)
+    if (getCompilation().parser.options["verbose"]): print(*args)
 #endregion ------- Parser Utils -------
 
-parser = yacc.yacc()
-parser.diagnostics = []
-parser._diagnosticTrace = []
-parser.options = {
-    "verbose": True
-}
-parser.backtracks = {}
+#region ============== Parsing Tables =============
+# The LALR tables are precomputed by a build step (see buildtables.py) into a module shipped with the package 
+#   (lrtables.py), keyed by the signature of the grammar defined above. Loading them skips the grammar introspection and
+#   table generation of yacc.yacc, and never touches the working directory. If the grammar changed since the tables were
+#   built, they are generated in memory instead, until the build step is run again.
+TABLES_VERSION = 1
+
+def grammarSignature() -> str:
+    """
+        Computes the signature of the grammar defined in this module: a hash over the start symbol, precedence table,
+        tokens and the docstrings of the productions, in definition order (the same parts PLY signs parsetab.py with).
+    """
+    pfuncs = sorted(
+        (f for (name, f) in globals().items() if name.startswith("p_") and name != "p_error" and callable(f)),
+        key=lambda f: (f.__code__.co_firstlineno, f.__name__)
+    )
+
+    h = sha256()
+    h.update(f"{TABLES_VERSION}:{yacc.__tabversion__}:{start}:".encode())
+    h.update(repr(precedence).encode())
+    h.update(" ".join(tokens).encode())
+    for f in pfuncs: h.update((f.__doc__ or "").encode())
+
+    return h.hexdigest()
+
+def loadTables():
+    """
+        Loads the precomputed LALR tables (see lrtables.py), if they exist and match the current grammar and table 
+        version. Returns None otherwise.
+    """
+    try:
+        from . import lrtables
+    except ImportError:
+        return None
+
+    if (lrtables.TABLES_VERSION != TABLES_VERSION or lrtables.GRAMMAR_HASH != grammarSignature()): return None
+
+    lr = yacc.LRTable()
+    lr.lr_action = { state: dict(row) for (state, row) in lrtables.ACTION }
+    lr.lr_goto = { state: dict(row) for (state, row) in lrtables.GOTO }
+    lr.lr_productions = [yacc.MiniProduction(*p) for p in lrtables.PRODUCTIONS]
+    lr.lr_method = lrtables.METHOD
+    lr.bind_callables(globals())
 
+    return lr
+
+def makeParser():
+    """
+        Builds the module-level parser from the precomputed tables or, if those are outdated, from tables generated in
+        memory.
+    """
+    lr = loadTables()
+    if (lr != None): return yacc.LRParser(lr, p_error)
+
+    print(
+        "[synanaler] The precomputed parsing tables are missing or outdated. Run 'python3 -m compiler.buildtables' to"
+        + " rebuild them.",
+        file=sys.stderr
+    )
+    return yacc.yacc(debug=False, write_tables=False, errorlog=yacc.NullLogger())
+#endregion ============== Parsing Tables =============
+
+# The module-level parser is only built on first use (see getParser).
+_PARSER: yacc.LRParser = None
+_PARSER_LOCK = Lock()
+
+def getParser() -> yacc.LRParser:
+    """
+        Gets the module-level parser, building it if it wasn't yet.
+    """
+    global _PARSER
+    if (_PARSER == None):
+        with _PARSER_LOCK:
+            if (_PARSER == None):
+                p = makeParser()
+                p.diagnostics = []
+                p._diagnosticTrace = []
+                p.options = {
+                    "verbose": True,
+                    # Whether printed diagnostics are prefixed with the location of the rule that emitted them.
+                    "debug": False
+                }
+                p.backtracks = {}
+                _PARSER = p
+
+    return _PARSER
+
+def __getattr__(name):
+    # Keeps "from compiler.synanaler import parser" working, while only building the parser when it's first imported.
+    if (name == "parser"): return getParser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Builds a new parser, independent from the module-level one, in order for multiple compilations to be able to parse
+#   concurrently (see compilation.py). The parsing tables are shared with the module-level parser.
+def buildParser():
+    parser = getParser()
+    p = copy(parser)
+    p.diagnostics = []
+    p._diagnosticTrace = []
+    p.options = { **parser.options }
+    p.backtracks = {}
+
+    return p
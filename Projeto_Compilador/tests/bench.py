@@ -0,0 +1,1689 @@
+import gc
+import io
+import os
+import sys
+import time
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+import types
+import argparse
+import contextlib
+from ply import lex
+import compiler.lexer as lexerModule
+from compiler.lexer import lexer
+from compiler.diag import getCallerHeader
+from util.cli import CLI, CLICommand
+
+#
+# Benchmark Suite
+#
+#   This module contains micro benchmarks for the compiler phases. Sources are either generated synthetically, in order
+# to control their size, or taken from the test suite cases (see tests/test.py).
+#
+
+#region ============== Source Generators =============
+def generateProgramLines(lines: int):
+    """
+        Yields the lines of a syntatically valid program with approximately the given number of lines.
+        The statement part is made of simple assignments, with a comment every few lines, in order to exercise the line
+        accounting on both the normal and the comment lexer states.
+    """
+    yield from [
+        "program Bench;",
+        "var",
+        "    a, b, c: Integer;",
+        "begin",
+        "    a := 0;",
+    ]
+
+    for i in range(0, max(0, lines - 7)):
+        if (i % 8 == 0): yield f"    {{ Step {i} }}"
+        else: yield f"    b := a + {i} * (c - 1);"
+
+    yield "    a := b"
+    yield "end."
+
+def generateProgram(lines: int) -> str:
+    """
+        Generates a syntatically valid program with approximately the given number of lines (see generateProgramLines).
+    """
+    return "\n".join(generateProgramLines(lines))
+
+def writeProgram(path: str, size: int) -> int:
+    """
+        Writes a generated program with approximately the given size, in bytes, to a file, without keeping it in memory.
+        Returns the number of lines written.
+    """
+    # Each generated line has roughly 30 characters.
+    lines = max(8, size // 30)
+    with open(path, "w") as f:
+        for (i, line) in enumerate(generateProgramLines(lines)):
+            if (i != 0): f.write("\n")
+            f.write(line)
+
+    return lines
+
+def generateErrorProgram(errors: int) -> str:
+    """
+        Generates a program with the given number of syntax errors, from which the syntatic analyser recovers (an
+        enumerated type with a missing comma per type definition).
+    """
+    return "\n".join([
+        "program Errors;",
+        "type",
+        *(f"    t{i} = (A{i} B{i}, C{i});" for i in range(0, errors)),
+        "begin",
+        "end."
+    ])
+
+def generateSymbolsProgram(variables: int) -> str:
+    """
+        Generates a semantically valid program declaring the given number of global variables, along with a procedure
+        (with it's own parameter and local variable) per 10 variables. The statement part assigns each variable to the
+        next one, in order for every statement to look up the symbol table.
+    """
+    lines = [
+        "program Symbols;",
+        "var",
+        "    " + ", ".join(f"v{i}" for i in range(0, variables)) + ": Integer;",
+    ]
+    for i in range(0, variables // 10):
+        lines += [f"procedure p{i}(x: Integer);", "var", "    a: Integer;", "begin", f"    a := {i}", "end;"]
+
+    lines += [
+        "begin",
+        *(f"    v{i} := v{i + 1};" for i in range(0, variables - 1)),
+        "    v0 := 1",
+        "end."
+    ]
+    return "\n".join(lines)
+
+def generateActivatablesProgram(activatables: int, statements: int, edited: int = None, offset: int = 0) -> str:
+    """
+        Generates a semantically valid program declaring the given number of procedures, each with a loop and the given
+        number of statements, and a statement part calling each of them. If given, the body of the edited procedure
+        differs from the one of the unedited program. The offset is the number of blank lines the declarations are
+        preceded by, which moves them around without changing them.
+    """
+    lines = ["program Activatables;", *([""] * offset), "var", "    x: Integer;"]
+    for i in range(0, activatables):
+        lines += [
+            f"procedure p{i}(n: Integer);",
+            "var",
+            "    i, a, b: Integer;",
+            "begin",
+            "    a := n;",
+            "    for i := 1 to 10 do",
+            "        begin",
+            *(f"            b := {j};" for j in range(0, statements)),
+            "            WriteLn(b)",
+            "        end;",
+            f"    WriteLn('p{i}{'*' if (i == edited) else ''}')",
+            "end;"
+        ]
+
+    lines += ["begin", "    x := 1;", *(f"    p{i}(x);" for i in range(0, activatables)), "    WriteLn(x)", "end."]
+    return "\n".join(lines)
+
+def generateEWVMLoop(iterations: int) -> str:
+    """
+        Generates an EWVM program summing the integers below a given number, on a counted loop.
+    """
+    return "\n".join([
+        "PUSHI 0",
+        "PUSHI 0",
+        "Loop: PUSHL 0",
+        f"PUSHI {iterations}",
+        "INF",
+        "JZ End",
+        "PUSHL 1",
+        "PUSHL 0",
+        "ADD",
+        "STOREL 1",
+        "PUSHL 0",
+        "PUSHI 1",
+        "ADD",
+        "STOREL 0",
+        "JUMP Loop",
+        "End: PUSHL 1",
+        "WRITEI",
+    ])
+
+def generateConstantLoop(iterations: int) -> str:
+    """
+        Generates a program whose counted loop is made of expressions over constants and straight-line assignments.
+    """
+    return "\n".join([
+        "program ConstantLoop;",
+        "const Width = 8; Height = 6; Scale = 2.5; Area = Width;",
+        "var i, a, b, c: Integer;",
+        "begin",
+        f"  for i := 1 to {iterations} * 1 do",
+        "  begin",
+        "    a := Width * Height + 2 * 3;",
+        "    b := a - Height * (4 - 1);",
+        "    c := i + b * 2;",
+        "    if (Width * 2 > Height + 1) then c := c + Area * Scale;",
+        "  end;",
+        "  WriteLn(c);",
+        "end.",
+    ])
+
+def generateNestedLoops(iterations: int, depth: int) -> str:
+    """
+        Generates a program counting the iterations of a given number of nested loops, the outermost running a given
+        number of times, and each inner level running two sequential loops.
+    """
+    names = [f"i{d}" for d in range(0, depth)]
+    lines = [
+        "program NestedLoops;",
+        f"var {', '.join(names)}, s: Integer;",
+        "begin",
+        f"  for i0 := 1 to {iterations} do",
+        "  begin",
+    ]
+    for d in range(1, depth):
+        indent = "  " * (d + 1)
+        lines.append(f"{indent}for {names[d]} := 1 to 3 do s := s + 1;")
+        lines.append(f"{indent}for {names[d]} := 1 to 2 do")
+        lines.append(f"{indent}begin")
+    lines.append(f"{'  ' * (depth + 1)}s := s + 1;")
+    lines.extend(f"{'  ' * (d + 1)}end;" for d in reversed(range(0, depth)))
+    lines.extend(["  WriteLn(s);", "end."])
+    return "\n".join(lines)
+
+def generateBranches(iterations: int) -> str:
+    """
+        Generates a program whose counted loop is made of conditional statements without else clauses, nested into one
+        another, whose labels and jumps end up chained.
+    """
+    return "\n".join([
+        "program Branches;",
+        "var i, a, b: Integer;",
+        "begin",
+        f"  for i := 1 to {iterations} do",
+        "  begin",
+        "    if i > 2 then a := a + 1;",
+        "    if i > 5 then if i > 7 then if i > 9 then b := b + 1;",
+        "    if a > b then begin if a > 10 then a := a - 1 else b := b + 1 end else b := b - 1;",
+        "  end;",
+        "  WriteLn(a);",
+        "  WriteLn(b);",
+        "end.",
+    ])
+
+def generateInvariantLoops(iterations: int, hoisted: bool) -> str:
+    """
+        Generates a program of a while, a repeat and a counted loop, each running a given number of times, and reading
+        the same loop invariant expression, either on each iteration, or off a variable it was assigned to beforehand.
+    """
+    inv = "t" if (hoisted) else "(n * k + m)"
+    return "\n".join([
+        "program InvariantLoops;",
+        "var i, n, k, m, s, t: Integer;",
+        "begin",
+        "  if s < 1 then",
+        "  begin",
+        "    n := 7; k := 3; m := 2;",
+        *(["    t := n * k + m;"] if (hoisted) else []),
+        f"    while i < {iterations} do begin s := s + {inv}; i := i + 1 end;",
+        f"    repeat s := s - {inv}; i := i - 1 until i < 1;",
+        f"    for i := 1 to {iterations} do s := s + i * {inv};",
+        "    WriteLn(s);",
+        "  end;",
+        "end.",
+    ])
+
+def loadCorpus(root: str = None) -> list[(str, str)]:
+    """
+        Loads every source file of the test suite cases, as (path, text) tuples.
+    """
+    if (root == None): root = os.path.join(os.path.dirname(__file__), "cases")
+
+    corpus = []
+    for (dirpath, _, filenames) in os.walk(root):
+        for filename in sorted(filenames):
+            if (not filename.endswith(".pas")): continue
+            path = os.path.join(dirpath, filename)
+            with open(path, "r") as f: corpus.append((path, f.read()))
+
+    return sorted(corpus)
+
+# The input lines each program of the project cases (tests/cases/proj) reads, when run.
+PROJ_INPUTS = {
+    "ex1": [],
+    "ex2": ["3", "9", "4"],
+    "ex3": ["6"],
+    "ex4": ["9"],
+    "ex5": ["1", "2", "3", "4", "5"],
+    "ex6": ["101"],
+    "ex7": ["101"],
+}
+
+def loadProjPrograms() -> list[(str, str, list[str])]:
+    """
+        Loads the project cases (tests/cases/proj), as (name, text, input lines) tuples.
+    """
+    root = os.path.join(os.path.dirname(__file__), "cases", "proj")
+    return [
+        (os.path.basename(path)[:-4], src, PROJ_INPUTS.get(os.path.basename(path)[:-4], []))
+        for (path, src) in loadCorpus(root)
+    ]
+#endregion ============== Source Generators =============
+
+#region ============== Utilities =============
+def timeit(cb, repeat: int = 3) -> float:
+    """
+        Returns the best wall-clock time, in seconds, of a given number of runs of the callback.
+    """
+    best = None
+    for _ in range(0, repeat):
+        start = time.perf_counter()
+        cb()
+        elapsed = time.perf_counter() - start
+        if (best == None or elapsed < best): best = elapsed
+
+    return best
+
+def tokenize(inp: str) -> int:
+    """
+        Tokenizes a given source text through the same path the parser uses and returns the number of tokens produced.
+    """
+    lexer.reset()
+    lexer.input(inp)
+
+    count = 0
+    while lexer.getExtendedToken() != None: count += 1
+    lexer.finish()
+
+    return count
+
+def tokenizeFile(path: str, chunkSize: int = None) -> int:
+    """
+        Tokenizes a source file and returns the number of tokens produced. The file is either read whole or, if a chunk
+        size is given, streamed (see lexer.inputStream).
+    """
+    lexer.reset()
+    with open(path, "r") as f:
+        if (chunkSize == None): lexer.input(f.read())
+        else: lexer.inputStream(f, chunkSize)
+
+        count = 0
+        while lexer.getExtendedToken() != None: count += 1
+        lexer.finish()
+
+    return count
+
+def buildKeywordRuleLexer():
+    """
+        Builds a lexer where each reserved keyword is recognized by its own rule, ordered before IDENTIFIER, as the 
+        compiler lexer did before keywords were classified through the reserved table. Used as a comparison baseline.
+    """
+    rules = dict(vars(lexerModule))
+
+    # PLY orders function rules by their definition line, so the keyword rules are relocated past every other rule,
+    #   with IDENTIFIER last.
+    def relocate(fn, line):
+        fn.__code__ = fn.__code__.replace(co_firstlineno=line)
+        return fn
+
+    def makeKeywordRule(pattern):
+        def rule(t): return t
+        rule.__doc__ = pattern
+        return rule
+
+    for (i, (word, kw)) in enumerate(lexerModule.reserved.items()):
+        rules[f"t_{kw}"] = relocate(makeKeywordRule(rf"{word}\b"), 100000 + i)
+
+    def identifier(t): return t
+    identifier.__doc__ = lexerModule.t_IDENTIFIER.__doc__
+    rules["t_IDENTIFIER"] = relocate(identifier, 200000)
+
+    l = lex.lex(module=types.SimpleNamespace(**rules))
+    l._lastLineLexPos = 0
+    l.lineLens = []
+    l.lineOffsets = []
+    l.diagnostics = []
+    l.options = { "printDiags": False }
+    return l
+
+def rawTokenize(l, inp: str) -> int:
+    """
+        Tokenizes a given source text through the raw PLY token stream and returns the number of tokens produced.
+    """
+    l.lineno = 1
+    l._lastLineLexPos = 0
+    l.lineLens = []
+    l.lineOffsets = []
+    l.diagnostics = []
+    l.input(inp)
+
+    count = 0
+    while l.token() != None: count += 1
+
+    return count
+
+# Measures, on a fresh interpreter, the time from importing the compiler to the end of the first parse. The tables mode
+#   "generated" hides the precomputed tables module, in order for the tables to be generated on import.
+STARTUP_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+if (sys.argv[1] == "generated"): sys.modules["compiler.lrtables"] = None
+import compiler.synanaler
+from compiler.compilation import getCompilation
+imported = time.perf_counter()
+pout = getCompilation().parse(sys.argv[2])
+end = time.perf_counter()
+print(imported - start, end - start, pout != None)
+"""
+
+def measureStartup(mode: str, inp: str) -> (float, float):
+    """
+        Runs the startup script on a fresh interpreter, with the given tables mode. Returns the time to import the
+        compiler and the time to the end of the first parse, in seconds.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT, mode, inp],
+        cwd=root, capture_output=True, text=True, check=True
+    ).stdout.split()
+
+    if (out[2] != "True"): print(f"The first parse failed on mode '{mode}'.")
+    return (float(out[0]), float(out[1]))
+
+# Compiles a source text through every phase, without writing the generated code.
+COMPILE_SCRIPT = """
+import sys
+from compiler.compilation import Compilation
+comp = Compilation()
+pout = comp.parse(sys.argv[1])
+if (pout == None or not comp.analyze(pout)): sys.exit(1)
+comp.generate(pout)
+"""
+
+def measureCommand(args: list[str], runs: int) -> float:
+    """
+        Runs a command on fresh interpreters the given number of times, and returns the median wall-clock time, in 
+        seconds. The command must succeed.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times = []
+    for _ in range(0, runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=root, stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times)
+
+def parseSilently(inp: str, debug: bool):
+    """
+        Parses a given source text on a new compilation, without printing the diagnostics. Returns the compilation.
+    """
+    from compiler.compilation import Compilation
+    comp = Compilation(debug)
+    with contextlib.redirect_stdout(io.StringIO()): comp.parse(inp)
+    return comp
+
+# The symbol table lookups as they were before the tables were indexed (see compiler/symbols.py), used as a comparison
+#   baseline.
+def _linearGetSymbolById(self, id, local = False):
+    ownSym = list(filter(lambda s: s.id == id, self.syms))
+    if (len(ownSym) > 0): return ownSym[0]
+    if (not local and self.parent != None): return self.parent.getSymbolById(id)
+    return None
+
+def _linearGetSymbolByNameAndKind(self, name, kind = None, local = False):
+    from compiler.symbols import SymbolKind
+    if (kind == None or kind == SymbolKind.SYM_ANY): ownSym = list(filter(lambda s: s.name == name, self.syms))
+    else: ownSym = list(filter(lambda s: s.kind == kind and s.name == name, self.syms))
+
+    if (len(ownSym) > 0): return ownSym[0]
+    if (not local and self.parent != None): return self.parent.getSymbolByNameAndKind(name, kind)
+    return None
+
+def _linearHasSymbol(self, name, kind = None, local = False):
+    from compiler.symbols import SymbolKind
+    if (kind == None or kind == SymbolKind.SYM_ANY):
+        return any(sym.name == name for sym in self.syms) \
+            or (not local and (self.parent.hasSymbol(name, kind) if self.parent else False))
+    else:
+        return any(sym.kind == kind and sym.name == name for sym in self.syms) \
+            or (not local and (self.parent.hasSymbol(name, kind) if self.parent else False))
+
+@contextlib.contextmanager
+def linearSymbolTables():
+    """
+        Replaces the indexed symbol table lookups with linear searches for the duration of the context.
+    """
+    from compiler.symbols import SymbolTable
+    indexed = (SymbolTable.getSymbolById, SymbolTable.getSymbolByNameAndKind, SymbolTable.hasSymbol)
+    SymbolTable.getSymbolById = _linearGetSymbolById
+    SymbolTable.getSymbolByNameAndKind = _linearGetSymbolByNameAndKind
+    SymbolTable.hasSymbol = _linearHasSymbol
+    try:
+        yield
+    finally:
+        (SymbolTable.getSymbolById, SymbolTable.getSymbolByNameAndKind, SymbolTable.hasSymbol) = indexed
+
+# The code emission as it was before it was streamed (see codegen.writeCode), used as a comparison baseline: each line is
+#   concatenated onto the program so far, and subtrees are emitted recursively.
+def _concatenateCode(bld) -> str:
+    from compiler.codegen import CodeID
+    code = ""
+
+    for p in bld.stack:
+        match (p[0]):
+            case CodeID._LABEL:
+                code += f"L{p[1][0]}: "
+            case CodeID._SUBTREE:
+                code += _concatenateCode(p[1][0])
+            case CodeID.JZ:
+                code += f"JZ L{p[1][0]}"
+            case CodeID.JUMP:
+                code += f"JUMP L{p[1][0]}"
+            case CodeID.PUSHA:
+                code += f"PUSHA L{p[1][0]}"
+            case _:
+                code += f"{p[0].name} "
+                if (len(p[1]) > 0): code += " ".join(map(lambda e: f"{e}", p[1]))
+        code += "\n"
+
+    return code
+
+@contextlib.contextmanager
+def unsharedCodePoints():
+    """
+        Allocates a new code point (and operand list) for every instruction without operands, as code trees did before
+        those were shared (see codegen._NULLARY), for the duration of the context.
+    """
+    from compiler.codegen import CodeID, CodeTree
+    shared = (CodeTree._mono, CodeTree.nop)
+    CodeTree._mono = lambda self, id: self.stack.append((id, []))
+    CodeTree.nop = lambda self: self.stack.append((CodeID.NOP, []))
+    try:
+        yield
+    finally:
+        (CodeTree._mono, CodeTree.nop) = shared
+
+def analyzeSilently(inp: str) -> (float, bool):
+    """
+        Parses a given source text on a new compilation, and runs the semantic analysis on it, without printing the
+        diagnostics. Returns the time taken by the semantic analysis, in seconds, and whether it succeeded.
+    """
+    from compiler.compilation import Compilation
+    comp = Compilation()
+    with contextlib.redirect_stdout(io.StringIO()):
+        pout = comp.parse(inp)
+        start = time.perf_counter()
+        ok = comp.analyze(pout)
+        elapsed = time.perf_counter() - start
+
+    return (elapsed, ok)
+#endregion ============== Utilities =============
+
+#region ============== Benchmarks =============
+def benchLexScale(baseLines: int, steps: int, repeat: int):
+    """
+        Tokenizes programs of doubling sizes and reports the time per line for each size. On a linear lexer, the time
+        per line stays (roughly) constant as the file grows.
+    """
+    print(f"{'LINES':>10} {'TOKENS':>10} {'TIME (s)':>10} {'US/LINE':>10} {'RATIO':>8}")
+
+    first = None
+    lines = baseLines
+    for _ in range(0, steps):
+        inp = generateProgram(lines)
+        count = tokenize(inp)
+        elapsed = timeit(lambda: tokenize(inp), repeat)
+
+        perLine = elapsed / lines * 1e6
+        if (first == None): first = perLine
+        print(f"{lines:>10} {count:>10} {elapsed:>10.4f} {perLine:>10.3f} {perLine / first:>8.2f}")
+
+        lines *= 2
+
+def benchKeywords(repeat: int, scale: int):
+    """
+        Compares the tokenization throughput on the test suite corpus between the reserved table lexer and a lexer with
+        one rule per keyword. The corpus is concatenated the given number of times, in order to get stable timings.
+    """
+    corpus = loadCorpus()
+    inp = "\n".join(src for (_, src) in corpus) * scale
+    ruleLexer = buildKeywordRuleLexer()
+
+    tableCount = rawTokenize(lexer, inp)
+    ruleCount = rawTokenize(ruleLexer, inp)
+    if (tableCount != ruleCount):
+        print(f"Token count mismatch: {tableCount} (table) vs {ruleCount} (rules).")
+        
+    tableTime = timeit(lambda: rawTokenize(lexer, inp), repeat)
+    ruleTime = timeit(lambda: rawTokenize(ruleLexer, inp), repeat)
+
+    print(f"Corpus: {len(corpus)} files x{scale}, {len(inp)} chars, {tableCount} tokens.")
+    print(f"{'LEXER':>10} {'TIME (s)':>10} {'TOKENS/S':>12}")
+    print(f"{'rules':>10} {ruleTime:>10.4f} {ruleCount / ruleTime:>12.0f}")
+    print(f"{'table':>10} {tableTime:>10.4f} {tableCount / tableTime:>12.0f}")
+    print(f"Speedup: {ruleTime / tableTime:.2f}x")
+
+def benchLexStream(size: int, chunkSize: int):
+    """
+        Tokenizes a generated source file of the given size (in MiB), read whole and streamed in chunks of the given 
+        size (in KiB), and reports the time and peak memory usage of each.
+        The tokens are discarded as they are produced, so the peak memory usage is dominated by the source text when
+        the file is read whole, and by the line accounting (see lexer.lineLens) when it is streamed.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "bench.pas")
+        lines = writeProgram(path, size << 20)
+        print(f"Source: {os.path.getsize(path)} bytes, {lines} lines.")
+        print(f"{'MODE':>10} {'TOKENS':>10} {'TIME (s)':>10} {'PEAK (MiB)':>12}")
+
+        lineLens = {}
+        for (mode, chunk) in [("whole", None), ("stream", chunkSize << 10)]:
+            start = time.perf_counter()
+            count = tokenizeFile(path, chunk)
+            elapsed = time.perf_counter() - start
+
+            # Tracing slows down the lexer considerably, so memory is measured on a separate run.
+            lexer.reset()
+            tracemalloc.start()
+            tokenizeFile(path, chunk)
+            (_, peak) = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            lineLens[mode] = lexer.lineLens
+            lexer.reset()
+            print(f"{mode:>10} {count:>10} {elapsed:>10.4f} {peak / (1 << 20):>12.2f}")
+
+        if (lineLens["whole"] != lineLens["stream"]): print("Line accounting mismatch between modes.")
+
+def benchStartup(runs: int, lines: int):
+    """
+        Measures the import-to-first-parse time of the compiler on fresh interpreters, with the precomputed parsing 
+        tables (see compiler/buildtables.py) and with the tables generated on import, and reports the median and best
+        times of each.
+    """
+    inp = generateProgram(lines)
+    print(f"{'TABLES':>12} {'IMPORT (ms)':>12} {'MEDIAN (ms)':>12} {'BEST (ms)':>12}")
+
+    for mode in ["precomputed", "generated"]:
+        # The first run is discarded, as it might have to compile the modules to bytecode.
+        measureStartup(mode, inp)
+        times = [measureStartup(mode, inp) for _ in range(0, runs)]
+
+        imports = statistics.median(t[0] for t in times) * 1e3
+        median = statistics.median(t[1] for t in times) * 1e3
+        best = min(t[1] for t in times) * 1e3
+        print(f"{mode:>12} {imports:>12.2f} {median:>12.2f} {best:>12.2f}")
+
+def benchBudget(runs: int, helpBudget: float, compileBudget: float) -> bool:
+    """
+        Measures the wall-clock time of printing the help of the test suite CLI and of compiling a hello world program,
+        on fresh interpreters, and checks them against the given budgets (in milliseconds). Returns whether both are 
+        within budget.
+    """
+    helloWorld = "program HelloWorld;\nbegin\n    WriteLn('Hello, World!');\nend."
+    checks = [
+        ("help", ["-m", "tests.test", "--help"], helpBudget),
+        ("compile", ["-c", COMPILE_SCRIPT, helloWorld], compileBudget),
+    ]
+
+    # The first run is discarded, as it might have to compile the modules to bytecode.
+    for (_, args, _) in checks: measureCommand(args, 1)
+
+    ok = True
+    print(f"{'CHECK':>10} {'MEDIAN (ms)':>12} {'BUDGET (ms)':>12}")
+    for (name, args, budget) in checks:
+        elapsed = measureCommand(args, runs) * 1e3
+        within = elapsed <= budget
+        ok = ok and within
+
+        color = "\x1b[32m" if within else "\x1b[31m"
+        print(f"{color}{name:>10}\x1b[0m {elapsed:>12.1f} {budget:>12.1f}")
+
+    return ok
+
+def benchDiagnostics(errors: int, repeat: int):
+    """
+        Parses a program with the given number of syntax errors and reports the time taken with the debug mode off (no
+        caller information), on (caller information fetched through sys._getframe) and on, with the caller information
+        fetched through inspect.stack, as the diagnostics did before, as a comparison baseline.
+    """
+    import inspect
+    import compiler.synanaler as synanaler
+    inp = generateErrorProgram(errors)
+
+    def inspectCallerHeader(depth = 1):
+        caller = inspect.getframeinfo(inspect.stack()[depth + 1][0])
+        return f"[{caller.filename}:{caller.lineno}] "
+
+    print(f"Source: {errors} syntax errors, {len(inp)} chars.")
+    print(f"{'CALLER':>10} {'DIAGS':>8} {'TIME (s)':>10} {'US/DIAG':>10}")
+
+    for (mode, debug) in [("off", False), ("getframe", True), ("inspect", True)]:
+        if (mode == "inspect"): synanaler.getCallerHeader = inspectCallerHeader
+        try:
+            count = len(parseSilently(inp, debug).getParserDiagnostics())
+            elapsed = timeit(lambda: parseSilently(inp, debug), repeat)
+        finally:
+            synanaler.getCallerHeader = getCallerHeader
+
+        print(f"{mode:>10} {count:>8} {elapsed:>10.4f} {elapsed / max(1, count) * 1e6:>10.1f}")
+
+def benchSymbols(baseVariables: int, steps: int, repeat: int):
+    """
+        Runs the semantic analysis on programs declaring a doubling number of variables and procedures (see
+        generateSymbolsProgram), with the indexed symbol tables and with linear lookups, and reports the time of each.
+    """
+    print(f"{'VARIABLES':>10} {'INDEXED (s)':>12} {'LINEAR (s)':>12} {'SPEEDUP':>8}")
+
+    variables = baseVariables
+    for _ in range(0, steps):
+        inp = generateSymbolsProgram(variables)
+        (_, ok) = analyzeSilently(inp)
+        if (not ok): print(f"The semantic analysis failed for {variables} variables.")
+
+        indexed = min(analyzeSilently(inp)[0] for _ in range(0, repeat))
+        with linearSymbolTables(): linear = min(analyzeSilently(inp)[0] for _ in range(0, repeat))
+
+        print(f"{variables:>10} {indexed:>12.4f} {linear:>12.4f} {linear / indexed:>8.2f}")
+        variables *= 2
+
+def benchASTMemory(baseLines: int, steps: int):
+    """
+        Parses generated programs of a doubling number of lines (see generateProgram) and reports the peak memory usage
+        of the parse and the memory retained by the resulting AST, as traced by tracemalloc, along with the number of
+        nodes and the retained memory per node.
+    """
+    import compiler.ast as ast
+    parseSilently("", False) # Build the parser and the builtin table, which are not part of the measure.
+
+    print(f"{'LINES':>8} {'NODES':>10} {'PEAK (MiB)':>12} {'AST (MiB)':>12} {'B/NODE':>8}")
+
+    lines = baseLines
+    for _ in range(0, steps):
+        inp = generateProgram(lines)
+        gc.collect()
+
+        tracemalloc.start()
+        comp = parseSilently(inp, False)
+        (retained, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        nodes = sum(1 for o in gc.get_objects() if isinstance(o, ast.Node))
+        print(
+            f"{lines:>8} {nodes:>10} {peak / (1 << 20):>12.2f} {retained / (1 << 20):>12.2f} "
+            f"{retained / max(1, nodes):>8.1f}"
+        )
+
+        del comp
+        lines *= 2
+
+def benchFlatAST(baseLines: int, steps: int):
+    """
+        Parses generated programs of a doubling number of lines (see generateProgram), and compares the memory retained
+        by their AST as node objects and as a flat AST (see compiler/flatast.py), as traced by tracemalloc, along with
+        the size of the serialized flat AST and the time to encode and decode it.
+    """
+    from compiler.compilation import Compilation
+    from compiler.flatast import FlatAST
+    parseSilently("", False) # Build the parser and the builtin table, which are not part of the measure.
+
+    print(
+        f"{'LINES':>8} {'NODES':>10} {'OBJECTS (MiB)':>14} {'FLAT (MiB)':>11} {'RATIO':>6} {'BYTES (MiB)':>12} "
+        f"{'ENCODE (s)':>11} {'DECODE (s)':>11}"
+    )
+
+    lines = baseLines
+    for _ in range(0, steps):
+        inp = generateProgram(lines)
+        comp = Compilation()
+        gc.collect()
+
+        tracemalloc.start()
+        with contextlib.redirect_stdout(io.StringIO()): pout = comp.parse(inp)
+        (objects, _) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Encoding resolves the rows and columns of the token positions (see lexer.TokenPos), which are kept by the
+        #   tokens, so the flat AST is only measured on a second encoding.
+        encode = timeit(lambda: FlatAST.fromNode(pout), 1)
+        tracemalloc.start()
+        flat = FlatAST.fromNode(pout)
+        (flatSize, _) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        decode = timeit(lambda: flat.node(), 1)
+        size = len(flat.toBytes())
+        print(
+            f"{lines:>8} {len(flat):>10} {objects / (1 << 20):>14.2f} {flatSize / (1 << 20):>11.2f} "
+            f"{objects / flatSize:>6.2f} {size / (1 << 20):>12.2f} {encode:>11.4f} {decode:>11.4f}"
+        )
+
+        del comp, pout, flat
+        lines *= 2
+
+def benchASTDump(baseLines: int, steps: int):
+    """
+        Dumps the AST of generated programs of a doubling number of lines (see generateProgram) as a JSON string (see
+        Node#toJSONString), as streamed JSON and on the binary format (see compiler/astdump.py), and reports the time,
+        peak memory usage (as traced by tracemalloc) and size of each.
+    """
+    from compiler.compilation import Compilation
+    from compiler.astdump import writeAST, writeJSON
+    parseSilently("", False) # Build the parser and the builtin table, which are not part of the measure.
+
+    def dumpJSON(pout, path):
+        with open(path, "w") as f: f.write(pout.toJSONString())
+
+    def dumpStream(pout, path):
+        with open(path, "w") as f: writeJSON(pout, f)
+
+    def dumpBinary(pout, path):
+        with open(path, "wb") as f: writeAST(pout, f)
+
+    print(f"{'LINES':>8} {'FORMAT':>8} {'TIME (s)':>10} {'PEAK (MiB)':>12} {'SIZE (MiB)':>12}")
+
+    lines = baseLines
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for _ in range(0, steps):
+            comp = Compilation()
+            with contextlib.redirect_stdout(io.StringIO()): pout = comp.parse(generateProgram(lines))
+            # Resolve the token positions (see lexer.TokenPos) beforehand, so that both formats are measured alike.
+            pout.toJSON()
+
+            for (mode, dump) in [("json", dumpJSON), ("stream", dumpStream), ("binary", dumpBinary)]:
+                path = os.path.join(tmpdir, f"ast.{mode}")
+                elapsed = timeit(lambda: dump(pout, path), 1)
+
+                tracemalloc.start()
+                dump(pout, path)
+                (_, peak) = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                print(
+                    f"{lines:>8} {mode:>8} {elapsed:>10.4f} {peak / (1 << 20):>12.2f} "
+                    f"{os.path.getsize(path) / (1 << 20):>12.2f}"
+                )
+
+            del comp, pout
+            lines *= 2
+
+def benchCache(scale: int, repeat: int):
+    """
+        Compiles the test suite cases (see loadCorpus), each repeated a given number of times, without the compilation
+        cache (see compiler/cache.py), on an empty cache, on a warm cache, and on a cache holding only the syntax stage
+        (as after a change to the code generator), and reports the time taken by each.
+    """
+    from compiler.compilation import Compilation
+    from compiler.cache import CompilationCache, STAGE_SYNTAX, STAGE_CODE, compileCached
+    corpus = [src for (_, src) in loadCorpus()]
+    # Each repetition is made a distinct source, with a trailing comment, in order not to hit the cache.
+    sources = [f"{src}\n{{ {i} }}" for i in range(0, scale) for src in corpus]
+    parseSilently("", False) # Build the parser and the builtin table, which are not part of the measure.
+
+    def compileAll(cache):
+        for src in sources:
+            try:
+                if (cache != None): compileCached(src, cache)
+                else:
+                    comp = Compilation()
+                    pout = comp.parse(src)
+                    if (pout == None or len(comp.getParserDiagnostics()) != 0): continue
+                    if (comp.analyze(pout) and len(comp.getSemanticDiagnostics()) == 0): comp.generate(pout)
+            except Exception:
+                pass # Crashes of the compiler are not part of the measure.
+
+    print(f"{len(sources)} sources.")
+    print(f"{'MODE':>8} {'TIME (s)':>10}")
+    with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(io.StringIO()):
+        cache = CompilationCache(os.path.join(tmpdir, "cache"))
+
+        def dropStage(stage):
+            for name in os.listdir(cache.root):
+                if (name.startswith(f"{stage}-")): os.remove(os.path.join(cache.root, name))
+
+        results = [
+            ("none", timeit(lambda: compileAll(None), repeat)),
+            ("cold", timeit(lambda: (cache.clear(), compileAll(cache)), repeat)),
+            ("syntax", timeit(lambda: (dropStage(STAGE_CODE), compileAll(cache)), repeat)),
+            ("warm", timeit(lambda: compileAll(cache), repeat)),
+        ]
+
+    for (mode, elapsed) in results: print(f"{mode:>8} {elapsed:>10.4f}")
+
+def benchIncremental(baseActivatables: int, steps: int, statements: int, repeat: int):
+    """
+        Analyses and generates programs of a doubling number of activatables (see generateActivatablesProgram) from
+        scratch, and incrementally (see compiler/incremental.py) after editing one of their activatables, and reports
+        the time taken by each. The parsing is not part of the measure.
+    """
+    from compiler.compilation import Compilation
+    from compiler.incremental import IncrementalUnit
+    parseSilently("", False) # Build the parser and the builtin table, which are not part of the measure.
+
+    def parse(src, unit = None):
+        comp = Compilation(unit = unit)
+        with contextlib.redirect_stdout(io.StringIO()): pout = comp.parse(src)
+        return (comp, pout)
+
+    def compile(comp, pout):
+        assert comp.analyze(pout)
+        return comp.generate(pout)
+
+    print(f"{'ACTS':>6} {'FULL (s)':>10} {'INCR (s)':>10} {'SPEEDUP':>8}")
+
+    activatables = baseActivatables
+    for _ in range(0, steps):
+        original = generateActivatablesProgram(activatables, statements)
+        edited = generateActivatablesProgram(activatables, statements, activatables // 2)
+
+        # Each run parses the program again, as the analysis binds symbols on the AST. Incremental runs start from a
+        #   unit holding the original program. Neither is part of the measure.
+        (full, best) = (None, None)
+        for _ in range(0, repeat):
+            (comp, pout) = parse(edited)
+            start = time.perf_counter()
+            compile(comp, pout)
+            elapsed = time.perf_counter() - start
+            if (full == None or elapsed < full): full = elapsed
+
+            unit = IncrementalUnit()
+            compile(*parse(original, unit))
+            (comp, pout) = parse(edited, unit)
+            start = time.perf_counter()
+            compile(comp, pout)
+            elapsed = time.perf_counter() - start
+            if (best == None or elapsed < best): best = elapsed
+
+        print(f"{activatables:>6} {full:>10.4f} {best:>10.4f} {full / best:>7.1f}x")
+        activatables *= 2
+def benchEWVM(baseIterations: int, steps: int, repeat: int):
+    """
+        Runs EWVM loops of a doubling number of iterations (see generateEWVMLoop) on the local interpreter (see
+        compiler/ewvm.py), and reports the time taken to assemble and run each, along with the instructions executed.
+    """
+    from compiler.ewvm import Machine, assemble
+    print(f"{'ITERS':>9} {'INSTRS':>10} {'ASM (ms)':>9} {'RUN (s)':>9} {'MINSTR/S':>9}")
+
+    iterations = baseIterations
+    for _ in range(0, steps):
+        text = generateEWVMLoop(iterations)
+        program = assemble(text)
+        res = Machine(program).run()
+        assert res.error == None and res.output == str(iterations * (iterations - 1) // 2)
+
+        asm = timeit(lambda: assemble(text), repeat)
+        run = timeit(lambda: Machine(program).run(), repeat)
+        print(f"{iterations:>9} {res.steps:>10} {asm * 1000:>9.3f} {run:>9.4f} {res.steps / run / 1e6:>9.2f}")
+        iterations *= 4
+
+def benchPeephole(maxSteps: int):
+    """
+        Compiles the project cases (see loadProjPrograms) with and without the peephole optimizer (see
+        compiler/optim.py), runs both on the local EWVM interpreter, and reports the instructions emitted and executed by
+        each, along with the instructions removed by each rule.
+    """
+    from compiler.compilation import Compilation
+    from compiler.ewvm import runProgram
+    from compiler.optim import PeepholeOptimizer
+    print(f"{'CASE':<6} {'EMITTED':>8} {'OPTIM':>8} {'EXECUTED':>9} {'OPTIM':>8}  {'STATUS':<8} REMOVED")
+
+    def compile(src, optimizer):
+        comp = Compilation(optimizer = optimizer)
+        with contextlib.redirect_stdout(io.StringIO()):
+            pout = comp.parse(src)
+            if (pout == None or not comp.analyze(pout)): return None
+            return comp.generate(pout)
+
+    totals = [0, 0, 0, 0]
+    for (name, src, inputs) in loadProjPrograms():
+        code = compile(src, None)
+        if (code == None):
+            print(f"{name:<6} {'-':>8} {'-':>8} {'-':>9} {'-':>8}  {'INVALID':<8}")
+            continue
+
+        optimizer = PeepholeOptimizer()
+        optimized = compile(src, optimizer)
+
+        (res, ores) = (runProgram(code, inputs, maxSteps), runProgram(optimized, inputs, maxSteps))
+        assert res.output == ores.output and (res.error == None) == (ores.error == None)
+
+        row = [len(res.program), len(ores.program), res.steps, ores.steps]
+        totals = [t + v for (t, v) in zip(totals, row)]
+        rules = ", ".join(f"{rule}: {n}" for (rule, n) in optimizer.removed.items() if (n != 0))
+        status = "OK" if (res.error == None) else "ERROR"
+        print(f"{name:<6} {row[0]:>8} {row[1]:>8} {row[2]:>9} {row[3]:>8}  {status:<8} {rules}")
+
+    print(f"{'TOTAL':<6} {totals[0]:>8} {totals[1]:>8} {totals[2]:>9} {totals[3]:>8}")
+
+def benchLoops(iterations: int, maxSteps: int):
+    """
+        Compiles the project cases (see loadProjPrograms) and generated loops (see generateNestedLoops and
+        generateInvariantLoops), runs them on the local EWVM interpreter, and reports the instructions emitted and
+        executed by each, along with the instructions executed per iteration of the generated loops, measured against a
+        run of twice as many iterations. The invariant loops are compared against the same loops with their invariants
+        hoisted by hand.
+    """
+    from compiler.compilation import Compilation
+    from compiler.ewvm import runProgram
+    print(f"{'CASE':<14} {'EMITTED':>8} {'EXECUTED':>9} {'PER ITER':>9}  {'STATUS':<8} OUTPUT")
+
+    def compile(src):
+        comp = Compilation()
+        with contextlib.redirect_stdout(io.StringIO()):
+            pout = comp.parse(src)
+            if (pout == None or not comp.analyze(pout)): return None
+            return comp.generate(pout)
+
+    generators = [
+        ("nested", lambda n: generateNestedLoops(n, 3)),
+        ("invariant", lambda n: generateInvariantLoops(n, False)),
+        ("hand hoisted", lambda n: generateInvariantLoops(n, True)),
+    ]
+    programs = [(name, src, inputs, None) for (name, src, inputs) in loadProjPrograms()]
+    programs += [(name, gen(iterations), [], gen(iterations * 2)) for (name, gen) in generators]
+    for (name, src, inputs, doubled) in programs:
+        code = compile(src)
+        if (code == None):
+            print(f"{name:<14} {'-':>8} {'-':>9} {'-':>9}  {'INVALID':<8}")
+            continue
+
+        res = runProgram(code, inputs, maxSteps)
+        perIteration = "-"
+        if (doubled != None):
+            perIteration = f"{(runProgram(compile(doubled), inputs, maxSteps).steps - res.steps) / iterations:.2f}"
+        status = "OK" if (res.error == None) else "ERROR"
+        output = res.output.strip().splitlines()[-1] if (res.output.strip() != "") else ""
+        print(f"{name:<14} {len(res.program):>8} {res.steps:>9} {perIteration:>9}  {status:<8} {output[:32]}")
+
+def benchFlow(iterations: int, maxSteps: int):
+    """
+        Compiles the project cases (see loadProjPrograms) and a program of nested conditionals (see generateBranches)
+        without optimizers, with the control flow optimizer (see compiler/flow.py), and with both the peephole and
+        control flow optimizers, runs them on the local EWVM interpreter, and reports the instructions emitted and
+        executed by each, along with the instructions and labels removed by each step of the control flow optimizer.
+    """
+    from compiler.compilation import Compilation
+    from compiler.ewvm import runProgram
+    from compiler.flow import FlowOptimizer
+    from compiler.optim import PeepholeOptimizer
+    print(
+        f"{'CASE':<9} {'EMITTED':>8} {'FLOW':>6} {'BOTH':>6} {'EXECUTED':>9} {'FLOW':>8} {'BOTH':>8}  {'STATUS':<8} " \
+        f"REMOVED"
+    )
+
+    def compile(src, optimizer, flow):
+        comp = Compilation(optimizer = optimizer, flow = flow)
+        with contextlib.redirect_stdout(io.StringIO()):
+            pout = comp.parse(src)
+            if (pout == None or not comp.analyze(pout)): return None
+            return comp.generate(pout)
+
+    programs = loadProjPrograms() + [("branches", generateBranches(iterations), [])]
+    totals = [0] * 6
+    for (name, src, inputs) in programs:
+        code = compile(src, None, None)
+        if (code == None):
+            print(f"{name:<9} {'-':>8} {'-':>6} {'-':>6} {'-':>9} {'-':>8} {'-':>8}  {'INVALID':<8}")
+            continue
+
+        flow = FlowOptimizer()
+        results = [runProgram(c, inputs, maxSteps) for c in (
+            code, compile(src, None, flow), compile(src, PeepholeOptimizer(), FlowOptimizer())
+        )]
+        assert all(res.output == results[0].output for res in results)
+        assert all((res.error == None) == (results[0].error == None) for res in results)
+
+        row = [len(res.program) for res in results] + [res.steps for res in results]
+        totals = [t + v for (t, v) in zip(totals, row)]
+        steps = ", ".join(f"{step}: {n}" for (step, n) in flow.removed.items() if (n != 0))
+        if (flow.threaded != 0): steps += f" (threaded {flow.threaded} jumps)"
+        status = "OK" if (results[0].error == None) else "ERROR"
+        print(
+            f"{name:<9} {row[0]:>8} {row[1]:>6} {row[2]:>6} {row[3]:>9} {row[4]:>8} {row[5]:>8}  {status:<8} {steps}"
+        )
+
+    print(
+        f"{'TOTAL':<9} {totals[0]:>8} {totals[1]:>6} {totals[2]:>6} {totals[3]:>9} {totals[4]:>8} {totals[5]:>8}"
+    )
+
+def benchConstantFolding(iterations: int, maxSteps: int):
+    """
+        Compiles the project cases (see loadProjPrograms), and a program made of constant expressions (see
+        generateConstantLoop), with and without the constant folder (see compiler/constfold.py), runs both on the local
+        EWVM interpreter, and reports the instructions emitted and executed by each, along with the expressions folded
+        and the references replaced.
+    """
+    from compiler.compilation import Compilation
+    from compiler.ewvm import runProgram
+    from compiler.constfold import ConstantFolder
+    print(
+        f"{'CASE':<6} {'EMITTED':>8} {'FOLDED':>8} {'EXECUTED':>9} {'FOLDED':>8}  {'STATUS':<8} {'EXPRS':>6} {'REFS':>6}"
+    )
+
+    def compile(src, folder):
+        comp = Compilation(folder = folder)
+        with contextlib.redirect_stdout(io.StringIO()):
+            pout = comp.parse(src)
+            if (pout == None or not comp.analyze(pout)): return None
+            return comp.generate(pout)
+
+    programs = loadProjPrograms() + [("loop", generateConstantLoop(iterations), [])]
+    totals = [0, 0, 0, 0]
+    for (name, src, inputs) in programs:
+        code = compile(src, None)
+        if (code == None):
+            print(f"{name:<6} {'-':>8} {'-':>8} {'-':>9} {'-':>8}  {'INVALID':<8}")
+            continue
+
+        folder = ConstantFolder()
+        folded = compile(src, folder)
+
+        # Folding replaces the references to constants, which are otherwise generated as reads of a variable, so the
+        #   output is not compared.
+        (res, fres) = (runProgram(code, inputs, maxSteps), runProgram(folded, inputs, maxSteps))
+        row = [len(res.program), len(fres.program), res.steps, fres.steps]
+        totals = [t + v for (t, v) in zip(totals, row)]
+        status = "OK" if (fres.error == None) else "ERROR"
+        print(
+            f"{name:<6} {row[0]:>8} {row[1]:>8} {row[2]:>9} {row[3]:>8}  {status:<8} " \
+            f"{folder.folded:>6} {folder.replaced:>6}"
+        )
+
+    print(f"{'TOTAL':<6} {totals[0]:>8} {totals[1]:>8} {totals[2]:>9} {totals[3]:>8}")
+
+def benchFrame(iterations: int, depth: int, steps: int, maxSteps: int):
+    """
+        Compiles programs of nested loops (see generateNestedLoops), whose outermost loop runs twice as many times on
+        each step, runs them on the local EWVM interpreter, and reports the size of the frame allocated by the generated
+        code along with the size of the operand stack once each program stopped, which should not grow with the number
+        of iterations.
+    """
+    from compiler.compilation import Compilation
+    from compiler.ewvm import runProgram
+    print(f"{'ITERATIONS':>10} {'FRAME':>6} {'EXECUTED':>10} {'STACK':>6}  OUTPUT")
+    for step in range(0, steps):
+        n = iterations * (2 ** step)
+        comp = Compilation()
+        with contextlib.redirect_stdout(io.StringIO()):
+            pout = comp.parse(generateNestedLoops(n, depth))
+            if (pout == None or not comp.analyze(pout)): raise RuntimeError("The generated program is not valid.")
+            code = comp.generate(pout)
+
+        frame = sum(int(line.split()[1]) for line in code.splitlines() if line.startswith("PUSHN "))
+        res = runProgram(code, (), maxSteps)
+        output = res.output.strip() if (res.error == None) else f"ERROR: {res.error}"
+        print(f"{n:>10} {frame:>6} {res.steps:>10} {res.stackSize:>6}  {output}")
+
+def benchCodeMemory(baseActivatables: int, steps: int, statements: int):
+    """
+        Generates the code trees of programs of a doubling number of procedures (see generateActivatablesProgram), and
+        reports the memory retained by the trees, as traced by tracemalloc, with a code point per instruction (the former
+        representation) and with the code points of instructions without operands shared. Then, reports the memory
+        retained by copies of every stack, as lists of code points and as code buffers (see codegen.CodeBuffer), which
+        is how incremental compilation keeps the code of each activatable around (see compiler/incremental.py).
+    """
+    from compiler.compilation import Compilation
+    from compiler.codegen import CodeBuffer, CodeID, buildCode
+    def build(n: int):
+        comp = Compilation()
+        with contextlib.redirect_stdout(io.StringIO()):
+            pout = comp.parse(generateActivatablesProgram(n, statements))
+            if (pout == None or not comp.analyze(pout)): raise RuntimeError("The generated program is not valid.")
+        gc.collect()
+        tracemalloc.start()
+        with comp.activate(): bld = buildCode(pout)
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return (bld, retained)
+
+    def traced(cb) -> int:
+        gc.collect()
+        tracemalloc.start()
+        res = cb()
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del res
+        return retained
+
+    print(
+        f"{'PROCS':>6} {'INSTRS':>8} {'NULLARY':>8} {'TREE (KiB)':>11} {'SHARED (KiB)':>13} {'LISTS (KiB)':>12} " \
+        f"{'BUFFERS (KiB)':>14}"
+    )
+    for step in range(0, steps):
+        n = baseActivatables * (2 ** step)
+        with unsharedCodePoints(): (_, unshared) = build(n)
+        (bld, shared) = build(n)
+
+        stacks = []
+        pending = [bld]
+        while (len(pending) > 0):
+            tree = pending.pop()
+            stacks.append(tree.stack)
+            pending += [args[0] for (p, args) in tree.stack if (p == CodeID._SUBTREE)]
+        points = [p for stack in stacks for p in stack]
+        nullary = sum(1 for p in points if (len(p[1]) == 0))
+
+        lists = traced(lambda: [[(p, list(args)) for (p, args) in stack] for stack in stacks])
+        buffers = traced(lambda: [CodeBuffer.fromStack(stack) for stack in stacks])
+        print(
+            f"{n:>6} {len(points):>8} {nullary / len(points):>8.0%} {unshared / 1024:>11.1f} {shared / 1024:>13.1f} " \
+            f"{lists / 1024:>12.1f} {buffers / 1024:>14.1f}"
+        )
+
+def benchEmission(baseActivatables: int, steps: int, statements: int, repeat: int):
+    """
+        Generates the code trees of programs of a doubling number of procedures (see generateActivatablesProgram), and
+        reports the time taken to write each out by concatenation (the former emission), by a single join and streamed
+        to a file, along with the time taken to pack it (see compiler/packed.py) and to load it, from text and packed.
+    """
+    from compiler.compilation import Compilation
+    from compiler.codegen import buildCode, transformCode, writeCode
+    from compiler.ewvm import assemble
+    from compiler.packed import PackedProgram
+    print(
+        f"{'PROCS':>6} {'LINES':>8} {'CONCAT (ms)':>12} {'JOIN (ms)':>10} {'STREAM (ms)':>12} {'PACK (ms)':>10} " \
+        f"{'ASM (ms)':>9} {'UNPACK (ms)':>12} {'TEXT (KB)':>10} {'PACKED (KB)':>12}"
+    )
+    for step in range(0, steps):
+        n = baseActivatables * (2 ** step)
+        comp = Compilation()
+        with contextlib.redirect_stdout(io.StringIO()):
+            pout = comp.parse(generateActivatablesProgram(n, statements))
+            if (pout == None or not comp.analyze(pout)): raise RuntimeError("The generated program is not valid.")
+            with comp.activate(): bld = buildCode(pout)
+
+        text = transformCode(bld)
+        assert _concatenateCode(bld) == text
+        packed = PackedProgram.fromTree(bld).toBytes()
+
+        concat = timeit(lambda: _concatenateCode(bld), repeat)
+        join = timeit(lambda: transformCode(bld), repeat)
+        def stream():
+            with open(os.devnull, "w") as f: writeCode(bld, f)
+        streamed = timeit(stream, repeat)
+        pack = timeit(lambda: PackedProgram.fromTree(bld).toBytes(), repeat)
+        asm = timeit(lambda: assemble(text), repeat)
+        unpack = timeit(lambda: PackedProgram.fromBytes(packed).program(), repeat)
+        print(
+            f"{n:>6} {text.count(chr(10)):>8} {concat * 1000:>12.2f} {join * 1000:>10.2f} {streamed * 1000:>12.2f} " \
+            f"{pack * 1000:>10.2f} {asm * 1000:>9.2f} {unpack * 1000:>12.2f} {len(text.encode()) / 1024:>10.1f} " \
+            f"{len(packed) / 1024:>12.1f}"
+        )
+
+#endregion ============== Benchmarks =============
+
+def makeCLI():
+    lexScaleCmd = CLICommand(
+        name="lexscale",
+        description="Measures how the tokenization time scales with the size of the source text"
+    )
+    lexScaleCmd.addArgument(
+        "--lines", "-n",
+        type=int,
+        default=1000,
+        help="The number of lines of the smallest generated program."
+    )
+    lexScaleCmd.addArgument(
+        "--steps", "-s",
+        type=int,
+        default=6,
+        help="The number of times the program size is doubled."
+    )
+    lexScaleCmd.addArgument(
+        "--repeat", "-r",
+        type=int,
+        default=3,
+        help="The number of runs per size. The best run is reported."
+    )
+
+    keywordsCmd = CLICommand(
+        name="keywords",
+        description="Compares the tokens/sec of the reserved table lexer against one rule per keyword on the test cases"
+    )
+    keywordsCmd.addArgument(
+        "--scale", "-x",
+        type=int,
+        default=20,
+        help="The number of times the corpus is concatenated."
+    )
+    keywordsCmd.addArgument(
+        "--repeat", "-r",
+        type=int,
+        default=3,
+        help="The number of runs per lexer. The best run is reported."
+    )
+
+    lexStreamCmd = CLICommand(
+        name="lexstream",
+        description="Compares the time and peak memory of lexing a large file read whole against streaming it"
+    )
+    lexStreamCmd.addArgument(
+        "--size", "-n",
+        type=int,
+        default=4,
+        help="The size of the generated program, in MiB."
+    )
+    lexStreamCmd.addArgument(
+        "--chunk", "-c",
+        type=int,
+        default=64,
+        help="The size of each streamed chunk, in KiB."
+    )
+
+    startupCmd = CLICommand(
+        name="startup",
+        description="Measures the import-to-first-parse time with precomputed against generated parsing tables"
+    )
+    startupCmd.addArgument(
+        "--runs", "-r",
+        type=int,
+        default=10,
+        help="The number of fresh interpreters run per mode."
+    )
+    startupCmd.addArgument(
+        "--lines", "-n",
+        type=int,
+        default=50,
+        help="The number of lines of the parsed program."
+    )
+
+    budgetCmd = CLICommand(
+        name="budget",
+        description="Checks the wall-clock time of the test CLI help and of a hello world compile against a budget"
+    )
+    budgetCmd.addArgument(
+        "--runs", "-r",
+        type=int,
+        default=5,
+        help="The number of fresh interpreters run per check. The median run is reported."
+    )
+    budgetCmd.addArgument(
+        "--help-budget",
+        type=float,
+        default=150,
+        help="The budget of the test CLI help, in milliseconds."
+    )
+    budgetCmd.addArgument(
+        "--compile-budget",
+        type=float,
+        default=400,
+        help="The budget of the hello world compile, in milliseconds."
+    )
+
+    diagnosticsCmd = CLICommand(
+        name="diagnostics",
+        description="Measures the cost of emitting diagnostics on a program with thousands of syntax errors"
+    )
+    diagnosticsCmd.addArgument(
+        "--errors", "-n",
+        type=int,
+        default=2000,
+        help="The number of syntax errors of the generated program."
+    )
+    diagnosticsCmd.addArgument(
+        "--repeat", "-r",
+        type=int,
+        default=3,
+        help="The number of runs per mode. The best run is reported."
+    )
+
+    symbolsCmd = CLICommand(
+        name="symbols",
+        description="Compares the semantic analysis time with indexed against linear symbol table lookups"
+    )
+    symbolsCmd.addArgument(
+        "--variables", "-n",
+        type=int,
+        default=500,
+        help="The number of variables of the smallest generated program. A procedure is declared per 10 variables."
+    )
+    symbolsCmd.addArgument(
+        "--steps", "-s",
+        type=int,
+        default=4,
+        help="The number of times the number of variables is doubled."
+    )
+    symbolsCmd.addArgument(
+        "--repeat", "-r",
+        type=int,
+        default=3,
+        help="The number of runs per size and lookup. The best run is reported."
+    )
+
+    astMemoryCmd = CLICommand(
+        name="astmemory",
+        description="Measures the memory used to parse generated programs and retained by their AST"
+    )
+    astMemoryCmd.addArgument(
+        "--lines", "-l",
+        type=int,
+        default=2000,
+        help="The number of lines of the smallest generated program."
+    )
+    astMemoryCmd.addArgument(
+        "--steps", "-s",
+        type=int,
+        default=4,
+        help="The number of times the number of lines is doubled."
+    )
+
+    flatASTCmd = CLICommand(
+        name="flatast",
+        description="Compares the memory retained by ASTs as node objects and as flat ASTs"
+    )
+    flatASTCmd.addArgument(
+        "--lines", "-l",
+        type=int,
+        default=2000,
+        help="The number of lines of the smallest generated program."
+    )
+    flatASTCmd.addArgument(
+        "--steps", "-s",
+        type=int,
+        default=4,
+        help="The number of times the number of lines is doubled."
+    )
+
+    astDumpCmd = CLICommand(
+        name="astdump",
+        description="Compares dumping ASTs as a JSON string, as streamed JSON and on the binary format"
+    )
+    astDumpCmd.addArgument(
+        "--lines", "-l",
+        type=int,
+        default=2000,
+        help="The number of lines of the smallest generated program."
+    )
+    astDumpCmd.addArgument(
+        "--steps", "-s",
+        type=int,
+        default=4,
+        help="The number of times the number of lines is doubled."
+    )
+
+    cacheCmd = CLICommand(
+        name="cache",
+        description="Compares compiling the test suite cases without the compilation cache, and on a cold and warm one"
+    )
+    cacheCmd.addArgument(
+        "--scale", "-x",
+        type=int,
+        default=10,
+        help="The number of (distinct) copies of each case."
+    )
+    cacheCmd.addArgument(
+        "--repeat", "-r",
+        type=int,
+        default=3,
+        help="The number of runs per mode. The best run is reported."
+    )
+
+    incrementalCmd = CLICommand(
+        name="incremental",
+        description="Compares analysing and generating a program from scratch and after editing one activatable"
+    )
+    incrementalCmd.addArgument(
+        "--activatables", "-n",
+        type=int,
+        default=25,
+        help="The number of activatables of the smallest generated program."
+    )
+    incrementalCmd.addArgument(
+        "--steps", "-s",
+        type=int,
+        default=4,
+        help="The number of times the number of activatables is doubled."
+    )
+    incrementalCmd.addArgument(
+        "--statements", "-t",
+        type=int,
+        default=10,
+        help="The number of statements of each activatable."
+    )
+    incrementalCmd.addArgument(
+        "--repeat", "-r",
+        type=int,
+        default=3,
+        help="The number of runs per size. The best run is reported."
+    )
+
+    ewvmCmd = CLICommand(
+        name="ewvm",
+        description="Measures the throughput of the local EWVM interpreter on counted loops"
+    )
+    ewvmCmd.addArgument(
+        "--iterations", "-n",
+        type=int,
+        default=1000,
+        help="The number of iterations of the smallest loop."
+    )
+    ewvmCmd.addArgument(
+        "--steps", "-s",
+        type=int,
+        default=4,
+        help="The number of times the number of iterations is quadrupled."
+    )
+    ewvmCmd.addArgument(
+        "--repeat", "-r",
+        type=int,
+        default=3,
+        help="The number of times each loop is run, keeping the best time."
+    )
+
+    peepholeCmd = CLICommand(
+        name="peephole",
+        description="Measures the instructions the peephole optimizer saves on the project cases"
+    )
+    peepholeCmd.addArgument(
+        "--max-steps",
+        type=int,
+        default=1000000,
+        help="The maximum number of instructions each program may execute."
+    )
+
+    flowCmd = CLICommand(
+        name="flow",
+        description="Measures the instructions the control flow optimizer saves on the project cases and a generated " \
+            "program"
+    )
+    flowCmd.addArgument(
+        "--iterations", "-n",
+        type=int,
+        default=1000,
+        help="The number of iterations of the loop of the generated program."
+    )
+    flowCmd.addArgument(
+        "--max-steps",
+        type=int,
+        default=1000000,
+        help="The maximum number of instructions each program may execute."
+    )
+
+    loopsCmd = CLICommand(
+        name="loops",
+        description="Measures the instructions executed by the loops of the project cases and generated programs"
+    )
+    loopsCmd.addArgument(
+        "--iterations", "-n",
+        type=int,
+        default=1000,
+        help="The number of iterations of the loops of the generated programs."
+    )
+    loopsCmd.addArgument(
+        "--max-steps",
+        type=int,
+        default=1000000,
+        help="The maximum number of instructions each program may execute."
+    )
+
+    constFoldCmd = CLICommand(
+        name="constfold",
+        description="Measures the instructions the constant folder saves on the project cases and a generated program"
+    )
+    constFoldCmd.addArgument(
+        "--iterations", "-n",
+        type=int,
+        default=1000,
+        help="The number of iterations of the loop of the generated program."
+    )
+    constFoldCmd.addArgument(
+        "--max-steps",
+        type=int,
+        default=1000000,
+        help="The maximum number of instructions each program may execute."
+    )
+
+    codeMemoryCmd = CLICommand(
+        name="codememory",
+        description="Measures the memory retained by the code trees of programs of growing size"
+    )
+    codeMemoryCmd.addArgument(
+        "--activatables", "-n",
+        type=int,
+        default=50,
+        help="The number of procedures of the smallest program."
+    )
+    codeMemoryCmd.addArgument(
+        "--steps", "-s",
+        type=int,
+        default=4,
+        help="The number of times the number of procedures is doubled."
+    )
+    codeMemoryCmd.addArgument(
+        "--statements",
+        type=int,
+        default=20,
+        help="The number of statements on the loop of each procedure."
+    )
+
+    emitCmd = CLICommand(
+        name="emit",
+        description="Measures the time taken to write out, pack and load the code of programs of growing size"
+    )
+    emitCmd.addArgument(
+        "--activatables", "-n",
+        type=int,
+        default=50,
+        help="The number of procedures of the smallest program."
+    )
+    emitCmd.addArgument(
+        "--steps", "-s",
+        type=int,
+        default=5,
+        help="The number of times the number of procedures is doubled."
+    )
+    emitCmd.addArgument(
+        "--statements",
+        type=int,
+        default=20,
+        help="The number of statements on the loop of each procedure."
+    )
+    emitCmd.addArgument(
+        "--repeat", "-r",
+        type=int,
+        default=3,
+        help="The number of times each program is written out, keeping the best time."
+    )
+
+    frameCmd = CLICommand(
+        name="frame",
+        description="Measures the stack space used by programs of nested loops as their iterations grow"
+    )
+    frameCmd.addArgument(
+        "--iterations", "-n",
+        type=int,
+        default=10,
+        help="The number of iterations of the outermost loop of the smallest program."
+    )
+    frameCmd.addArgument(
+        "--depth",
+        type=int,
+        default=3,
+        help="The number of nested loop levels."
+    )
+    frameCmd.addArgument(
+        "--steps", "-s",
+        type=int,
+        default=4,
+        help="The number of times the iterations of the outermost loop are doubled."
+    )
+    frameCmd.addArgument(
+        "--max-steps",
+        type=int,
+        default=10000000,
+        help="The maximum number of instructions each program may execute."
+    )
+
+    cli = CLI(name="Bench", description="A benchmark suite for the Standard Pascal compiler.")
+    cli.addCommand(lexScaleCmd)
+    cli.addCommand(keywordsCmd)
+    cli.addCommand(lexStreamCmd)
+    cli.addCommand(startupCmd)
+    cli.addCommand(budgetCmd)
+    cli.addCommand(diagnosticsCmd)
+    cli.addCommand(symbolsCmd)
+    cli.addCommand(astMemoryCmd)
+    cli.addCommand(flatASTCmd)
+    cli.addCommand(astDumpCmd)
+    cli.addCommand(cacheCmd)
+    cli.addCommand(incrementalCmd)
+    cli.addCommand(ewvmCmd)
+    cli.addCommand(peepholeCmd)
+    cli.addCommand(constFoldCmd)
+    cli.addCommand(flowCmd)
+    cli.addCommand(loopsCmd)
+    cli.addCommand(emitCmd)
+    cli.addCommand(codeMemoryCmd)
+    cli.addCommand(frameCmd)
+
+    return cli
+
+if __name__ == "__main__":
+    cli = makeCLI()
+    args = cli.parse()
+
+    match (args.switch()):
+        case "lexscale":
+            benchLexScale(args.lines, args.steps, args.repeat)
+        case "keywords":
+            benchKeywords(args.repeat, args.scale)
+        case "lexstream":
+            benchLexStream(args.size, args.chunk)
+        case "startup":
+            benchStartup(args.runs, args.lines)
+        case "budget":
+            if (not benchBudget(args.runs, args.help_budget, args.compile_budget)): sys.exit(1)
+        case "diagnostics":
+            benchDiagnostics(args.errors, args.repeat)
+        case "symbols":
+            benchSymbols(args.variables, args.steps, args.repeat)
+        case "astmemory":
+            benchASTMemory(args.lines, args.steps)
+        case "flatast":
+            benchFlatAST(args.lines, args.steps)
+        case "astdump":
+            benchASTDump(args.lines, args.steps)
+        case "cache":
+            benchCache(args.scale, args.repeat)
+        case "incremental":
+            benchIncremental(args.activatables, args.steps, args.statements, args.repeat)
+        case "ewvm":
+            benchEWVM(args.iterations, args.steps, args.repeat)
+        case "peephole":
+            benchPeephole(args.max_steps)
+        case "flow":
+            benchFlow(args.iterations, args.max_steps)
+        case "loops":
+            benchLoops(args.iterations, args.max_steps)
+        case "constfold":
+            benchConstantFolding(args.iterations, args.max_steps)
+        case "codememory":
+            benchCodeMemory(args.activatables, args.steps, args.statements)
+        case "emit":
+            benchEmission(args.activatables, args.steps, args.statements, args.repeat)
+        case "frame":
+            benchFrame(args.iterations, args.depth, args.steps, args.max_steps)
@@ -1,16 +1,21 @@
 import os
 import sys
+import glob
+import time
 import argparse
 import traceback
-from compiler.lexer import lexer
-from compiler.synanaler import parser
-import compiler.semanaler as semanal
-import compiler.codegen as codegen
+import contextlib
+import subprocess
 from util.cli import CLI, CLICommand
 
+# The compiler modules are imported by the commands that use them, in order for the CLI to start (and print it's help)
+#   without building the lexer, parser and builtins.
+
 g_debugMode = False
 
 def traceTokensSnippet(snippet, tracelex = True, tracesyn = False, tracediag = False):
+    from compiler.lexer import lexer
+    from compiler.synanaler import parser
     if (not snippet.endswith(".pas")): snippet += ".pas"
     with open(os.path.join(os.path.dirname(os.path.realpath(__file__)), "cases", snippet)) as sf:
         inp = sf.read()
@@ -35,6 +40,7 @@ def traceTokensSnippet(snippet, tracelex = True, tracesyn = False, tracediag = F
             # lexer.diagnostics = []
             lexer.reset()
             
+            parser.options["debug"] = g_debugMode
             pout = parser.parse(inp, lexer, g_debugMode, False, lexer.getExtendedToken)
             print(f"\x1b[32mPARSED:\x1b[0m {pout}")
             print("SYNANALDIAG:")
@@ -52,7 +58,9 @@ def traceTokensSnippet(snippet, tracelex = True, tracesyn = False, tracediag = F
                 else:
                     print("  - N/A")
 
-def dumpAST(snippet, outFile, tracelex = True, tracesyn = False, tracediag = False, verbose = False):
+def dumpAST(snippet, outFile, tracelex = True, tracesyn = False, tracediag = False, verbose = False, binary = False):
+    from compiler.lexer import lexer
+    from compiler.synanaler import parser
     if (not snippet.endswith(".pas")): snippet += ".pas"
     with open(os.path.join(os.path.dirname(os.path.realpath(__file__)), "cases", snippet)) as sf:
         inp = sf.read()
@@ -75,6 +83,7 @@ def dumpAST(snippet, outFile, tracelex = True, tracesyn = False, tracediag = Fal
         lexer.options["printDiags"] = False
         lexer.reset()
         
+        parser.options["debug"] = g_debugMode
         pout = parser.parse(inp, lexer, g_debugMode, False, lexer.getExtendedToken)
         if (tracesyn):
             print(f"\x1b[32mPARSED:\x1b[0m {pout}")
@@ -96,11 +105,16 @@ def dumpAST(snippet, outFile, tracelex = True, tracesyn = False, tracediag = Fal
                     print("  - N/A")
 
         if (pout != None):
-            jsonstr = pout.toJSONString()
             outFilePath = os.path.join(os.getcwd(), outFile)
             try:
-                with open(outFilePath, "w") as of:
-                    of.write(jsonstr)
+                if (binary):
+                    from compiler.astdump import writeAST
+                    with open(outFilePath, "wb") as of:
+                        writeAST(pout, of)
+                else:
+                    from compiler.astdump import writeJSON
+                    with open(outFilePath, "w") as of:
+                        writeJSON(pout, of)
                 print(f"\x1b[32mSuccessfully dumped AST to:\x1b[0m", outFilePath)
             except BaseException as e:
                 print(f"\x1b[31mCould not dump AST: Unable to open output file:\x1b[0m", outFilePath)
@@ -109,15 +123,27 @@ def dumpAST(snippet, outFile, tracelex = True, tracesyn = False, tracediag = Fal
         else:
             print(f"\x1b[31mCould not dump AST: Parser output is nil.\x1b[0m")
 
-def fullTest(snippet, traceall = False, tracediag = False, verbose = False, dumpAST = False, outFile = None):
+def fullTest(
+    snippet, traceall = False, tracediag = False, verbose = False, dumpAST = False, outFile = None, stream = False, 
+    useCache = False, packed = False
+):
+    from compiler.lexer import lexer
+    from compiler.synanaler import parser
+    import compiler.semanaler as semanal
+    import compiler.codegen as codegen
     if (not snippet.endswith(".pas")): snippet += ".pas"
+    # Tracing and streaming are meant to run every phase, and the cache only holds textual code, so those skip it.
+    if (useCache and not (traceall or stream or packed)): return cachedTest(snippet, tracediag, verbose, dumpAST, outFile)
+
     with open(os.path.join(os.path.dirname(os.path.realpath(__file__)), "cases", snippet)) as sf:
-        inp = sf.read()
+        # When streaming, the source file is lexed in chunks instead of being read whole (see lexer.inputStream).
+        inp = None if stream else sf.read()
 
         # Lexical Analysis
         if (traceall):
             lexer.options["printDiags"] = True
-            lexer.input(inp)
+            if (stream): lexer.inputStream(sf)
+            else: lexer.input(inp)
             while tok := lexer.token():
                 print(f"\x1b[36mTOKEN:\x1b[0m {tok}")
             
@@ -135,8 +161,12 @@ def fullTest(snippet, traceall = False, tracediag = False, verbose = False, dump
         
         lexer.options["printDiags"] = False
         lexer.reset()
+        if (stream):
+            sf.seek(0)
+            lexer.inputStream(sf)
         
         # Syntatic Analysis
+        parser.options["debug"] = g_debugMode
         pout = parser.parse(inp, lexer, g_debugMode, False, lexer.getExtendedToken)
         if (tracediag):
             print(f"\x1b[32mPARSED:\x1b[0m {pout}")
@@ -163,11 +193,11 @@ def fullTest(snippet, traceall = False, tracediag = False, verbose = False, dump
 
         # Optional AST dump
         if (dumpAST):
-            jsonstr = pout.toJSONString()
+            from compiler.astdump import writeJSON
             outFilePath = os.path.join(os.getcwd(), outFile)
             try:
                 with open(outFilePath, "w") as of:
-                    of.write(jsonstr)
+                    writeJSON(pout, of)
                 print(f"\x1b[32mSuccessfully dumped AST to:\x1b[0m", outFilePath)
             except BaseException as e:
                 print(f"\x1b[31mCould not dump AST: Unable to open output file:\x1b[0m", outFilePath)
@@ -180,7 +210,7 @@ def fullTest(snippet, traceall = False, tracediag = False, verbose = False, dump
             return
 
         # Semantic Analysis
-        semanal.SA_STATE["debug"] = g_debugMode
+        semanal.getState()["debug"] = g_debugMode
         semVeredict = semanal.analyzeSemantics(pout)
         if (semVeredict == False):
             print(f"\x1b[31mInvalid program: Semantic analysis errored out.\x1b[0m")
@@ -200,10 +230,1293 @@ def fullTest(snippet, traceall = False, tracediag = False, verbose = False, dump
             print(f"\x1b[31mInvalid program: Semantic analysis errored out.\x1b[0m")
             return
 
-        outFilePath = os.path.join(os.getcwd(), "out", f"{snippet.split(os.path.sep)[-1].replace('.pas', '.ewvm')}")
-        codegen.emitCode(pout, outFilePath)
+        ext = ".pewvm" if packed else ".ewvm"
+        outFilePath = os.path.join(os.getcwd(), "out", f"{snippet.split(os.path.sep)[-1].replace('.pas', ext)}")
+        try:
+            codegen.emitCode(pout, outFilePath, packed)
+        except codegen.CodegenError:
+            print(f"\x1b[31mInvalid program: Code generation errored out.\x1b[0m")
+            return
         print(f"\x1b[32mSuccessfully wrote output to:\x1b[0m", outFilePath)
 
+def cachedTest(snippet, tracediag = False, verbose = False, dumpAST = False, outFile = None):
+    """
+        Runs a test suite case as fullTest does, skipping the phases whose results are cached (see compiler/cache.py).
+        Diagnostics are printed as the phases emit them, so the diagnostics of the phases that were skipped are printed
+        from the cache instead.
+    """
+    from compiler.cache import CompilationCache, compileCached
+    with open(os.path.join(os.path.dirname(os.path.realpath(__file__)), "cases", snippet)) as sf:
+        inp = sf.read()
+
+    cache = CompilationCache()
+    res = compileCached(inp, cache, g_debugMode)
+    if (len(res.cached) != 0): print(f"\x1b[36mCached:\x1b[0m {', '.join(res.cached)} ({cache.root})")
+
+    def printDiagnostics(header, diags, cached):
+        if (not tracediag and not (cached and len(diags) != 0)): return
+        print(header)
+        if (len(diags) != 0):
+            for diag in diags:
+                print("  -", diag.toString(None))
+                if (verbose): print("  --", diag)
+        else:
+            print("  - N/A")
+
+    synCached = "syn" in res.cached
+    printDiagnostics("LEXDIAG:", res.lexerDiagnostics, synCached)
+    printDiagnostics("SYNANALDIAG:", res.parserDiagnostics, synCached)
+
+    pout = res.getAST()
+    if (pout == None):
+        print(f"\x1b[31mInvalid program: Syntatic analysis errored out with critical error.\x1b[0m")
+        return
+
+    if (dumpAST):
+        from compiler.astdump import writeJSON
+        outFilePath = os.path.join(os.getcwd(), outFile)
+        try:
+            with open(outFilePath, "w") as of:
+                writeJSON(pout, of)
+            print(f"\x1b[32mSuccessfully dumped AST to:\x1b[0m", outFilePath)
+        except BaseException as e:
+            print(f"\x1b[31mCould not dump AST: Unable to open output file:\x1b[0m", outFilePath)
+            print('  '.join(traceback.format_exception(e)))
+
+    if (res.status == "SYNTAX"):
+        print(f"\x1b[31mInvalid program: Syntatic analysis errored out.\x1b[0m")
+        return
+
+    if (res.semVerdict == False): print(f"\x1b[31mInvalid program: Semantic analysis errored out.\x1b[0m")
+    printDiagnostics("SEMANALDIAG:", res.semanticDiagnostics, "gen" in res.cached)
+    if (res.status == "SEMANTIC"):
+        print(f"\x1b[31mInvalid program: Semantic analysis errored out.\x1b[0m")
+        return
+    printDiagnostics("CODEGENDIAG:", res.codegenDiagnostics, "gen" in res.cached)
+    if (res.status == "CODEGEN"):
+        print(f"\x1b[31mInvalid program: Code generation errored out.\x1b[0m")
+        return
+
+    outFilePath = os.path.join(os.getcwd(), "out", f"{snippet.split(os.path.sep)[-1].replace('.pas', '.ewvm')}")
+    os.makedirs(os.path.dirname(outFilePath), exist_ok = True)
+    with open(outFilePath, "w+") as f:
+        f.write(res.code)
+    print(f"\x1b[32mSuccessfully wrote output to:\x1b[0m", outFilePath)
+
+def compileSource(src, transform = None, unit = None, optimizer = None, folder = None, packed = False, flow = None):
+    """
+        Compiles a source text on it's own compilation (see compiler/compilation.py) and returns a summary of the result:
+        the generated code if the program is valid, otherwise the phase that errored out and it's diagnostics.
+        If given, the AST is passed through transform before being analysed, and the compilation is run on the given
+        incremental unit (see compiler/incremental.py), constant folder (see compiler/constfold.py), peephole optimizer
+        (see compiler/optim.py) and control flow optimizer (see compiler/flow.py). If requested, the code is packed (see
+        compiler/packed.py).
+    """
+    from compiler.compilation import Compilation
+    comp = Compilation(unit = unit, optimizer = optimizer, folder = folder, flow = flow)
+    try:
+        pout = comp.parse(src)
+        diags = comp.getLexerDiagnostics() + comp.getParserDiagnostics()
+        if (pout == None or len(diags) != 0): return ("SYNTAX", sorted(map(repr, diags)))
+        if (transform != None): pout = transform(pout)
+
+        semVeredict = comp.analyze(pout)
+        semDiags = comp.getSemanticDiagnostics()
+        if (semVeredict == False or len(semDiags) != 0): return ("SEMANTIC", sorted(map(repr, semDiags)))
+
+        code = comp.generate(pout, packed)
+        if (code == None): return ("CODEGEN", sorted(map(repr, comp.getCodegenDiagnostics())))
+        return ("CODE", code)
+    except Exception as e:
+        return ("EXCEPTION", repr(e))
+
+@contextlib.contextmanager
+def quietly():
+    """
+        Silences the diagnostics printed by every phase of the compilations run within the context.
+    """
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull): yield
+
+def reportChecks(failures: int, passed: str, failed: str) -> bool:
+    """
+        Presents the summary of a test command, in green if none of it's checks failed (and in red otherwise), and
+        returns whether none failed.
+    """
+    if (failures == 0): print(f"\x1b[32m{passed}\x1b[0m")
+    else: print(f"\x1b[31m{failed}\x1b[0m")
+    return failures == 0
+
+def stressTest(threads, rounds):
+    """
+        Compiles the whole test suite concurrently, on a pool of threads, a given number of times, and checks that every
+        result is identical to the result of compiling each case sequentially.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from tests.bench import loadCorpus
+    corpus = loadCorpus()
+    print(f"Compiling {len(corpus)} cases {rounds} times on {threads} threads.")
+
+    # Diagnostics are printed by every phase. Silence them, as output from concurrent compilations is interleaved.
+    with quietly():
+        expected = [compileSource(src) for (_, src) in corpus]
+
+        with ThreadPoolExecutor(max_workers = threads) as pool:
+            jobs = [(i, pool.submit(compileSource, src)) for _ in range(0, rounds) for (i, (_, src)) in enumerate(corpus)]
+            results = [(i, job.result()) for (i, job) in jobs]
+
+    mismatches = 0
+    for (i, result) in results:
+        if (result != expected[i]):
+            mismatches += 1
+            print(f"\x1b[31mMismatch:\x1b[0m {corpus[i][0]}")
+
+    return reportChecks(
+        mismatches,
+        f"All {len(results)} concurrent compilations matched their sequential result.",
+        f"{mismatches} out of {len(results)} concurrent compilations mismatched."
+    )
+
+def cacheTest():
+    """
+        Compiles every test suite case through an empty compilation cache (see compiler/cache.py), then again through
+        the now warm cache, and checks that both runs have the same outcome, and that every diagnostic read from the
+        cache is presented as the one that was cached.
+    """
+    import tempfile
+    from compiler.cache import CompilationCache, compileCached
+    from tests.bench import loadCorpus
+    failures = 0
+    warm = 0
+    def compile(src, cache):
+        # Cases the front end crashes on are expected to crash the same from the cache.
+        try:
+            with quietly():
+                return compileCached(src, cache)
+        except Exception as e:
+            return repr(e)
+
+    def summarize(res):
+        if (isinstance(res, str)): return ("EXCEPTION", res)
+        diags = res.lexerDiagnostics + res.parserDiagnostics + res.semanticDiagnostics + res.codegenDiagnostics
+        # Arguments are cached as their text (see cache.encodeDiagnostic), so diagnostics are compared as presented.
+        return (res.status, res.code, [d.toString(None) for d in diags])
+
+    with tempfile.TemporaryDirectory() as root:
+        cache = CompilationCache(root)
+        for (path, src) in loadCorpus():
+            (cold, res) = (compile(src, cache), compile(src, cache))
+            try:
+                (expected, actual) = (summarize(cold), summarize(res))
+            except Exception as e:
+                failures += 1
+                print(f"\x1b[31mFailed:\x1b[0m {path} {e!r}")
+                continue
+            if (actual != expected):
+                failures += 1
+                print(f"\x1b[31mMismatch:\x1b[0m {path} {expected[0]} {actual[0]}")
+                continue
+            if (isinstance(res, str) or len(res.cached) == 0): continue
+            warm += 1
+            if (g_debugMode): print(f"{path}: {res.status}, {len(actual[2])} diagnostics, cached {', '.join(res.cached)}")
+
+    return reportChecks(
+        failures,
+        f"All {warm} cases compiled from a warm cache as they did from a cold one.",
+        f"{failures} cache checks failed."
+    )
+
+def flatASTTest():
+    """
+        Encodes the AST of every test suite case as a flat AST (see compiler/flatast.py), serializes and deserializes it,
+        and checks that the decoded tree dumps and compiles exactly as the original one.
+    """
+    from compiler.compilation import Compilation
+    from compiler.constfold import ConstantFolder
+    from compiler.flatast import FlatAST
+    from tests.bench import loadCorpus
+    corpus = loadCorpus()
+    
+    def roundTrip(pout):
+        flat = FlatAST.fromBytes(FlatAST.fromNode(pout).toBytes())
+        decoded = flat.node()
+        if (decoded.toJSONString() != pout.toJSONString()): raise AssertionError("AST dump mismatch")
+        return decoded
+
+    mismatches = 0
+    with quietly():
+        results = [(name, compileSource(src), compileSource(src, roundTrip)) for (name, src) in corpus]
+
+    for (name, expected, result) in results:
+        if (result != expected):
+            mismatches += 1
+            print(f"\x1b[31mMismatch:\x1b[0m {name} {result[1] if result[0] == 'EXCEPTION' else ''}")
+
+    # The constant folder may leave both zeros on a tree, which must not be pooled as the same constant.
+    comp = Compilation(folder = ConstantFolder())
+    with quietly(), comp.activate():
+        pout = comp.parse(_CONSTFOLD_PROGRAM % "a := 1; WriteLn(0.0); WriteLn(0.0 * (0 - 1.0))")
+        comp.analyze(pout)
+        comp.folder.run(pout)
+    try:
+        roundTrip(pout)
+    except AssertionError:
+        mismatches += 1
+        print(f"\x1b[31mMismatch:\x1b[0m signed zeros were not decoded as they were encoded.")
+
+    return reportChecks(
+        mismatches,
+        f"All {len(results)} decoded flat ASTs compiled as their original AST, and signed zeros were kept.",
+        f"{mismatches} flat AST checks failed."
+    )
+
+def incrementalTest(activatables, statements):
+    """
+        Compiles successive versions of a generated program (see generateActivatablesProgram) on the same incremental
+        unit (see compiler/incremental.py), and checks that only the edited activatables are analysed and generated
+        again, and that the generated code is identical to the code of a compilation from scratch. Also checks that
+        every test suite case compiles the same when compiled again on it's unit, and that editing an activatable
+        changes the keys of it's dependants.
+    """
+    from compiler.compilation import Compilation
+    from compiler.incremental import IncrementalUnit
+    from tests.bench import generateActivatablesProgram, loadCorpus
+    failures = 0
+    def check(name, cond, detail = ""):
+        nonlocal failures
+        if (not cond):
+            failures += 1
+            print(f"\x1b[31mFailed:\x1b[0m {name} {detail}")
+
+    names = [f"p{i}" for i in range(0, activatables)]
+    edited = activatables // 2
+    versions = [
+        ("initial", generateActivatablesProgram(activatables, statements), names),
+        ("unchanged", generateActivatablesProgram(activatables, statements), []),
+        ("moved", generateActivatablesProgram(activatables, statements, None, 5), []),
+        ("edited", generateActivatablesProgram(activatables, statements, edited, 5), [f"p{edited}"]),
+        ("reverted", generateActivatablesProgram(activatables, statements), [f"p{edited}"]),
+    ]
+
+    unit = IncrementalUnit()
+    with quietly():
+        results = []
+        for (name, src, _) in versions:
+            result = compileSource(src, None, unit)
+            state = { k: list(getattr(unit, k)) for k in ("analysed", "generated", "spliced") }
+            results.append((name, compileSource(src), result, state))
+        corpus = [
+            (name, compileSource(src, None, unit), compileSource(src, None, unit))
+            for (name, src) in loadCorpus() for unit in [IncrementalUnit()]
+        ]
+
+    for ((name, expected, result, state), (_, _, changed)) in zip(results, versions):
+        check(name, expected[0] == "CODE" and result == expected, result[1] if result[0] != "CODE" else "")
+        check(f"{name} (analysed)", state["analysed"] == changed, state["analysed"])
+        check(f"{name} (generated)", state["generated"] == changed, state["generated"])
+        check(f"{name} (spliced)", len(state["spliced"]) == activatables - len(changed), state["spliced"])
+
+    for (name, first, second) in corpus: check(name, first == second)
+
+    # Calls between activatables do not pass the analysis yet, so the dependencies are only checked on the keys.
+    src = generateActivatablesProgram(activatables, statements)
+    def keysOf(src):
+        comp = Compilation(unit = unit)
+        with quietly(): pout = comp.parse(src)
+        unit.prepare(pout)
+        return unit.getKeys()
+
+    caller = "procedure q(n: Integer);\nbegin\n    p0(n)\nend;\nbegin\n    x := 1;"
+    before = keysOf(src.replace("begin\n    x := 1;", caller))
+    after = keysOf(src.replace("WriteLn('p0')", "WriteLn('p0*')").replace("begin\n    x := 1;", caller))
+    check("dependants", [n for n in before if before[n] != after[n]] == ["p0", "q"])
+
+    return reportChecks(
+        failures,
+        f"All {len(versions)} versions compiled incrementally as from scratch, along with all " \
+        f"{len(corpus)} test suite cases.",
+        f"{failures} incremental compilation checks failed."
+    )
+
+def dumpCheckTest(depth):
+    """
+        Dumps the AST of every test suite case as streamed JSON and on the binary format (see compiler/astdump.py), and
+        checks that the JSON dump is identical to Node#toJSONString, and that the binary dump loads back as it's value.
+        Then, dumps an expression nested to a given depth, which is deeper than Node#toJSON can recurse.
+    """
+    import io
+    import json
+    from compiler.compilation import Compilation
+    from compiler.astdump import dumpAST, loadAST, writeJSON
+    from tests.bench import loadCorpus
+    corpus = loadCorpus()
+    (mismatches, checked) = (0, 0)
+    for (name, src) in corpus:
+        comp = Compilation()
+        try:
+            with quietly(): pout = comp.parse(src)
+        except Exception:
+            continue # Crashes of the syntatic analyser are covered by the test suite itself.
+        if (pout == None): continue
+
+        checked += 1
+        data = dumpAST(pout)
+        jsonstr = pout.toJSONString()
+        out = io.StringIO()
+        writeJSON(pout, out)
+        if (out.getvalue() != jsonstr or loadAST(data) != json.loads(jsonstr)):
+            mismatches += 1
+            print(f"\x1b[31mMismatch:\x1b[0m {name}")
+        elif (g_debugMode):
+            print(f"{name}: {len(data)} bytes, {len(jsonstr.encode('utf-8'))} bytes as JSON.")
+
+    passed = reportChecks(
+        mismatches,
+        f"All {checked} streamed AST dumps matched Node#toJSON.",
+        f"{mismatches} out of {checked} streamed AST dumps mismatched."
+    )
+
+    src = f"program Deep;\nvar a: Integer;\nbegin\n    a := {' + '.join(['a'] * depth)}\nend."
+    pout = Compilation().parse(src)
+    try:
+        writeJSON(pout, io.StringIO())
+        loadAST(dumpAST(pout))
+        print(f"\x1b[32mDumped an expression nested {depth} levels deep.\x1b[0m")
+    except RecursionError:
+        print(f"\x1b[31mCould not dump an expression nested {depth} levels deep.\x1b[0m")
+        return False
+
+    return passed
+
+def loadProgram(target, optimizer = None, folder = None, packed = False, flow = None):
+    """
+        Reads the text of an EWVM program, or the bytes of a packed program (.pewvm, see compiler/packed.py), or
+        compiles it from a test suite case (a target ending in .pas, or naming a case), with the given peephole
+        optimizer, constant folder and control flow optimizer, packed if requested. Returns None if the case does not
+        compile.
+    """
+    if (target.endswith(".ewvm")):
+        with open(target) as f: return f.read()
+    if (target.endswith(".pewvm")):
+        with open(target, "rb") as f: return f.read()
+
+    if (not target.endswith(".pas")): target += ".pas"
+    path = target
+    if (not os.path.exists(path)): path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "cases", target)
+    with open(path) as f: src = f.read()
+    with quietly():
+        (status, code) = compileSource(src, optimizer = optimizer, folder = folder, packed = packed, flow = flow)
+    return code if (status == "CODE") else None
+
+def runTest(
+    targets, inputs, counts = False, maxSteps = None, optimize = False, fold = False, packed = False, flow = False
+):
+    """
+        Runs EWVM programs on the local interpreter (see compiler/ewvm.py), with the given input lines, and presents
+        their output and the number of instructions they executed. Each target is either an EWVM program, textual or
+        packed, or a test suite case, which is compiled first (see loadProgram), folded, optimized (by the peephole and
+        control flow optimizers) and packed if requested. Without targets, every program on the out directory is run.
+    """
+    from compiler.ewvm import EWVMError, runProgram
+    from compiler.optim import PeepholeOptimizer
+    from compiler.constfold import ConstantFolder
+    from compiler.flow import FlowOptimizer
+    from compiler.packed import runPacked
+    if (len(targets) == 0):
+        targets = sorted(
+            glob.glob(os.path.join(os.getcwd(), "out", "**", "*.ewvm"), recursive = True) +
+            glob.glob(os.path.join(os.getcwd(), "out", "**", "*.pewvm"), recursive = True)
+        )
+
+    ok = True
+    for target in targets:
+        print(f"\x1b[36m{target}\x1b[0m")
+        try:
+            code = loadProgram(
+                target, PeepholeOptimizer() if optimize else None, ConstantFolder() if fold else None, packed,
+                FlowOptimizer() if flow else None
+            )
+            if (code == None):
+                print(f"\x1b[31mInvalid program: Compilation errored out.\x1b[0m")
+                ok = False
+                continue
+            res = runPacked(code, inputs, maxSteps) if isinstance(code, bytes) else runProgram(code, inputs, maxSteps)
+        except (OSError, ValueError, EWVMError) as e:
+            print(f"\x1b[31m{e}\x1b[0m")
+            ok = False
+            continue
+
+        sys.stdout.write(res.output)
+        if (res.output != "" and not res.output.endswith("\n")): print()
+        if (res.error != None):
+            print(f"\x1b[31mRuntime error:\x1b[0m {res.error}")
+            ok = False
+        print(f"Executed {res.steps} instructions.")
+        if (counts):
+            for (name, n) in res.counts().items(): print(f"    {name:<10} {n:>10}")
+
+    return ok
+
+# Programs run by ewvmTest, each along with it's input lines and either it's expected output or the line and the start
+#   of the message of it's expected error. Programs naming a test suite case are compiled first.
+_EWVM_CASES = [
+    ("arithmetic", """
+        PUSHI 7
+        PUSHI -2
+        DIV
+        WRITEI
+        PUSHS " "
+        WRITES
+        PUSHI -7
+        PUSHI 2
+        MOD
+        WRITEI
+        PUSHS " "
+        WRITES
+        PUSHF 1.5
+        PUSHI 2
+        FMUL
+        WRITEF
+        PUSHS " "
+        WRITES
+        PUSHF 0.1
+        PUSHF 0.2
+        FADD
+        WRITEF
+        PUSHS " "
+        WRITES
+        PUSHI 1
+        PUSHI 2
+        INF
+        PUSHI 0
+        NOT
+        AND
+        WRITEI
+    """, [], "-3 -1 3 0.30000000000000004 1"),
+    ("strings", """
+        PUSHS "ab"
+        PUSHS "c: \\"d\\""
+        CONCAT
+        DUP 1
+        WRITES
+        STRLEN
+        WRITEI
+        PUSHS "41"
+        ATOI
+        PUSHI 1
+        ADD
+        WRITEI
+        PUSHS "xyz"
+        PUSHI 1
+        CHARAT
+        WRITECHR
+        PUSHI 10
+        STRI
+        WRITES
+        WRITELN
+    """, [], 'abc: "d"842y10\n'),
+    ("memory", """
+        PUSHN 2
+        PUSHI 4
+        STOREG 1
+        PUSHG 1
+        WRITEI
+        PUSHGP
+        LOAD 1
+        WRITEI
+        ALLOC 2
+        DUP 1
+        PUSHI 9
+        STORE 1
+        LOAD 1
+        WRITEI
+        PUSHFP
+        PUSHI 0
+        PUSHI 5
+        STOREN
+        PUSHL 0
+        WRITEI
+    """, [], "4495"),
+    ("calls", """
+        PUSHI 3
+        PUSHA Twice
+        CALL
+        WRITEI
+        STOP
+        Twice: PUSHL -1
+        PUSHI 2
+        MUL
+        STOREL -1
+        RETURN
+    """, [], "6"),
+    ("input", """
+        PUSHI 0
+        Loop: READ
+        ATOI
+        DUP 1
+        JZ End
+        PUSHL 0
+        ADD
+        STOREL 0
+        JUMP Loop
+        End: POP 1
+        PUSHL 0
+        WRITEI
+    """, ["1", "2", "39", "0"], "42"),
+    ("division by zero", "PUSHI 1\nPUSHI 0\nDIV", [], (3, "DIV: Division by zero.")),
+    ("illegal operand", "PUSHS \"a\"\nPUSHI 1\nADD", [], (3, "ADD: Expected numbers")),
+    ("end of input", "READ", [], (1, "READ: End of input.")),
+    ("outside the frame", "PUSHL -1", [], (1, "PUSHL: Access out of bounds")),
+    ("unknown label", "JUMP L1", [], (1, "Unknown label 'L1'.")),
+    ("step limit", "L1: JUMP L1", [], (1, "JUMP: Exceeded")),
+    ("proj/ex1", None, [], "Ola, Mundo!\n"),
+    ("proj/ex2", None, ["3", "9", "4"], (
+        "Introduza o primeiro número: \nIntroduza o segundo número: \nIntroduza o terceiro número: \nO maior é: 9\n"
+    )),
+    ("proj/ex3", None, ["5"], "Introduza um número inteiro positivo:\nFatorial de 5: 120\n"),
+]
+
+def ewvmTest():
+    """
+        Runs programs exercising the local EWVM interpreter (see compiler/ewvm.py), along with the code generated for
+        some of the test suite cases, and checks their output or errors.
+    """
+    from compiler.ewvm import EWVMError, runProgram
+    failures = 0
+    for (name, text, inputs, expected) in _EWVM_CASES:
+        if (text == None): text = loadProgram(name)
+
+        try:
+            res = runProgram(text, inputs, 10000)
+            (output, error) = (res.output, res.error)
+        except EWVMError as e:
+            (output, error) = (None, e)
+
+        if (isinstance(expected, tuple)):
+            passed = error != None and str(error).startswith(f"Line {expected[0]}: {expected[1]}")
+        else:
+            passed = error == None and output == expected
+
+        if (not passed):
+            failures += 1
+            print(f"\x1b[31mFailed:\x1b[0m {name} {error if (error != None) else repr(output)}")
+        elif (g_debugMode):
+            print(f"{name}: {res.steps} instructions." if (error == None) else f"{name}: {error}")
+
+    return reportChecks(
+        failures,
+        f"All {len(_EWVM_CASES)} programs ran as expected on the local EWVM interpreter.",
+        f"{failures} out of {len(_EWVM_CASES)} programs did not run as expected."
+    )
+
+# Code trees optimized by peepholeTest, as their stack before and after the optimization.
+_PEEPHOLE_CASES = [
+    ("fold", [("PUSHI", 0), ("PUSHI", 5), ("SUB",), ("PUSHI", 2), ("MUL",)], [("PUSHI", -10)]),
+    ("fold", [("PUSHI", 2), ("PUSHI", 3), ("INF",)], [("PUSHI", 1)]),
+    ("fold", [("PUSHF", 2.5), ("PUSHI", 3), ("ADD",)], [("PUSHF", 2.5), ("PUSHI", 3), ("ADD",)]),
+    ("fold", [("PUSHI", 2147483647), ("PUSHI", 3), ("MUL",)], [("PUSHI", 2147483647), ("PUSHI", 3), ("MUL",)]),
+    ("fold", [("PUSHI", 2 ** 40), ("PUSHI", 2 ** 40 - 5), ("SUB",)], [("PUSHI", 5)]),
+    ("identity", [("PUSHL", 0), ("PUSHI", 0), ("ADD",), ("PUSHI", 1), ("MUL",)], [("PUSHL", 0)]),
+    ("identity", [("PUSHL", 0), ("PUSHI", 1), ("DIV",)], [("PUSHL", 0), ("PUSHI", 1), ("DIV",)]),
+    ("branch", [("PUSHI", 1), ("JZ", 3), ("PUSHI", 0), ("JZ", 3), ("_LABEL", 3)], [("JUMP", 3), ("_LABEL", 3)]),
+    ("alloc", [("PUSHN", 1), ("PUSHN", 0), ("PUSHN", 2), ("PUSHN", 1)], [("PUSHN", 4)]),
+    ("reload", [("PUSHL", 1), ("STOREL", 1), ("STOREL", 2), ("PUSHL", 2)], [("DUP", 1), ("STOREL", 2)]),
+    ("reload", [("STOREL", 2), ("PUSHL", 3)], [("STOREL", 2), ("PUSHL", 3)]),
+    ("nop", [("NOP",), ("_LABEL", 1), ("NOP",), ("PUSHI", 1), ("_LABEL", 2), ("NOP",)], [
+        ("_LABEL", 1), ("PUSHI", 1), ("_LABEL", 2), ("NOP",)
+    ]),
+    ("jump", [("JUMP", 2), ("_LABEL", 1), ("_LABEL", 2), ("JUMP", 1), ("_LABEL", 2)], [
+        ("_LABEL", 1), ("_LABEL", 2), ("JUMP", 1), ("_LABEL", 2)
+    ]),
+    ("unreachable", [("STOP",), ("PUSHI", 1), ("WRITEI",), ("_LABEL", 1), ("RETURN",), ("NOP",)], [
+        ("STOP",), ("_LABEL", 1), ("RETURN",)
+    ]),
+]
+
+def peepholeTest():
+    """
+        Checks each peephole rule (see compiler/optim.py) on it's own, over short code trees. Then, compiles every test
+        suite case with and without the peephole optimizer, runs both on the local EWVM interpreter (see
+        compiler/ewvm.py), and checks that both output the same, and that the optimized code executes no more
+        instructions.
+    """
+    from compiler.codegen import CodeID, CodeTree
+    from compiler.ewvm import runProgram
+    from compiler.optim import PeepholeOptimizer
+    from tests.bench import loadCorpus, PROJ_INPUTS
+    failures = 0
+    def toStack(points):
+        return [(CodeID[p[0]], list(p[1:])) for p in points]
+
+    for (rule, before, after) in _PEEPHOLE_CASES:
+        bld = CodeTree()
+        bld.stack = toStack(before)
+        PeepholeOptimizer([rule]).optimizeTree(bld, {})
+        if (bld.stack != toStack(after)):
+            failures += 1
+            print(f"\x1b[31mFailed:\x1b[0m {rule} {[(p.name, *args) for (p, args) in bld.stack]}")
+
+    (checked, removed, saved) = (0, 0, 0)
+    for (path, src) in loadCorpus():
+        optimizer = PeepholeOptimizer()
+        with quietly():
+            (status, code) = compileSource(src)
+            (ostatus, optimized) = compileSource(src, optimizer = optimizer)
+        if (status != "CODE"):
+            if (ostatus != status):
+                failures += 1
+                print(f"\x1b[31mMismatch:\x1b[0m {path} {status} {ostatus}")
+            continue
+
+        inputs = PROJ_INPUTS.get(os.path.basename(path)[:-4], ["1"] * 16)
+        (res, ores) = (runProgram(code, inputs, 100000), runProgram(optimized, inputs, 100000))
+        # Errors are reported on the line of the optimized code, which may differ.
+        error = str(res.error).partition(": ")[2] if (res.error != None) else None
+        oerror = str(ores.error).partition(": ")[2] if (ores.error != None) else None
+        if (res.output != ores.output or error != oerror or ores.steps > res.steps):
+            failures += 1
+            print(f"\x1b[31mMismatch:\x1b[0m {path} {error} {oerror} ({res.steps} vs {ores.steps} instructions)")
+            continue
+
+        checked += 1
+        removed += sum(optimizer.removed.values())
+        saved += res.steps - ores.steps
+        if (g_debugMode): print(f"{path}: {optimizer.removed} ({res.steps} -> {ores.steps} instructions)")
+
+    return reportChecks(
+        failures,
+        f"All {len(_PEEPHOLE_CASES)} rule cases passed, and all {checked} optimized cases ran as before, " \
+        f"with {removed} fewer instructions emitted and {saved} fewer executed.",
+        f"{failures} peephole checks failed."
+    )
+
+# Code trees simplified by flowTest, each along with the tree it should be simplified into.
+_FLOW_CASES = [
+    ("conditional", [
+        ("PUSHL", 0), ("JZ", 1), ("PUSHI", 1), ("WRITEI",), ("JUMP", 2), ("_LABEL", 1), ("_LABEL", 2), ("STOP",)
+    ], [("PUSHL", 0), ("JZ", 1), ("PUSHI", 1), ("WRITEI",), ("_LABEL", 1), ("STOP",)]),
+    ("thread", [
+        ("PUSHL", 0), ("JZ", 1), ("PUSHI", 1), ("WRITEI",), ("STOP",), ("_LABEL", 1), ("JUMP", 2), ("_LABEL", 3),
+        ("WRITEI",), ("_LABEL", 2), ("PUSHI", 2), ("WRITEI",), ("STOP",)
+    ], [
+        ("PUSHL", 0), ("JZ", 2), ("PUSHI", 1), ("WRITEI",), ("STOP",), ("_LABEL", 2), ("PUSHI", 2), ("WRITEI",),
+        ("STOP",)
+    ]),
+    ("fallthrough", [("PUSHL", 0), ("JZ", 4), ("_LABEL", 4), ("STOP",)], [("PUSHL", 0), ("POP", 1), ("STOP",)]),
+    ("cycle", [("JUMP", 1), ("_LABEL", 1), ("JUMP", 2), ("_LABEL", 2), ("JUMP", 1)], [("_LABEL", 2), ("JUMP", 2)]),
+    ("loop", [("_LABEL", 1), ("PUSHL", 0), ("JZ", 2), ("JUMP", 1), ("_LABEL", 2), ("NOP",)], [
+        ("_LABEL", 1), ("PUSHL", 0), ("JZ", 2), ("JUMP", 1), ("_LABEL", 2), ("NOP",)
+    ]),
+    ("duplicate", [("JUMP", 1), ("_LABEL", 1), ("_LABEL", 1)], [("JUMP", 1), ("_LABEL", 1), ("_LABEL", 1)]),
+]
+
+def flowTest():
+    """
+        Checks the control flow optimizer (see compiler/flow.py) over short code trees. Then, compiles every test suite
+        case without optimizers, with the control flow optimizer, and with both the peephole and control flow
+        optimizers, runs them on the local EWVM interpreter (see compiler/ewvm.py), and checks that all output the same,
+        and that the optimized code emits and executes no more instructions. Also checks that a program of nested
+        conditionals (see generateBranches) executes fewer instructions when optimized.
+    """
+    from compiler.codegen import CodeID, CodeTree
+    from compiler.ewvm import runProgram
+    from compiler.flow import FlowOptimizer
+    from compiler.optim import PeepholeOptimizer
+    from tests.bench import generateBranches, loadCorpus, PROJ_INPUTS
+    failures = 0
+    def toStack(points):
+        return [(CodeID[p[0]], list(p[1:])) for p in points]
+
+    for (name, before, after) in _FLOW_CASES:
+        bld = CodeTree()
+        bld.stack = toStack(before)
+        FlowOptimizer().optimizeTree(bld, {})
+        if (bld.stack != toStack(after)):
+            failures += 1
+            print(f"\x1b[31mFailed:\x1b[0m {name} {[(p.name, *args) for (p, args) in bld.stack]}")
+
+    (checked, emitted, executed) = (0, 0, 0)
+    for (path, src) in loadCorpus():
+        with quietly():
+            (status, code) = compileSource(src)
+            results = [
+                compileSource(src, flow = FlowOptimizer()),
+                compileSource(src, optimizer = PeepholeOptimizer(), flow = FlowOptimizer())
+            ]
+        if (status != "CODE"):
+            if (any(ostatus != status for (ostatus, _) in results)):
+                failures += 1
+                print(f"\x1b[31mMismatch:\x1b[0m {path} {status} {[ostatus for (ostatus, _) in results]}")
+            continue
+
+        inputs = PROJ_INPUTS.get(os.path.basename(path)[:-4], ["1"] * 16)
+        res = runProgram(code, inputs, 100000)
+        # Errors are reported on the line of the optimized code, which may differ.
+        error = str(res.error).partition(": ")[2] if (res.error != None) else None
+        for (_, optimized) in results:
+            ores = runProgram(optimized, inputs, 100000)
+            oerror = str(ores.error).partition(": ")[2] if (ores.error != None) else None
+            (lines, olines) = (len(code.splitlines()), len(optimized.splitlines()))
+            if (res.output != ores.output or error != oerror or ores.steps > res.steps or olines > lines):
+                failures += 1
+                print(
+                    f"\x1b[31mMismatch:\x1b[0m {path} {error} {oerror} ({res.steps} vs {ores.steps} instructions, " \
+                    f"{lines} vs {olines} lines)"
+                )
+                break
+        else:
+            checked += 1
+            (_, flowCode) = results[0]
+            emitted += len(code.splitlines()) - len(flowCode.splitlines())
+            executed += res.steps - runProgram(flowCode, inputs, 100000).steps
+            if (g_debugMode):
+                print(f"{path}: {len(code.splitlines())} -> {len(flowCode.splitlines())} lines ({res.steps} executed)")
+
+    # The test suite cases barely branch, so the jumps chained by nested conditionals are checked on their own.
+    with quietly():
+        (_, code) = compileSource(generateBranches(100))
+        (_, flowCode) = compileSource(generateBranches(100), flow = FlowOptimizer())
+    (res, ores) = (runProgram(code, (), 100000), runProgram(flowCode, (), 100000))
+    if (res.error != None or res.output != ores.output or ores.steps >= res.steps):
+        failures += 1
+        print(f"\x1b[31mFailed:\x1b[0m branches {res.error} ({res.steps} vs {ores.steps} instructions)")
+
+    return reportChecks(
+        failures,
+        f"All {len(_FLOW_CASES)} flow cases passed, and all {checked} optimized cases ran as before, " \
+        f"with {emitted} fewer lines emitted and {executed} fewer instructions executed. Nested conditionals " \
+        f"executed {res.steps - ores.steps} fewer instructions ({res.steps} -> {ores.steps}).",
+        f"{failures} control flow checks failed."
+    )
+
+# Programs compiled by constFoldTest, each along with it's expected output and the number of expressions folded and
+#   references replaced. Statements are nested, as the semantic analyser only checks top-level statements, and rejects
+#   any binary expression there.
+_CONSTFOLD_PROGRAM = """program Fold;
+const N = 4; M = -2; R = 1.5; S = 'x'; K = N;
+var a, i: Integer; b: Boolean;
+begin
+  if a < 1 then begin
+    %s
+  end;
+end."""
+
+_CONSTFOLD_CASES = [
+    ("const", "a := K; WriteLn(a); WriteLn(S)", "4\nx\n", (0, 3)),
+    ("arithmetic", "a := N * 2 + M; WriteLn(a); WriteLn(R * 2)", "6\n3\n", (3, 4)),
+    ("relational", "b := (N > 3) and true; if b then WriteLn(1) else WriteLn(0)", "1\n", (2, 2)),
+    ("overflow", "a := 2147483647 * 3; WriteLn(a)", "6442450941\n", (0, 0)),
+    ("overflow", "a := 2147483647; a := a + 1; WriteLn(a)", "2147483648\n", (0, 1)),
+    ("division", "a := 7 div 2; a := R div 0.0", None, (0, 1)),
+    ("loop", "for i := 1 to N - 1 do a := a + N; WriteLn(a)", "12\n", (1, 2)),
+    ("merge", "if i < 1 then a := 2 else a := 2; i := 5; if a < 3 then a := 1; WriteLn(i); WriteLn(a)", "5\n1\n", (
+        0, 1
+    )),
+    ("repeat", "repeat a := N; i := i + a until i > N * 2; WriteLn(i)", "12\n", (1, 3)),
+    ("call", "a := 2; ReadLn(a); WriteLn(a)", None, (0, 0)),
+]
+
+def constFoldTest():
+    """
+        Compiles programs exercising the constant folder (see compiler/constfold.py), runs them on the local EWVM
+        interpreter, and checks their output and the expressions folded and references replaced. Then, compiles every
+        test suite case with and without the constant folder, and checks that the code of those without anything to fold
+        is unchanged.
+    """
+    from compiler.ewvm import runProgram
+    from compiler.constfold import ConstantFolder
+    from tests.bench import loadCorpus
+    failures = 0
+    for (name, stmts, expected, counts) in _CONSTFOLD_CASES:
+        folder = ConstantFolder()
+        with quietly():
+            (status, code) = compileSource(_CONSTFOLD_PROGRAM % stmts, folder = folder)
+        if (status != "CODE"):
+            failures += 1
+            print(f"\x1b[31mFailed:\x1b[0m {name} {status} {code}")
+            continue
+
+        res = runProgram(code, ["1"], 10000)
+        if ((expected != None and res.output != expected) or (folder.folded, folder.replaced) != counts):
+            failures += 1
+            print(f"\x1b[31mFailed:\x1b[0m {name} {res.output!r} {(folder.folded, folder.replaced)}")
+        elif (g_debugMode):
+            print(f"{name}: {folder.folded} folded, {folder.replaced} replaced, {res.steps} instructions.")
+
+    checked = 0
+    for (path, src) in loadCorpus():
+        folder = ConstantFolder()
+        with quietly():
+            expected = compileSource(src)
+            actual = compileSource(src, folder = folder)
+        if (folder.folded + folder.replaced > 0): continue
+        if (actual != expected):
+            failures += 1
+            print(f"\x1b[31mMismatch:\x1b[0m {path} {expected[0]} {actual[0]}")
+            continue
+        checked += 1
+
+    return reportChecks(
+        failures,
+        f"All {len(_CONSTFOLD_CASES)} folding cases passed, and the code of {checked} cases without " \
+        f"constants was unchanged.",
+        f"{failures} constant folding checks failed."
+    )
+
+# Programs compiled by loopsTest, each along with it's input lines, expected output, and the number of times some
+#   instructions are expected to be executed. Statements are nested, as in _CONSTFOLD_PROGRAM.
+_LOOPS_PROGRAM = """program Loops;
+var i, j, n, k, s, t, d: Integer;
+begin
+  if s < 1 then begin
+    %s
+  end;
+end."""
+
+_LOOPS_CASES = [
+    ("zero trip", "n := 0; for i := 1 to n do WriteLn(1); for i := 3 to 2 do WriteLn(2); WriteLn(i)", [], "3\n", {}),
+    ("downto", "for i := 3 downto 1 do Write(i); for i := 0 downto 1 do Write(i); WriteLn(' ')", [], "321 \n", {}),
+    ("final once", "n := 3; for i := 1 to n do n := n + 1; WriteLn(n)", [], "6\n", { "STOREL": 9 }),
+    ("final expression", "k := 2; for i := k * 2 to k * 3 do s := s + i; WriteLn(s)", [], "15\n", { "FMUL": 2 }),
+    ("while", "while i < 10 do i := i + 3; while i < 0 do i := 100; WriteLn(i)", [], "12\n", { "JZ": 7 }),
+    ("repeat", "repeat j := j + 5 until j > 12; repeat j := j + 1 until j > 0; WriteLn(j)", [], "16\n", { "JZ": 5 }),
+    ("invariant", "n := 4; k := 3; for i := 1 to 5 do begin t := n * k; s := s + t end; WriteLn(s)", [], "60\n", {
+        "FMUL": 1
+    }),
+    ("nested", "n := 2; for i := 1 to 3 do for j := 1 to 4 do s := s + n * 5; WriteLn(s)", [], "120\n", {
+        "FMUL": 1
+    }),
+    ("variant", "while i < 5 do begin s := s + i * 2; i := i + 1 end; WriteLn(s)", [], "20\n", { "FMUL": 5 }),
+    ("division", "n := 6; while i < 3 do begin if d > 0 then t := n div d; i := i + 1 end; WriteLn(i)", [], "3\n", {
+        "FDIV": 0
+    }),
+]
+
+def loopsTest():
+    """
+        Compiles programs exercising the loop lowering (see emitWhile, emitRepeat and emitFor in compiler/codegen.py),
+        runs them on the local EWVM interpreter, and checks their output and the number of times some instructions
+        were executed (e.g. that loop invariants were evaluated once). Then, checks that the project cases run as
+        before with the peephole and control flow optimizers.
+    """
+    from compiler.ewvm import runProgram
+    from compiler.flow import FlowOptimizer
+    from compiler.optim import PeepholeOptimizer
+    from tests.bench import loadProjPrograms
+    failures = 0
+    for (name, stmts, inputs, expected, counts) in _LOOPS_CASES:
+        with quietly():
+            (status, code) = compileSource(_LOOPS_PROGRAM % stmts)
+        if (status != "CODE"):
+            failures += 1
+            print(f"\x1b[31mFailed:\x1b[0m {name} {status} {code}")
+            continue
+
+        res = runProgram(code, inputs, 10000)
+        executed = res.counts()
+        mismatched = { op: executed.get(op, 0) for (op, n) in counts.items() if (executed.get(op, 0) != n) }
+        if (res.error != None or res.output != expected or len(mismatched) != 0):
+            failures += 1
+            print(f"\x1b[31mFailed:\x1b[0m {name} {res.output!r} {res.error} {mismatched}")
+        elif (g_debugMode):
+            print(f"{name}: {res.steps} instructions.")
+
+    # Nested statements are not checked by the semantic analyser, so calls to undeclared activatables are reported by
+    #   the code generator.
+    with quietly():
+        (status, diags) = compileSource(_LOOPS_PROGRAM % "repeat i := Undeclared(i) until i > 0")
+    if (status != "CODEGEN" or len(diags) != 1 or "UNDECLARED_ACTIVATABLE" not in diags[0]):
+        failures += 1
+        print(f"\x1b[31mFailed:\x1b[0m undeclared call {status} {diags}")
+
+    checked = 0
+    rejected = []
+    for (name, src, inputs) in loadProjPrograms():
+        with quietly():
+            results = [
+                compileSource(src), compileSource(src, optimizer = PeepholeOptimizer(), flow = FlowOptimizer())
+            ]
+        # Cases the front end rejects are reported, while any case it accepts must be generated.
+        statuses = { status for (status, _) in results }
+        if (statuses <= { "SYNTAX", "SEMANTIC" }):
+            rejected.append(name)
+            continue
+        if (statuses != { "CODE" }):
+            failures += 1
+            print(f"\x1b[31mFailed:\x1b[0m {name} {[status for (status, _) in results]} {results[0][1]}")
+            continue
+
+        (res, ores) = (runProgram(code, inputs, 100000) for (_, code) in results)
+        if (res.output != ores.output or (res.error == None) != (ores.error == None) or ores.steps > res.steps):
+            failures += 1
+            print(f"\x1b[31mMismatch:\x1b[0m {name} ({res.steps} vs {ores.steps} instructions)")
+            continue
+        checked += 1
+        if (g_debugMode): print(f"{name}: {res.steps} instructions, {ores.steps} optimized.")
+
+    return reportChecks(
+        failures,
+        f"All {len(_LOOPS_CASES)} loop cases passed, and all {checked} project cases ran the same when " \
+        f"optimized ({', '.join(rejected) or 'none'} rejected by the front end).",
+        f"{failures} loop lowering checks failed."
+    )
+
+def frameTest():
+    """
+        Checks that the code generated for every test suite case allocates each frame with a single PUSHN, at the entry
+        of the program or activatable, and that programs of nested loops run in the same stack space regardless of the
+        number of iterations.
+    """
+    from compiler.ewvm import runProgram
+    from tests.bench import loadCorpus, generateNestedLoops
+    failures = 0
+    checked = 0
+    for (path, src) in loadCorpus():
+        with quietly():
+            (status, code) = compileSource(src)
+        if (status != "CODE"): continue
+
+        lines = code.splitlines()
+        entries = { f"{line.split()[1]}:" for line in lines if line.startswith("PUSHA ") }
+        misplaced = [
+            i for (i, line) in enumerate(lines)
+            if line.startswith("PUSHN ") and i != 0 and lines[i - 1].strip() not in entries
+        ]
+        if (len(misplaced) != 0):
+            failures += 1
+            print(f"\x1b[31mMisplaced PUSHN:\x1b[0m {path} (lines {', '.join(str(i + 1) for i in misplaced)})")
+            continue
+        checked += 1
+
+    sizes = []
+    for n in (5, 50):
+        with quietly():
+            (status, code) = compileSource(generateNestedLoops(n, 3))
+        res = runProgram(code, (), 100000) if (status == "CODE") else None
+        if (res == None or res.error != None or res.output != f"{13 * n}\n"):
+            failures += 1
+            print(f"\x1b[31mFailed:\x1b[0m nested loops ({n} iterations) {res.error if res else code}")
+            continue
+        sizes.append(res.stackSize)
+        if (g_debugMode): print(f"Nested loops ({n} iterations): {res.steps} instructions, stack of {res.stackSize}.")
+
+    if (len(set(sizes)) > 1):
+        failures += 1
+        print(f"\x1b[31mThe stack of the nested loops grew with the iterations:\x1b[0m {sizes}")
+
+    return reportChecks(
+        failures,
+        f"All {checked} generated cases allocated their frames on entry, and nested loops ran in " \
+        f"constant stack space.",
+        f"{failures} frame layout checks failed."
+    )
+
+def outputsTest():
+    """
+        Checks that the generated code of the project cases written to the out directory (see fullTest) is the code
+        they currently compile to, as those outputs are kept along with the compiler.
+    """
+    from tests.bench import loadProjPrograms
+    outDir = os.path.join(os.getcwd(), "out")
+    failures = 0
+    checked = 0
+    for (name, src, _) in loadProjPrograms():
+        outFilePath = os.path.join(outDir, f"{name}.ewvm")
+        if (not os.path.exists(outFilePath)): continue
+
+        with quietly(): (status, code) = compileSource(src)
+        with open(outFilePath) as f: written = f.read()
+        if (status != "CODE" or code != written):
+            failures += 1
+            print(f"\x1b[31mStale:\x1b[0m {outFilePath} ({status})")
+            continue
+        checked += 1
+
+    return reportChecks(
+        failures,
+        f"All {checked} project case outputs matched their generated code.",
+        f"{failures} project case outputs are stale. Regenerate them with: ./runTest.sh case proj/<name>"
+    )
+
+def packedTest():
+    """
+        Checks that streamed and joined code emission (see compiler/codegen.py) write the same program, even for deeply
+        nested code trees, and that code buffers (see CodeBuffer) hold the stack they were given. Then, compiles every
+        test suite case as text and packed (see compiler/packed.py), with and without the peephole optimizer, and
+        checks that both load as the same program and run the same.
+    """
+    import io
+    from compiler.codegen import CodeBuffer, CodeID, CodeTree, transformCode, writeCode
+    from compiler.ewvm import assemble, runProgram
+    from compiler.optim import PeepholeOptimizer
+    from compiler.packed import PackedProgram, runPacked
+    from tests.bench import loadCorpus, PROJ_INPUTS
+    failures = 0
+    root = bld = CodeTree()
+    for i in range(0, 5000):
+        sub = CodeTree()
+        bld.stack += [(CodeID._LABEL, [i]), (CodeID.PUSHI, [i]), (CodeID._SUBTREE, [sub]), (CodeID.POP, [1])]
+        bld = sub
+    bld.stack.append((CodeID.PUSHS, ['"a \\"b\\"\\n"']))
+
+    (out, data) = (io.StringIO(), b"")
+    try:
+        writeCode(root, out)
+        text = transformCode(root)
+        if (out.getvalue() != text or len(text.splitlines()) != 20001):
+            failures += 1
+            print(f"\x1b[31mMismatch:\x1b[0m nested code trees were not written the same.")
+        data = PackedProgram.fromTree(root).toBytes()
+        if (PackedProgram.fromBytes(data).program().operands[-1] != assemble(text).operands[-1]):
+            failures += 1
+            print(f"\x1b[31mMismatch:\x1b[0m nested code trees were not packed as assembled.")
+    except RecursionError:
+        failures += 1
+        print(f"\x1b[31mFailed:\x1b[0m nested code trees hit the recursion limit.")
+
+    stack = [
+        (CodeID.PUSHI, [2 ** 40]), (CodeID.PUSHF, [0.0]), (CodeID.PUSHF, [-0.0]), (CodeID.PUSHS, ['"a"']),
+        (CodeID.PUSHS, ['"a"']), (CodeID.PUSHI, [2 ** 70]), (CodeID._SUBTREE, [root]), (CodeID.ADD, ())
+    ]
+    buf = CodeBuffer.fromStack(stack)
+    if (
+        buf.toStack() != stack or len(buf.pool) != 5 or buf.toStack()[6][1][0] is not root or
+        str(buf.toStack()[2][1][0]) != "-0.0"
+    ):
+        failures += 1
+        print(f"\x1b[31mMismatch:\x1b[0m code buffers did not hold the stack they were given.")
+
+    for broken in (b"", b"PEWVM", data[:len(data) // 2], data[:-1], data + b"\0"):
+        try:
+            PackedProgram.fromBytes(broken)
+            failures += 1
+            print(f"\x1b[31mFailed:\x1b[0m a malformed packed program of {len(broken)} bytes was loaded.")
+        except ValueError:
+            pass
+
+    (checked, textSize, packedSize) = (0, 0, 0)
+    for (path, src) in loadCorpus():
+        for optimizer in (None, PeepholeOptimizer()):
+            with quietly():
+                (status, code) = compileSource(src, optimizer = optimizer)
+                (pstatus, packed) = compileSource(src, optimizer = optimizer, packed = True)
+            if (status != "CODE" or pstatus != "CODE"):
+                if (pstatus != status):
+                    failures += 1
+                    print(f"\x1b[31mMismatch:\x1b[0m {path} {status} {pstatus}")
+                continue
+
+            (program, pprogram) = (assemble(code), PackedProgram.fromBytes(packed).program())
+            if (
+                (program.opcodes, program.operands, program.lines, program.labels) !=
+                (list(pprogram.opcodes), pprogram.operands, list(pprogram.lines), pprogram.labels)
+            ):
+                failures += 1
+                print(f"\x1b[31mMismatch:\x1b[0m {path} was not packed as it is assembled.")
+                continue
+
+            inputs = PROJ_INPUTS.get(os.path.basename(path)[:-4], ["1"] * 16)
+            (res, pres) = (runProgram(code, inputs, 100000), runPacked(packed, inputs, 100000))
+            if ((res.output, str(res.error), res.steps) != (pres.output, str(pres.error), pres.steps)):
+                failures += 1
+                print(f"\x1b[31mMismatch:\x1b[0m {path} {res.error} {pres.error} ({res.steps} vs {pres.steps})")
+                continue
+
+            checked += 1
+            (textSize, packedSize) = (textSize + len(code.encode()), packedSize + len(packed))
+            if (g_debugMode): print(f"{path}: {len(code.encode())} -> {len(packed)} bytes")
+
+    return reportChecks(
+        failures,
+        f"Nested code trees were written the same, and all {checked} packed cases ran as their text " \
+        f"({packedSize} bytes packed, {textSize} bytes of text).",
+        f"{failures} packed program checks failed."
+    )
+
+def findSources(targets):
+    """
+        Finds the source files for the given targets, each being either a directory, searched recursively, or a file / 
+        glob pattern. Returns the common root directory of the files found, along with the sorted files.
+    """
+    files = set()
+    for target in targets:
+        if (os.path.isdir(target)): files.update(glob.glob(os.path.join(target, "**", "*.pas"), recursive = True))
+        else: 
+            for f in glob.glob(target, recursive = True):
+                if (os.path.isdir(f)): files.update(glob.glob(os.path.join(f, "**", "*.pas"), recursive = True))
+                elif (f.endswith(".pas")): files.add(f)
+
+    files = sorted(os.path.abspath(f) for f in files)
+    root = os.path.commonpath([os.path.dirname(f) for f in files]) if (len(files) != 0) else None
+    return (root, files)
+
+def countDiagnostics(diags):
+    """
+        Returns the number of errors and warnings on a list of diagnostics.
+    """
+    from compiler.diag import DiagnosticKind
+    errors = sum(1 for d in diags if d.kind == DiagnosticKind.ERROR or d.kind == DiagnosticKind.CRITICAL)
+    return (errors, sum(1 for d in diags if d.kind == DiagnosticKind.WARN))
+
+def _initBatchWorker(verbose):
+    # Diagnostics are printed by every phase. Unless requested, silence them, as output from the workers is interleaved.
+    if (not verbose): sys.stdout = open(os.devnull, "w")
+
+def _lexicalErrors(diags) -> bool:
+    # Lexical warnings do not stop the compilation.
+    return countDiagnostics(diags)[0] != 0
+
+def batchCompileFile(path, outFilePath, useCache = False, debug = False):
+    """
+        Compiles a single source file on it's own compilation, writing the generated code to the given output file.
+        Mirrors the phase checks of fullTest. Returns a summary of the compilation.
+    """
+    from compiler.compilation import Compilation
+    start = time.perf_counter()
+    summary = { "file": path, "status": "OK", "lex": (0, 0), "syn": (0, 0), "sem": (0, 0), "out": None }
+
+    try:
+        if (useCache):
+            from compiler.cache import CompilationCache, compileCached
+            with open(path, "r") as sf: res = compileCached(sf.read(), CompilationCache(), debug)
+            summary["status"] = "LEXICAL" if (_lexicalErrors(res.lexerDiagnostics)) else res.status
+            summary["lex"] = countDiagnostics(res.lexerDiagnostics)
+            summary["syn"] = countDiagnostics(res.parserDiagnostics)
+            summary["sem"] = countDiagnostics(res.semanticDiagnostics)
+            summary["cached"] = len(res.cached) == 2
+            if (summary["status"] == "OK"):
+                os.makedirs(os.path.dirname(outFilePath), exist_ok = True)
+                with open(outFilePath, "w") as of: of.write(res.code)
+                summary["out"] = outFilePath
+
+            summary["time"] = time.perf_counter() - start
+            return summary
+
+        comp = Compilation(debug)
+        with open(path, "r") as sf: pout = comp.parse(sf.read())
+        summary["lex"] = countDiagnostics(comp.getLexerDiagnostics())
+        summary["syn"] = countDiagnostics(comp.getParserDiagnostics())
+
+        if (_lexicalErrors(comp.getLexerDiagnostics())): summary["status"] = "LEXICAL"
+        elif (pout == None or len(comp.getParserDiagnostics()) != 0): summary["status"] = "SYNTAX"
+        else:
+            semVeredict = comp.analyze(pout)
+            summary["sem"] = countDiagnostics(comp.getSemanticDiagnostics())
+
+            if (semVeredict == False or len(comp.getSemanticDiagnostics()) != 0): summary["status"] = "SEMANTIC"
+            else:
+                code = comp.generate(pout)
+                if (code == None): summary["status"] = "CODEGEN"
+                else:
+                    os.makedirs(os.path.dirname(outFilePath), exist_ok = True)
+                    with open(outFilePath, "w") as of: of.write(code)
+                    summary["out"] = outFilePath
+    except Exception as e:
+        summary["status"] = "CRASH"
+        summary["error"] = repr(e)
+
+    summary["time"] = time.perf_counter() - start
+    return summary
+
+def batchTest(targets, jobs = None, verbose = False, useCache = False, debug = False):
+    """
+        Compiles every source file of the given directories or glob patterns on a pool of worker processes. The compiler is
+        imported (and the parsing tables are built) once per worker and reused for every file it compiles.
+        The generated code is written to the "out" directory, under the same relative path as the source file.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    (root, files) = findSources(targets)
+    if (len(files) == 0):
+        print(f"\x1b[31mNo source files found for:\x1b[0m {' '.join(targets)}")
+        return
+
+    outDir = os.path.join(os.getcwd(), "out")
+    jobs = jobs or os.cpu_count()
+    print(f"Compiling {len(files)} files on {jobs} workers.")
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers = jobs, initializer = _initBatchWorker, initargs = (verbose,)) as pool:
+        futures = []
+        for f in files:
+            outFilePath = os.path.join(outDir, os.path.splitext(os.path.relpath(f, root))[0] + ".ewvm")
+            futures.append(pool.submit(batchCompileFile, f, outFilePath, useCache, debug))
+        summaries = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    print(f"{'STATUS':<9} {'LEX E/W':>8} {'SYN E/W':>8} {'SEM E/W':>8} {'TIME (ms)':>10}  FILE")
+    for s in summaries:
+        color = "\x1b[32m" if s["status"] == "OK" else "\x1b[31m"
+        print(
+            f"{color}{s['status']:<9}\x1b[0m " \
+            f"{'%d/%d' % s['lex']:>8} {'%d/%d' % s['syn']:>8} {'%d/%d' % s['sem']:>8} " \
+            f"{s['time'] * 1000:>10.1f}  {os.path.relpath(s['file'], root)}"
+        )
+        if (verbose and "error" in s): print("  --", s["error"])
+
+    ok = sum(1 for s in summaries if s["status"] == "OK")
+    print(f"{ok} out of {len(summaries)} files compiled successfully in {elapsed:.2f}s. Output written to: {outDir}")
+    if (useCache): print(f"{sum(1 for s in summaries if s.get('cached'))} results were fully read from the cache.")
+
+# Measures, on a fresh interpreter, the time taken by the first use of each lazily built subsystem of the compiler.
+SUBSYSTEMS_SCRIPT = """
+import time
+def measure(name, cb):
+    start = time.perf_counter()
+    cb()
+    print(name, time.perf_counter() - start)
+
+measure("import", lambda: __import__("compiler.codegen"))
+from compiler.lexer import getLexer
+from compiler.synanaler import getParser
+from compiler.runtime.builtin import getBuiltinSymtable
+measure("lexer", getLexer)
+measure("parser", getParser)
+measure("builtins", getBuiltinSymtable)
+"""
+
+def parseImportTimes(report: str) -> list[(str, int, int)]:
+    """
+        Parses the report of "python -X importtime" into (module, self, cumulative) tuples, with the times in 
+        microseconds.
+    """
+    imports = []
+    for line in report.splitlines():
+        if (not line.startswith("import time:")): continue
+        (selfTime, cumulative, name) = line[len("import time:"):].split("|")
+        if (not selfTime.strip().isdigit()): continue # Header
+        imports.append((name.strip(), int(selfTime), int(cumulative)))
+
+    return imports
+
+def profileStartup(command: list[str], top: int):
+    """
+        Runs a command of this CLI on a fresh interpreter with import profiling enabled, and reports the total time, the
+        slowest imports and the time taken by the first use of each lazily built subsystem of the compiler.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    if (len(command) == 0): command = ["--help"]
+
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "tests.test", *command],
+        cwd=root, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    elapsed = time.perf_counter() - start
+
+    imports = parseImportTimes(proc.stderr)
+    compilerImports = [i for i in imports if i[0].startswith("compiler")]
+    print(f"Command: {' '.join(command)} (exit code {proc.returncode})")
+    print(f"Wall-clock time: {elapsed * 1000:.1f} ms, {len(imports)} modules imported, {len(compilerImports)} from the compiler.")
+
+    print(f"\n{'SELF (ms)':>10} {'CUMUL. (ms)':>12}  MODULE")
+    for (name, selfTime, cumulative) in sorted(imports, key=lambda i: i[2], reverse=True)[:top]:
+        print(f"{selfTime / 1000:>10.2f} {cumulative / 1000:>12.2f}  {name}")
+
+    out = subprocess.run([sys.executable, "-c", SUBSYSTEMS_SCRIPT], cwd=root, capture_output=True, text=True)
+    print(f"\n{'FIRST USE (ms)':>14}  SUBSYSTEM")
+    for line in out.stdout.splitlines():
+        (name, t) = line.split()
+        print(f"{float(t) * 1000:>14.2f}  {name}")
+
 def makeCLI():
     caseCmd = CLICommand(name="case", description="Runs a specific test suite case")
     caseCmd.addArgument("target", type=str, help="The name of a test suite target to run.")
@@ -232,6 +1545,16 @@ def makeCLI():
         action=argparse.BooleanOptionalAction, 
         help="Whether intermediate diagnostics should be output to the STDOUT."
     )
+    caseCmd.addArgument(
+        "--stream", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the source file should be lexed in chunks, instead of being read whole."
+    )
+    caseCmd.addArgument(
+        "--packed", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the program should be written packed (.pewvm, see compiler/packed.py), instead of as text."
+    )
     caseCmd.addArgument(
         "--verbose", "-v", 
         action=argparse.BooleanOptionalAction, 
@@ -239,6 +1562,14 @@ def makeCLI():
             "internal state."
     )
 
+    caseCmd.addArgument(
+        "--cache", 
+        action=argparse.BooleanOptionalAction, 
+        default=True,
+        help="Whether the results of unchanged sources should be read from (and written to) the compilation cache " \
+            "(on the .pascache directory). Use --no-cache to run every phase."
+    )
+
     traceLexCmd = CLICommand(name="tracelex", description="Traces the lexer output for specific test suite target")
     traceLexCmd.addArgument("target", type=str, help="The name of a test suite target to run.")
     traceLexCmd.addArgument(
@@ -293,6 +1624,11 @@ def makeCLI():
         help="The output file to dump the AST.",
         required=True
     )
+    dumpASTCmd.addArgument(
+        "--binary", "-b", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the AST should be dumped on the binary format (see compiler/astdump.py) instead of JSON."
+    )
     dumpASTCmd.addArgument(
         "--debug", "-d", 
         action=argparse.BooleanOptionalAction, 
@@ -305,11 +1641,296 @@ def makeCLI():
             "internal state."
     )
 
+    stressCmd = CLICommand(
+        name="stress", 
+        description="Compiles the test suite concurrently and checks the results against sequential compilations"
+    )
+    stressCmd.addArgument(
+        "--threads", "-t", 
+        type=int,
+        default=8,
+        help="The number of threads compiling concurrently."
+    )
+    stressCmd.addArgument(
+        "--rounds", "-r", 
+        type=int,
+        default=4,
+        help="The number of times the test suite is compiled."
+    )
+    stressCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether additional information should be presented while running the test suite."
+    )
+
+    cacheCmd = CLICommand(
+        name="cache", 
+        description="Checks that the test suite compiles the same from a warm compilation cache (see compiler/cache.py)"
+    )
+    cacheCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the outcome of each case should be presented."
+    )
+
+    flatCmd = CLICommand(
+        name="flatast", 
+        description="Checks that the test suite compiles the same through flat ASTs (see compiler/flatast.py)"
+    )
+    flatCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether additional information should be presented while running the test suite."
+    )
+
+    dumpCheckCmd = CLICommand(
+        name="dumpcheck", 
+        description="Checks that the streamed JSON and binary AST dumps of the test suite match Node#toJSON"
+    )
+    dumpCheckCmd.addArgument(
+        "--depth", 
+        type=int,
+        default=5000,
+        help="The nesting depth of the generated expression that is dumped."
+    )
+    dumpCheckCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the size of each dump should be presented."
+    )
+
+    incrementalCmd = CLICommand(
+        name="incremental", 
+        description="Checks that successive versions of a program compile incrementally as they do from scratch"
+    )
+    incrementalCmd.addArgument(
+        "--activatables", "-n", 
+        type=int,
+        default=20,
+        help="The number of procedures of the generated program."
+    )
+    incrementalCmd.addArgument(
+        "--statements", "-s", 
+        type=int,
+        default=10,
+        help="The number of statements of each procedure."
+    )
+    incrementalCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether additional information should be presented while running the test suite."
+    )
+
+    runCmd = CLICommand(
+        name="run", 
+        description="Runs EWVM programs, or test suite cases, on the local interpreter (see compiler/ewvm.py)"
+    )
+    runCmd.addArgument(
+        "target", 
+        nargs="*", 
+        help="The EWVM programs (.ewvm) or test suite cases to run. Defaults to every program on the out directory."
+    )
+    runCmd.addArgument(
+        "--input", "-i", 
+        action="append", 
+        default=[],
+        help="A line of the input read by the programs. May be given multiple times, once per line."
+    )
+    runCmd.addArgument(
+        "--counts", "-c", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the number of instructions executed by opcode should be presented."
+    )
+    runCmd.addArgument(
+        "--optimize", "-O", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether test suite cases should be compiled with the peephole optimizer (see compiler/optim.py)."
+    )
+    runCmd.addArgument(
+        "--fold", "-F", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether test suite cases should be compiled with the constant folder (see compiler/constfold.py)."
+    )
+    runCmd.addArgument(
+        "--flow", "-C", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether test suite cases should be compiled with the control flow optimizer (see compiler/flow.py)."
+    )
+    runCmd.addArgument(
+        "--packed", "-P", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether test suite cases should be packed (see compiler/packed.py) before being run."
+    )
+    runCmd.addArgument(
+        "--max-steps", 
+        type=int,
+        default=None,
+        help="The maximum number of instructions each program may execute."
+    )
+    runCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether additional information should be presented while running the test suite."
+    )
+
+    ewvmCmd = CLICommand(
+        name="ewvm", 
+        description="Checks the output of programs run on the local EWVM interpreter (see compiler/ewvm.py)"
+    )
+    ewvmCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the number of instructions executed by each program should be presented."
+    )
+
+    peepholeCmd = CLICommand(
+        name="peephole", 
+        description="Checks that the peephole optimizer (see compiler/optim.py) keeps the behaviour of the test suite"
+    )
+    peepholeCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the instructions removed from each case should be presented."
+    )
+
+    constFoldCmd = CLICommand(
+        name="constfold", 
+        description="Checks the constant folder (see compiler/constfold.py) on short programs and the test suite"
+    )
+    constFoldCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the expressions folded on each program should be presented."
+    )
+
+    frameCmd = CLICommand(
+        name="frame", 
+        description="Checks the frame layout of the generated code (see CodeTree.reserveFrame in compiler/codegen.py)"
+    )
+    frameCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the stack space used by the nested loops should be presented."
+    )
+
+    outputsCmd = CLICommand(
+        name="outputs", 
+        description="Checks that the project case outputs on the out directory match the code they compile to"
+    )
+    outputsCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether additional information should be presented while running the test suite."
+    )
+
+    loopsCmd = CLICommand(
+        name="loops", 
+        description="Checks the loop lowering of the code generator (see emitFor in compiler/codegen.py)"
+    )
+    loopsCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the instructions executed by each case should be presented."
+    )
+
+    flowCmd = CLICommand(
+        name="flow", 
+        description="Checks that the control flow optimizer (see compiler/flow.py) keeps the behaviour of the test " \
+            "suite"
+    )
+    flowCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the lines removed from each case should be presented."
+    )
+
+    packedCmd = CLICommand(
+        name="packed", 
+        description="Checks the code emission and packed programs (see compiler/packed.py) over the test suite"
+    )
+    packedCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the size of each case, as text and packed, should be presented."
+    )
+
+    batchCmd = CLICommand(
+        name="batch", 
+        description="Compiles every source file of a directory or glob pattern on a pool of worker processes"
+    )
+    batchCmd.addArgument(
+        "target", 
+        type=str, 
+        nargs="+", 
+        help="The directories (searched recursively) or glob patterns of the source files to compile."
+    )
+    batchCmd.addArgument(
+        "--jobs", "-j", 
+        type=int,
+        default=None,
+        help="The number of worker processes. Defaults to the number of CPUs."
+    )
+    batchCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the files should be compiled in debug mode (diagnostics are presented with their emitting location)."
+    )
+    batchCmd.addArgument(
+        "--verbose", "-v", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether the diagnostics of each compilation and the errors of crashed compilations should be presented."
+    )
+
+    batchCmd.addArgument(
+        "--cache", 
+        action=argparse.BooleanOptionalAction, 
+        default=True,
+        help="Whether the results of unchanged sources should be read from (and written to) the compilation cache " \
+            "(on the .pascache directory). Use --no-cache to run every phase."
+    )
+
+    startupCmd = CLICommand(
+        name="startup", 
+        description="Profiles the startup of a command of this CLI: import times and first use of each subsystem"
+    )
+    startupCmd.addArgument(
+        "command", 
+        nargs=argparse.REMAINDER, 
+        help="The command to profile, along with it's arguments. Defaults to --help."
+    )
+    startupCmd.addArgument(
+        "--top", "-n", 
+        type=int,
+        default=20,
+        help="The number of slowest imports (by cumulative time) to report."
+    )
+    startupCmd.addArgument(
+        "--debug", "-d", 
+        action=argparse.BooleanOptionalAction, 
+        help="Whether additional information should be presented while running the test suite."
+    )
+
     cli = CLI(name="Test", description="A test suite for the Standard Pascal compiler.")
     cli.addCommand(caseCmd)
     cli.addCommand(traceLexCmd)
     cli.addCommand(traceSynCmd)
     cli.addCommand(dumpASTCmd)
+    cli.addCommand(stressCmd)
+    cli.addCommand(cacheCmd)
+    cli.addCommand(flatCmd)
+    cli.addCommand(dumpCheckCmd)
+    cli.addCommand(incrementalCmd)
+    cli.addCommand(runCmd)
+    cli.addCommand(ewvmCmd)
+    cli.addCommand(peepholeCmd)
+    cli.addCommand(constFoldCmd)
+    cli.addCommand(frameCmd)
+    cli.addCommand(outputsCmd)
+    cli.addCommand(packedCmd)
+    cli.addCommand(flowCmd)
+    cli.addCommand(loopsCmd)
+    cli.addCommand(batchCmd)
+    cli.addCommand(startupCmd)
 
     return cli
 
@@ -323,10 +1944,49 @@ if __name__ == "__main__":
     
     match (args.switch()):
         case "case":
-            fullTest(args.target, args.traceall, args.tracediag, args.verbose, args.dumpAST, args.out)
+            fullTest(
+                args.target, args.traceall, args.tracediag, args.verbose, args.dumpAST, args.out, args.stream, 
+                args.cache, args.packed
+            )
         case "tracelex":
             traceTokensSnippet(args.target)
         case "tracesyn":
             traceTokensSnippet(args.target, args.tracelex, True, args.tracediag)
         case "dumpast":
-            dumpAST(args.target, args.out, args.tracelex, True, args.tracediag, args.verbose)
+            dumpAST(args.target, args.out, args.tracelex, True, args.tracediag, args.verbose, args.binary)
+        case "batch":
+            batchTest(args.target, args.jobs, args.verbose, args.cache, args.debug)
+        case "startup":
+            profileStartup(args.command, args.top)
+        case "stress":
+            if (not stressTest(args.threads, args.rounds)): sys.exit(1)
+        case "cache":
+            if (not cacheTest()): sys.exit(1)
+        case "flatast":
+            if (not flatASTTest()): sys.exit(1)
+        case "dumpcheck":
+            if (not dumpCheckTest(args.depth)): sys.exit(1)
+        case "incremental":
+            if (not incrementalTest(args.activatables, args.statements)): sys.exit(1)
+        case "run":
+            ok = runTest(
+                args.target, args.input, args.counts, args.max_steps, args.optimize, args.fold, args.packed,
+                args.flow
+            )
+            if (not ok): sys.exit(1)
+        case "ewvm":
+            if (not ewvmTest()): sys.exit(1)
+        case "peephole":
+            if (not peepholeTest()): sys.exit(1)
+        case "constfold":
+            if (not constFoldTest()): sys.exit(1)
+        case "frame":
+            if (not frameTest()): sys.exit(1)
+        case "outputs":
+            if (not outputsTest()): sys.exit(1)
+        case "packed":
+            if (not packedTest()): sys.exit(1)
+        case "flow":
+            if (not flowTest()): sys.exit(1)
+        case "loops":
+            if (not loopsTest()): sys.exit(1)
@@ -0,0 +1,124 @@
+//#region ============== Binary AST Dumps ==============
+// Decoder for the binary AST dumps written by the compiler (see compiler/astdump.py for the format). Decoding a dump
+// yields the same value as parsing the JSON dump of the same tree.
+
+const FORMAT_MAGIC = [0x50, 0x41, 0x53, 0x42]; // "PASB"
+const FORMAT_VERSION = 1;
+
+const TAG_NULL       = 0;
+const TAG_FALSE      = 1;
+const TAG_TRUE       = 2;
+const TAG_INT        = 3;
+const TAG_FLOAT      = 4;
+const TAG_STRING     = 5;
+const TAG_STRING_REF = 6;
+const TAG_ARRAY      = 7;
+const TAG_OBJECT     = 8;
+
+/**
+ * Checks whether a buffer holds a binary AST dump, based on it's magic bytes.
+ * @param {ArrayBuffer} buffer
+ * @returns {boolean}
+ */
+export function isBinaryAST(buffer) {
+    const bytes = new Uint8Array(buffer, 0, Math.min(buffer.byteLength, FORMAT_MAGIC.length));
+    return bytes.length === FORMAT_MAGIC.length && FORMAT_MAGIC.every((b, i) => bytes[i] === b);
+}
+
+/**
+ * Decodes a binary AST dump.
+ * @param {ArrayBuffer} buffer
+ * @returns {any} The JSON value of the dumped tree.
+ */
+export function decodeBinaryAST(buffer) {
+    if (!isBinaryAST(buffer)) throw new Error("Not a binary AST dump.");
+
+    const bytes = new Uint8Array(buffer);
+    const view = new DataView(buffer);
+    const decoder = new TextDecoder("utf-8");
+    if (bytes[FORMAT_MAGIC.length] !== FORMAT_VERSION) {
+        throw new Error(`Unsupported AST dump version ${bytes[FORMAT_MAGIC.length]}.`);
+    }
+
+    let pos = FORMAT_MAGIC.length + 1;
+    const strings = [];
+
+    // Varints are decoded with arithmetic instead of bitwise operators, which would truncate them to 32 bits.
+    function varint() {
+        let v = 0;
+        let scale = 1;
+        for (;;) {
+            if (pos >= bytes.length) throw new Error("Truncated AST dump.");
+            const b = bytes[pos++];
+            v += (b & 0x7F) * scale;
+            if (b < 0x80) return v;
+            scale *= 128;
+        }
+    }
+
+    // Containers being filled. Trees may be deeper than the call stack allows, hence the explicit stack.
+    /** @type {{ value: any, remaining: number, key: string | undefined }[]} */
+    const stack = [];
+    let root = undefined;
+    for (;;) {
+        if (pos >= bytes.length) throw new Error("Truncated AST dump.");
+        const tag = bytes[pos++];
+
+        let v;
+        let container = undefined;
+        switch (tag) {
+            case TAG_NULL: v = null; break;
+            case TAG_FALSE: v = false; break;
+            case TAG_TRUE: v = true; break;
+            case TAG_INT: {
+                const z = varint();
+                v = (z % 2 === 0) ? z / 2 : -(z + 1) / 2;
+                break;
+            }
+            case TAG_FLOAT:
+                v = view.getFloat64(pos, true);
+                pos += 8;
+                break;
+            case TAG_STRING: {
+                const length = varint();
+                v = decoder.decode(bytes.subarray(pos, pos + length));
+                pos += length;
+                strings.push(v);
+                break;
+            }
+            case TAG_STRING_REF: v = strings[varint()]; break;
+            case TAG_ARRAY:
+                v = [];
+                container = { value: v, remaining: varint(), key: undefined };
+                break;
+            case TAG_OBJECT:
+                v = {};
+                container = { value: v, remaining: varint(), key: undefined };
+                break;
+            default:
+                throw new Error(`Unknown tag ${tag} at offset ${pos - 1}.`);
+        }
+
+        // Place the value on it's parent, then close every container that was filled.
+        if (stack.length === 0) {
+            root = v;
+        } else {
+            const top = stack[stack.length - 1];
+            if (Array.isArray(top.value)) {
+                top.value.push(v);
+                top.remaining--;
+            } else if (top.key === undefined) {
+                top.key = v;
+            } else {
+                top.value[top.key] = v;
+                top.key = undefined;
+                top.remaining--;
+            }
+        }
+
+        if (container !== undefined && container.remaining > 0) stack.push(container);
+        while (stack.length > 0 && stack[stack.length - 1].remaining === 0) stack.pop();
+        if (stack.length === 0) return root;
+    }
+}
+//#endregion ============== Binary AST Dumps ==============
@@ -1,4 +1,5 @@
 import { processAST } from "./astStruct.js";
+import { isBinaryAST, decodeBinaryAST } from "./astBinary.js";
 
 const borderColors = ["#f44336", "#4caf50", "#2196f3", "#ff9800", "#9c27b0"];
 let borderColorInd = 0;
@@ -65,8 +66,11 @@ document.addEventListener("DOMContentLoaded", () => {
             const file = ASTInput.files[0];
             console.debug("AST Input File:", file);
 
-            const textData = await file.text();
-            const data = JSON.parse(textData);
+            // Dumps are either JSON or binary (see astBinary.js), which are told apart by their magic bytes.
+            const buffer = await file.arrayBuffer();
+            const data = isBinaryAST(buffer)
+                ? decodeBinaryAST(buffer)
+                : JSON.parse(new TextDecoder("utf-8").decode(buffer));
             console.debug("AST Input:", data);
             
             console.log("Processing AST...");